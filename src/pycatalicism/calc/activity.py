@@ -1,10 +1,108 @@
+import numpy as np
+
 class Activity():
     """
-    Wrapper for activity data storage. Not implemented at the moment.
+    Wrapper for activity data storage. Activity is stored as parallel numpy.ndarrays of floats: temperatures, reaction rates per catalyst mass and, optionally, turnover frequencies and key reactant conversions at which rates were measured.
     """
 
-    def __init__(self):
+    def __init__(self, temperatures:list[float]|np.ndarray[float, np.dtype], rates:list[float]|np.ndarray[float, np.dtype], tofs:list[float]|np.ndarray[float, np.dtype]|None, sample_name:str|None, alphas:list[float]|np.ndarray[float, np.dtype]|None=None):
+        """
+        Assign parameters to instance variables after conversion lists to numpy.ndarrays.
+
+        parameters
+        ----------
+        temperatures:list[float]|numpy.ndarray[float]
+            list of temperatures
+        rates:list[float]|numpy.ndarray[float]
+            list of key reactant consumption rates in mol/(g*s)
+        tofs:list[float]|numpy.ndarray[float]|None
+            list of turnover frequencies in 1/s or None if they were not calculated
+        sample_name:str|None
+            name of sample
+        alphas:list[float]|numpy.ndarray[float]|None (default:None)
+            list of key reactant conversions parallel to rates or None if they are not known
+        """
+        self.temperatures = np.asarray(temperatures)
+        self.rates = np.asarray(rates)
+        self.tofs = None if tofs is None else np.asarray(tofs)
+        self.sample_name = sample_name
+        self.alphas = None if alphas is None else np.asarray(alphas)
+
+    def __str__(self) -> str:
+        """
+        Get string representation of activity vs. temperature data in a format:
+
+        Sample<tab><sample-name><br>
+        <br>
+        Temperature<tab>Rate, mol/(g*s)[<tab>TOF, 1/s]<br>
+        <temperature><tab><rate>[<tab><tof>]<br>
+        ...
+
+        returns
+        -------
+        string:str
+            string representation of activity vs. temperature data
+        """
+        order = np.argsort(self.temperatures, kind='stable')
+        header = f'Sample\t{self.sample_name}\n\nTemperature\tRate, mol/(g*s)'
+        columns = [self.temperatures[order], self.rates[order]]
+        if self.tofs is not None:
+            header = header + '\tTOF, 1/s'
+            columns.append(self.tofs[order])
+        lines = ['\t'.join(str(value) for value in row) for row in zip(*[column.tolist() for column in columns])]
+        return header + '\n' + ''.join(line + '\n' for line in lines)
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get temperatures as numpy.ndarray list
+
+        returns
+        -------
+        temperatures:ndarray
+            temperatures stored in this wrapper
+        """
+        return self.temperatures
+
+    def get_rates(self) -> np.ndarray[float, np.dtype]:
         """
-        Initialize activity object. Not implemented at the moment
+        Get reaction rates per catalyst mass as numpy.ndarray list
+
+        returns
+        -------
+        rates:ndarray
+            rates in mol/(g*s)
+        """
+        return self.rates
+
+    def get_tofs(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get turnover frequencies as numpy.ndarray list
+
+        returns
+        -------
+        tofs:ndarray|None
+            turnover frequencies in 1/s or None if they were not calculated
+        """
+        return self.tofs
+
+    def get_alphas(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get key reactant conversions at which rates were measured as numpy.ndarray list
+
+        returns
+        -------
+        alphas:ndarray|None
+            conversions parallel to rates or None if they are not known
+        """
+        return self.alphas
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get sample name
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
         """
-        raise NotImplementedError()
+        return self.sample_name
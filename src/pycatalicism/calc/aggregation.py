@@ -0,0 +1,331 @@
+import warnings
+
+import numpy as np
+
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Aggregation of replicate measurements. Rows of data matrix are grouped by key (temperature of catalytic reaction rounded to resolution or a single replicate set) in one sorted pass: rows are sorted by key, groups are found by numpy.unique and sums over groups are calculated by numpy.add.reduceat. Outliers are rejected in each column separately by modified z-score based on median absolute deviation (MAD): value is rejected if 0.6745 * |x - median| / MAD exceeds threshold. Values are aggregated by mean or median of remaining values.
+"""
+
+STATISTICS = ['mean', 'median']
+
+class Aggregation():
+    """
+    Wrapper for aggregated replicate measurements: aggregated values, standard deviations, numbers of used values and numbers of rejected outliers for each group and column. Values which cannot be determined (e.g. standard deviation of single value) are NaN.
+    """
+
+    def __init__(self, keys:np.ndarray[float, np.dtype], values:np.ndarray, stds:np.ndarray, counts:np.ndarray, rows:np.ndarray, rejected:np.ndarray, statistic:str, columns:list[str]|None=None, key_name:str='Key'):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        keys:numpy.ndarray[float]
+            keys of groups, e.g. mean temperatures of catalytic reaction
+        values:numpy.ndarray
+            aggregated values of shape (groups, columns)
+        stds:numpy.ndarray
+            sample standard deviations of values used for aggregation of the same shape
+        counts:numpy.ndarray
+            numbers of values used for aggregation of the same shape
+        rows:numpy.ndarray
+            numbers of rows in groups parallel to keys
+        rejected:numpy.ndarray
+            numbers of rejected outliers of the same shape as values
+        statistic:str {mean|median}
+            statistic used for aggregation
+        columns:list[str]|None (default:None)
+            names of columns used for string representation, columns are numbered if None
+        key_name:str (default:Key)
+            name of keys used for string representation
+        """
+        self.keys = keys
+        self.values = values
+        self.stds = stds
+        self.counts = counts
+        self.rows = rows
+        self.rejected = rejected
+        self.statistic = statistic
+        self.columns = columns
+        self.key_name = key_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of aggregation in a form of table:
+
+        Statistic<tab><statistic><br>
+        <br>
+        <key-name><tab>Replicates<tab>Rejected<tab><column><tab><column> std<tab>...
+
+        Rejected is a total number of values rejected as outliers in a group.
+
+        returns
+        -------
+        string:str
+            string representation of aggregation
+        """
+        columns = self.columns if self.columns is not None else [str(column) for column in range(self.values.shape[1])]
+        header = f'Statistic\t{self.statistic}\n\n{self.key_name}\tReplicates\tRejected' + ''.join(f'\t{column}\t{column} std' for column in columns) + '\n'
+        data = np.stack([self.values, self.stds], axis=-1).reshape(len(self.keys), -1)
+        rows = zip(self.keys.tolist(), self.rows.tolist(), self.rejected.sum(axis=1).tolist(), data.tolist())
+        return header + ''.join(f'{key}\t{replicates}\t{rejected}' + ''.join(f'\t{value}' for value in values) + '\n' for key, replicates, rejected, values in rows)
+
+    def get_keys(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get keys of groups
+
+        returns
+        -------
+        keys:numpy.ndarray[float]
+            keys of groups
+        """
+        return self.keys
+
+    def get_values(self) -> np.ndarray:
+        """
+        Get aggregated values
+
+        returns
+        -------
+        values:numpy.ndarray
+            matrix of shape (groups, columns)
+        """
+        return self.values
+
+    def get_stds(self) -> np.ndarray:
+        """
+        Get sample standard deviations of values used for aggregation
+
+        returns
+        -------
+        stds:numpy.ndarray
+            matrix of shape (groups, columns), NaN if less than two values were used
+        """
+        return self.stds
+
+    def get_counts(self) -> np.ndarray:
+        """
+        Get numbers of values used for aggregation
+
+        returns
+        -------
+        counts:numpy.ndarray
+            matrix of shape (groups, columns)
+        """
+        return self.counts
+
+    def get_rows(self) -> np.ndarray:
+        """
+        Get numbers of rows in groups
+
+        returns
+        -------
+        rows:numpy.ndarray
+            numbers of replicates parallel to keys
+        """
+        return self.rows
+
+    def get_rejected(self) -> np.ndarray:
+        """
+        Get numbers of values rejected as outliers
+
+        returns
+        -------
+        rejected:numpy.ndarray
+            matrix of shape (groups, columns)
+        """
+        return self.rejected
+
+    def get_statistic(self) -> str:
+        """
+        Get statistic used for aggregation
+
+        returns
+        -------
+        statistic:str
+            mean or median
+        """
+        return self.statistic
+
+    def get_columns(self) -> list[str]|None:
+        """
+        Get names of columns
+
+        returns
+        -------
+        columns:list[str]|None
+            names of columns or None if they are not known
+        """
+        return self.columns
+
+def aggregate(keys:np.ndarray[float, np.dtype], values:np.ndarray, statistic:str='mean', outlier_threshold:float|None=3.5, columns:list[str]|None=None) -> Aggregation:
+    """
+    Group rows of values by keys and aggregate each group. NaN values are ignored. Outliers are rejected only in columns of groups with at least 3 values and non-zero MAD.
+
+    parameters
+    ----------
+    keys:numpy.ndarray[float]
+        keys of rows, rows with equal keys form a group
+    values:numpy.ndarray
+        values of shape (rows, columns)
+    statistic:str {mean|median} (default:mean)
+        statistic used for aggregation
+    outlier_threshold:float|None (default:3.5)
+        threshold of modified z-score, outliers are not rejected if None
+    columns:list[str]|None (default:None)
+        names of columns
+
+    returns
+    -------
+    aggregation:Aggregation
+        aggregated values with keys of groups sorted in ascending order
+
+    raises
+    ------
+    exception:CalculatorException
+        if statistic is unknown or there are no rows to aggregate
+    """
+    if statistic not in STATISTICS:
+        raise CalculatorException(f'Unknown statistic {statistic}')
+    keys = np.asarray(keys, dtype=float).reshape(-1)
+    values = np.asarray(values, dtype=float).reshape(len(keys), -1)
+    if len(keys) == 0:
+        raise CalculatorException('No rows to aggregate')
+    order = np.argsort(keys, kind='stable')
+    values = values[order]
+    unique_keys, starts, rows = np.unique(keys[order], return_index=True, return_counts=True)
+    groups = np.repeat(np.arange(len(unique_keys)), rows)
+    known = ~np.isnan(values)
+    medians = _get_group_medians(values, groups, starts, rows)
+    if outlier_threshold is None:
+        outliers = np.zeros(values.shape, dtype=bool)
+    else:
+        deviations = np.abs(values - medians[groups])
+        mads = _get_group_medians(deviations, groups, starts, rows)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scores = 0.6745 * deviations / mads[groups]
+            outliers = known & (np.add.reduceat(known, starts, axis=0)[groups] >= 3) & (mads[groups] > 0) & (scores > outlier_threshold)
+    used = known & ~outliers
+    counts = np.add.reduceat(used, starts, axis=0)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        means = np.add.reduceat(np.where(used, values, 0), starts, axis=0) / counts
+        stds = np.sqrt(np.add.reduceat(np.where(used, values - means[groups], 0)**2, starts, axis=0) / (counts - 1))
+    stds = np.where(counts > 1, stds, np.nan)
+    if statistic == 'mean':
+        aggregated = means
+    elif statistic == 'median':
+        aggregated = _get_group_medians(np.where(used, values, np.nan), groups, starts, rows)
+    return Aggregation(unique_keys, aggregated, stds, counts, rows, np.add.reduceat(outliers, starts, axis=0), statistic, columns)
+
+def aggregate_raw_data(input_data:RawData, statistic:str='mean', outlier_threshold:float|None=3.5, resolution:float=1.0) -> tuple[RawData,Aggregation]:
+    """
+    Aggregate measurements done at the same temperature. Temperatures are rounded to resolution to find groups, concentrations and flow rate data are aggregated by statistic with rejection of outliers, temperatures and times of acquisition are averaged over all replicates.
+
+    parameters
+    ----------
+    input_data:RawData
+        wrapper with concentrations and flow rate data
+    statistic:str {mean|median} (default:mean)
+        statistic used for aggregation
+    outlier_threshold:float|None (default:3.5)
+        threshold of modified z-score, outliers are not rejected if None
+    resolution:float (default:1.0)
+        resolution of temperatures in °C used to find replicates
+
+    returns
+    -------
+    (raw_data, aggregation):tuple[RawData,Aggregation]
+        wrapper with one measurement per temperature and aggregation of concentrations and flow rate data
+
+    raises
+    ------
+    exception:CalculatorException
+        if resolution is not positive, statistic is unknown or there are no measurements
+    """
+    if resolution <= 0:
+        raise CalculatorException(f'Resolution of temperatures must be positive, got {resolution}')
+    keys = np.round(input_data.get_temperatures() / resolution) * resolution
+    flow_data = [input_data.get_fin_amb_temps(), input_data.get_fin_amb_pressures(), input_data.get_fin_flows()]
+    has_flow = all(data is not None for data in flow_data)
+    columns = input_data.get_compounds() + (['Ambient temperature', 'Ambient pressure', 'Flow'] if has_flow else [])
+    values = np.column_stack([input_data.get_conc_matrix()] + (flow_data if has_flow else []))
+    aggregation = aggregate(keys, values, statistic, outlier_threshold, columns)
+    timestamps = input_data.get_timestamps()
+    averages = aggregate(keys, np.column_stack([input_data.get_temperatures(), np.full(len(keys), np.nan) if timestamps is None else timestamps]), 'mean', None).get_values()
+    aggregated = aggregation.get_values()
+    compounds = len(input_data.get_compounds())
+    aggregation = Aggregation(averages[:, 0], aggregated, aggregation.get_stds(), aggregation.get_counts(), aggregation.get_rows(), aggregation.get_rejected(), statistic, columns, 'Temperature')
+    raw_data = RawData(temperatures=averages[:, 0], initial_concentrations=input_data.get_init_concs(), concentrations=aggregated[:, :compounds], initial_ambient_temperature=input_data.get_init_amb_temp(), initial_ambient_pressure=input_data.get_init_amb_pres(), initial_flow=input_data.get_init_flow(), final_ambient_temperatures=aggregated[:, compounds] if has_flow else None, final_ambient_pressures=aggregated[:, compounds+1] if has_flow else None, final_flows=aggregated[:, compounds+2] if has_flow else None, sample_name=input_data.get_sample_name(), compounds=input_data.get_compounds(), timestamps=None if timestamps is None else averages[:, 1])
+    return (raw_data, aggregation)
+
+def aggregate_chromatograms(chromatograms:list[Chromatogram], statistic:str='mean', outlier_threshold:float|None=3.5, source:str|None=None) -> tuple[Chromatogram,Aggregation]:
+    """
+    Aggregate replicate chromatograms (e.g. of initial gas composition gathered by measure-init-concentration command) into a single chromatogram. Compounds of all replicates are used, flow rate data are aggregated only if they were measured in all replicates.
+
+    parameters
+    ----------
+    chromatograms:list[Chromatogram]
+        replicate chromatograms
+    statistic:str {mean|median} (default:mean)
+        statistic used for aggregation
+    outlier_threshold:float|None (default:3.5)
+        threshold of modified z-score, outliers are not rejected if None
+    source:str|None (default:None)
+        name of data source of aggregated chromatogram
+
+    returns
+    -------
+    (chromatogram, aggregation):tuple[Chromatogram,Aggregation]
+        aggregated chromatogram and aggregation of its data
+
+    raises
+    ------
+    exception:CalculatorException
+        if statistic is unknown or no chromatograms are provided
+    """
+    compounds = {}
+    for chromatogram in chromatograms:
+        for compound in chromatogram.get_compounds():
+            compounds.setdefault(compound, len(compounds))
+    flow_data = np.array([(chromatogram.get_ambient_temperature(), chromatogram.get_ambient_pressure(), chromatogram.get_flow()) for chromatogram in chromatograms], dtype=float).reshape(-1, 3)
+    has_flow = np.isfinite(flow_data).all()
+    values = np.full((len(chromatograms), len(compounds) + 3), np.nan)
+    for row, chromatogram in enumerate(chromatograms):
+        values[row, [compounds[compound] for compound in chromatogram.get_compounds()]] = chromatogram.get_concentrations()
+    if has_flow:
+        values[:, len(compounds):] = flow_data
+    columns = list(compounds) + (['Ambient temperature', 'Ambient pressure', 'Flow'] if has_flow else [])
+    aggregation = aggregate(np.zeros(len(chromatograms)), values[:, :len(columns)], statistic, outlier_threshold, columns)
+    aggregated = aggregation.get_values()[0]
+    timestamps = [chromatogram.get_timestamp() for chromatogram in chromatograms if chromatogram.get_timestamp() is not None]
+    chromatogram = Chromatogram(temperature=float(np.mean([chromatogram.get_temperature() for chromatogram in chromatograms])), compounds=list(compounds), concentrations=aggregated[:len(compounds)], ambient_temperature=float(aggregated[-3]) if has_flow else None, ambient_pressure=float(aggregated[-2]) if has_flow else None, flow=float(aggregated[-1]) if has_flow else None, source=source, timestamp=min(timestamps) if timestamps else None)
+    return (chromatogram, aggregation)
+
+def _get_group_medians(values:np.ndarray, groups:np.ndarray, starts:np.ndarray, rows:np.ndarray) -> np.ndarray:
+    """
+    Get medians of sorted rows over groups ignoring NaN values. Groups are padded with NaN to the size of the largest group, so that medians of all groups are calculated by a single call.
+
+    parameters
+    ----------
+    values:numpy.ndarray
+        values of shape (rows, columns) sorted by group
+    groups:numpy.ndarray
+        indices of groups of rows
+    starts:numpy.ndarray
+        indices of first rows of groups
+    rows:numpy.ndarray
+        numbers of rows in groups
+
+    returns
+    -------
+    medians:numpy.ndarray
+        medians of shape (groups, columns), NaN if all values of group are NaN
+    """
+    padded = np.full((len(starts), rows.max(), values.shape[1]), np.nan)
+    padded[groups, np.arange(len(groups)) - starts[groups]] = values
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanmedian(padded, axis=1)
@@ -0,0 +1,146 @@
+import tarfile
+import zipfile
+from pathlib import Path
+from typing import Iterator
+
+from pycatalicism.calc.parserexception import ParserException
+
+"""
+Access to input data stored in zip or tar (optionally compressed) archives. Paths to archives can be used as paths to input data directory, paths inside archives (e.g. campaign.zip/sample/initial.txt) can be used as paths to input data directory or to initial data file. Members are read directly from archive without extraction to disk.
+"""
+
+def split_path(path:Path) -> tuple[Path,str]|None:
+    """
+    Split path to archive file and path of member inside archive.
+
+    parameters
+    ----------
+    path:Path
+        path to archive or path inside archive
+
+    returns
+    -------
+    (archive, member):tuple[Path,str]|None
+        archive:Path
+            path to archive file
+        member:str
+            path of member inside archive in posix format, empty string if path is archive itself
+        None is returned if path is not related to archive
+    """
+    for candidate in [path] + list(path.parents):
+        if candidate.is_dir():
+            return None
+        if candidate.is_file():
+            if zipfile.is_zipfile(candidate) or tarfile.is_tarfile(candidate):
+                member = path.relative_to(candidate).as_posix()
+                return (candidate, '' if member == '.' else member)
+            return None
+    return None
+
+def is_zip(archive:Path) -> bool:
+    """
+    Check whether archive is zip archive which allows random access to members
+
+    parameters
+    ----------
+    archive:Path
+        path to archive file
+
+    returns
+    -------
+    is_zip:bool
+        True if archive is zip archive, False if it is tar archive
+    """
+    return zipfile.is_zipfile(archive)
+
+def list_members(archive:Path, directory:str) -> list[str]:
+    """
+    Get sorted names of files located directly in directory inside archive.
+
+    parameters
+    ----------
+    archive:Path
+        path to archive file
+    directory:str
+        path of directory inside archive, empty string for archive root
+
+    returns
+    -------
+    members:list[str]
+        names of files in directory
+
+    raises
+    ------
+    exception:ParserException
+        if directory is not found in archive
+    """
+    prefix = directory.strip('/') + '/' if directory.strip('/') else ''
+    if is_zip(archive):
+        with zipfile.ZipFile(archive) as zip_archive:
+            names = [info.filename for info in zip_archive.infolist() if not info.is_dir()]
+    else:
+        with tarfile.open(archive, mode='r:*') as tar_archive:
+            names = [member.name for member in tar_archive if member.isfile()]
+    names = [name.removeprefix('./') for name in names]
+    members = sorted(name for name in names if name.startswith(prefix) and '/' not in name[len(prefix):])
+    if not members and not any(name.startswith(prefix) for name in names):
+        raise ParserException(f'directory {directory} not found in archive {archive}')
+    return members
+
+def read_member(archive:Path, member:str) -> bytes:
+    """
+    Read contents of file inside archive.
+
+    parameters
+    ----------
+    archive:Path
+        path to archive file
+    member:str
+        path of file inside archive
+
+    returns
+    -------
+    data:bytes
+        contents of file
+
+    raises
+    ------
+    exception:ParserException
+        if file is not found in archive
+    """
+    for _, data in iter_members(archive, [member]):
+        return data
+    raise ParserException(f'file {member} not found in archive {archive}')
+
+def iter_members(archive:Path, members:list[str]) -> Iterator[tuple[str,bytes]]:
+    """
+    Read files from archive one by one. Tar archives are read sequentially in a single pass, thus, files are yielded in order of archive, zip archive files are yielded in order of members list.
+
+    parameters
+    ----------
+    archive:Path
+        path to archive file
+    members:list[str]
+        paths of files inside archive
+
+    returns
+    -------
+    members:Iterator[tuple[str,bytes]]
+        iterator over tuples (<member>, <contents>)
+    """
+    if is_zip(archive):
+        with zipfile.ZipFile(archive) as zip_archive:
+            for member in members:
+                try:
+                    yield (member, zip_archive.read(member))
+                except KeyError:
+                    continue
+    else:
+        wanted = set(members)
+        with tarfile.open(archive, mode='r:*') as tar_archive:
+            for info in tar_archive:
+                name = info.name.removeprefix('./')
+                if info.isfile() and name in wanted:
+                    file = tar_archive.extractfile(info)
+                    if file is not None:
+                        yield (name, file.read())
@@ -0,0 +1,184 @@
+import numpy as np
+
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Consistency check of calculation results. Conversion of key reactant is calculated both from reactants and from products concentrations together with closure of basis element (e.g. carbon) balance in a single pass over input data (see ReactionCalculator.calculate_balance). Points at which conversions on both bases differ or balance closure deviates from unity by more than threshold are flagged.
+"""
+
+class Balance():
+    """
+    Wrapper for conversions on both bases and balance closures. All values are vectors parallel to sorted temperatures.
+    """
+
+    def __init__(self, temperatures:np.ndarray[float, np.dtype], alphas:np.ndarray[float, np.dtype], products_alphas:np.ndarray[float, np.dtype], closures:np.ndarray[float, np.dtype], threshold:float, element:str, sample_name:str|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        temperatures:numpy.ndarray[float]
+            sorted temperatures of catalytic reaction
+        alphas:numpy.ndarray[float]
+            conversions of key reactant calculated from reactants concentrations
+        products_alphas:numpy.ndarray[float]
+            conversions of key reactant calculated from products concentrations
+        closures:numpy.ndarray[float]
+            closures of basis element balance
+        threshold:float
+            maximum allowed difference of conversions and deviation of balance closure from unity
+        element:str
+            basis element of balance
+        sample_name:str|None
+            name of sample
+        """
+        self.temperatures = temperatures
+        self.alphas = alphas
+        self.products_alphas = products_alphas
+        self.closures = closures
+        self.threshold = threshold
+        self.element = element
+        self.sample_name = sample_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of balance in a format:
+
+        Sample<tab><sample-name><br>
+        Threshold<tab><threshold><br>
+        Flagged<tab><number of flagged points><br>
+        <br>
+        Temperature<tab>Conversion<tab>Conversion (products basis)<tab>Difference<tab><element> balance<tab>Flag<br>
+        ...
+
+        Flag is 1 for points exceeding threshold and 0 otherwise.
+
+        returns
+        -------
+        string:str
+            string representation of balance
+        """
+        flagged = self.get_flagged()
+        header = f'Sample\t{self.sample_name}\nThreshold\t{self.threshold}\nFlagged\t{int(np.count_nonzero(flagged))}\n\nTemperature\tConversion\tConversion (products basis)\tDifference\t{self.element} balance\tFlag\n'
+        rows = zip(self.temperatures.tolist(), self.alphas.tolist(), self.products_alphas.tolist(), self.get_differences().tolist(), self.closures.tolist(), flagged.astype(int).tolist())
+        return header + ''.join('\t'.join(str(value) for value in row) + '\n' for row in rows)
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get sorted temperatures of catalytic reaction
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            temperatures
+        """
+        return self.temperatures
+
+    def get_alphas(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get conversions of key reactant calculated from reactants concentrations
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            conversions parallel to temperatures
+        """
+        return self.alphas
+
+    def get_products_alphas(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get conversions of key reactant calculated from products concentrations
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            conversions parallel to temperatures
+        """
+        return self.products_alphas
+
+    def get_differences(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get differences of conversions calculated from products and from reactants concentrations
+
+        returns
+        -------
+        differences:numpy.ndarray[float]
+            differences parallel to temperatures
+        """
+        return self.products_alphas - self.alphas
+
+    def get_closures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get closures of basis element balance
+
+        returns
+        -------
+        closures:numpy.ndarray[float]
+            ratios of amounts of basis element after and before catalytic reactor parallel to temperatures
+        """
+        return self.closures
+
+    def get_flagged(self) -> np.ndarray[bool, np.dtype]:
+        """
+        Get mask of points at which difference of conversions or deviation of balance closure from unity exceeds threshold. Points with unknown balance closure are flagged as well.
+
+        returns
+        -------
+        flagged:numpy.ndarray[bool]
+            mask parallel to temperatures
+        """
+        with np.errstate(invalid='ignore'):
+            return (np.abs(self.get_differences()) > self.threshold) | ~(np.abs(self.closures - 1) <= self.threshold)
+
+    def get_threshold(self) -> float:
+        """
+        Get threshold used to flag points
+
+        returns
+        -------
+        threshold:float
+            maximum allowed difference of conversions and deviation of balance closure from unity
+        """
+        return self.threshold
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get name of sample
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
+
+def get_balance(calculator:ReactionCalculator, input_data:RawData, threshold:float=0.05) -> Balance:
+    """
+    Calculate conversions on both bases and balance closure at all temperatures (see ReactionCalculator.calculate_balance) and sort them by temperature.
+
+    parameters
+    ----------
+    calculator:ReactionCalculator
+        calculator of reaction
+    input_data:RawData
+        wrapper with concentrations and flow rate data
+    threshold:float (default:0.05)
+        maximum allowed difference of conversions and deviation of balance closure from unity, points exceeding it are flagged
+
+    returns
+    -------
+    balance:Balance
+        conversions on both bases and balance closures
+
+    raises
+    ------
+    exception:CalculatorException
+        if threshold is not positive
+    """
+    if threshold <= 0:
+        raise CalculatorException(f'Balance threshold must be positive, got {threshold}')
+    order = np.argsort(input_data.get_temperatures(), kind='stable')
+    alphas, products_alphas, closures = calculator.calculate_balance(input_data)[order].T
+    return Balance(input_data.get_temperatures()[order], alphas, products_alphas, closures, threshold, calculator.get_reaction().get_element(), input_data.get_sample_name())
@@ -0,0 +1,183 @@
+from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc.results import Results
+from pycatalicism.calc.calculation_settings import CalculationSettings
+from pycatalicism.calc import light_off
+from pycatalicism.calc import kinetics
+from pycatalicism.calc.batch_summary import BatchSummary
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Batch calculation of conversion, selectivity, yield and/or activity for several samples. Samples are listed in manifest file or found as subdirectories of samples directory. Samples are calculated by pool of worker processes, results of each sample are exported to its own subdirectory of output directory and summary table with metrics of all samples and failures is exported to the output directory.
+"""
+
+def calculate_batch(samples_path:str, reaction:str, settings:CalculationSettings, export_plot:bool=False, workers:int=1, initial_data_file_name:str='initial.txt') -> BatchSummary:
+    """
+    Main interface to module. Calculates results for all samples, exports them to <output-data-path>/<sample-name> directories, prints summary table and exports it to <output-data-path>/summary.dat. Light-off metrics and Arrhenius parameters of all samples, if enabled in settings, are calculated for summary by single vectorized calls after all samples are calculated. Failure of one sample does not stop calculation of others, error is added to the summary instead.
+
+    samples_path can be either manifest file or directory. Manifest is a text file with a line per sample in a format:
+
+    <sample-name><tab><input-data-path><tab><initial-data-path>[<tab><catalyst-mass>]
+
+    Empty lines and lines starting with # are ignored, relative paths are resolved relative to manifest location. If samples_path is a directory, each of its subdirectories is a sample named after subdirectory, which contains input data files and initial data file named initial_data_file_name. Initial data path may be a directory with replicate files of initial data.
+
+    parameters
+    ----------
+    samples_path:str
+        Path to manifest file or to directory with samples directories
+    reaction:str {co-oxidation|co2-hydrogenation|co2-methanation|rwgs|dry-reforming|co-prox|co2-hydrogenation-oxygenates|<reaction declared in config.py>}
+        Chemical reaction to calculate data for
+    settings:CalculationSettings
+        Options of calculation common for all samples, output data path is a directory to export results of samples and summary. Sample name, catalyst mass and output paths of each sample are set from samples list, results of samples are not printed and plots are not shown
+    export_plot:bool (default:False)
+        Whether to export plots to samples output directories
+    workers:int (default:1)
+        Number of worker processes, samples are calculated serially if 1
+    initial_data_file_name:str (default:initial.txt)
+        Name of initial data file in samples directories
+
+    returns
+    -------
+    summary:BatchSummary
+        summary of batch calculation
+
+    raises
+    ------
+    exception:CalculatorException
+        if nothing to calculate, if output data path is not provided, if samples cannot be read or if sample names are not unique
+    """
+    if not (settings.calculate_conversion or settings.calculate_selectivity or settings.calculate_yield):
+        raise CalculatorException('Nothing to calculate')
+    if settings.output_data_path is None:
+        raise CalculatorException('Output data path must be provided for batch calculation')
+    samples = _read_samples(Path(samples_path).resolve(), initial_data_file_name)
+    output_path = Path(settings.output_data_path).resolve()
+    tasks = [(name, input_path, initial_path, reaction, settings.replace(output_data_path=str(output_path.joinpath(name)), output_plot_path=str(output_path.joinpath(name)) if export_plot else None, show_plot=False, sample_name=name, catalyst_mass=catalyst_mass, print_results=False)) for name, input_path, initial_path, catalyst_mass in samples]
+    if workers == 1 or len(tasks) < 2:
+        outcomes = list(map(_calculate_sample, tasks))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outcomes = list(executor.map(_calculate_sample, tasks))
+    metrics = [{} if results is None else _get_metrics(results) for _, results, _ in outcomes]
+    if settings.calculate_light_off:
+        converted = [i for i, (_, results, _) in enumerate(outcomes) if results is not None and results.get_conversion() is not None and len(results.get_conversion().get_temperatures()) > 0]
+        light_offs = light_off.get_light_offs([outcomes[i][1].get_conversion() for i in converted], [outcomes[i][1].get_yield() for i in converted], method=settings.light_off_method)
+        for i, light_off_metrics in zip(converted, light_offs):
+            metrics[i].update(light_off_metrics.get_metrics())
+    if settings.fit_arrhenius:
+        fitted = [i for i, (_, results, _) in enumerate(outcomes) if results is not None and results.get_activity() is not None and results.get_activity().get_alphas() is not None]
+        arrhenius_fits = kinetics.get_arrhenius_fits([outcomes[i][1].get_activity() for i in fitted], settings.kinetics_max_conversion, settings.kinetics_confidence)
+        for i, arrhenius_fit in zip(fitted, arrhenius_fits):
+            metrics[i].update(arrhenius_fit.get_metrics())
+    summary = BatchSummary()
+    for (name, _, error), sample_metrics in zip(outcomes, metrics):
+        summary.add_sample(name, sample_metrics, error)
+    print(summary)
+    output_path.mkdir(parents=True, exist_ok=True)
+    with output_path.joinpath('summary.dat').open(mode='w') as output:
+        output.write(str(summary))
+    return summary
+
+def _read_samples(samples_path:Path, initial_data_file_name:str) -> list[tuple[str,Path,Path,float|None]]:
+    """
+    Get list of samples from manifest file or from samples directory.
+
+    parameters
+    ----------
+    samples_path:Path
+        path to manifest file or to directory with samples directories
+    initial_data_file_name:str
+        name of initial data file in samples directories
+
+    returns
+    -------
+    samples:list[tuple[str,Path,Path,float|None]]
+        list of tuples (<sample-name>, <input-data-path>, <initial-data-path>, <catalyst-mass>)
+
+    raises
+    ------
+    exception:CalculatorException
+        if samples_path does not exist, if manifest format is wrong or if sample names are not unique
+    """
+    samples = []
+    if samples_path.is_dir():
+        for directory in sorted(samples_path.iterdir()):
+            if directory.is_dir():
+                samples.append((directory.name, directory, directory.joinpath(initial_data_file_name), None))
+    elif samples_path.is_file():
+        for number, line in enumerate(samples_path.read_text().splitlines(), start=1):
+            if line.strip() == '' or line.startswith('#'):
+                continue
+            words = line.rstrip('\r').split(sep='\t')
+            if len(words) not in [3, 4]:
+                raise CalculatorException(f'Wrong format of line {number} in manifest {samples_path}')
+            try:
+                catalyst_mass = float(words[3].replace(',', '.')) if len(words) == 4 and words[3].strip() else None
+            except ValueError:
+                raise CalculatorException(f'Wrong catalyst mass in line {number} in manifest {samples_path}')
+            samples.append((words[0], samples_path.parent.joinpath(words[1]).resolve(), samples_path.parent.joinpath(words[2]).resolve(), catalyst_mass))
+    else:
+        raise CalculatorException(f'Samples path {samples_path} does not exist')
+    names = [sample[0] for sample in samples]
+    if len(set(names)) != len(names):
+        raise CalculatorException(f'Sample names in {samples_path} are not unique')
+    return samples
+
+def _calculate_sample(task:tuple) -> tuple[str,Results|None,str|None]:
+    """
+    Calculate results for single sample and export them. This function is executed by workers of pool, therefore, errors are returned instead of being raised.
+
+    parameters
+    ----------
+    task:tuple
+        tuple (<sample-name>, <input-data-path>, <initial-data-path>, <reaction>, <settings>) with arguments of calc.calculate function
+
+    returns
+    -------
+    (name, results, error):tuple
+        name:str
+            name of sample
+        results:Results|None
+            results of calculation or None if calculation failed
+        error:str|None
+            error message or None if calculation succeeded
+    """
+    name, input_path, initial_path, reaction, settings = task
+    try:
+        results = calc.calculate(str(input_path), str(initial_path), reaction, settings)
+        return (name, results, None)
+    except Exception as e:
+        return (name, None, f'{type(e).__name__}: {e}')
+
+def _get_metrics(results:Results) -> dict[str,float]:
+    """
+    Get metrics of sample from calculated results.
+
+    parameters
+    ----------
+    results:Results
+        results of calculation
+
+    returns
+    -------
+    metrics:dict[str,float]
+        metrics of sample in a format {<metric>:<value>}
+    """
+    metrics = {}
+    conversion = results.get_conversion()
+    if conversion is not None and len(conversion.get_temperatures()) > 0:
+        temperatures = conversion.get_temperatures()
+        alphas = conversion.get_alphas()
+        metrics['Points'] = len(temperatures)
+        metrics['Tmin'] = float(temperatures[0])
+        metrics['Tmax'] = float(temperatures[-1])
+        metrics['Max conversion'] = float(np.nanmax(alphas)) if np.any(~np.isnan(alphas)) else np.nan
+        metrics['Conversion at Tmax'] = float(alphas[-1])
+    activity = results.get_activity()
+    if activity is not None and len(activity.get_rates()) > 0:
+        metrics['Max rate, mol/(g*s)'] = float(np.nanmax(activity.get_rates()))
+    return metrics
@@ -0,0 +1,90 @@
+class BatchSummary():
+    """
+    Summary of batch calculation: metrics of each sample and errors of failed samples in order of samples in the batch. Columns of summary table are collected from metrics of all samples in order of their first appearance.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty summary.
+        """
+        self.samples = []
+        self.metrics = []
+        self.errors = []
+        self.columns = {}
+
+    def __str__(self) -> str:
+        """
+        Get string representation of summary in a form of table:
+
+        Sample<tab>Status<tab><metric><tab>...<tab>Error
+
+        Metrics which were not calculated for a sample are represented by empty cells.
+
+        returns
+        -------
+        string:str
+            string representation of summary
+        """
+        header = 'Sample\tStatus' + ''.join(f'\t{column}' for column in self.columns) + '\tError\n'
+        lines = []
+        for sample, metrics, error in zip(self.samples, self.metrics, self.errors):
+            values = ''.join(f'\t{metrics[column]}' if column in metrics else '\t' for column in self.columns)
+            lines.append(f'{sample}\t{"failed" if error else "ok"}{values}\t{error or ""}\n')
+        return header + ''.join(lines)
+
+    def __len__(self) -> int:
+        """
+        Get number of samples in summary
+
+        returns
+        -------
+        length:int
+            number of samples
+        """
+        return len(self.samples)
+
+    def add_sample(self, sample:str, metrics:dict[str,float], error:str|None=None):
+        """
+        Add sample to summary
+
+        parameters
+        ----------
+        sample:str
+            name of sample
+        metrics:dict[str,float]
+            metrics of sample in a format {<metric>:<value>}
+        error:str|None (default:None)
+            error message if calculation for sample failed
+        """
+        self.samples.append(sample)
+        self.metrics.append(metrics)
+        self.errors.append(error)
+        for column in metrics:
+            self.columns.setdefault(column, len(self.columns))
+
+    def get_failed(self) -> list[tuple[str,str]]:
+        """
+        Get list of failed samples
+
+        returns
+        -------
+        failed:list[tuple[str,str]]
+            list of tuples (<sample>, <error>)
+        """
+        return [(sample, error) for sample, error in zip(self.samples, self.errors) if error]
+
+    def get_metrics(self, sample:str) -> dict[str,float]:
+        """
+        Get metrics of sample
+
+        parameters
+        ----------
+        sample:str
+            name of sample
+
+        returns
+        -------
+        metrics:dict[str,float]
+            metrics of sample in a format {<metric>:<value>}
+        """
+        return self.metrics[self.samples.index(sample)]
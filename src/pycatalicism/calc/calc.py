@@ -1,11 +1,37 @@
 from pathlib import Path
+from typing import BinaryIO
+
+import numpy as np
 
 from pycatalicism.calc import calculator_factory
 from pycatalicism.calc import parser_factory
 from pycatalicism.calc import exporter_factory
-from pycatalicism.calc import plotter_factory
-from pycatalicism.calc.conversion import Conversion
-from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc import reaction_factory
+from pycatalicism.calc.parse_cache import ParseCache
+from pycatalicism.calc import parse_cache
+from pycatalicism.calc import watcher
+from pycatalicism.calc import archive
+from pycatalicism.calc import record_stream
+from pycatalicism.calc import uncertainty
+from pycatalicism.calc import time_on_stream
+from pycatalicism.calc import aggregation
+from pycatalicism.calc import balance
+from pycatalicism.calc import equilibrium
+from pycatalicism.calc import light_off
+from pycatalicism.calc import kinetics
+from pycatalicism.calc.equilibrium import Equilibrium
+from pycatalicism.calc.aggregation import Aggregation
+from pycatalicism.calc.parser import Parser
+from pycatalicism.calc.exporter import Exporter
+from pycatalicism.calc.plotter import Plotter
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.rawdata_builder import RawDataBuilder
+from pycatalicism.calc.results_buffer import ResultsBuffer
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.calc.parserexception import ParserException
+from pycatalicism.calc.results import Results
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+from pycatalicism.calc.calculation_settings import CalculationSettings
 from pycatalicism.calc.calculatorexception import CalculatorException
 
 """
@@ -13,25 +39,158 @@ Main interface for calculating conversion, activity and selectivity of catalysts
 """
 
 
-def _print_results(conversion:Conversion|None, selectivity:Selectivity|None):
+def _print_results(results:Results):
+    """
+    Print calculated results vs. temperature to console.
+
+    parameters
+    ----------
+    results:Results
+        Bundle of conversion, selectivity, yield and activity data wrappers
+    """
+    if results.get_conversion():
+        print(results.get_conversion())
+    if results.get_selectivity():
+        print(results.get_selectivity())
+    if results.get_yield():
+        print(f'Yield\n{results.get_yield()}')
+    if results.get_activity():
+        print(results.get_activity())
+
+def _get_fingerprint(cache:ParseCache|None, input_data_path:Path, initial_data_path:Path, reaction:str, *options) -> str:
+    """
+    Get fingerprint of input data files, reaction definition (including stoichiometric coefficients of products) and calculation options used as a key for cached calculation results. If input data are stored in archive, whole archive file and paths inside it are used for fingerprint. If initial data path is a directory, all replicate files in it are used.
+
+    parameters
+    ----------
+    cache:ParseCache|None
+        cache used to get content hashes of files or None if files must be hashed
+    input_data_path:Path
+        path to directory with input data files
+    initial_data_path:Path
+        path to file or directory with initial gas composition data
+    reaction:str
+        chemical reaction to calculate data for
+    options
+        other options of calculation
+
+    returns
+    -------
+    fingerprint:str
+        fingerprint of calculation
+    """
+    files = sorted(file for file in input_data_path.iterdir() if file != initial_data_path and file.is_file()) if input_data_path.is_dir() else []
+    definition = reaction
+    if reaction in reaction_factory.get_reaction_names():
+        reaction_definition = reaction_factory.get_reaction(reaction)
+        coefficients = reaction_definition.get_product_coefficients()
+        definition = f'{reaction_definition} {None if coefficients is None else coefficients.tolist()}'
+    replicates = sorted(file for file in initial_data_path.iterdir() if file.is_file()) if initial_data_path.is_dir() else []
+    paths = [initial_data_path] + replicates + files
+    for data_path in [input_data_path, initial_data_path]:
+        archive_path = archive.split_path(data_path)
+        if archive_path is not None:
+            paths.append(archive_path[0])
+            options = options + (archive_path[1],)
+    paths = [path for path in paths if path.is_file()]
+    if cache is None:
+        return parse_cache.get_fingerprint([(path.name, parse_cache.get_digest(path)) for path in paths], definition, *options)
+    return cache.get_fingerprint(paths, definition, *options)
+
+def calculate(input_data_path:str, initial_data_path:str, reaction:str, settings:CalculationSettings) -> Results:
     """
-    Print results for conversion and/or selectivities vs. temperature to console.
+    Main interface to module. Parses input data from equipment capable of measuring composition and, ideally, initial and final gas total flow rate. Calculates conversion, selectivity, yield and/or activity data from input data in a single pass and runs additional analyses enabled in settings. Prints results to console if requested and returns them. If output data path was provided exports results. If show_plot is set, shows resulting plots. If output plot path was provided, exports corresponding plots.
 
     parameters
     ----------
-    conversion:Conversion
-        Reactant conversions at different temperatures data wrapper
-    selectivity:Selectivity
-        Catalyst selectivities for different product components at different temperatures data wrapper
+    input_data_path:str
+        Path to directory with input data files
+    initial_data_path:str
+        Path to file with gas composition data without catalyst (i.e. no reaction occured) or to directory with replicate files of such data, which are aggregated into single measurement
+    reaction:str {co-oxidation|co2-hydrogenation|co2-methanation|rwgs|dry-reforming|co-prox|co2-hydrogenation-oxygenates|<reaction declared in config.py>}
+        Chemical reaction to calculate data for
+    settings:CalculationSettings
+        Options of calculation, output and additional analyses
+
+    returns
+    -------
+    results:Results
+        Bundle of calculated conversion, selectivity, yield and activity data wrappers
+
+    raises
+    ------
+    exception:CalculatorException
+        if nothing to calculate
     """
-    if conversion:
-        print(conversion)
-    if selectivity:
-        print(selectivity)
+    if not settings.is_calculated():
+        raise CalculatorException('Nothing to calculate')
+    calculator = calculator_factory.get_calculator(reaction, settings.products_basis, settings.tracer)
+    output_data_path = settings.output_data_path
+    exporter = None if output_data_path is None else exporter_factory.get_exporter(reaction)
+    cache = None if settings.cache_path is None else ParseCache(Path(settings.cache_path).expanduser().resolve(), settings.parser_type, settings.cache_max_size)
+    options = settings.get_result_options()
+    parser = parser_factory.get_parser(settings.parser_type, workers=settings.parser_workers, pool_type=settings.parser_pool_type, chunk_size=settings.parser_chunk_size, cache=cache, replicate_statistic=settings.replicate_statistic, outlier_threshold=settings.outlier_threshold)
+    results = None
+    raw_data = None
+    input_data = None
+    replicate_aggregation = None
+    fingerprint = None
+    if cache is not None or settings.export_binary:
+        fingerprint = _get_fingerprint(cache, Path(input_data_path).resolve(), Path(initial_data_path).resolve(), reaction, *options.values(), settings.sample_name)
+    if cache is not None:
+        results = cache.get_result(fingerprint)
+    if results is None:
+        raw_data, input_data, replicate_aggregation = _parse_input_data(parser, Path(input_data_path).resolve(), Path(initial_data_path).resolve(), settings)
+        results = _calculate_results(calculator, input_data, settings)
+        if cache is not None:
+            cache.put_result(fingerprint, results)
+    elif settings.aggregate_replicates or settings.uncertainty_draws > 0 or settings.calculate_time_on_stream or settings.check_balance or settings.calculate_equilibrium:
+        raw_data, input_data, replicate_aggregation = _parse_input_data(parser, Path(input_data_path).resolve(), Path(initial_data_path).resolve(), settings)
+    if settings.print_results:
+        _print_results(results)
+    if replicate_aggregation is not None:
+        if settings.print_results:
+            print(replicate_aggregation)
+        if output_data_path is not None:
+            exporter.export_replicates(Path(output_data_path).resolve(), replicate_aggregation)
+    if settings.check_balance:
+        sample_balance = balance.get_balance(calculator, input_data, settings.balance_threshold)
+        if settings.print_results:
+            print(sample_balance)
+        if output_data_path is not None:
+            exporter.export_balance(Path(output_data_path).resolve(), sample_balance)
+    if settings.uncertainty_draws > 0:
+        errors = dict(settings.uncertainty_errors or {})
+        initial_replicates_path = settings.initial_replicates_path
+        if initial_replicates_path is None and Path(initial_data_path).resolve().is_dir():
+            initial_replicates_path = initial_data_path
+        if initial_replicates_path is not None:
+            errors.update(uncertainty.get_replicate_errors(_parse_replicates(parser, Path(initial_replicates_path).resolve())))
+        sample_uncertainty = uncertainty.estimate_uncertainty(calculator, input_data, settings.uncertainty_draws, errors, settings.uncertainty_confidence, settings.calculate_conversion, settings.calculate_selectivity, settings.calculate_yield, settings.light_off_method, settings.uncertainty_seed)
+        if settings.print_results:
+            print(sample_uncertainty)
+        if output_data_path is not None:
+            exporter.export_uncertainty(Path(output_data_path).resolve(), sample_uncertainty)
+    if settings.calculate_time_on_stream:
+        sample_time_on_stream = time_on_stream.get_time_on_stream(calculator, raw_data, settings.deactivation_model, settings.time_on_stream_tolerance)
+        _output_time_on_stream(sample_time_on_stream, exporter, settings)
+    sample_equilibrium = None
+    if settings.calculate_equilibrium:
+        sample_equilibrium = equilibrium.get_equilibrium(calculator.get_reaction(), input_data.get_init_concs(), equilibrium.get_temperature_grid(input_data.get_temperatures(), settings.equilibrium_step), settings.equilibrium_pressure, cache)
+        if settings.print_results:
+            print(sample_equilibrium)
+        if output_data_path is not None:
+            exporter.export_equilibrium(Path(output_data_path).resolve(), sample_equilibrium)
+    _output_results(results, reaction, settings, settings.show_plot, cache, sample_equilibrium, exporter=exporter)
+    if cache is not None:
+        cache.close()
+    if settings.export_binary and output_data_path is not None:
+        exporter.export_binary(Path(output_data_path).resolve(), results, {'reaction':reaction, 'parser_type':settings.parser_type, 'options':options, 'fingerprint':fingerprint})
+    return results
 
-def calculate(input_data_path:str, initial_data_path:str, reaction:str, parser_type:str, calculate_conversion:bool, calculate_selectivity:bool, products_basis:bool=False, output_data_path:str|None=None, show_plot:bool=False, output_plot_path:str|None=None, sample_name:str|None=None):
+def watch(input_data_path:str, initial_data_path:str, reaction:str, settings:CalculationSettings, watch_method:str='auto', watch_interval:float=2.0, max_updates:int|None=None):
     """
-    Main interface to module. Parses input data from equipment capable of measuring composition and, ideally, initial and final gas total flow rate. Calculates conversion and/or selectivity data from input data. Prints results to console. If output_data_path was provided exports results. If show_plot is True, shows resulting plots. If output_plot_path was provided, exports corresponding plots.
+    Watch mode of calculate function. Parses all files in input data directory, calculates and outputs results as calculate function does and then waits for new, changed or removed files. Only those files are parsed again and their rows are updated in columnar buffer of raw data, results are recalculated only for these rows and are written to parallel buffer of results (all rows are recalculated if initial data file is changed), after which results are printed and exported files and plot are refreshed. Watching stops on KeyboardInterrupt or after max_updates updates.
 
     parameters
     ----------
@@ -39,41 +198,381 @@ def calculate(input_data_path:str, initial_data_path:str, reaction:str, parser_t
         Path to directory with input data files
     initial_data_path:str
         Path to file with gas composition data without catalyst (i.e. no reaction occured)
-    reaction:str {co-oxidation|co2-hydrogenation}
+    reaction:str {co-oxidation|co2-hydrogenation|co2-methanation|rwgs|dry-reforming|co-prox|co2-hydrogenation-oxygenates|<reaction declared in config.py>}
         Chemical reaction to calculate data for
-    parser_type:str {chromatec-crystal-composition-copy-paste}
-        Parser type to use for parsing input data
-    calculate_conversion:bool
-        Whether to calculate conversion
-    calculate_selectivity:bool
-        Whether to calculate selectivity
-    products_bases:bool (default:False)
-        If True, calculate conversion based on products concentrations
-    output_data_path:str|None {default:None}
+    settings:CalculationSettings
+        Options of calculation and output, plot is not shown and only light-off metrics and Arrhenius fit are taken from additional analyses
+    watch_method:str {auto|inotify|poll} (default:auto)
+        Method used to watch input data directory, inotify is used if available when auto
+    watch_interval:float (default:2.0)
+        Time between scans of input data directory in s if polling is used
+    max_updates:int|None (default:None)
+        Number of updates after which watching stops, watch until KeyboardInterrupt if None
+
+    raises
+    ------
+    exception:CalculatorException
+        if nothing to calculate
+    """
+    if not settings.is_calculated():
+        raise CalculatorException('Nothing to calculate')
+    calculator = calculator_factory.get_calculator(reaction, settings.products_basis, settings.tracer)
+    parser = parser_factory.get_parser(settings.parser_type)
+    input_path = Path(input_data_path).resolve()
+    initial_path = Path(initial_data_path).resolve()
+    if not input_path.is_dir():
+        raise ParserException(f'input data path {input_path} must be a directory')
+    directory_watcher = watcher.get_watcher(input_path, watch_method, watch_interval)
+    initial = parser.parse_initial(initial_path)
+    exporter, plotter = _get_outputs(reaction, settings.output_data_path, False, settings.output_plot_path)
+    builder = RawDataBuilder()
+    results_buffer = ResultsBuffer()
+    rows = {}
+    _, updated = _update_rows(parser, builder, results_buffer, rows, sorted(input_path.iterdir()), initial_path)
+    _recalculate_rows(calculator, builder, results_buffer, [rows[path] for path in updated if path in rows], initial, settings)
+    updates = 0
+    try:
+        while True:
+            if len(builder) > 0:
+                results = results_buffer.build(settings.sample_name)
+                _print_results(results)
+                _output_results(results, reaction, settings, False, exporter=exporter, plotter=plotter)
+            updates = updates + 1
+            if max_updates is not None and updates >= max_updates:
+                break
+            changed = 0
+            while changed == 0:
+                paths = directory_watcher.wait()
+                initial_changed = False
+                if initial_path in paths:
+                    try:
+                        initial = parser.parse_initial(initial_path)
+                        initial_changed = True
+                        changed = changed + 1
+                    except ParserException as e:
+                        print(f'Cannot parse initial data file, previous data are used: {e}')
+                changed_rows, updated = _update_rows(parser, builder, results_buffer, rows, sorted(paths), initial_path)
+                changed = changed + changed_rows
+                _recalculate_rows(calculator, builder, results_buffer, range(len(builder)) if initial_changed else [rows[path] for path in updated if path in rows], initial, settings)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        directory_watcher.close()
+
+def stream(input_stream:BinaryIO, initial_data_path:str, reaction:str, settings:CalculationSettings, separator:bytes=b'\x1e', flush_interval:int=10) -> Results|None:
+    """
+    Streaming mode of calculate function. Reads concatenated measurement records in the same format as data files separated by record separator from binary stream (e.g. stdin or FIFO). Each record is parsed and appended to columnar buffer of raw data as soon as it arrives, results are calculated only for this record and are appended to parallel buffer of results, after which a line with the record number and temperature is printed. Exported files and plot are refreshed every flush_interval records and when the stream ends. Results are printed when the stream ends.
+
+    parameters
+    ----------
+    input_stream:BinaryIO
+        Binary stream with records
+    initial_data_path:str
+        Path to file with gas composition data without catalyst (i.e. no reaction occured)
+    reaction:str {co-oxidation|co2-hydrogenation|co2-methanation|rwgs|dry-reforming|co-prox|co2-hydrogenation-oxygenates|<reaction declared in config.py>}
+        Chemical reaction to calculate data for
+    settings:CalculationSettings
+        Options of calculation and output, plot is not shown and only light-off metrics and Arrhenius fit are taken from additional analyses
+    separator:bytes (default:ASCII record separator)
+        Record separator
+    flush_interval:int (default:10)
+        Number of records after which exported files and plot are refreshed
+
+    returns
+    -------
+    results:Results|None
+        Results calculated from all records or None if no valid records were read
+
+    raises
+    ------
+    exception:CalculatorException
+        if nothing to calculate or flush interval is less than 1
+    """
+    if not settings.is_calculated():
+        raise CalculatorException('Nothing to calculate')
+    if flush_interval < 1:
+        raise CalculatorException('Flush interval must be positive')
+    calculator = calculator_factory.get_calculator(reaction, settings.products_basis, settings.tracer)
+    parser = parser_factory.get_parser(settings.parser_type)
+    initial = parser.parse_initial(Path(initial_data_path).resolve())
+    exporter, plotter = _get_outputs(reaction, settings.output_data_path, False, settings.output_plot_path)
+    builder = RawDataBuilder()
+    results_buffer = ResultsBuffer()
+    flushed = 0
+    for number, record in enumerate(record_stream.read_records(input_stream, separator), start=1):
+        try:
+            chromatogram = parser.parse_bytes(record, f'record {number}')
+        except ParserException as e:
+            print(f'Skipping record {number}: {e}', flush=True)
+            continue
+        builder.append(chromatogram)
+        _recalculate_rows(calculator, builder, results_buffer, [len(builder) - 1], initial, settings)
+        print(f'Record {number}\t{chromatogram.get_temperature()}', flush=True)
+        if len(builder) - flushed >= flush_interval:
+            _output_results(results_buffer.build(settings.sample_name), reaction, settings, False, exporter=exporter, plotter=plotter)
+            flushed = len(builder)
+    if len(builder) == 0:
+        return None
+    results = results_buffer.build(settings.sample_name)
+    if len(builder) > flushed:
+        _output_results(results, reaction, settings, False, exporter=exporter, plotter=plotter)
+    _print_results(results)
+    return results
+
+def _update_rows(parser:Parser, builder:RawDataBuilder, results_buffer:ResultsBuffer, rows:dict[Path,int], paths:list[Path], initial_data_path:Path) -> tuple[int,list[Path]]:
+    """
+    Parse new or changed files and write them to rows of columnar buffer, remove rows of deleted or broken files from buffers of raw data and results. Results of new or changed rows must be recalculated afterwards (see _recalculate_rows).
+
+    parameters
+    ----------
+    parser:Parser
+        parser used to parse files
+    builder:RawDataBuilder
+        columnar buffer with raw data
+    results_buffer:ResultsBuffer
+        columnar buffer with results parallel to rows of raw data
+    rows:dict[Path,int]
+        dictionary of files and their rows in buffer in a format {<path>:<row>}, it is updated by this function
+    paths:list[Path]
+        paths to new, changed or removed files
+    initial_data_path:Path
+        path to file with initial data, it is not written to buffer
+
+    returns
+    -------
+    (changed, updated):tuple[int,list[Path]]
+        number of added, changed or removed rows and paths to files which were added or changed
+    """
+    changed = 0
+    updated = []
+    for path in paths:
+        if path == initial_data_path:
+            continue
+        chromatogram = None
+        if path.is_file():
+            try:
+                chromatogram = parser.parse_file(path)
+            except ParserException as e:
+                print(f'Skipping file {path}: {e}')
+        if chromatogram is None:
+            if path in rows:
+                row = rows.pop(path)
+                builder.remove(row)
+                if row < len(results_buffer):
+                    results_buffer.remove(row)
+                for other, other_row in rows.items():
+                    if other_row > row:
+                        rows[other] = other_row - 1
+                changed = changed + 1
+        elif path in rows:
+            builder.replace(rows[path], chromatogram)
+            updated.append(path)
+            changed = changed + 1
+        else:
+            rows[path] = len(builder)
+            builder.append(chromatogram)
+            updated.append(path)
+            changed = changed + 1
+    return (changed, updated)
+
+def _recalculate_rows(calculator:ReactionCalculator, builder:RawDataBuilder, results_buffer:ResultsBuffer, rows:list[int], initial:Chromatogram, settings:CalculationSettings):
+    """
+    Calculate results only for specified rows of raw data buffer and write them to the same rows of results buffer. Rows are sorted by temperature before calculation, so that calculated results are parallel to rows. Conversions parallel to rows are taken from calculator separately, since conversion wrapper orders measurements done at the same temperature by conversion.
+
+    parameters
+    ----------
+    calculator:ReactionCalculator
+        calculator of results
+    builder:RawDataBuilder
+        columnar buffer with raw data
+    results_buffer:ResultsBuffer
+        columnar buffer with results parallel to rows of raw data
+    rows:list[int]
+        indices of rows to recalculate
+    initial:Chromatogram
+        chromatogram measured before catalytic reaction started
+    settings:CalculationSettings
+        options of calculation
+    """
+    rows = np.unique(np.asarray(rows, dtype=int))
+    if len(rows) == 0:
+        return
+    rows = rows[np.argsort(builder.get_temperatures()[rows], kind='stable')]
+    input_data = builder.build(initial, settings.sample_name, rows)
+    results = _calculate_results(calculator, input_data, settings)
+    alphas = calculator.calculate_alphas(input_data) if results.get_conversion() is not None else None
+    results_buffer.write(rows, input_data.get_temperatures(), results, alphas)
+
+def _get_outputs(reaction:str, output_data_path:str|None, show_plot:bool, output_plot_path:str|None) -> tuple[Exporter|None, Plotter|None]:
+    """
+    Create exporter and plotter for reaction once, so that they can be reused when results are output repeatedly.
+
+    parameters
+    ----------
+    reaction:str
+        Chemical reaction results are calculated for
+    output_data_path:str|None
         Path to directory to export results in text format
-    show_plot:bool {default:False}
+    show_plot:bool
         Whether to show resulting plot
-    output_plot_path:str|None {default:None}
+    output_plot_path:str|None
         Path to directory to export resulting plot
-    sample_name:str|None (default:None)
-        Sample name which will be appended at the beginning of resulting data and as a plot title on resulting plot
+
+    returns
+    -------
+    outputs:tuple[Exporter|None, Plotter|None]
+        exporter or None if results are not exported and plotter or None if results are not plotted
     """
-    if not (calculate_conversion or calculate_selectivity):
-        raise CalculatorException('Nothing to calculate')
-    calculator = calculator_factory.get_calculator(reaction, products_basis)
-    parser = parser_factory.get_parser(parser_type)
-    input_data = parser.parse_data(Path(input_data_path).resolve(), Path(initial_data_path).resolve(), sample_name)
-    conversion = None
-    selectivity = None
-    if calculate_conversion:
-        conversion = calculator.calculate_conversion(input_data)
-    if calculate_selectivity:
-        selectivity = calculator.calculate_selectivity(input_data)
-    _print_results(conversion, selectivity)
-    if output_data_path is not None:
-        exporter = exporter_factory.get_exporter(reaction)
-        exporter.export(Path(output_data_path).resolve(), conversion, selectivity)
+    exporter = None if output_data_path is None else exporter_factory.get_exporter(reaction)
+    plotter = None
     if show_plot or (output_plot_path is not None):
+        # matplotlib is imported only if plot is requested
+        from pycatalicism.calc import plotter_factory
         plotter = plotter_factory.get_plotter(reaction)
+    return (exporter, plotter)
+
+def _parse_replicates(parser:Parser, replicates_path:Path) -> list[Chromatogram]:
+    """
+    Parse replicate chromatograms of initial gas composition
+
+    parameters
+    ----------
+    parser:Parser
+        parser of chromatograms
+    replicates_path:Path
+        path to directory with replicate chromatograms
+
+    returns
+    -------
+    chromatograms:list[Chromatogram]
+        parsed chromatograms in order of sorted file names
+
+    raises
+    ------
+    exception:ParserException
+        if replicates path is not a directory
+    """
+    if not replicates_path.is_dir():
+        raise ParserException(f'initial replicates path {replicates_path} must be a directory')
+    return [parser.parse_file(path) for path in sorted(replicates_path.iterdir()) if path.is_file()]
+
+def _parse_input_data(parser:Parser, input_data_path:Path, initial_data_path:Path, settings:CalculationSettings) -> tuple[RawData,RawData,Aggregation|None]:
+    """
+    Parse input data and aggregate replicate measurements done at the same temperature if requested.
+
+    parameters
+    ----------
+    parser:Parser
+        parser of input data
+    input_data_path:Path
+        path to directory with input data files
+    initial_data_path:Path
+        path to file or directory with initial data
+    settings:CalculationSettings
+        settings with sample name and options of aggregation of replicates
+
+    returns
+    -------
+    (raw_data, input_data, replicate_aggregation):tuple[RawData,RawData,Aggregation|None]
+        parsed data with all measurements, data used for calculation and aggregation of replicates, input_data is raw_data and replicate_aggregation is None if replicates are not aggregated
+    """
+    raw_data = parser.parse_data(input_data_path, initial_data_path, settings.sample_name)
+    if not settings.aggregate_replicates:
+        return (raw_data, raw_data, None)
+    input_data, replicate_aggregation = aggregation.aggregate_raw_data(raw_data, settings.replicate_statistic, settings.outlier_threshold, settings.replicate_resolution)
+    return (raw_data, input_data, replicate_aggregation)
+
+def _calculate_results(calculator:ReactionCalculator, input_data:RawData, settings:CalculationSettings) -> Results:
+    """
+    Calculate results requested in settings in a single pass over input data.
+
+    parameters
+    ----------
+    calculator:ReactionCalculator
+        calculator of reaction
+    input_data:RawData
+        data used for calculation
+    settings:CalculationSettings
+        settings with requested results and parameters of activity calculation
+
+    returns
+    -------
+    results:Results
+        bundle of calculated results
+    """
+    return calculator.calculate(input_data, calculate_conversion=settings.calculate_conversion, calculate_selectivity=settings.calculate_selectivity, calculate_yield=settings.calculate_yield, catalyst_mass=settings.catalyst_mass, flow_rate=settings.flow_rate, metal_loading=settings.metal_loading, metal_molar_mass=settings.metal_molar_mass)
+
+def _output_time_on_stream(sample_time_on_stream:time_on_stream.TimeOnStream, exporter:Exporter|None, settings:CalculationSettings):
+    """
+    Print, export and plot time-on-stream series and fitted deactivation parameters if requested.
+
+    parameters
+    ----------
+    sample_time_on_stream:TimeOnStream
+        time-on-stream series and fitted deactivation parameters
+    exporter:Exporter|None
+        Exporter shared by the caller, None if results are not exported
+    settings:CalculationSettings
+        settings with options of output
+    """
+    if settings.print_results:
+        print(sample_time_on_stream)
+    if settings.output_data_path is not None:
+        exporter.export_time_on_stream(Path(settings.output_data_path).resolve(), sample_time_on_stream)
+    if settings.show_plot or (settings.output_plot_path is not None):
+        # matplotlib is imported only if plot is requested
+        from pycatalicism.calc.time_on_stream_plotter import TimeOnStreamPlotter
+        plotter = TimeOnStreamPlotter()
+        plotter.plot_time_on_stream(sample_time_on_stream, settings.show_plot, None if settings.output_plot_path is None else Path(settings.output_plot_path).resolve())
+
+def _output_results(results:Results, reaction:str, settings:CalculationSettings, show_plot:bool, cache:ParseCache|None=None, sample_equilibrium:Equilibrium|None=None, exporter:Exporter|None=None, plotter:Plotter|None=None):
+    """
+    Export results together with light-off metrics and Arrhenius parameters, if they are enabled in settings, and plot results if requested. Conversion and selectivity are plotted only if at least one of them was calculated (e.g. not for activity only calculation). If plot is only exported and cache is provided, plot is rendered only if plot with the same data and style is not found in cache.
+
+    parameters
+    ----------
+    results:Results
+        Bundle of conversion, selectivity, yield and activity data wrappers
+    reaction:str
+        Chemical reaction results were calculated for
+    settings:CalculationSettings
+        Settings with output paths, sample name used as a plot title and options of light-off metrics and Arrhenius fit
+    show_plot:bool
+        Whether to show resulting plot
+    cache:ParseCache|None (default:None)
+        cache of rendered plots or None if plots must be rendered
+    sample_equilibrium:Equilibrium|None (default:None)
+        Thermodynamic equilibrium overlaid on plots
+    exporter:Exporter|None (default:None)
+        Exporter shared by the caller, new exporter for reaction is created if None
+    plotter:Plotter|None (default:None)
+        Plotter shared by the caller, new plotter for reaction is created if None
+    """
+    output_data_path = settings.output_data_path
+    output_plot_path = settings.output_plot_path
+    sample_name = settings.sample_name
+    if output_data_path is not None:
+        if exporter is None:
+            exporter = exporter_factory.get_exporter(reaction)
+        exporter.export_results(Path(output_data_path).resolve(), results)
+        if settings.calculate_light_off and results.get_conversion() is not None:
+            exporter.export_light_off(Path(output_data_path).resolve(), light_off.get_light_off(results.get_conversion(), results.get_yield(), method=settings.light_off_method))
+        if settings.fit_arrhenius and results.get_activity() is not None and results.get_activity().get_alphas() is not None:
+            exporter.export_arrhenius(Path(output_data_path).resolve(), kinetics.get_arrhenius_fit(results.get_activity(), settings.kinetics_max_conversion, settings.kinetics_confidence))
+    if (show_plot or (output_plot_path is not None)) and (results.get_conversion() is not None or results.get_selectivity() is not None):
+        if plotter is None:
+            # matplotlib is imported only if plot is requested
+            from pycatalicism.calc import plotter_factory
+            plotter = plotter_factory.get_plotter(reaction)
         path = None if output_plot_path is None else Path(output_plot_path).resolve()
-        plotter.plot(conversion, selectivity, show_plot, path, sample_name)
+        if cache is None or show_plot:
+            plotter.plot(results.get_conversion(), results.get_selectivity(), show_plot, path, sample_name, sample_equilibrium)
+            return
+        fingerprint = plotter.get_fingerprint(results.get_conversion(), results.get_selectivity(), sample_name, sample_equilibrium)
+        image = cache.get_plot(fingerprint)
+        if image is None:
+            plotter.plot(results.get_conversion(), results.get_selectivity(), False, path, sample_name, sample_equilibrium)
+            cache.put_plot(fingerprint, path.joinpath('result.png').read_bytes())
+        else:
+            path.mkdir(parents=True, exist_ok=True)
+            path.joinpath('result.png').write_bytes(image)
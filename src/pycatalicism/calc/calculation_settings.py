@@ -0,0 +1,188 @@
+"""
+Settings of calculation of catalyst characteristics passed as a single object to calc.calculate, calc.watch, calc.stream and batch.calculate_batch functions. Module does not import numpy, so that command line interface can create settings without loading calculation modules.
+"""
+
+class CalculationSettings():
+    """
+    Options of calculation, output and additional analyses. Options are stored in instance variables named after parameters of constructor. Additional analyses (light-off metrics, Arrhenius fit, uncertainty, time on stream, aggregation of replicates, balance and equilibrium) are done only if they are enabled.
+    """
+
+    def __init__(self, calculate_conversion:bool=False, calculate_selectivity:bool=False, calculate_yield:bool=False, products_basis:bool=False, catalyst_mass:float|None=None, flow_rate:float|None=None, metal_loading:float|None=None, metal_molar_mass:float|None=None, tracer:str|None=None, parser_type:str='chromatec-crystal-composition-copy-paste', parser_workers:int=1, parser_pool_type:str='process', parser_chunk_size:int=64, cache_path:str|None=None, cache_max_size:int=256*1024**2, output_data_path:str|None=None, show_plot:bool=False, output_plot_path:str|None=None, sample_name:str|None=None, print_results:bool=True, export_binary:bool=False, calculate_light_off:bool=False, light_off_method:str='interpolation', fit_arrhenius:bool=False, kinetics_max_conversion:float=0.15, kinetics_confidence:float=0.95, uncertainty_draws:int=0, uncertainty_errors:dict[str,float]|None=None, initial_replicates_path:str|None=None, uncertainty_confidence:float=0.95, uncertainty_seed:int|None=None, calculate_time_on_stream:bool=False, deactivation_model:str='exponential', time_on_stream_tolerance:float=1.0, aggregate_replicates:bool=False, replicate_statistic:str='mean', outlier_threshold:float|None=3.5, replicate_resolution:float=1.0, check_balance:bool=False, balance_threshold:float=0.05, calculate_equilibrium:bool=False, equilibrium_pressure:float=101325.0, equilibrium_step:float=5.0):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        calculate_conversion:bool (default:False)
+            Whether to calculate conversion
+        calculate_selectivity:bool (default:False)
+            Whether to calculate selectivity
+        calculate_yield:bool (default:False)
+            Whether to calculate yields of products
+        products_basis:bool (default:False)
+            If True, calculate conversion based on products concentrations
+        catalyst_mass:float|None (default:None)
+            Mass of catalyst in g, activity is calculated if provided
+        flow_rate:float|None (default:None)
+            Total gas flow rate before catalytic reactor in nml/min used for activity calculation instead of measured flow rate
+        metal_loading:float|None (default:None)
+            Active metal loading in wt.%, TOF is calculated if provided together with metal_molar_mass
+        metal_molar_mass:float|None (default:None)
+            Molar mass of active metal in g/mol
+        tracer:str|None (default:None)
+            Inert compound (e.g. He, N2 or Ar) used as internal standard to correct for change of total gas flow rate instead of gas-clock measurements
+        parser_type:str {chromatec-crystal-composition-copy-paste} (default:chromatec-crystal-composition-copy-paste)
+            Parser type to use for parsing input data
+        parser_workers:int (default:1)
+            Number of workers used to parse input data files
+        parser_pool_type:str {process|thread} (default:process)
+            Type of pool of workers used to parse input data files
+        parser_chunk_size:int (default:64)
+            Number of files sent to parser worker at once
+        cache_path:str|None (default:None)
+            Path to directory with persistent cache of parsed files and calculation results, cache is not used if None
+        cache_max_size:int (default:256 MiB)
+            Maximum size of cached data in bytes, least recently used entries are evicted if exceeded
+        output_data_path:str|None (default:None)
+            Path to directory to export results in text format
+        show_plot:bool (default:False)
+            Whether to show resulting plot
+        output_plot_path:str|None (default:None)
+            Path to directory to export resulting plot
+        sample_name:str|None (default:None)
+            Sample name which will be appended at the beginning of resulting data and as a plot title on resulting plot
+        print_results:bool (default:True)
+            Whether to print results to console
+        export_binary:bool (default:False)
+            Whether to export results to binary results.npz file in addition to text files, output_data_path must be provided
+        calculate_light_off:bool (default:False)
+            Whether to determine light-off metrics (T10, T50, T90, maximum conversion and temperatures of maximum yields) from conversion, they are exported to light_off.dat
+        light_off_method:str {interpolation|sigmoid} (default:interpolation)
+            Method used to determine light-off temperatures (also for confidence intervals of light-off temperatures in uncertainty estimation)
+        fit_arrhenius:bool (default:False)
+            Whether to fit apparent activation energy and pre-exponential factor to activity in differential regime, they are exported to arrhenius.dat
+        kinetics_max_conversion:float (default:0.15)
+            Maximum conversion of points in differential regime used for Arrhenius fit
+        kinetics_confidence:float (default:0.95)
+            Confidence level of intervals of apparent activation energy and pre-exponential factor
+        uncertainty_draws:int (default:0)
+            Number of Monte Carlo draws used to estimate confidence intervals of conversion, selectivities, yields and light-off temperatures, which are printed and exported to uncertainty.dat. Uncertainty is not estimated if 0
+        uncertainty_errors:dict[str,float]|None (default:None)
+            Standard deviations of input data (see ReactionCalculator.calculate_draws)
+        initial_replicates_path:str|None (default:None)
+            Path to directory with replicate chromatograms of initial gas composition, errors of initial data are estimated from them instead of uncertainty_errors. Initial data path is used if it is a directory and this path is not provided
+        uncertainty_confidence:float (default:0.95)
+            Confidence level of intervals
+        uncertainty_seed:int|None (default:None)
+            Seed of random numbers generator
+        calculate_time_on_stream:bool (default:False)
+            Whether to group measurements done at the same temperature by time of acquisition and fit deactivation model to conversion vs. time on stream. Series and fitted deactivation rates are printed, exported to time_on_stream.dat and plotted to time_on_stream.png
+        deactivation_model:str {exponential|linear} (default:exponential)
+            Model of deactivation fitted to time-on-stream series
+        time_on_stream_tolerance:float (default:1.0)
+            Maximum difference of temperatures of neighbouring measurements in °C, which are considered to be done at the same temperature
+        aggregate_replicates:bool (default:False)
+            Whether to aggregate replicate measurements done at the same temperature before calculation. Aggregated replicates are printed and exported to replicates.dat
+        replicate_statistic:str {mean|median} (default:mean)
+            Statistic used to aggregate replicate measurements and replicate files of initial data if initial data path is a directory
+        outlier_threshold:float|None (default:3.5)
+            Threshold of modified z-score used to reject outliers among replicates, outliers are not rejected if None
+        replicate_resolution:float (default:1.0)
+            Resolution of temperatures in °C used to find replicate measurements
+        check_balance:bool (default:False)
+            Whether to calculate conversion of key reactant on both bases and closure of basis element balance. Results are printed and exported to balance.dat, points exceeding balance_threshold are flagged
+        balance_threshold:float (default:0.05)
+            Maximum allowed difference of conversions on both bases and deviation of balance closure from unity
+        calculate_equilibrium:bool (default:False)
+            Whether to calculate thermodynamic equilibrium conversion and selectivities for initial gas composition. Equilibrium is printed, exported to equilibrium.dat and overlaid on plots
+        equilibrium_pressure:float (default:101325.0)
+            Total pressure in reactor in Pa used for equilibrium calculation
+        equilibrium_step:float (default:5.0)
+            Step of temperature grid of equilibrium calculation in °C
+        """
+        self.calculate_conversion = calculate_conversion
+        self.calculate_selectivity = calculate_selectivity
+        self.calculate_yield = calculate_yield
+        self.products_basis = products_basis
+        self.catalyst_mass = catalyst_mass
+        self.flow_rate = flow_rate
+        self.metal_loading = metal_loading
+        self.metal_molar_mass = metal_molar_mass
+        self.tracer = tracer
+        self.parser_type = parser_type
+        self.parser_workers = parser_workers
+        self.parser_pool_type = parser_pool_type
+        self.parser_chunk_size = parser_chunk_size
+        self.cache_path = cache_path
+        self.cache_max_size = cache_max_size
+        self.output_data_path = output_data_path
+        self.show_plot = show_plot
+        self.output_plot_path = output_plot_path
+        self.sample_name = sample_name
+        self.print_results = print_results
+        self.export_binary = export_binary
+        self.calculate_light_off = calculate_light_off
+        self.light_off_method = light_off_method
+        self.fit_arrhenius = fit_arrhenius
+        self.kinetics_max_conversion = kinetics_max_conversion
+        self.kinetics_confidence = kinetics_confidence
+        self.uncertainty_draws = uncertainty_draws
+        self.uncertainty_errors = uncertainty_errors
+        self.initial_replicates_path = initial_replicates_path
+        self.uncertainty_confidence = uncertainty_confidence
+        self.uncertainty_seed = uncertainty_seed
+        self.calculate_time_on_stream = calculate_time_on_stream
+        self.deactivation_model = deactivation_model
+        self.time_on_stream_tolerance = time_on_stream_tolerance
+        self.aggregate_replicates = aggregate_replicates
+        self.replicate_statistic = replicate_statistic
+        self.outlier_threshold = outlier_threshold
+        self.replicate_resolution = replicate_resolution
+        self.check_balance = check_balance
+        self.balance_threshold = balance_threshold
+        self.calculate_equilibrium = calculate_equilibrium
+        self.equilibrium_pressure = equilibrium_pressure
+        self.equilibrium_step = equilibrium_step
+
+    def replace(self, **options) -> 'CalculationSettings':
+        """
+        Get copy of settings with some options changed (e.g. output paths and sample name of each sample in batch calculation).
+
+        parameters
+        ----------
+        options
+            new values of options in a format <option>=<value>
+
+        returns
+        -------
+        settings:CalculationSettings
+            new settings object
+
+        raises
+        ------
+        exception:TypeError
+            if option is not known
+        """
+        return CalculationSettings(**(vars(self) | options))
+
+    def is_calculated(self) -> bool:
+        """
+        Check whether any result is requested: conversion, selectivity, yield or activity (if catalyst mass is provided).
+
+        returns
+        -------
+        calculated:bool
+            True if at least one result is requested
+        """
+        return self.calculate_conversion or self.calculate_selectivity or self.calculate_yield or self.catalyst_mass is not None
+
+    def get_result_options(self) -> dict:
+        """
+        Get options which affect calculated results, they are used as a part of fingerprint of cached results and stored in binary results file.
+
+        returns
+        -------
+        options:dict
+            options in a format {<option>:<value>}
+        """
+        return {'products_basis':self.products_basis, 'calculate_conversion':self.calculate_conversion, 'calculate_selectivity':self.calculate_selectivity, 'calculate_yield':self.calculate_yield, 'catalyst_mass':self.catalyst_mass, 'flow_rate':self.flow_rate, 'metal_loading':self.metal_loading, 'metal_molar_mass':self.metal_molar_mass, 'aggregate_replicates':self.aggregate_replicates, 'replicate_statistic':self.replicate_statistic, 'outlier_threshold':self.outlier_threshold, 'replicate_resolution':self.replicate_resolution, 'tracer':self.tracer}
@@ -1,13 +1,51 @@
+import numpy as np
+
 from pycatalicism.calc.rawdata import RawData
 from pycatalicism.calc.conversion import Conversion
 from pycatalicism.calc.selectivity import Selectivity
 from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.results import Results
 
 class Calculator():
     """
     Abstract class to calculate catalyst's activity, selectivity or conversion for different reactions of interest. Concrete classes should override corresponding abstract methods of this class.
     """
 
+    def calculate(self, input_data:RawData, calculate_conversion:bool=True, calculate_selectivity:bool=True, calculate_yield:bool=False, catalyst_mass:float|None=None, flow_rate:float|None=None, metal_loading:float|None=None, metal_molar_mass:float|None=None) -> Results:
+        """
+        Calculate all requested results in a single pass over input data. Abstract method, should be overriden by concrete classes.
+
+        parameters
+        ----------
+        input_data:RawData
+            input data for calculation containing concentrations of reaction participants at different temperatures
+        calculate_conversion:bool (default:True)
+            whether to calculate conversion
+        calculate_selectivity:bool (default:True)
+            whether to calculate selectivity
+        calculate_yield:bool (default:False)
+            whether to calculate yields
+        catalyst_mass:float|None (default:None)
+            mass of catalyst in g, activity is calculated only if provided
+        flow_rate:float|None (default:None)
+            total gas flow rate before catalytic reactor in nml/min
+        metal_loading:float|None (default:None)
+            active metal loading in wt.%
+        metal_molar_mass:float|None (default:None)
+            molar mass of active metal in g/mol
+
+        returns
+        -------
+        results:Results
+            Bundle of calculated results
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden but is used
+        """
+        raise NotImplementedError()
+
     def calculate_conversion(self, input_data:RawData) -> Conversion:
         """
         Calculate conversion vs. temperature data. Abstract method, should be overriden by concrete classes.
@@ -50,7 +88,7 @@ class Calculator():
         """
         raise NotImplementedError()
 
-    def calculate_activity(self, input_data:RawData) -> Activity:
+    def calculate_activity(self, input_data:RawData, catalyst_mass:float, flow_rate:float|None=None, metal_loading:float|None=None, metal_molar_mass:float|None=None) -> Activity|None:
         """
         Calculate activity vs. temperature data. Abstract method, should be overriden by concrete classes.
 
@@ -58,10 +96,18 @@ class Calculator():
         ----------
         input_data:RawData
             input data for calculation, containing concentrations of reaction participants at different temperatures
+        catalyst_mass:float
+            mass of catalyst in g
+        flow_rate:float|None (default:None)
+            total gas flow rate before catalytic reactor in nml/min
+        metal_loading:float|None (default:None)
+            active metal loading in wt.%
+        metal_molar_mass:float|None (default:None)
+            molar mass of active metal in g/mol
 
         returns
         -------
-        activity:Activity
+        activity:Activity|None
             Wrapper of activity vs. temperature data
 
         raises
@@ -70,3 +116,61 @@ class Calculator():
             if this method is not overriden but is used
         """
         raise NotImplementedError()
+
+    def calculate_yield(self, input_data:RawData) -> Selectivity:
+        """
+        Calculate yields of reaction products vs. temperature data. Abstract method, should be overriden by concrete classes.
+
+        parameters
+        ----------
+        input_data:RawData
+            input data for calculation, containing concentrations of reaction participants at different temperatures
+
+        returns
+        -------
+        yield:Selectivity
+            Wrapper of yields vs. temperature data stored in the same format as selectivities
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden but is used
+        """
+        raise NotImplementedError()
+
+    def _get_flow_data(self, input_data:RawData) -> tuple[float,float,float,np.ndarray,np.ndarray,np.ndarray]:
+        """
+        Get data of total gas flow rate measurement before and after catalytic reactor. Final values are returned as vectors parallel to temperatures of catalytic reaction, so that flow correction can be calculated for all temperatures at once. If flow rate measurement data is not provided, all values are set to 1 and warning is logged to console.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with flow rate data
+
+        returns
+        -------
+        (T_i, p_i, f_i, T_f, p_f, f_f):tuple
+            T_i:float
+                temperature of gas at point of total gas flow rate measurement before catalytic reactor
+            p_i:float
+                pressure of gas at point of total gas flow rate measurement before catalytic reactor
+            f_i:float
+                total gas flow rate before catalytic reactor
+            T_f:numpy.ndarray[float]
+                temperatures of gas at point of total gas flow rate measurement after catalytic reactor
+            p_f:numpy.ndarray[float]
+                pressures of gas at point of total gas flow rate measurement after catalytic reactor
+            f_f:numpy.ndarray[float]
+                total gas flow rates after catalytic reactor
+        """
+        T_i = input_data.get_init_amb_temp()
+        p_i = input_data.get_init_amb_pres()
+        f_i = input_data.get_init_flow()
+        T_f = input_data.get_fin_amb_temps()
+        p_f = input_data.get_fin_amb_pressures()
+        f_f = input_data.get_fin_flows()
+        if T_i is None or p_i is None or f_i is None or T_f is None or p_f is None or f_f is None:
+            self.logger.warning(f'No data about initial and final flow rate found. Calculating results based only on concentrations')
+            ones = np.ones(len(input_data.get_temperatures()))
+            return (1, 1, 1, ones, ones, ones)
+        return (T_i, p_i, f_i, T_f, p_f, f_f)
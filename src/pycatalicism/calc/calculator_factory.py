@@ -2,22 +2,26 @@ from pycatalicism.calc.calculator import Calculator
 from pycatalicism.calc.cooxidationcalculator import COOxidationCalculator
 from pycatalicism.calc.co2hydrogenationcalculator import CO2HydrogenationCalculator
 from pycatalicism.calc.co2hydrogenationproductsbasiscalculator import CO2HydrogenationProductsBasisCalculator
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+from pycatalicism.calc import reaction_factory
 from pycatalicism.calc.calculatorexception import CalculatorException
 
 """
 Factory to create calculator for proper reaction.
 """
 
-def get_calculator(reaction:str, products_basis:bool) -> Calculator:
+def get_calculator(reaction:str, products_basis:bool, tracer:str|None=None) -> Calculator:
     """
     Create calculator for reaction to calculate conversion, selectivity or activity vs. temperature data.
 
     parameters
     ----------
-    reaction:str {co-oxidation|co2-hydrogenation}
-        Chemical reaction for which to calculate results
+    reaction:str
+        Chemical reaction for which to calculate results. Reactions other than co-oxidation and co2-hydrogenation are calculated by generic calculator using reaction declarations from reaction_factory
     products_basis:bool
         If True, return calculator, which calculates conversion based on products composition
+    tracer:str|None (default:None)
+        Inert compound (e.g. He, N2 or Ar) used by calculator to correct for change of total gas flow rate instead of gas-clock measurements
 
     returns
     -------
@@ -26,15 +30,17 @@ def get_calculator(reaction:str, products_basis:bool) -> Calculator:
 
     raises
     ------
-    exception:Exception
+    exception:CalculatorException
         if reaction is not known
     """
     if reaction == 'co-oxidation':
-        return COOxidationCalculator()
+        return COOxidationCalculator(tracer)
     elif reaction == 'co2-hydrogenation':
         if products_basis:
-            return CO2HydrogenationProductsBasisCalculator()
+            return CO2HydrogenationProductsBasisCalculator(tracer)
         else:
-            return CO2HydrogenationCalculator()
+            return CO2HydrogenationCalculator(tracer=tracer)
+    elif reaction in reaction_factory.get_reaction_names():
+        return ReactionCalculator(reaction_factory.get_reaction(reaction), products_basis, tracer)
     else:
         raise CalculatorException(f'Cannot create calculator for reaction {reaction}')
@@ -1,8 +1,20 @@
+import re
 from pathlib import Path
+from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable
+
+import numpy as np
 
 from pycatalicism.calc.parser import Parser
 from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.calc.rawdata_builder import RawDataBuilder
 from pycatalicism.calc.parserexception import ParserException
+from pycatalicism.calc.parse_report import ParseReport
+from pycatalicism.calc.parse_cache import ParseCache
+from pycatalicism.calc import archive
+from pycatalicism.calc import aggregation
 from pycatalicism.logging_decorator import Logging
 
 class ChromatecCrystalCompositionCopyPasteParser(Parser):
@@ -12,6 +24,7 @@ class ChromatecCrystalCompositionCopyPasteParser(Parser):
     Data for this parser must be in the following format:
 
     Температура<tab><temperature>
+    [Дата анализа<tab><date-and-time>]
     <br>
     Название<tab>Время, мин<tab>Детектор<tab>Концентрация<tab>Ед, измерения<tab>Площадь<tab>Высота
     <compound-name><tab><retention-time><tab><detector-name><tab><compound-concentration><tab><concentration-units><tab><peak-area><tab><peak-height>
@@ -19,20 +32,56 @@ class ChromatecCrystalCompositionCopyPasteParser(Parser):
     Темп. (газовые часы)<tab><flow-temperature>
     Давление (газовые часы)<tab><flow-pressure>
     Поток<tab><flow-rate>]
+
+    Files are parsed as bytes in a single pass. Both UTF-8 and cp1251 encoded files are supported, decimal separator may be both "," and ".". Time of acquisition of chromatogram is taken from optional date line (e.g. 25.03.2023 14:05:30 or 2023-03-25T14:05:30) or, if it is absent, from file name written by measure command (e.g. 20230325_140530_sample_300.0.txt, only date is known for names without time).
     """
 
     @Logging
-    def __init__(self):
+    def __init__(self, workers:int=1, pool_type:str='process', chunk_size:int=64, cache:ParseCache|None=None, replicate_statistic:str='mean', outlier_threshold:float|None=3.5):
         """
-        Registers logger to the object which can be used by self.logger instance variable.
+        Registers logger to the object which can be used by self.logger instance variable. Assigns parameters of parallel parsing and cache to instance variables.
+
+        parameters
+        ----------
+        workers:int (default:1)
+            number of workers used to parse files, files are parsed serially if workers is 1
+        pool_type:str {process|thread} (default:process)
+            type of worker pool
+        chunk_size:int (default:64)
+            number of files sent to worker at once
+        cache:ParseCache|None (default:None)
+            persistent cache of parsed files or None if files must be parsed on each call
+        replicate_statistic:str {mean|median} (default:mean)
+            statistic used to aggregate replicate files of initial data
+        outlier_threshold:float|None (default:3.5)
+            threshold of modified z-score used to reject outliers among replicate files of initial data, outliers are not rejected if None
+
+        raises
+        ------
+        exception:ParserException
+            if pool type or statistic is not known or number of workers or chunk size is less than 1
         """
         super().__init__()
+        if pool_type not in ['process', 'thread']:
+            raise ParserException(f'unknown pool type {pool_type}')
+        if workers < 1 or chunk_size < 1:
+            raise ParserException('number of workers and chunk size must be positive')
+        if replicate_statistic not in aggregation.STATISTICS:
+            raise ParserException(f'unknown statistic {replicate_statistic}')
+        self.workers = workers
+        self.pool_type = pool_type
+        self.chunk_size = chunk_size
+        self.cache = cache
+        self.replicate_statistic = replicate_statistic
+        self.outlier_threshold = outlier_threshold
+        self.report = ParseReport()
 
     def parse_data(self, input_data_path:Path, initial_data_path:Path, sample_name:str|None) -> RawData:
         """
         Main interface to the class. Parses concentration, temperature and, if present, flow rate data from data files. Data must be in the following format:
 
         Температура<tab><temperature>
+        [Дата анализа<tab><date-and-time>]
         <br>
         Название<tab>Время, мин<tab>Детектор<tab>Концентрация<tab>Ед, измерения<tab>Площадь<tab>Высота
         <compound-name><tab><retention-time><tab><detector-name><tab><compound-concentration><tab><concentration-units><tab><peak-area><tab><peak-height>
@@ -41,7 +90,7 @@ class ChromatecCrystalCompositionCopyPasteParser(Parser):
         Давление (газовые часы)<tab><flow-pressure>
         Поток<tab><flow-rate>]
 
-        If format in a file is wrong that file is ignored and warning is logged via self.logger
+        Input data path can be a directory, zip or tar archive or directory inside archive, initial data path can be a file, a file inside archive or a directory with replicate files of initial data, which are aggregated into single chromatogram (see parse_initial). Files found in cache are not parsed again, other files are parsed in chunks by pool of workers if more than one worker was configured. Parsed data are merged in order of sorted file names. Directories found in input data path are skipped and warning is logged via self.logger. If format in a file is wrong that file is ignored and it is added to report which is logged via self.logger and is available via get_report method
 
         parameters
         ----------
@@ -60,53 +109,83 @@ class ChromatecCrystalCompositionCopyPasteParser(Parser):
         raises
         ------
         exception:ParserException
-            if initial_data_path is not file or if input_data_path is not directory
+            if initial_data_path is not file or directory or if input_data_path is not directory
         """
-        if not initial_data_path.is_file():
-            raise ParserException(f'initial data path {initial_data_path} must be a file')
-        if not input_data_path.is_dir():
+        input_archive = archive.split_path(input_data_path)
+        initial_archive = archive.split_path(initial_data_path)
+        if initial_archive is None and not (initial_data_path.is_file() or initial_data_path.is_dir()):
+            raise ParserException(f'initial data path {initial_data_path} must be a file or a directory')
+        if input_archive is None and not input_data_path.is_dir():
             raise ParserException(f'input data path {input_data_path} must be a directory')
-        _, Cs_i, Ta_i, Pa_i, f_i = self._parse_file(initial_data_path)
-        flow_is_measured = Ta_i and Pa_i and f_i
-        Ts = []
-        Cs_f = []
-        Ta_f = [] if flow_is_measured else None
-        Pa_f = [] if flow_is_measured else None
-        f_f = [] if flow_is_measured else None
-        for file in input_data_path.iterdir():
-            if file == initial_data_path:
-                continue
-            if file.is_dir():
-                self.logger.warning(f'Found directory {file} in input data path')
-                continue
-            try:
-                T, C, Ta, Pa, f = self._parse_file(file)
-            except ParserException:
-                self.logger.warning(f'Wrong data format in file {file}. Skipping.')
-                continue
-            Ts.append(T)
-            Cs_f.append(C)
-            if Ta_f is not None and Pa_f is not None and f_f is not None:
-                Ta_f.append(Ta)
-                Pa_f.append(Pa)
-                f_f.append(f)
-        rawdata = RawData(temperatures=Ts, initial_concentrations=Cs_i, concentrations=Cs_f, initial_ambient_temperature=Ta_i, initial_ambient_pressure=Pa_i, initial_flow=f_i, final_ambient_temperatures=Ta_f, final_ambient_pressures=Pa_f, final_flows=f_f, sample_name=sample_name)
-        return rawdata
+        if initial_archive is None:
+            initial = self.parse_initial(initial_data_path)
+        else:
+            initial = _parse_bytes(archive.read_member(*initial_archive), str(initial_data_path))
+        if input_archive is None:
+            files = []
+            for file in sorted(input_data_path.iterdir()):
+                if file == initial_data_path:
+                    continue
+                if file.is_dir():
+                    self.logger.warning(f'Found directory {file} in input data path')
+                    continue
+                files.append(file)
+            results = self._parse_files(files)
+        else:
+            results = self._parse_archive(input_archive[0], input_archive[1], initial_archive)
+        if self.cache is not None:
+            self.cache.commit()
+        return self._merge(results, initial, sample_name)
 
-    def _parse_file(self, path:Path) -> tuple[float,dict[str,float],float|None,float|None,float|None]:
+    def parse_initial(self, path:Path) -> Chromatogram:
         """
-        Parse single file with data. Data in a file must be in a following format:
+        Parse initial data. If path is a directory, all files in it are parsed as replicate chromatograms of initial gas composition (e.g. gathered by measure-init-concentration command), concentrations and flow rate data are aggregated by statistic configured for this parser with rejection of outliers. Cache is used the same way as for input data files.
 
-        Температура<tab><temperature>
-        <br>
-        Название<tab>Время, мин<tab>Детектор<tab>Концентрация<tab>Ед, измерения<tab>Площадь<tab>Высота
-        <compound-name><tab><retention-time><tab><detector-name><tab><compound-concentration><tab><concentration-units><tab><peak-area><tab><peak-height>
-        [<br>
-        Темп. (газовые часы)<tab><flow-temperature>
-        Давление (газовые часы)<tab><flow-pressure>
-        Поток<tab><flow-rate>]
+        parameters
+        ----------
+        path:Path
+            path to file with initial data or to directory with replicate files
+
+        returns
+        -------
+        chromatogram:Chromatogram
+            parsed data, replicates are aggregated into single chromatogram
 
-        All commas in a file is replaced with dots before parsing, so decimal separator may be both "," and "."
+        raises
+        ------
+        exception:ParserException
+            if file cannot be parsed or directory does not contain files in correct format
+        """
+        if not path.is_dir():
+            initial = self._parse_files([path])[0]
+            if not isinstance(initial, Chromatogram):
+                raise ParserException(initial[1])
+            return initial
+        results = self._parse_files(sorted(file for file in path.iterdir() if file.is_file()))
+        replicates = [result for result in results if isinstance(result, Chromatogram)]
+        for result in results:
+            if not isinstance(result, Chromatogram):
+                self.logger.warning(f'Skipping replicate of initial data {result[0]}: {result[1]}')
+        if not replicates:
+            raise ParserException(f'No replicates of initial data were found in {path}')
+        initial, replicate_aggregation = aggregation.aggregate_chromatograms(replicates, self.replicate_statistic, self.outlier_threshold, str(path))
+        self.logger.info(f'Aggregated {len(replicates)} replicates of initial data, {int(replicate_aggregation.get_rejected().sum())} outliers were rejected')
+        return initial
+
+    def get_report(self) -> ParseReport:
+        """
+        Get report about files processed by the last call of parse_data method
+
+        returns
+        -------
+        report:ParseReport
+            report with number of parsed files and errors
+        """
+        return self.report
+
+    def parse_file(self, path:Path) -> Chromatogram:
+        """
+        Parse single data file. Cache is not used by this method.
 
         parameters
         ----------
@@ -115,79 +194,505 @@ class ChromatecCrystalCompositionCopyPasteParser(Parser):
 
         returns
         -------
-        (T, C, Ta, Pa, f):tuple
-            T:float
-                temperature at which reaction taken place
-            C:dict[str:float]
-                dictionary of compounds and their concentrations in mol.%
-            Ta:float|None
-                temperature at which measurement of flow rate was done or None if not present in a file (NB: units)
-            Pa:float|None
-                pressure at which measurement of flow rate was done or None if not present in a file (NB: units)
-            f:float|None
-                total gas flow rate or None if not present in a file (NB: units)
+        chromatogram:Chromatogram
+            parsed data
+
+        raises
+        ------
+        exception:ParserException
+            if file cannot be read or data format is wrong
+        """
+        return _parse_file(path)
+
+    def parse_bytes(self, data:bytes, source:str) -> Chromatogram:
+        """
+        Parse contents of single data file or record already read to memory.
+
+        parameters
+        ----------
+        data:bytes
+            contents of data file
+        source:str
+            name of data source used in error messages
+
+        returns
+        -------
+        chromatogram:Chromatogram
+            parsed data
 
         raises
         ------
         exception:ParserException
             if data format is wrong
         """
-        try:
-            file_contents = self._replace_commas_with_dots(path)
-        except UnicodeDecodeError:
-            raise ParserException(f'Non unicode file {path}')
-        T = None
-        C = {}
-        Ta = None
-        Pa = None
-        f = None
-        lines = file_contents.split(sep='\n')
-        while lines:
-            line = lines.pop(0)
-            words = line.split(sep='\t')
-            self.logger.debug(f'processing line: "{line}"')
-            if 'Температура' in words:
-                T = float(words[1])
-            if 'Название' in words and 'Концентрация' in words:
-                compound_index = words.index('Название')
-                concentration_index = words.index('Концентрация')
-                while True:
-                    if lines:
-                        line = lines.pop(0)
-                        words = line.split(sep='\t')
-                        if line == '':
-                            break
-                        self.logger.debug(f'processing line: "{line}"')
-                        compound = words[compound_index]
-                        concentration = words[concentration_index]
-                        C[compound] = float(concentration)
-                    else:
-                        break
-            if 'Темп. (газовые часы)' in words:
-                Ta = float(line.split(sep='\t')[1])
-            if 'Давление (газовые часы)' in words:
-                Pa = float(line.split(sep='\t')[1])
-            if 'Поток' in words:
-                f = float(line.split(sep='\t')[1])
-        if T is None or len(C) == 0:
-            raise ParserException(f'Wrong data format in file {path}')
-        return (T, C, Ta, Pa, f)
-
-    def _replace_commas_with_dots(self, path:Path) -> str:
-        """
-        replace all commas with dots in a file
+        return _parse_bytes(data, source)
+
+    def _parse_files(self, files:list[Path]) -> list[Chromatogram|tuple[str,str]]:
+        """
+        Parse files taking already parsed ones from cache. Files not found in cache are parsed in chunks by pool of workers if more than one worker was configured and are stored to cache.
+
+        parameters
+        ----------
+        files:list[Path]
+            paths to files with data
+
+        returns
+        -------
+        results:list[Chromatogram|tuple[str,str]]
+            list parallel to files with parsed chromatogram or tuple (<file>, <error>) if file was not parsed
+        """
+        results = [None] * len(files)
+        digests = {}
+        if self.cache is not None:
+            for i, file in enumerate(files):
+                try:
+                    digests[i] = self.cache.get_digest(file)
+                except OSError:
+                    continue
+                results[i] = self.cache.get_chromatogram(digests[i], file.name)
+        pending = [i for i, result in enumerate(results) if result is None]
+        self.logger.debug(f'Found {len(files) - len(pending)} of {len(files)} files in cache')
+        chunks = [[files[i] for i in pending[j:j+self.chunk_size]] for j in range(0, len(pending), self.chunk_size)]
+        parsed = self._map_chunks(_parse_chunk, chunks)
+        for i, result in zip(pending, parsed):
+            results[i] = result
+            if self.cache is not None and i in digests and isinstance(result, Chromatogram):
+                self.cache.put_chromatogram(digests[i], files[i].name, result)
+        return results
+
+    def _parse_archive(self, archive_path:Path, directory:str, initial_archive:tuple[Path,str]|None) -> list[Chromatogram|tuple[str,str]]:
+        """
+        Parse files located in directory inside archive without extracting them to disk. Members of zip archive are read and parsed in chunks by pool of workers if more than one worker was configured, tar archive is read sequentially in a single pass and its members are parsed by pool of workers. Cache is not used for archives.
 
         parameters
         ----------
-            path:Path
-                path to file for processing
+        archive_path:Path
+            path to archive file
+        directory:str
+            path of directory with data files inside archive
+        initial_archive:tuple[Path,str]|None
+            archive and member of initial data file, which is excluded from parsed files, or None if initial data file is not in archive
 
         returns
         -------
-            new_contents:str
-                string with file contents in which commas were replaced with dots
+        results:list[Chromatogram|tuple[str,str]]
+            list with parsed chromatogram or tuple (<file>, <error>) if file was not parsed in order of sorted members names
         """
-        with path.open(mode='r') as file:
-            contents = file.read()
-            new_contents = contents.replace(',', '.')
-        return new_contents
+        members = [member for member in archive.list_members(archive_path, directory) if initial_archive is None or (archive_path, member) != initial_archive]
+        self.logger.debug(f'Parsing {len(members)} files from archive {archive_path}')
+        if archive.is_zip(archive_path):
+            chunks = [(archive_path, members[j:j+self.chunk_size]) for j in range(0, len(members), self.chunk_size)]
+            return self._map_chunks(_parse_archive_chunk, chunks)
+        contents = dict(archive.iter_members(archive_path, members))
+        chunks = [[(f'{archive_path}/{member}', contents.get(member)) for member in members[j:j+self.chunk_size]] for j in range(0, len(members), self.chunk_size)]
+        return self._map_chunks(_parse_bytes_chunk, chunks)
+
+    def _map_chunks(self, function:Callable[[Any], list[Chromatogram|tuple[str,str]]], chunks:list) -> list[Chromatogram|tuple[str,str]]:
+        """
+        Apply parsing function to chunks serially or by pool of workers if more than one worker was configured and concatenate results in order of chunks.
+
+        parameters
+        ----------
+        function:Callable
+            module level function parsing single chunk
+        chunks:list
+            chunks of data to parse
+
+        returns
+        -------
+        results:list[Chromatogram|tuple[str,str]]
+            concatenated results of function
+        """
+        if self.workers == 1 or len(chunks) < 2:
+            return [result for chunk in map(function, chunks) for result in chunk]
+        executor_class = ProcessPoolExecutor if self.pool_type == 'process' else ThreadPoolExecutor
+        self.logger.debug(f'Parsing {len(chunks)} chunks with {self.workers} {self.pool_type} workers')
+        with executor_class(max_workers=self.workers) as executor:
+            return [result for chunk in executor.map(function, chunks) for result in chunk]
+
+    def _merge(self, results:list[Chromatogram|tuple[str,str]], initial:Chromatogram, sample_name:str|None) -> RawData:
+        """
+        Merge parsed files into RawData in order of input files. Errors are collected to the report which is logged as a single warning.
+
+        parameters
+        ----------
+        results:list[Chromatogram|tuple[str,str]]
+            parsed chromatograms or tuples (<file>, <error>) in order of input files
+        initial:Chromatogram
+            chromatogram measured before catalytic reaction started
+        sample_name:str|None
+            name of sample used as label for plotting
+
+        returns
+        -------
+        raw_data:RawData
+            wrapper with parsed data
+        """
+        self.report = ParseReport()
+        builder = RawDataBuilder(capacity=len(results))
+        for result in results:
+            if isinstance(result, Chromatogram):
+                builder.append(result)
+                self.report.add_parsed()
+            else:
+                self.report.add_error(*result)
+        if len(self.report):
+            self.logger.warning(f'Some files in input data path were skipped:\n{self.report}')
+        return builder.build(initial, sample_name)
+
+_BOM = b'\xef\xbb\xbf'
+
+_ENCODINGS = ['utf-8', 'cp1251']
+
+_KEYWORDS = {encoding:{'temperature':'Температура'.encode(encoding),
+                       'compound':'Название'.encode(encoding),
+                       'concentration':'Концентрация'.encode(encoding),
+                       'time':'Время, мин'.encode(encoding),
+                       'detector':'Детектор'.encode(encoding),
+                       'area':'Площадь'.encode(encoding),
+                       'height':'Высота'.encode(encoding),
+                       'ambient_temperature':'Темп. (газовые часы)'.encode(encoding),
+                       'ambient_pressure':'Давление (газовые часы)'.encode(encoding),
+                       'flow':'Поток'.encode(encoding),
+                       'timestamp':'Дата анализа'.encode(encoding)} for encoding in _ENCODINGS}
+
+_DATE_FORMATS = ['%d.%m.%Y %H:%M:%S', '%d.%m.%Y %H:%M', '%d.%m.%Y']
+
+_NAME_TIMESTAMP = re.compile(r'(?<!\d)(\d{8})(?:[_T-](\d{6}))?(?!\d)')
+
+def _detect_encoding(data:bytes) -> str:
+    """
+    Detect encoding of data file by searching for encoded temperature keyword. UTF-8 is returned if keyword is not found in any of supported encodings.
+
+    parameters
+    ----------
+    data:bytes
+        contents of data file
+
+    returns
+    -------
+    encoding:str
+        name of encoding
+    """
+    for encoding in _ENCODINGS:
+        if _KEYWORDS[encoding]['temperature'] in data:
+            return encoding
+    return _ENCODINGS[0]
+
+def _to_float(token:bytes, source:str) -> float:
+    """
+    Convert bytes token to float, decimal comma is replaced with dot.
+
+    parameters
+    ----------
+    token:bytes
+        token to convert
+    source:str
+        name of data source used in error message
+
+    returns
+    -------
+    value:float
+        converted value
+
+    raises
+    ------
+    exception:ParserException
+        if token is not a number
+    """
+    try:
+        return float(token.replace(b',', b'.'))
+    except ValueError:
+        raise ParserException(f'Cannot convert {token!r} to number in {source}')
+
+def _to_value(words:list[bytes], source:str) -> float:
+    """
+    Convert value of keyword line (i.e. second token) to float.
+
+    parameters
+    ----------
+    words:list[bytes]
+        tokens of keyword line
+    source:str
+        name of data source used in error message
+
+    returns
+    -------
+    value:float
+        converted value
+
+    raises
+    ------
+    exception:ParserException
+        if value is absent or is not a number
+    """
+    if len(words) < 2:
+        raise ParserException(f'No value for {words[0]!r} in {source}')
+    return _to_float(words[1], source)
+
+def _to_timestamp(words:list[bytes]) -> float|None:
+    """
+    Convert value of date line to POSIX timestamp. Date may be written in a format dd.mm.yyyy[ HH:MM[:SS]] or in ISO format, date and time may be separated by tab. Date line is optional metadata, therefore, absent or malformed date does not make the file invalid.
+
+    parameters
+    ----------
+    words:list[bytes]
+        tokens of date line
+
+    returns
+    -------
+    timestamp:float|None
+        POSIX timestamp in s, local time zone is assumed if it is not specified, or None if date is absent or its format is unknown
+    """
+    value = b' '.join(word.strip() for word in words[1:] if word.strip()).decode('ascii', errors='replace')
+    for date_format in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, date_format).timestamp()
+        except ValueError:
+            continue
+    try:
+        return datetime.fromisoformat(value).timestamp()
+    except ValueError:
+        return None
+
+def _get_name_timestamp(name:str) -> float|None:
+    """
+    Get time of acquisition of chromatogram from file name in a format <yyyymmdd>[_<HHMMSS>]_..., which is used by measure command. Midnight is assumed if only date is present in a name.
+
+    parameters
+    ----------
+    name:str
+        name of file
+
+    returns
+    -------
+    timestamp:float|None
+        POSIX timestamp in s or None if name does not contain valid date
+    """
+    match = _NAME_TIMESTAMP.search(name)
+    if match is None:
+        return None
+    try:
+        return datetime.strptime(match.group(1) + (match.group(2) or '000000'), '%Y%m%d%H%M%S').timestamp()
+    except ValueError:
+        return None
+
+def _to_float_or_nan(words:list[bytes], index:int|None) -> float:
+    """
+    Convert optional peak table column to float.
+
+    parameters
+    ----------
+    words:list[bytes]
+        tokens of peak table row
+    index:int|None
+        index of column or None if column is absent in a table
+
+    returns
+    -------
+    value:float
+        converted value or numpy.nan if column or value is absent
+    """
+    if index is None or index >= len(words):
+        return np.nan
+    try:
+        return float(words[index].replace(b',', b'.'))
+    except ValueError:
+        return np.nan
+
+def _find(words:list[bytes], keyword:bytes) -> int|None:
+    """
+    Find index of keyword in table header.
+
+    parameters
+    ----------
+    words:list[bytes]
+        tokens of table header
+    keyword:bytes
+        encoded column name
+
+    returns
+    -------
+    index:int|None
+        index of column or None if column is absent
+    """
+    return words.index(keyword) if keyword in words else None
+
+def _parse_chunk(paths:list[Path]) -> list[Chromatogram|tuple[str,str]]:
+    """
+    Parse chunk of files. This function is executed by workers of pool, therefore, errors are returned instead of being logged.
+
+    parameters
+    ----------
+    paths:list[Path]
+        paths to files with data
+
+    returns
+    -------
+    results:list[Chromatogram|tuple[str,str]]
+        list parallel to paths with parsed chromatogram or tuple (<file>, <error>) if file was not parsed
+    """
+    results = []
+    for path in paths:
+        try:
+            results.append(_parse_file(path))
+        except ParserException as e:
+            results.append((str(path), str(e)))
+    return results
+
+def _parse_archive_chunk(chunk:tuple[Path,list[str]]) -> list[Chromatogram|tuple[str,str]]:
+    """
+    Parse chunk of files from zip archive. This function is executed by workers of pool, each of which opens archive on its own.
+
+    parameters
+    ----------
+    chunk:tuple[Path,list[str]]
+        tuple (<archive-path>, <members>)
+
+    returns
+    -------
+    results:list[Chromatogram|tuple[str,str]]
+        list parallel to members with parsed chromatogram or tuple (<file>, <error>) if file was not parsed
+    """
+    archive_path, members = chunk
+    contents = dict(archive.iter_members(archive_path, members))
+    return _parse_bytes_chunk([(f'{archive_path}/{member}', contents.get(member)) for member in members])
+
+def _parse_bytes_chunk(chunk:list[tuple[str,bytes|None]]) -> list[Chromatogram|tuple[str,str]]:
+    """
+    Parse chunk of files already read to memory. This function is executed by workers of pool, therefore, errors are returned instead of being logged.
+
+    parameters
+    ----------
+    chunk:list[tuple[str,bytes|None]]
+        list of tuples (<source>, <contents>), contents is None if file cannot be read
+
+    returns
+    -------
+    results:list[Chromatogram|tuple[str,str]]
+        list parallel to chunk with parsed chromatogram or tuple (<file>, <error>) if file was not parsed
+    """
+    results = []
+    for source, data in chunk:
+        if data is None:
+            results.append((source, 'cannot read file from archive'))
+            continue
+        try:
+            results.append(_parse_bytes(data, source))
+        except ParserException as e:
+            results.append((source, str(e)))
+    return results
+
+def _parse_file(path:Path) -> Chromatogram:
+    """
+    Read single file with data as bytes and parse it. Data in a file must be in a following format:
+
+    Температура<tab><temperature>
+    [Дата анализа<tab><date-and-time>]
+    <br>
+    Название<tab>Время, мин<tab>Детектор<tab>Концентрация<tab>Ед, измерения<tab>Площадь<tab>Высота
+    <compound-name><tab><retention-time><tab><detector-name><tab><compound-concentration><tab><concentration-units><tab><peak-area><tab><peak-height>
+    [<br>
+    Темп. (газовые часы)<tab><flow-temperature>
+    Давление (газовые часы)<tab><flow-pressure>
+    Поток<tab><flow-rate>]
+
+    parameters
+    ----------
+    path:Path
+        path to file with data
+
+    returns
+    -------
+    chromatogram:Chromatogram
+        parsed data
+
+    raises
+    ------
+    exception:ParserException
+        if file cannot be read or data format is wrong
+    """
+    try:
+        data = path.read_bytes()
+    except OSError as e:
+        raise ParserException(f'Cannot read file {path}: {e}')
+    return _parse_bytes(data, str(path))
+
+def _parse_bytes(data:bytes, source:str) -> Chromatogram:
+    """
+    Parse contents of single data file in a single pass over its lines. Lines are split to tokens once and only names of compounds and detectors are decoded, numbers are converted directly from bytes and written to columnar buffer preallocated for the number of lines in data. Time of acquisition is taken from file name if date line is absent or cannot be converted. Decimal separator may be both "," and ".". Encoding of data is detected from the first keyword found, both UTF-8 and cp1251 are supported.
+
+    parameters
+    ----------
+    data:bytes
+        contents of data file
+    source:str
+        name of data source used in log and error messages
+
+    returns
+    -------
+    chromatogram:Chromatogram
+        parsed data
+
+    raises
+    ------
+    exception:ParserException
+        if data format is wrong
+    """
+    if data.startswith(_BOM):
+        data = data[len(_BOM):]
+    encoding = _detect_encoding(data)
+    keywords = _KEYWORDS[encoding]
+    T = None
+    Ta = None
+    Pa = None
+    f = None
+    timestamp = None
+    lines = data.split(b'\n')
+    compounds = []
+    detectors = []
+    # peak table rows cannot outnumber lines, columns are trimmed to number of rows after parsing
+    buffer = np.full((4, len(lines)), np.nan)
+    concentrations, retention_times, areas, heights = buffer
+    rows = 0
+    columns = None
+    for line in lines:
+        line = line.rstrip(b'\r')
+        if columns is not None:
+            if not line.strip():
+                columns = None
+                continue
+            words = line.split(b'\t')
+            compound_index, concentration_index, time_index, detector_index, area_index, height_index = columns
+            try:
+                compound = words[compound_index].decode(encoding)
+                concentration = _to_float(words[concentration_index], source)
+            except (IndexError, UnicodeDecodeError):
+                raise ParserException(f'Wrong peak table row in {source}')
+            compounds.append(compound)
+            concentrations[rows] = concentration
+            retention_times[rows] = _to_float_or_nan(words, time_index)
+            areas[rows] = _to_float_or_nan(words, area_index)
+            heights[rows] = _to_float_or_nan(words, height_index)
+            rows += 1
+            detectors.append(words[detector_index].decode(encoding, errors='replace') if detector_index is not None and detector_index < len(words) else '')
+            continue
+        words = line.split(b'\t')
+        if keywords['temperature'] in words:
+            T = _to_value(words, source)
+        elif keywords['compound'] in words and keywords['concentration'] in words:
+            columns = (words.index(keywords['compound']), words.index(keywords['concentration']), _find(words, keywords['time']), _find(words, keywords['detector']), _find(words, keywords['area']), _find(words, keywords['height']))
+        elif keywords['ambient_temperature'] in words:
+            Ta = _to_value(words, source)
+        elif keywords['ambient_pressure'] in words:
+            Pa = _to_value(words, source)
+        elif keywords['flow'] in words:
+            f = _to_value(words, source)
+        elif keywords['timestamp'] in words:
+            timestamp = _to_timestamp(words)
+    if T is None or len(compounds) == 0:
+        raise ParserException(f'Wrong data format in file {source}')
+    if timestamp is None:
+        timestamp = _get_name_timestamp(Path(source).name)
+    concentrations, retention_times, areas, heights = buffer[:, :rows].copy()
+    return Chromatogram(temperature=T, compounds=compounds, concentrations=concentrations, retention_times=retention_times if not np.isnan(retention_times).all() else None, areas=areas if not np.isnan(areas).all() else None, heights=heights if not np.isnan(heights).all() else None, detectors=detectors if any(detectors) else None, ambient_temperature=Ta, ambient_pressure=Pa, flow=f, source=source, timestamp=timestamp)
@@ -0,0 +1,193 @@
+import numpy as np
+
+class Chromatogram():
+    """
+    Wrapper for data parsed from single measurement file: temperature of catalytic reaction, peak table and, if present, flow rate measurement data. Peak table is stored in columnar form as numpy.ndarrays parallel to the list of compounds.
+    """
+
+    def __init__(self, temperature:float, compounds:list[str], concentrations:np.ndarray[float, np.dtype], retention_times:np.ndarray[float, np.dtype]|None=None, areas:np.ndarray[float, np.dtype]|None=None, heights:np.ndarray[float, np.dtype]|None=None, detectors:list[str]|None=None, ambient_temperature:float|None=None, ambient_pressure:float|None=None, flow:float|None=None, source:str|None=None, timestamp:float|None=None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        temperature:float
+            temperature at which reaction taken place
+        compounds:list[str]
+            names of compounds in peak table
+        concentrations:numpy.ndarray[float]
+            concentrations of compounds in mol.% parallel to compounds
+        retention_times:numpy.ndarray[float]|None (default:None)
+            retention times in min parallel to compounds or None if not present in a file
+        areas:numpy.ndarray[float]|None (default:None)
+            peak areas parallel to compounds or None if not present in a file
+        heights:numpy.ndarray[float]|None (default:None)
+            peak heights parallel to compounds or None if not present in a file
+        detectors:list[str]|None (default:None)
+            names of detectors parallel to compounds or None if not present in a file
+        ambient_temperature:float|None (default:None)
+            temperature at which measurement of flow rate was done or None if not present in a file
+        ambient_pressure:float|None (default:None)
+            pressure at which measurement of flow rate was done or None if not present in a file
+        flow:float|None (default:None)
+            total gas flow rate or None if not present in a file
+        source:str|None (default:None)
+            name of file data were parsed from
+        timestamp:float|None (default:None)
+            time of acquisition of chromatogram as POSIX timestamp in s or None if it is not known
+        """
+        self.temperature = temperature
+        self.compounds = compounds
+        self.concentrations = concentrations
+        self.retention_times = retention_times
+        self.areas = areas
+        self.heights = heights
+        self.detectors = detectors
+        self.ambient_temperature = ambient_temperature
+        self.ambient_pressure = ambient_pressure
+        self.flow = flow
+        self.source = source
+        self.timestamp = timestamp
+
+    def get_temperature(self) -> float:
+        """
+        Get temperature at which reaction taken place
+
+        returns
+        -------
+        temperature:float
+            temperature of catalytic reaction
+        """
+        return self.temperature
+
+    def get_compounds(self) -> list[str]:
+        """
+        Get names of compounds in peak table
+
+        returns
+        -------
+        compounds:list[str]
+            list of compounds
+        """
+        return self.compounds
+
+    def get_concentrations(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get concentrations of compounds parallel to compounds list
+
+        returns
+        -------
+        concentrations:numpy.ndarray[float]
+            concentrations in mol.%
+        """
+        return self.concentrations
+
+    def get_concentrations_dict(self) -> dict[str,float]:
+        """
+        Get concentrations of compounds as dictionary
+
+        returns
+        -------
+        concentrations:dict[str,float]
+            dictionary in a format {<compound>:<concentration>}
+        """
+        return dict(zip(self.compounds, self.concentrations.tolist()))
+
+    def get_retention_times(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get retention times of peaks parallel to compounds list
+
+        returns
+        -------
+        retention_times:numpy.ndarray[float]|None
+            retention times in min or None if not present in a file
+        """
+        return self.retention_times
+
+    def get_areas(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get peak areas parallel to compounds list
+
+        returns
+        -------
+        areas:numpy.ndarray[float]|None
+            peak areas or None if not present in a file
+        """
+        return self.areas
+
+    def get_heights(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get peak heights parallel to compounds list
+
+        returns
+        -------
+        heights:numpy.ndarray[float]|None
+            peak heights or None if not present in a file
+        """
+        return self.heights
+
+    def get_detectors(self) -> list[str]|None:
+        """
+        Get names of detectors parallel to compounds list
+
+        returns
+        -------
+        detectors:list[str]|None
+            detectors or None if not present in a file
+        """
+        return self.detectors
+
+    def get_ambient_temperature(self) -> float|None:
+        """
+        Get temperature at which measurement of flow rate was done
+
+        returns
+        -------
+        temperature:float|None
+            temperature or None if not present in a file
+        """
+        return self.ambient_temperature
+
+    def get_ambient_pressure(self) -> float|None:
+        """
+        Get pressure at which measurement of flow rate was done
+
+        returns
+        -------
+        pressure:float|None
+            pressure or None if not present in a file
+        """
+        return self.ambient_pressure
+
+    def get_flow(self) -> float|None:
+        """
+        Get total gas flow rate
+
+        returns
+        -------
+        flow:float|None
+            flow rate or None if not present in a file
+        """
+        return self.flow
+
+    def get_source(self) -> str|None:
+        """
+        Get name of file data were parsed from
+
+        returns
+        -------
+        source:str|None
+            file name
+        """
+        return self.source
+
+    def get_timestamp(self) -> float|None:
+        """
+        Get time of acquisition of chromatogram
+
+        returns
+        -------
+        timestamp:float|None
+            POSIX timestamp in s or None if it is not known
+        """
+        return self.timestamp
@@ -18,7 +18,7 @@ class CO2HydrogenationExporter(Exporter):
         """
         super().__init__()
 
-    def export(self, output_data_path:Path, conversion:Conversion, selectivity:Selectivity):
+    def export(self, output_data_path:Path, conversion:Conversion|None, selectivity:Selectivity|None):
         """
         Main interface of this class. Exports conversion and selectivity data for CO2 hydrogenation reaction to conversion.dat and selectivity.dat to a directory provided by user of this method.
 
@@ -26,10 +26,10 @@ class CO2HydrogenationExporter(Exporter):
         ----------
         output_data_path:Path
             path to directory to export resulting data
-        conversion:Conversion
-            wrapper of CO2 conversion at different temperatures
-        selectivity:Selectivity
-            wrapper of selectivities to different compounds at different temperatures
+        conversion:Conversion|None
+            wrapper of CO2 conversion at different temperatures, conversion is not exported if None
+        selectivity:Selectivity|None
+            wrapper of selectivities to different compounds at different temperatures, selectivity is not exported if None
 
         raises
         ------
@@ -38,8 +38,10 @@ class CO2HydrogenationExporter(Exporter):
         """
         if output_data_path.exists() and not output_data_path.is_dir():
             raise ExporterException(f'Data path for exporting data must be a folder')
-        self._export_conversion(output_data_path, conversion)
-        self._export_selectivity(output_data_path, selectivity)
+        if conversion is not None:
+            self._export_conversion(output_data_path, conversion)
+        if selectivity is not None:
+            self._export_selectivity(output_data_path, selectivity)
 
     def _export_conversion(self, output_data_path:Path, conversion:Conversion):
         """
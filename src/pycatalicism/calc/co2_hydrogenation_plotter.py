@@ -1,14 +1,12 @@
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-import matplotlib
-import matplotlib.axes
 import numpy as np
 
 from pycatalicism.calc.plotter import Plotter
 from pycatalicism.calc.plotterexception import PlotterException
 from pycatalicism.calc.conversion import Conversion
 from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.equilibrium import Equilibrium
 from pycatalicism.logging_decorator import Logging
 
 class CO2HydrogenationPlotter(Plotter):
@@ -22,10 +20,14 @@ class CO2HydrogenationPlotter(Plotter):
         Registers logger with instances of this class which can be accessed via self.logger instance variable
         """
         super().__init__()
+        self.conversion_label = '$\mathrm{CO_2}$ conversion'
+        self.dpi = 300
+        self.width = 160 / 25.4
+        self.height = 80 / 25.4
 
-    def plot(self, conversion:Conversion|None, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None):
+    def plot(self, conversion:Conversion|None, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None, equilibrium:Equilibrium|None=None):
         """
-        Main interface of this class. Plots conversion vs. temperature as line plot and selectivities vs. temperature as bar plot. If show_plot is true, shows plots. If output_data_path was provided, exports plots to result.png to provided directory
+        Main interface of this class. Plots conversion vs. temperature as line plot and selectivities vs. temperature as bar plot. If equilibrium is provided, equilibrium conversion and selectivities are overlaid as dashed lines. If show_plot is true, shows plots. If output_data_path was provided, exports plots to result.png to provided directory. Figure is closed afterwards.
 
         parameters
         ----------
@@ -37,47 +39,54 @@ class CO2HydrogenationPlotter(Plotter):
             if True, show plots
         output_data_path:Path|None (default:None)
             path to directory to export data
+        plot_title:str|None (default:None)
+            title of plot
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium for feed composition
 
         raises
         ------
         PlotterException
             if conversion and selectivities are None
         """
+        fig = self._get_figure(show_plot)
         if conversion and selectivity:
-            fig, (ax_conversion, ax_selectivity) = plt.subplots(nrows=1, ncols=2)
-            ax_conversion = self._plot_conversion(ax_conversion, conversion)
-            ax_selectivity = self._plot_selectivity(ax_selectivity, selectivity)
+            ax_conversion, ax_selectivity = fig.subplots(nrows=1, ncols=2)
+            ax_conversion = self._plot_conversion(ax_conversion, conversion, equilibrium)
+            ax_selectivity = self._plot_selectivity(ax_selectivity, selectivity, equilibrium)
         elif conversion and not selectivity:
-            fig, ax_conversion = plt.subplots()
-            ax_conversion = self._plot_conversion(ax_conversion, conversion)
+            ax_conversion = fig.subplots()
+            ax_conversion = self._plot_conversion(ax_conversion, conversion, equilibrium)
         elif selectivity and not conversion:
-            fig, ax_selectivity = plt.subplots()
-            ax_selectivity = self._plot_selectivity(ax_selectivity, selectivity)
+            ax_selectivity = fig.subplots()
+            ax_selectivity = self._plot_selectivity(ax_selectivity, selectivity, equilibrium)
         else:
+            self._close_figure(fig, show_plot)
             raise PlotterException('Nothing to plot')
         if plot_title:
             fig.suptitle(plot_title)
-        if show_plot:
-            self.logger.info(f'Plotting conversion vs. temperature for CO2 hydrogenation reaction')
-            plt.show()
-        if output_plot_path:
-            if output_plot_path.exists() and not output_plot_path.is_dir():
-                raise PlotterException(f'Output plot path must be a directory')
-            if not output_plot_path.exists():
-                output_plot_path.mkdir(parents=True)
-            self.logger.info(f'Exporting plot of conversion vs. temperature for CO oxidation reaction')
-            dpi = 300
-            width = 160 / 25.4
-            height = 80 / 25.4
-            fig.set_dpi(dpi)
-            fig.set_figheight(height)
-            fig.set_figwidth(width)
-            fig.set_tight_layout(True)
-            fig.savefig(fname=output_plot_path.joinpath('result.png'))
+        try:
+            if show_plot:
+                import matplotlib.pyplot as plt
+                self.logger.info(f'Plotting conversion vs. temperature for CO2 hydrogenation reaction')
+                plt.show()
+            if output_plot_path:
+                if output_plot_path.exists() and not output_plot_path.is_dir():
+                    raise PlotterException(f'Output plot path must be a directory')
+                if not output_plot_path.exists():
+                    output_plot_path.mkdir(parents=True)
+                self.logger.info(f'Exporting plot of conversion vs. temperature for CO oxidation reaction')
+                fig.set_dpi(self.dpi)
+                fig.set_figheight(self.height)
+                fig.set_figwidth(self.width)
+                fig.set_tight_layout(True)
+                fig.savefig(fname=output_plot_path.joinpath('result.png'))
+        finally:
+            self._close_figure(fig, show_plot)
 
-    def _plot_conversion(self, ax:matplotlib.axes.Axes, conversion:Conversion) -> matplotlib.axes.Axes:
+    def _plot_conversion(self, ax:'matplotlib.axes.Axes', conversion:Conversion, equilibrium:Equilibrium|None=None) -> 'matplotlib.axes.Axes':
         """
-        Plot CO2 conversion vs. temperature plot as line plot.
+        Plot CO2 conversion vs. temperature plot as line plot. Equilibrium conversion is plotted as dashed line if provided, limits of axis are extended to show it.
 
         parameters
         ----------
@@ -85,6 +94,8 @@ class CO2HydrogenationPlotter(Plotter):
             axes to plot to
         conversion:Conversion
             wrapper to CO2 conversion at different temperatures data
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium for feed composition
 
         returns
         -------
@@ -95,15 +106,20 @@ class CO2HydrogenationPlotter(Plotter):
         ax.plot(sorted_conversion.get_temperatures(), sorted_conversion.get_alphas(), marker='o', markersize=5)
         _max = sorted_conversion.get_alphas().max()
         _min = sorted_conversion.get_alphas().min()
+        if equilibrium:
+            ax.plot(equilibrium.get_temperatures(), equilibrium.get_alphas(), color='black', linestyle='--', linewidth=1, label='Equilibrium')
+            ax.legend(loc='best', fontsize='small')
+            _max = max(_max, np.nanmax(equilibrium.get_alphas()))
+            _min = min(_min, np.nanmin(equilibrium.get_alphas()))
         delta = _max - _min
         ax.set_ylim(bottom=_min - 0.1 * delta, top=_max + 0.1 * delta)
         ax.set_xlabel('Temperature, °C')
-        ax.set_ylabel('$\mathrm{CO_2}$ conversion')
+        ax.set_ylabel(self.conversion_label)
         return ax
 
-    def _plot_selectivity(self, ax:matplotlib.axes.Axes, selectivity:Selectivity) -> matplotlib.axes.Axes:
+    def _plot_selectivity(self, ax:'matplotlib.axes.Axes', selectivity:Selectivity, equilibrium:Equilibrium|None=None) -> 'matplotlib.axes.Axes':
         """
-        Plot selectivities to different compounds at different temperatures as bar plot
+        Plot selectivities to different compounds at different temperatures as stacked bar plot. Compounds with zero selectivity at all temperatures are not plotted. If equilibrium is provided, equilibrium selectivities of plotted compounds are stacked in the same order and upper edge of each compound is plotted as dashed line of the same color.
 
         parameters
         ----------
@@ -111,6 +127,8 @@ class CO2HydrogenationPlotter(Plotter):
             axes to plot to
         selectivity:Selectivity
             wrapper with selectivity data
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium for feed composition
 
         returns
         -------
@@ -118,29 +136,32 @@ class CO2HydrogenationPlotter(Plotter):
             axes with plotted data
         """
         sorted_selectivity = selectivity.get_sorted()
-        self.logger.debug(f'{str(sorted_selectivity) = }')
-        s_dict = {}
-        for temperature in sorted_selectivity.get_temperatures():
-            self.logger.debug(f'{temperature = }')
-            for compound in sorted_selectivity.get_selectivities_at(temperature):
-                self.logger.debug(f'{compound = }')
-                self.logger.debug(f'{s_dict = }')
-                if compound in s_dict:
-                    self.logger.debug(f'{sorted_selectivity.get_selectivity(compound, temperature) = }')
-                    s_dict[compound].append(sorted_selectivity.get_selectivity(compound, temperature))
-                else:
-                    self.logger.debug(f'{sorted_selectivity.get_selectivity(compound, temperature) = }')
-                    s_dict[compound] = [sorted_selectivity.get_selectivity(compound, temperature)]
-        compounds = list(s_dict)
-        bottom = 0
-        for i in range(len(compounds)):
-            self.logger.debug(f'{compounds[i] = }')
-            self.logger.debug(f'{sorted_selectivity.get_temperatures() = }')
-            self.logger.debug(f'{s_dict[compounds[i]] = }')
-            self.logger.debug(f'{bottom = }')
-            if not np.all(np.array(s_dict[compounds[i]]) == 0):
-                ax.bar(sorted_selectivity.get_temperatures(), s_dict[compounds[i]], bottom=bottom, width=5, label=compounds[i])
-                bottom = bottom + np.array(s_dict[compounds[i]])
+        temperatures = sorted_selectivity.get_temperatures()
+        matrix = sorted_selectivity.get_matrix()
+        plotted = ~np.all(matrix == 0, axis=1)
+        compounds = [compound for compound, is_plotted in zip(sorted_selectivity.get_compounds(), plotted) if is_plotted]
+        matrix = matrix[plotted]
+        bottoms = np.zeros_like(matrix)
+        np.cumsum(matrix[:-1], axis=0, out=bottoms[1:])
+        # each compound is drawn as a single collection of rectangles instead of patch per bar
+        from matplotlib.collections import PolyCollection
+        import matplotlib
+        colors = matplotlib.rcParams['axes.prop_cycle'].by_key()['color']
+        width = 5
+        left = temperatures - width / 2
+        x = np.stack([left, left, left + width, left + width], axis=1)
+        for i, (compound, values, bottom) in enumerate(zip(compounds, matrix, bottoms)):
+            top = bottom + values
+            vertices = np.stack([x, np.stack([bottom, top, top, bottom], axis=1)], axis=2)
+            bars = PolyCollection(vertices, facecolors=colors[i % len(colors)], edgecolors='none', label=compound)
+            bars.sticky_edges.y.append(0)
+            ax.add_collection(bars)
+        if equilibrium and equilibrium.get_selectivities() is not None:
+            products = equilibrium.get_products()
+            tops = np.cumsum(np.column_stack([equilibrium.get_selectivities()[:, products.index(compound)] if compound in products else np.zeros(len(equilibrium.get_temperatures())) for compound in compounds]), axis=1)
+            for i, top in enumerate(tops.T):
+                ax.plot(equilibrium.get_temperatures(), top, color=colors[i % len(colors)], linestyle='--', linewidth=1)
+        ax.autoscale_view()
         ax.set_xlabel('Temperature, °C')
         ax.set_ylabel('Selectivity')
         ax.legend(loc='upper left', bbox_to_anchor=(1, 1))
@@ -18,7 +18,7 @@ class COOxidationExporter(Exporter):
         """
         super().__init__()
 
-    def export(self, output_data_path:Path, conversion:Conversion, selectivity:Selectivity|None):
+    def export(self, output_data_path:Path, conversion:Conversion|None, selectivity:Selectivity|None):
         """
         Main interface of this class. Exports conversion data for CO oxidation reaction to conversion.dat to a directory provided by user of this method.
 
@@ -26,8 +26,8 @@ class COOxidationExporter(Exporter):
         ----------
         output_data_path:Path
             path to directory to export resulting data
-        conversion:Conversion
-            wrapper of CO conversion at different temperatures
+        conversion:Conversion|None
+            wrapper of CO conversion at different temperatures, nothing is exported if None
         selectivity:Selectivity|None
             should be None since selectivity does not make sense for CO oxidation reaction
 
@@ -38,7 +38,8 @@ class COOxidationExporter(Exporter):
         """
         if output_data_path.exists() and not output_data_path.is_dir():
             raise ExporterException(f'Data path for exporting data must be a folder')
-        self._export_conversion(output_data_path, conversion)
+        if conversion is not None:
+            self._export_conversion(output_data_path, conversion)
 
     def _export_conversion(self, output_data_path:Path, conversion:Conversion):
         """
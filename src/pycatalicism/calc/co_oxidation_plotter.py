@@ -1,11 +1,10 @@
 from pathlib import Path
 
-import matplotlib.pyplot as plt
-
 from pycatalicism.calc.plotter import Plotter
 from pycatalicism.calc.plotterexception import PlotterException
 from pycatalicism.calc.conversion import Conversion
 from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.equilibrium import Equilibrium
 from pycatalicism.logging_decorator import Logging
 
 class COOxidationPlotter(Plotter):
@@ -18,10 +17,13 @@ class COOxidationPlotter(Plotter):
         """
         Registers logger with instances of this class which can be accessed via self.logger instance variable
         """
+        self.dpi = 300
+        self.width = 80 / 25.4
+        self.height = 80 / 25.4
 
-    def plot(self, conversion:Conversion, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None):
+    def plot(self, conversion:Conversion, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None, equilibrium:Equilibrium|None=None):
         """
-        Main interface of this class. Plots conversion vs. temperature as line plot. If show_plot is true, shows plots. If output_data_path was provided, exports plots to result.png to provided directory
+        Main interface of this class. Plots conversion vs. temperature as line plot, equilibrium conversion is plotted as dashed line if provided. If show_plot is true, shows plots. If output_data_path was provided, exports plots to result.png to provided directory. Figure is closed afterwards.
 
         parameters
         ----------
@@ -33,29 +35,38 @@ class COOxidationPlotter(Plotter):
             if True, show plots
         output_data_path:Path|None (default:None)
             path to directory to export data
+        plot_title:str|None (default:None)
+            title of plot
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium for feed composition
         """
-        fig, ax = plt.subplots()
+        fig = self._get_figure(show_plot)
+        ax = fig.subplots()
         sorted_conversion = conversion.get_sorted()
         ax.plot(sorted_conversion.get_temperatures(), sorted_conversion.get_alphas(), marker='o', markersize=5)
+        if equilibrium:
+            ax.plot(equilibrium.get_temperatures(), equilibrium.get_alphas(), color='black', linestyle='--', linewidth=1, label='Equilibrium')
+            ax.legend(loc='lower right', fontsize='small')
         if plot_title:
             ax.set_title(plot_title)
         ax.set_ylim(bottom=-0.1, top=1.1)
         ax.set_xlabel('Temperature, °C')
         ax.set_ylabel('$\mathrm{CO}$ conversion')
-        if show_plot:
-            self.logger.info(f'Plotting conversion vs. temperature for CO oxidation reaction')
-            plt.show()
-        if output_plot_path:
-            if output_plot_path.exists() and not output_plot_path.is_dir():
-                raise PlotterException(f'Output plot path must be a directory')
-            if not output_plot_path.exists():
-                output_plot_path.mkdir(parents=True)
-            self.logger.info(f'Exporting plot of conversion vs. temperature for CO oxidation reaction')
-            dpi = 300
-            width = 80 / 25.4
-            height = 80 / 25.4
-            fig.set_dpi(dpi)
-            fig.set_figheight(height)
-            fig.set_figwidth(width)
-            fig.set_tight_layout(True)
-            fig.savefig(fname=output_plot_path.joinpath('result.png'))
+        try:
+            if show_plot:
+                import matplotlib.pyplot as plt
+                self.logger.info(f'Plotting conversion vs. temperature for CO oxidation reaction')
+                plt.show()
+            if output_plot_path:
+                if output_plot_path.exists() and not output_plot_path.is_dir():
+                    raise PlotterException(f'Output plot path must be a directory')
+                if not output_plot_path.exists():
+                    output_plot_path.mkdir(parents=True)
+                self.logger.info(f'Exporting plot of conversion vs. temperature for CO oxidation reaction')
+                fig.set_dpi(self.dpi)
+                fig.set_figheight(self.height)
+                fig.set_figwidth(self.width)
+                fig.set_tight_layout(True)
+                fig.savefig(fname=output_plot_path.joinpath('result.png'))
+        finally:
+            self._close_figure(fig, show_plot)
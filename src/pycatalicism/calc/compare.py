@@ -0,0 +1,296 @@
+from pathlib import Path
+
+import numpy as np
+
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.results import Results
+from pycatalicism.calc import results_npz
+from pycatalicism.calc.comparison import Comparison, Interpolant
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Comparison of results of several samples. Results are loaded from output directories of calc or calc-batch commands (from results.npz if it exists, otherwise from conversion.dat, selectivity.dat and yield.dat), interpolants of conversion, selectivities and yields of each sample are prepared once and resampled to a common temperature grid. Resampled values, differences and ratios relative to reference sample and ranking of samples are exported as tables, conversions of all samples are plotted on a single overlay plot.
+"""
+
+def compare(results_paths:list[str], output_data_path:str|None=None, show_plot:bool=False, output_plot_path:str|None=None, reference:str|None=None, grid_min:float|None=None, grid_max:float|None=None, grid_step:float=10.0, print_results:bool=True) -> Comparison:
+    """
+    Main interface to module. Loads results of samples, resamples them to common temperature grid, prints ranking of samples and exports comparison tables and overlay plot if requested.
+
+    Each of results_paths is either output directory of calc command or output directory of calc-batch command with directories of samples. Samples are named by sample name stored in results or by name of directory if sample name is not known. By default, grid spans temperature range where conversions (or selectivities, if conversion was not calculated) of all samples are known. If ranges of samples do not overlap, grid spans temperature range of all samples.
+
+    parameters
+    ----------
+    results_paths:list[str]
+        Paths to directories with results of samples
+    output_data_path:str|None (default:None)
+        Path to directory to export comparison tables, tables are not exported if None
+    show_plot:bool (default:False)
+        Whether to show overlay plot
+    output_plot_path:str|None (default:None)
+        Path to directory to export overlay plot to comparison.png
+    reference:str|None (default:None)
+        Name of reference sample for difference and ratio tables, first sample is used if None
+    grid_min:float|None (default:None)
+        Lowest temperature of grid in °C, determined from data if None
+    grid_max:float|None (default:None)
+        Highest temperature of grid in °C, determined from data if None
+    grid_step:float (default:10.0)
+        Step of grid in °C
+    print_results:bool (default:True)
+        Whether to print ranking of samples to console
+
+    returns
+    -------
+    comparison:Comparison
+        comparison of samples on common grid
+
+    raises
+    ------
+    exception:CalculatorException
+        if no results were found, if sample names are not unique, if reference sample is unknown or if grid parameters are wrong
+    """
+    samples = load_samples([Path(results_path).resolve() for results_path in results_paths])
+    names = [name for name, _ in samples]
+    if reference is None:
+        reference = names[0]
+    if reference not in names:
+        raise CalculatorException(f'Reference sample {reference} is not found among compared samples')
+    interpolants = get_interpolants([results for _, results in samples])
+    grid = get_grid(interpolants, grid_min, grid_max, grid_step)
+    comparison = Comparison(names, interpolants, grid, reference)
+    if print_results:
+        print(comparison)
+    if output_data_path is not None:
+        export_comparison(Path(output_data_path).resolve(), comparison)
+    if show_plot or (output_plot_path is not None):
+        # matplotlib is imported only if plot is requested
+        from pycatalicism.calc.comparison_plotter import ComparisonPlotter
+        plotter = ComparisonPlotter()
+        plotter.plot_comparison(comparison, show_plot, None if output_plot_path is None else Path(output_plot_path).resolve())
+    return comparison
+
+def load_samples(results_paths:list[Path]) -> list[tuple[str,Results]]:
+    """
+    Load results of samples from output directories of calc or calc-batch commands
+
+    parameters
+    ----------
+    results_paths:list[Path]
+        paths to directories with results of sample or with directories of samples
+
+    returns
+    -------
+    samples:list[tuple[str,Results]]
+        list of tuples (<sample-name>, <results>)
+
+    raises
+    ------
+    exception:CalculatorException
+        if results were not found or if sample names are not unique
+    """
+    directories = []
+    for results_path in results_paths:
+        if not results_path.is_dir():
+            raise CalculatorException(f'Results path {results_path} must be a directory')
+        if _has_results(results_path):
+            directories.append(results_path)
+        else:
+            directories.extend(directory for directory in sorted(results_path.iterdir()) if directory.is_dir() and _has_results(directory))
+    if not directories:
+        raise CalculatorException('No results were found')
+    samples = []
+    for directory in directories:
+        results = load_results(directory)
+        sample_name = _get_sample_name(results)
+        samples.append((directory.name if sample_name in [None, 'None'] else sample_name, results))
+    names = [name for name, _ in samples]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise CalculatorException(f'Sample names must be unique, duplicated names: {", ".join(duplicates)}')
+    return samples
+
+def load_results(directory:Path) -> Results:
+    """
+    Load results from output directory of calc command. Binary results.npz file is used if it exists, otherwise conversion, selectivities and yields are read from text files.
+
+    parameters
+    ----------
+    directory:Path
+        path to directory with results
+
+    returns
+    -------
+    results:Results
+        bundle of loaded results, activity is loaded only from binary file
+    """
+    if directory.joinpath('results.npz').exists():
+        return results_npz.load_results(directory.joinpath('results.npz'))
+    conversion = None
+    if directory.joinpath('conversion.dat').exists():
+        sample_name, _, data = _read_table(directory.joinpath('conversion.dat'))
+        conversion = Conversion(data[:, 0], data[:, 1], sample_name)
+    selectivities = {}
+    for prefix in ['selectivity', 'yield']:
+        selectivities[prefix] = None
+        if directory.joinpath(f'{prefix}.dat').exists():
+            sample_name, columns, data = _read_table(directory.joinpath(f'{prefix}.dat'))
+            selectivities[prefix] = Selectivity(data[:, 0], data[:, 1:].T, sample_name, compounds=columns[1:])
+    return Results(conversion, selectivities['selectivity'], selectivities['yield'], None)
+
+def get_interpolants(results:list[Results]) -> dict[str,list[Interpolant|None]]:
+    """
+    Prepare interpolants of conversion, selectivities and yields of compounds of samples
+
+    parameters
+    ----------
+    results:list[Results]
+        results of samples
+
+    returns
+    -------
+    interpolants:dict[str,list[Interpolant|None]]
+        interpolants in a format {<quantity>:<interpolants parallel to results>}, quantities are Conversion, Selectivity <compound> and Yield <compound>
+    """
+    interpolants = {}
+    for row, sample_results in enumerate(results):
+        conversion = sample_results.get_conversion()
+        if conversion is not None:
+            interpolants.setdefault('Conversion', [None] * len(results))[row] = Interpolant(conversion.get_temperatures(), conversion.get_alphas())
+        for prefix, selectivity in [('Selectivity', sample_results.get_selectivity()), ('Yield', sample_results.get_yield())]:
+            if selectivity is None:
+                continue
+            for compound, values in zip(selectivity.get_compounds(), selectivity.get_matrix()):
+                interpolants.setdefault(f'{prefix} {compound}', [None] * len(results))[row] = Interpolant(selectivity.get_temperatures(), values)
+    return interpolants
+
+def get_grid(interpolants:dict[str,list[Interpolant|None]], grid_min:float|None=None, grid_max:float|None=None, grid_step:float=10.0) -> np.ndarray[float, np.dtype]:
+    """
+    Get common temperature grid. Limits which are not provided are determined from temperature ranges of first quantity (usually, conversion) of samples.
+
+    parameters
+    ----------
+    interpolants:dict[str,list[Interpolant|None]]
+        interpolants of quantities of samples
+    grid_min:float|None (default:None)
+        lowest temperature of grid
+    grid_max:float|None (default:None)
+        highest temperature of grid
+    grid_step:float (default:10.0)
+        step of grid
+
+    returns
+    -------
+    grid:numpy.ndarray[float]
+        temperatures from grid_min to grid_max (inclusive) with grid_step
+
+    raises
+    ------
+    exception:CalculatorException
+        if grid step is not positive, if limits cannot be determined or if grid_min is higher than grid_max
+    """
+    if grid_step <= 0:
+        raise CalculatorException(f'Grid step must be positive, got {grid_step}')
+    ranges = np.array([(interpolant.get_temperatures()[0], interpolant.get_temperatures()[-1]) for quantity_interpolants in list(interpolants.values())[:1] for interpolant in quantity_interpolants if interpolant is not None and len(interpolant.get_temperatures()) > 0]).reshape(-1, 2)
+    if len(ranges) == 0 and (grid_min is None or grid_max is None):
+        raise CalculatorException('Cannot determine temperature range of grid')
+    if len(ranges) > 0:
+        low, high = ranges[:, 0].max(), ranges[:, 1].min()
+        if low > high:
+            low, high = ranges[:, 0].min(), ranges[:, 1].max()
+        grid_min = low if grid_min is None else grid_min
+        grid_max = high if grid_max is None else grid_max
+    if grid_min > grid_max:
+        raise CalculatorException(f'Lowest temperature of grid {grid_min} is higher than highest temperature {grid_max}')
+    return grid_min + grid_step * np.arange(int(np.floor((grid_max - grid_min) / grid_step + 1e-9)) + 1)
+
+def export_comparison(output_data_path:Path, comparison:Comparison):
+    """
+    Export comparison tables to output directory. For every quantity resampled values, differences and ratios are exported to <quantity>.dat, <quantity>_difference.dat and <quantity>_ratio.dat, where quantity is written in lower case with spaces replaced by underscores (e.g. selectivity_CH4.dat). Ranking of samples is exported to ranking.dat.
+
+    parameters
+    ----------
+    output_data_path:Path
+        path to directory to export tables to
+    comparison:Comparison
+        comparison of samples
+    """
+    output_data_path.mkdir(parents=True, exist_ok=True)
+    for quantity in comparison.get_quantities():
+        prefix, _, compound = quantity.partition(' ')
+        name = prefix.lower() + (f'_{compound}' if compound else '')
+        for kind, suffix in [('values', ''), ('difference', '_difference'), ('ratio', '_ratio')]:
+            with output_data_path.joinpath(f'{name}{suffix}.dat').open(mode='w') as output:
+                output.write(comparison.get_table(quantity, kind))
+    with output_data_path.joinpath('ranking.dat').open(mode='w') as output:
+        output.write(str(comparison))
+
+def _has_results(directory:Path) -> bool:
+    """
+    Check whether directory contains results of calc command
+
+    parameters
+    ----------
+    directory:Path
+        path to directory
+
+    returns
+    -------
+    has_results:bool
+        True if results.npz, conversion.dat or selectivity.dat exists in directory
+    """
+    return any(directory.joinpath(file_name).exists() for file_name in ['results.npz', 'conversion.dat', 'selectivity.dat'])
+
+def _get_sample_name(results:Results) -> str|None:
+    """
+    Get sample name stored in results
+
+    parameters
+    ----------
+    results:Results
+        bundle of results
+
+    returns
+    -------
+    sample_name:str|None
+        name of sample or None if it is not known
+    """
+    for data in [results.get_conversion(), results.get_selectivity(), results.get_yield()]:
+        if data is not None:
+            return data.get_sample_name()
+    return None
+
+def _read_table(path:Path) -> tuple[str|None,list[str],np.ndarray]:
+    """
+    Read table exported by calc command. Table has a format:
+
+    Sample<tab><sample-name><br>
+    <br>
+    Temperature<tab><column><tab>...<br>
+    <temperature><tab><value><tab>...
+
+    parameters
+    ----------
+    path:Path
+        path to file
+
+    returns
+    -------
+    (sample_name, columns, data):tuple[str|None,list[str],numpy.ndarray]
+        name of sample, names of columns and data of shape (rows, columns)
+
+    raises
+    ------
+    exception:CalculatorException
+        if format of file is wrong
+    """
+    lines = path.read_text().splitlines()
+    if len(lines) < 3 or not lines[0].startswith('Sample\t') or lines[1].strip() != '':
+        raise CalculatorException(f'Wrong format of results file {path}')
+    sample_name = lines[0].split(sep='\t', maxsplit=1)[1]
+    columns = lines[2].split(sep='\t')
+    try:
+        data = np.array([[float(value) for value in line.split(sep='\t')] for line in lines[3:] if line.strip()], dtype=float).reshape(-1, len(columns))
+    except ValueError:
+        raise CalculatorException(f'Wrong format of results file {path}')
+    return (None if sample_name == 'None' else sample_name, columns, data)
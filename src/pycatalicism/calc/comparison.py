@@ -0,0 +1,308 @@
+import numpy as np
+
+class Interpolant():
+    """
+    Piecewise linear interpolant of data of single sample. Data are sorted, values measured at the same temperature are averaged and slopes of segments are calculated once at construction, so that the same interpolant can be evaluated on any number of grids by a single vectorized call. Interpolant is not extrapolated: values outside of measured temperature range are NaN.
+    """
+
+    def __init__(self, temperatures:list[float]|np.ndarray[float, np.dtype], values:list[float]|np.ndarray[float, np.dtype]):
+        """
+        Prepare interpolation data. Points with NaN temperature or value are ignored.
+
+        parameters
+        ----------
+        temperatures:list[float]|numpy.ndarray[float]
+            temperatures at which values were measured
+        values:list[float]|numpy.ndarray[float]
+            values parallel to temperatures
+        """
+        temperatures = np.asarray(temperatures, dtype=float)
+        values = np.asarray(values, dtype=float)
+        finite = np.isfinite(temperatures) & np.isfinite(values)
+        self.temperatures, inverse, counts = np.unique(temperatures[finite], return_inverse=True, return_counts=True)
+        self.values = np.bincount(inverse, weights=values[finite], minlength=len(counts)) / counts if len(counts) else np.empty(0)
+        self.slopes = np.diff(self.values) / np.diff(self.temperatures)
+
+    def __call__(self, grid:np.ndarray[float, np.dtype]) -> np.ndarray[float, np.dtype]:
+        """
+        Evaluate interpolant on grid
+
+        parameters
+        ----------
+        grid:numpy.ndarray[float]
+            temperatures to evaluate interpolant at
+
+        returns
+        -------
+        values:numpy.ndarray[float]
+            interpolated values parallel to grid, NaN outside of measured temperature range
+        """
+        grid = np.asarray(grid, dtype=float)
+        if len(self.temperatures) == 0:
+            return np.full(grid.shape, np.nan)
+        if len(self.temperatures) == 1:
+            return np.where(grid == self.temperatures[0], self.values[0], np.nan)
+        segments = np.clip(np.searchsorted(self.temperatures, grid, side='right') - 1, 0, len(self.slopes) - 1)
+        values = self.values[segments] + self.slopes[segments] * (grid - self.temperatures[segments])
+        return np.where((grid >= self.temperatures[0]) & (grid <= self.temperatures[-1]), values, np.nan)
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get sorted unique temperatures of interpolated data
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            temperatures
+        """
+        return self.temperatures
+
+    def get_values(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get values of interpolated data parallel to temperatures
+
+        returns
+        -------
+        values:numpy.ndarray[float]
+            values averaged over points measured at the same temperature
+        """
+        return self.values
+
+class Comparison():
+    """
+    Comparison of several samples on a common temperature grid. Data of each sample and quantity (conversion, selectivity or yield of a compound) are stored as cached interpolants, resampled values are calculated once per quantity on first request. Differences and ratios are calculated relative to reference sample. Values which cannot be determined (quantity was not calculated for sample or temperature is outside of measured range) are NaN.
+    """
+
+    def __init__(self, samples:list[str], interpolants:dict[str,list[Interpolant|None]], grid:np.ndarray[float, np.dtype], reference:str):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        samples:list[str]
+            names of samples
+        interpolants:dict[str,list[Interpolant|None]]
+            interpolants of quantities in a format {<quantity>:<interpolants parallel to samples>}, None if quantity was not calculated for sample
+        grid:numpy.ndarray[float]
+            common temperature grid
+        reference:str
+            name of reference sample
+        """
+        self.samples = samples
+        self.interpolants = interpolants
+        self.grid = np.asarray(grid, dtype=float)
+        self.reference = reference
+        self.values = {}
+
+    def __str__(self) -> str:
+        """
+        Get string representation of ranking of samples in a form of table:
+
+        Quantity<tab>Rank<tab>Sample<tab>Mean value
+
+        returns
+        -------
+        string:str
+            string representation of ranking
+        """
+        lines = []
+        for quantity in self.interpolants:
+            for rank, (sample, value) in enumerate(self.get_ranking(quantity), start=1):
+                lines.append(f'{quantity}\t{rank}\t{sample}\t{value}\n')
+        return 'Quantity\tRank\tSample\tMean value\n' + ''.join(lines)
+
+    def get_samples(self) -> list[str]:
+        """
+        Get names of compared samples
+
+        returns
+        -------
+        samples:list[str]
+            names of samples
+        """
+        return self.samples
+
+    def get_quantities(self) -> list[str]:
+        """
+        Get names of compared quantities
+
+        returns
+        -------
+        quantities:list[str]
+            names of quantities, e.g. Conversion, Selectivity CH4, Yield CH4
+        """
+        return list(self.interpolants)
+
+    def get_grid(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get common temperature grid
+
+        returns
+        -------
+        grid:numpy.ndarray[float]
+            temperatures of grid
+        """
+        return self.grid
+
+    def get_reference(self) -> str:
+        """
+        Get name of reference sample
+
+        returns
+        -------
+        reference:str
+            name of reference sample
+        """
+        return self.reference
+
+    def get_interpolants(self, quantity:str) -> list[Interpolant|None]:
+        """
+        Get interpolants of quantity
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        interpolants:list[Interpolant|None]
+            interpolants parallel to samples
+        """
+        return self.interpolants[quantity]
+
+    def get_resampled(self, grid:np.ndarray[float, np.dtype]) -> 'Comparison':
+        """
+        Get comparison of the same data on another grid. Interpolants are shared, so that data are not prepared again.
+
+        parameters
+        ----------
+        grid:numpy.ndarray[float]
+            new temperature grid
+
+        returns
+        -------
+        comparison:Comparison
+            comparison on new grid
+        """
+        return Comparison(self.samples, self.interpolants, grid, self.reference)
+
+    def get_values(self, quantity:str) -> np.ndarray:
+        """
+        Get values of quantity resampled to common grid
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        values:numpy.ndarray
+            matrix of shape (samples, grid)
+        """
+        if quantity not in self.values:
+            values = np.full((len(self.samples), len(self.grid)), np.nan)
+            for row, interpolant in enumerate(self.interpolants[quantity]):
+                if interpolant is not None:
+                    values[row] = interpolant(self.grid)
+            self.values[quantity] = values
+        return self.values[quantity]
+
+    def get_differences(self, quantity:str) -> np.ndarray:
+        """
+        Get differences between values of samples and values of reference sample
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        differences:numpy.ndarray
+            matrix of shape (samples, grid)
+        """
+        values = self.get_values(quantity)
+        return values - values[self.samples.index(self.reference)]
+
+    def get_ratios(self, quantity:str) -> np.ndarray:
+        """
+        Get ratios of values of samples to values of reference sample. Ratio is NaN if value of reference sample is zero.
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        ratios:numpy.ndarray
+            matrix of shape (samples, grid)
+        """
+        values = self.get_values(quantity)
+        reference = values[self.samples.index(self.reference)]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(reference != 0, values / reference, np.nan)
+
+    def get_ranking(self, quantity:str) -> list[tuple[str,float]]:
+        """
+        Get samples ranked by mean value of quantity from higher to lower. Mean is calculated over grid points at which quantity is known for all samples, so that samples are compared in the same temperature range. If there are no such points, mean is calculated over all known values of each sample. Samples without known values are ranked last.
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        ranking:list[tuple[str,float]]
+            list of tuples (<sample>, <mean value>) sorted by rank
+        """
+        values = self.get_values(quantity)
+        known = np.isfinite(values)
+        common = known.all(axis=0)
+        used = np.where(common, known, False) if common.any() else known
+        counts = used.sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            means = np.where(used, values, 0).sum(axis=1) / counts
+        order = np.lexsort((-np.nan_to_num(means, nan=-np.inf), np.isnan(means)))
+        return [(self.samples[row], float(means[row])) for row in order]
+
+    def get_table(self, quantity:str, kind:str='values') -> str:
+        """
+        Get string representation of resampled data in a form of table:
+
+        Quantity<tab><quantity><br>
+        Reference<tab><reference><br>
+        <br>
+        Temperature<tab><sample><tab>...
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+        kind:str {values|difference|ratio} (default:values)
+            which data to represent
+
+        returns
+        -------
+        string:str
+            string representation of data
+
+        raises
+        ------
+        exception:ValueError
+            if kind is unknown
+        """
+        if kind == 'values':
+            data = self.get_values(quantity)
+        elif kind == 'difference':
+            data = self.get_differences(quantity)
+        elif kind == 'ratio':
+            data = self.get_ratios(quantity)
+        else:
+            raise ValueError(f'Unknown kind of comparison table {kind}')
+        header = f'Quantity\t{quantity}\nReference\t{self.reference}\n\nTemperature' + ''.join(f'\t{sample}' for sample in self.samples) + '\n'
+        rows = zip(self.grid.tolist(), data.T.tolist())
+        return header + ''.join(f'{temperature}' + ''.join(f'\t{value}' for value in values) + '\n' for temperature, values in rows)
@@ -0,0 +1,73 @@
+from pathlib import Path
+
+from pycatalicism.calc.plotter import Plotter
+from pycatalicism.calc.plotterexception import PlotterException
+from pycatalicism.calc.comparison import Comparison
+from pycatalicism.logging_decorator import Logging
+
+class ComparisonPlotter(Plotter):
+    """
+    Class for plotting comparison of several samples: measured points of each sample are plotted as markers and values resampled to common grid as lines of the same color.
+    """
+
+    @Logging
+    def __init__(self):
+        """
+        Registers logger with instances of this class which can be accessed via self.logger instance variable
+        """
+        self.dpi = 300
+        self.width = 160 / 25.4
+        self.height = 100 / 25.4
+
+    def plot_comparison(self, comparison:Comparison, show_plot:bool=False, output_plot_path:Path|None=None, quantity:str|None=None):
+        """
+        Main interface of this class. Plots quantity of all samples vs. temperature on a single overlay plot. If show_plot is true, shows plot. If output_plot_path was provided, exports plot to comparison.png to provided directory. Figure is closed afterwards.
+
+        parameters
+        ----------
+        comparison:Comparison
+            comparison of samples on common grid
+        show_plot:bool (default:False)
+            if True, show plot
+        output_plot_path:Path|None (default:None)
+            path to directory to export plot
+        quantity:str|None (default:None)
+            quantity to plot, conversion is plotted if None and it is known, otherwise first quantity of comparison
+
+        raises
+        ------
+        exception:PlotterException
+            if output plot path is not a directory
+        """
+        if quantity is None:
+            quantity = 'Conversion' if 'Conversion' in comparison.get_quantities() else comparison.get_quantities()[0]
+        fig = self._get_figure(show_plot)
+        ax = fig.subplots()
+        values = comparison.get_values(quantity)
+        for row, (sample, interpolant) in enumerate(zip(comparison.get_samples(), comparison.get_interpolants(quantity))):
+            if interpolant is None:
+                continue
+            line, = ax.plot(comparison.get_grid(), values[row], label=sample)
+            ax.plot(interpolant.get_temperatures(), interpolant.get_values(), linestyle='none', marker='o', markersize=3, color=line.get_color())
+        ax.set_xlabel('Temperature, °C')
+        ax.set_ylabel(quantity)
+        ax.set_title(f'Reference: {comparison.get_reference()}')
+        ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), fontsize='small')
+        try:
+            if show_plot:
+                import matplotlib.pyplot as plt
+                self.logger.info(f'Plotting comparison of {quantity} of samples')
+                plt.show()
+            if output_plot_path:
+                if output_plot_path.exists() and not output_plot_path.is_dir():
+                    raise PlotterException(f'Output plot path must be a directory')
+                if not output_plot_path.exists():
+                    output_plot_path.mkdir(parents=True)
+                self.logger.info(f'Exporting plot of comparison of {quantity} of samples')
+                fig.set_dpi(self.dpi)
+                fig.set_figheight(self.height)
+                fig.set_figwidth(self.width)
+                fig.set_tight_layout(True)
+                fig.savefig(fname=output_plot_path.joinpath('comparison.png'))
+        finally:
+            self._close_figure(fig, show_plot)
@@ -2,23 +2,34 @@ import numpy as np
 
 class Conversion():
     """
-    Wrapper for conversion data storage. Conversion is stored as two parallel numpy.ndarrays of floats: temperature and conversion data.
+    Wrapper for conversion data storage. Conversion is stored as two parallel numpy.ndarrays of floats: temperature and conversion data. Data are sorted by temperature once at construction, so that sorted view is always available without copying.
     """
 
-    def __init__(self, temperatures:list[float], alphas:list[float], sample_name:str|None):
+    def __init__(self, temperatures:list[float]|np.ndarray[float, np.dtype], alphas:list[float]|np.ndarray[float, np.dtype], sample_name:str|None, is_sorted:bool=False):
         """
-        Assign parameters to instance variables after conversion lists to numpy.ndarrays.
+        Assign parameters to instance variables after conversion lists to numpy.ndarrays sorted by temperature from lower to higher value. Points measured at the same temperature are ordered by conversion.
 
         parameters
         ----------
-        temperatures:list[float]
+        temperatures:list[float]|numpy.ndarray[float]
             list of temperatures
-        alphas:list[float]
+        alphas:list[float]|numpy.ndarray[float]
             list of conversions
         sample_name:str|None
+        is_sorted:bool (default:False)
+            if True, data are already sorted and are stored as is without copying (e.g. memory-mapped arrays loaded from binary file)
         """
-        self.temperatures = np.array(temperatures)
-        self.alphas = np.array(alphas)
+        temperatures = np.asarray(temperatures)
+        alphas = np.asarray(alphas)
+        if len(temperatures) != len(alphas):
+            raise ValueError(f'Temperatures and conversions must be of the same length')
+        if is_sorted:
+            self.temperatures = temperatures
+            self.alphas = alphas
+        else:
+            order = np.lexsort((alphas, temperatures))
+            self.temperatures = temperatures[order]
+            self.alphas = alphas[order]
         self.sample_name = sample_name
 
     def __str__(self) -> str:
@@ -36,30 +47,24 @@ class Conversion():
         string:str
             string representation of conversion vs. temperature data
         """
-        string = f'Sample\t{self.sample_name}\n\nTemperature\tConversion\n'
-        sorted_conversion = self.get_sorted()
-        for temperature, alpha in zip(sorted_conversion.get_temperatures(), sorted_conversion.get_alphas()):
-            string = string + f'{temperature}\t{alpha}\n'
-        return string
+        header = f'Sample\t{self.sample_name}\n\nTemperature\tConversion\n'
+        lines = [f'{temperature}\t{alpha}\n' for temperature, alpha in zip(self.temperatures.tolist(), self.alphas.tolist())]
+        return header + ''.join(lines)
 
     def get_sorted(self) -> 'Conversion':
         """
-        Get conversion data sorted by temperature from lower to higher value
+        Get conversion data sorted by temperature from lower to higher value. Data are sorted at construction, thus, this object itself is returned.
 
         returns
         -------
         conversion:Conversion
             wrapper of sorted conversion data
         """
-        zipped_lists = zip(self.temperatures, self.alphas, strict=True)
-        sorted_pairs = sorted(zipped_lists)
-        tuples = zip(*sorted_pairs)
-        sorted_temperatures, sorted_alphas = [list(tuple) for tuple in tuples]
-        return Conversion(sorted_temperatures, sorted_alphas, self.sample_name)
+        return self
 
     def get_temperatures(self) -> np.ndarray[float, np.dtype]:
         """
-        Get temperatures as numpy.ndarray list
+        Get temperatures as numpy.ndarray list sorted from lower to higher value
 
         returns
         -------
@@ -70,7 +75,7 @@ class Conversion():
 
     def get_alphas(self) -> np.ndarray[float, np.dtype]:
         """
-        Get conversions as numpy.ndarray list
+        Get conversions as numpy.ndarray list parallel to temperatures
 
         returns
         -------
@@ -78,3 +83,14 @@ class Conversion():
             conversions stored in this wrapper
         """
         return self.alphas
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get sample name
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
@@ -0,0 +1,390 @@
+import numpy as np
+
+from pycatalicism.calc.reaction import Reaction
+from pycatalicism.calc import reaction
+from pycatalicism.calc.parse_cache import ParseCache
+from pycatalicism.calc import parse_cache
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Thermodynamic equilibrium of gas phase for feed composition of catalytic reaction. Equilibrium composition is found by minimization of Gibbs energy of ideal gas mixture subject to element balance constraints by Newton iterations on element potentials (RAND method, see Gordon S., McBride B.J., NASA RP-1311, 1994). All points of temperature grid are solved at once as a batch of linear systems. Standard Gibbs energies of compounds are calculated from NASA 7-coefficient polynomials. Equilibrium mixture contains all compounds with known thermodynamic data consisting of elements present in the feed, feed compounds without thermodynamic data (e.g. He, Ar) are treated as inert. Formation of solid carbon is not taken into account.
+"""
+
+# NASA 7-coefficient polynomials (GRI-Mech 3.0) in a format {<compound>:(<coefficients for 200-1000 K>, <coefficients for 1000-3500 K>)}
+THERMO_DATA = {
+                'H2'    :   ((2.34433112e+00, 7.98052075e-03, -1.94781510e-05, 2.01572094e-08, -7.37611761e-12, -9.17935173e+02, 6.83010238e-01), (3.33727920e+00, -4.94024731e-05, 4.99456778e-07, -1.79566394e-10, 2.00255376e-14, -9.50158922e+02, -3.20502331e+00)),
+                'O2'    :   ((3.78245636e+00, -2.99673416e-03, 9.84730201e-06, -9.68129509e-09, 3.24372837e-12, -1.06394356e+03, 3.65767573e+00), (3.28253784e+00, 1.48308754e-03, -7.57966669e-07, 2.09470555e-10, -2.16717794e-14, -1.08845772e+03, 5.45323129e+00)),
+                'N2'    :   ((3.29867700e+00, 1.40824040e-03, -3.96322200e-06, 5.64151500e-09, -2.44485400e-12, -1.02089990e+03, 3.95037200e+00), (2.92664000e+00, 1.48797680e-03, -5.68476000e-07, 1.00970380e-10, -6.75335100e-15, -9.22797700e+02, 5.98052800e+00)),
+                'H2O'   :   ((4.19864056e+00, -2.03643410e-03, 6.52040211e-06, -5.48797062e-09, 1.77197817e-12, -3.02937267e+04, -8.49032208e-01), (3.03399249e+00, 2.17691804e-03, -1.64072518e-07, -9.70419870e-11, 1.68200992e-14, -3.00042971e+04, 4.96677010e+00)),
+                'CO'    :   ((3.57953347e+00, -6.10353680e-04, 1.01681433e-06, 9.07005884e-10, -9.04424499e-13, -1.43440860e+04, 3.50840928e+00), (2.71518561e+00, 2.06252743e-03, -9.98825771e-07, 2.30053008e-10, -2.03647716e-14, -1.41518724e+04, 7.81868772e+00)),
+                'CO2'   :   ((2.35677352e+00, 8.98459677e-03, -7.12356269e-06, 2.45919022e-09, -1.43699548e-13, -4.83719697e+04, 9.90105222e+00), (3.85746029e+00, 4.41437026e-03, -2.21481404e-06, 5.23490188e-10, -4.72084164e-14, -4.87591660e+04, 2.27163806e+00)),
+                'CH4'   :   ((5.14987613e+00, -1.36709788e-02, 4.91800599e-05, -4.84743026e-08, 1.66693956e-11, -1.02466476e+04, -4.64130376e+00), (7.48514950e-02, 1.33909467e-02, -5.73285809e-06, 1.22292535e-09, -1.01815230e-13, -9.46834459e+03, 1.84373180e+01)),
+                'C2H4'  :   ((3.95920148e+00, -7.57052247e-03, 5.70990292e-05, -6.91588753e-08, 2.69884373e-11, 5.08977593e+03, 4.09733096e+00), (2.03611116e+00, 1.46454151e-02, -6.71077915e-06, 1.47222923e-09, -1.25706061e-13, 4.93988614e+03, 1.03053693e+01)),
+                'C2H6'  :   ((4.29142492e+00, -5.50154270e-03, 5.99438288e-05, -7.08466285e-08, 2.68685771e-11, -1.15222055e+04, 2.66682316e+00), (1.07188150e+00, 2.16852677e-02, -1.00256067e-05, 2.21412001e-09, -1.90002890e-13, -1.14263932e+04, 1.51156107e+01)),
+                'C3H8'  :   ((9.33553810e-01, 2.64245790e-02, 6.10597270e-06, -2.19774990e-08, 9.51492530e-12, -1.39585200e+04, 1.92016910e+01), (7.53413680e+00, 1.88722390e-02, -6.27184910e-06, 9.14756490e-10, -4.78380690e-14, -1.64675160e+04, -1.78923490e+01)),
+                'CH3OH' :   ((5.71539582e+00, -1.52309129e-02, 6.52441155e-05, -7.10806889e-08, 2.61352698e-11, -2.56427656e+04, -1.50409823e+00), (1.78970791e+00, 1.40938292e-02, -6.36500835e-06, 1.38171085e-09, -1.17060220e-13, -2.53748747e+04, 1.45023623e+01)),
+              }
+
+# temperature in K separating ranges of NASA polynomials
+_T_MID = 1000.0
+# standard pressure of thermodynamic data in Pa
+_P_STANDARD = 1e5
+# compounds with mole fraction below this value are considered minor and their steps are limited separately
+_MINOR_FRACTION = 1e-8
+
+class Equilibrium():
+    """
+    Wrapper for equilibrium composition of gas phase at different temperatures together with equilibrium conversion of key reactant and selectivities to reaction products derived from it. All values are parallel to sorted temperature grid, values at points where minimization did not converge are NaN.
+    """
+
+    def __init__(self, temperatures:np.ndarray[float, np.dtype], pressure:float, feed:dict[str,float], compounds:list[str], amounts:np.ndarray, alphas:np.ndarray[float, np.dtype], products:list[str], selectivities:np.ndarray|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        temperatures:numpy.ndarray[float]
+            temperature grid in °C
+        pressure:float
+            total pressure in Pa
+        feed:dict[str,float]
+            feed composition in mol.%
+        compounds:list[str]
+            compounds of equilibrium mixture
+        amounts:numpy.ndarray
+            equilibrium amounts of compounds per 100 mol of feed of shape (temperatures, compounds)
+        alphas:numpy.ndarray[float]
+            equilibrium conversions of key reactant
+        products:list[str]
+            reaction products parallel to columns of selectivities
+        selectivities:numpy.ndarray|None
+            equilibrium selectivities to reaction products of shape (temperatures, products) or None if reaction has single product
+        """
+        self.temperatures = temperatures
+        self.pressure = pressure
+        self.feed = feed
+        self.compounds = compounds
+        self.amounts = amounts
+        self.alphas = alphas
+        self.products = products
+        self.selectivities = selectivities
+
+    def __str__(self) -> str:
+        """
+        Get string representation of equilibrium in a format:
+
+        Pressure, Pa<tab><pressure><br>
+        <br>
+        Compound<tab>Feed, mol.%<br>
+        ...<br>
+        <br>
+        Temperature<tab>Conversion<tab>Selectivity <product><tab>...<tab><compound>, mol.%<tab>...<br>
+        ...
+
+        returns
+        -------
+        string:str
+            string representation of equilibrium
+        """
+        feed = ''.join(f'{compound}\t{concentration}\n' for compound, concentration in self.feed.items())
+        header = f'Pressure, Pa\t{self.pressure}\n\nCompound\tFeed, mol.%\n{feed}\nTemperature\tConversion'
+        columns = [self.alphas[:, np.newaxis]]
+        if self.selectivities is not None:
+            header = header + ''.join(f'\tSelectivity {product}' for product in self.products)
+            columns.append(self.selectivities)
+        header = header + ''.join(f'\t{compound}, mol.%' for compound in self.compounds) + '\n'
+        columns.append(self.get_fractions() * 100)
+        rows = zip(self.temperatures.tolist(), np.concatenate(columns, axis=1).tolist())
+        return header + ''.join(f'{temperature}' + ''.join(f'\t{value}' for value in values) + '\n' for temperature, values in rows)
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get temperature grid
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            temperatures in °C
+        """
+        return self.temperatures
+
+    def get_pressure(self) -> float:
+        """
+        Get total pressure
+
+        returns
+        -------
+        pressure:float
+            pressure in Pa
+        """
+        return self.pressure
+
+    def get_feed(self) -> dict[str,float]:
+        """
+        Get feed composition
+
+        returns
+        -------
+        feed:dict[str,float]
+            concentrations of compounds in mol.%
+        """
+        return self.feed
+
+    def get_compounds(self) -> list[str]:
+        """
+        Get compounds of equilibrium mixture
+
+        returns
+        -------
+        compounds:list[str]
+            compounds parallel to columns of amounts
+        """
+        return self.compounds
+
+    def get_amounts(self) -> np.ndarray:
+        """
+        Get equilibrium amounts of compounds
+
+        returns
+        -------
+        amounts:numpy.ndarray
+            amounts per 100 mol of feed of shape (temperatures, compounds)
+        """
+        return self.amounts
+
+    def get_fractions(self) -> np.ndarray:
+        """
+        Get equilibrium mole fractions of compounds
+
+        returns
+        -------
+        fractions:numpy.ndarray
+            mole fractions of shape (temperatures, compounds)
+        """
+        return self.amounts / self.amounts.sum(axis=1, keepdims=True)
+
+    def get_alphas(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get equilibrium conversions of key reactant
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            conversions parallel to temperatures
+        """
+        return self.alphas
+
+    def get_products(self) -> list[str]:
+        """
+        Get reaction products
+
+        returns
+        -------
+        products:list[str]
+            products parallel to columns of selectivities
+        """
+        return self.products
+
+    def get_selectivities(self) -> np.ndarray|None:
+        """
+        Get equilibrium selectivities to reaction products
+
+        returns
+        -------
+        selectivities:numpy.ndarray|None
+            selectivities of shape (temperatures, products) or None if reaction has single product
+        """
+        return self.selectivities
+
+def get_equilibrium(reaction:Reaction, feed:dict[str,float], temperatures:np.ndarray[float, np.dtype], pressure:float=101325.0, cache:ParseCache|None=None) -> Equilibrium:
+    """
+    Calculate equilibrium composition for feed composition at all temperatures of grid, equilibrium conversion of key reactant and selectivities to reaction products weighted by number of basis element atoms (see ReactionCalculator.calculate_selectivity). If cache is provided, equilibrium is looked up by fingerprint of reaction (including its key reactant and products, so that redeclared reactions are not confused), feed composition, pressure and temperature grid first and stored to cache after calculation.
+
+    parameters
+    ----------
+    reaction:Reaction
+        declaration of reaction
+    feed:dict[str,float]
+        feed composition in mol.%
+    temperatures:numpy.ndarray[float]
+        temperature grid in °C
+    pressure:float (default:101325.0)
+        total pressure in Pa
+    cache:ParseCache|None (default:None)
+        persistent cache of calculated equilibria
+
+    returns
+    -------
+    equilibrium:Equilibrium
+        equilibrium composition, conversion and selectivities
+
+    raises
+    ------
+    exception:CalculatorException
+        if pressure is not positive or thermodynamic data for key reactant is not known or it is absent in feed
+    """
+    if pressure <= 0:
+        raise CalculatorException(f'Pressure must be positive, got {pressure}')
+    key_reactant = reaction.get_key_reactant()
+    if key_reactant not in THERMO_DATA:
+        raise CalculatorException(f'Thermodynamic data for {key_reactant} is not known')
+    if not feed.get(key_reactant, 0) > 0:
+        raise CalculatorException(f'Key reactant {key_reactant} was not found in feed')
+    feed = {compound:float(concentration) for compound, concentration in feed.items() if concentration > 0}
+    fingerprint = None
+    if cache is not None:
+        fingerprint = parse_cache.get_fingerprint([], 'equilibrium', reaction.get_name(), reaction.get_key_reactant(), reaction.get_products(), sorted(feed.items()), float(pressure), np.asarray(temperatures, dtype=float).tolist())
+        equilibrium = cache.get_equilibrium(fingerprint)
+        if equilibrium is not None:
+            return equilibrium
+    compounds, matrix = _get_compounds(feed)
+    amounts = np.array([feed.get(compound, 0.0) for compound in compounds])
+    standard_energies = np.zeros((len(temperatures), len(compounds)))
+    reactive = [column for column, compound in enumerate(compounds) if compound in THERMO_DATA]
+    standard_energies[:, reactive] = get_standard_gibbs_energies([compounds[column] for column in reactive], np.asarray(temperatures, dtype=float) + 273.15)
+    equilibrium_amounts = minimize_gibbs(matrix, matrix @ amounts, standard_energies, pressure)
+    alphas = 1 - equilibrium_amounts[:, compounds.index(key_reactant)] / feed[key_reactant]
+    products = reaction.get_products()
+    selectivities = None
+    if len(products) > 1:
+        weighted_amounts = np.column_stack([equilibrium_amounts[:, compounds.index(product)] if product in compounds else np.zeros(len(temperatures)) for product in products]) * reaction.get_product_counts()
+        total = weighted_amounts.sum(axis=1, keepdims=True)
+        selectivities = weighted_amounts / np.where(total == 0, 1, total)
+    equilibrium = Equilibrium(np.asarray(temperatures, dtype=float), pressure, feed, compounds, equilibrium_amounts, alphas, products, selectivities)
+    if cache is not None:
+        cache.put_equilibrium(fingerprint, equilibrium)
+    return equilibrium
+
+def get_temperature_grid(temperatures:np.ndarray[float, np.dtype], step:float=5.0) -> np.ndarray[float, np.dtype]:
+    """
+    Get temperature grid with constant step covering range of temperatures. Bounds of grid are multiples of step.
+
+    parameters
+    ----------
+    temperatures:numpy.ndarray[float]
+        temperatures in °C
+    step:float (default:5.0)
+        step of grid in °C
+
+    returns
+    -------
+    grid:numpy.ndarray[float]
+        temperature grid in °C
+
+    raises
+    ------
+    exception:CalculatorException
+        if step is not positive or temperatures are empty
+    """
+    if step <= 0:
+        raise CalculatorException(f'Step of temperature grid must be positive, got {step}')
+    if len(temperatures) == 0:
+        raise CalculatorException('Cannot make temperature grid without temperatures')
+    start = np.floor(np.min(temperatures) / step)
+    stop = np.ceil(np.max(temperatures) / step)
+    return np.arange(start, stop + 1) * step
+
+def get_standard_gibbs_energies(compounds:list[str], temperatures:np.ndarray[float, np.dtype]) -> np.ndarray:
+    """
+    Calculate dimensionless standard Gibbs energies G°/RT = H°/RT - S°/R of compounds from NASA polynomials at all temperatures at once.
+
+    parameters
+    ----------
+    compounds:list[str]
+        compounds with known thermodynamic data
+    temperatures:numpy.ndarray[float]
+        temperatures in K
+
+    returns
+    -------
+    energies:numpy.ndarray
+        G°/RT of shape (temperatures, compounds)
+    """
+    low = np.array([THERMO_DATA[compound][0] for compound in compounds]).T
+    high = np.array([THERMO_DATA[compound][1] for compound in compounds]).T
+    T = np.asarray(temperatures, dtype=float)[:, np.newaxis]
+    a1, a2, a3, a4, a5, a6, a7 = np.where(T[np.newaxis] < _T_MID, low[:, np.newaxis], high[:, np.newaxis])
+    enthalpies = a1 + a2 * T / 2 + a3 * T**2 / 3 + a4 * T**3 / 4 + a5 * T**4 / 5 + a6 / T
+    entropies = a1 * np.log(T) + a2 * T + a3 * T**2 / 2 + a4 * T**3 / 3 + a5 * T**4 / 4 + a7
+    return enthalpies - entropies
+
+def minimize_gibbs(matrix:np.ndarray, element_amounts:np.ndarray[float, np.dtype], standard_energies:np.ndarray, pressure:float, max_iterations:int=200, tolerance:float=1e-12) -> np.ndarray:
+    """
+    Find equilibrium amounts of compounds of ideal gas mixture by minimization of Gibbs energy subject to element balance constraints. Newton step of element potentials and total amount is found for all temperatures at once by batched solution of linear systems, steps of major compounds are damped to 2 in log scale and minor compounds are not allowed to grow above minor fraction in a single step (see Gordon and McBride). Amounts are kept positive by iterating in log scale.
+
+    parameters
+    ----------
+    matrix:numpy.ndarray
+        number of atoms of each element in each compound of shape (elements, compounds)
+    element_amounts:numpy.ndarray[float]
+        amounts of elements in feed, all amounts must be positive
+    standard_energies:numpy.ndarray
+        G°/RT of compounds of shape (temperatures, compounds)
+    pressure:float
+        total pressure in Pa
+    max_iterations:int (default:200)
+        maximum number of Newton iterations
+    tolerance:float (default:1e-12)
+        convergence criterion for changes of amounts relative to total amount
+
+    returns
+    -------
+    amounts:numpy.ndarray
+        equilibrium amounts of compounds of shape (temperatures, compounds), NaN at temperatures where minimization did not converge
+    """
+    elements = matrix.shape[0]
+    log_amounts = np.full(standard_energies.shape, np.log(element_amounts.sum() / matrix.shape[1]))
+    converged = np.zeros(len(standard_energies), dtype=bool)
+    for _ in range(max_iterations):
+        amounts = np.exp(log_amounts)
+        total = amounts.sum(axis=1, keepdims=True)
+        potentials = standard_energies + np.log(pressure / _P_STANDARD) + log_amounts - np.log(total)
+        weighted = amounts[:, np.newaxis, :] * matrix
+        current_elements = weighted.sum(axis=2)
+        system = np.empty((len(amounts), elements + 1, elements + 1))
+        system[:, :elements, :elements] = weighted @ matrix.T
+        system[:, :elements, elements] = current_elements
+        system[:, elements, :elements] = current_elements
+        system[:, elements, elements] = 0
+        rhs = np.concatenate([element_amounts - current_elements + (weighted @ potentials[..., np.newaxis])[..., 0], np.sum(amounts * potentials, axis=1, keepdims=True)], axis=1)
+        solution = np.linalg.solve(system, rhs[..., np.newaxis])[..., 0]
+        total_step = solution[:, elements:]
+        steps = -potentials + solution[:, :elements] @ matrix + total_step
+        fractions = amounts / total
+        major = fractions > _MINOR_FRACTION
+        major_damping = 2 / np.maximum(np.maximum(5 * np.abs(total_step[:, 0]), np.where(major, np.abs(steps), 0).max(axis=1)), np.finfo(float).tiny)
+        with np.errstate(divide='ignore'):
+            minor_damping = np.where(~major & (steps > total_step), np.abs((np.log(_MINOR_FRACTION) - np.log(fractions)) / (steps - total_step)), np.inf).min(axis=1)
+        damping = np.minimum(1, np.minimum(major_damping, minor_damping))[:, np.newaxis]
+        log_amounts = np.maximum(log_amounts + damping * steps, -600)
+        converged = (np.abs(steps) * fractions).max(axis=1) < tolerance
+        if converged.all():
+            break
+    amounts = np.exp(log_amounts)
+    amounts[~converged] = np.nan
+    return amounts
+
+def _get_compounds(feed:dict[str,float]) -> tuple[list[str],np.ndarray]:
+    """
+    Get compounds of equilibrium mixture and their element matrix. Feed compounds without thermodynamic data are inert, each of them is assigned its own pseudo-element, so that its amount is conserved.
+
+    parameters
+    ----------
+    feed:dict[str,float]
+        feed composition in mol.% with positive concentrations only
+
+    returns
+    -------
+    (compounds, matrix):tuple[list[str],numpy.ndarray]
+        compounds of equilibrium mixture and number of atoms of each element (including pseudo-elements) in each compound of shape (elements, compounds)
+    """
+    compositions = {compound:reaction.parse_formula(compound) for compound in THERMO_DATA}
+    elements = sorted({element for compound in feed if compound in THERMO_DATA for element in compositions[compound]})
+    compounds = [compound for compound in THERMO_DATA if set(compositions[compound]) <= set(elements)]
+    inerts = [compound for compound in feed if compound not in THERMO_DATA]
+    matrix = np.zeros((len(elements) + len(inerts), len(compounds) + len(inerts)))
+    for column, compound in enumerate(compounds):
+        for element, count in compositions[compound].items():
+            matrix[elements.index(element), column] = count
+    matrix[len(elements):, len(compounds):] = np.eye(len(inerts))
+    return (compounds + inerts, matrix)
@@ -1,7 +1,18 @@
 from pathlib import Path
+from typing import Any
 
 from pycatalicism.calc.conversion import Conversion
 from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.results import Results
+from pycatalicism.calc import results_npz
+from pycatalicism.calc.light_off import LightOff
+from pycatalicism.calc.kinetics import ArrheniusFit
+from pycatalicism.calc.uncertainty import Uncertainty
+from pycatalicism.calc.time_on_stream import TimeOnStream
+from pycatalicism.calc.aggregation import Aggregation
+from pycatalicism.calc.balance import Balance
+from pycatalicism.calc.equilibrium import Equilibrium
 
 class Exporter():
     """
@@ -27,3 +38,147 @@ class Exporter():
             if this method is not overriden
         """
         raise NotImplementedError()
+
+    def export_results(self, output_data_path:Path, results:Results):
+        """
+        Export bundle of calculated results. Conversion and selectivity are exported by export method of concrete class, yields and activity, if calculated, are exported to yield.dat and activity.dat, respectively.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        results:Results
+            bundle of calculated results
+        """
+        self.export(output_data_path, results.get_conversion(), results.get_selectivity())
+        if results.get_yield() is not None:
+            self._export_data(output_data_path.joinpath('yield.dat'), results.get_yield(), 'yields vs. temperature data')
+        if results.get_activity() is not None:
+            self._export_data(output_data_path.joinpath('activity.dat'), results.get_activity(), 'activity vs. temperature data')
+
+    def export_light_off(self, output_data_path:Path, light_off:LightOff):
+        """
+        Export light-off metrics (T10, T50, T90, maximum conversion and temperatures of maximum yields) to light_off.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        light_off:LightOff
+            light-off metrics of sample
+        """
+        self._export_data(output_data_path.joinpath('light_off.dat'), light_off, 'light-off metrics')
+
+    def export_arrhenius(self, output_data_path:Path, arrhenius_fit:ArrheniusFit):
+        """
+        Export apparent activation energy and pre-exponential factor fitted to points in differential regime to arrhenius.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        arrhenius_fit:ArrheniusFit
+            fitted Arrhenius parameters
+        """
+        self._export_data(output_data_path.joinpath('arrhenius.dat'), arrhenius_fit, 'Arrhenius parameters')
+
+    def export_uncertainty(self, output_data_path:Path, uncertainty:Uncertainty):
+        """
+        Export confidence intervals of results estimated by Monte Carlo method to uncertainty.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        uncertainty:Uncertainty
+            confidence intervals of results
+        """
+        self._export_data(output_data_path.joinpath('uncertainty.dat'), uncertainty, 'confidence intervals of results')
+
+    def export_time_on_stream(self, output_data_path:Path, time_on_stream:TimeOnStream):
+        """
+        Export time-on-stream series and fitted deactivation parameters to time_on_stream.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        time_on_stream:TimeOnStream
+            time-on-stream series and fitted deactivation parameters
+        """
+        self._export_data(output_data_path.joinpath('time_on_stream.dat'), time_on_stream, 'time-on-stream data')
+
+    def export_replicates(self, output_data_path:Path, aggregation:Aggregation):
+        """
+        Export aggregated replicate measurements to replicates.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        aggregation:Aggregation
+            aggregated replicate measurements
+        """
+        self._export_data(output_data_path.joinpath('replicates.dat'), aggregation, 'aggregated replicate measurements')
+
+    def export_balance(self, output_data_path:Path, balance:Balance):
+        """
+        Export conversions on both bases and balance closures to balance.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        balance:Balance
+            conversions on both bases and balance closures
+        """
+        self._export_data(output_data_path.joinpath('balance.dat'), balance, 'balance closure')
+
+    def export_equilibrium(self, output_data_path:Path, equilibrium:Equilibrium):
+        """
+        Export equilibrium composition, conversion and selectivities to equilibrium.dat file.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        equilibrium:Equilibrium
+            thermodynamic equilibrium for feed composition
+        """
+        self._export_data(output_data_path.joinpath('equilibrium.dat'), equilibrium, 'thermodynamic equilibrium')
+
+    def export_binary(self, output_data_path:Path, results:Results, metadata:dict[str,Any]|None=None):
+        """
+        Export bundle of calculated results to binary results.npz file which can be loaded back by results_npz.load_results function without parsing.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        results:Results
+            bundle of calculated results
+        metadata:dict[str,Any]|None (default:None)
+            JSON serializable metadata stored in a file (e.g. reaction, calculation options and fingerprint of input data)
+        """
+        path = output_data_path.joinpath('results.npz')
+        self.logger.info(f'Exporting results in binary format to "{path}"')
+        results_npz.save_results(path, results, metadata)
+
+    def _export_data(self, path:Path, data:Conversion|Selectivity|Activity|LightOff|ArrheniusFit|Uncertainty|TimeOnStream|Aggregation|Balance|Equilibrium, description:str):
+        """
+        Export string representation of data to file, create parent directory if it does not exist.
+
+        parameters
+        ----------
+        path:Path
+            path to file to export data to
+        data:Conversion|Selectivity|Activity|LightOff|ArrheniusFit|Uncertainty|TimeOnStream|Aggregation|Balance|Equilibrium
+            wrapper of data to export
+        description:str
+            description of data used in log message
+        """
+        self.logger.info(f'Exporting {description} to "{path}"')
+        if not path.parent.exists():
+            path.parent.mkdir(parents=True)
+        with path.open(mode='w') as f:
+            f.write(str(data))
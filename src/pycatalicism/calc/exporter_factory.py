@@ -1,7 +1,9 @@
 from pycatalicism.calc.exporter import Exporter
 from pycatalicism.calc.co2_hydrogenation_exporter import CO2HydrogenationExporter
 from pycatalicism.calc.co_oxidation_exporter import COOxidationExporter
+from pycatalicism.calc.reaction_exporter import ReactionExporter
 from pycatalicism.calc.exporterexception import ExporterException
+from pycatalicism.calc import reaction_factory
 
 """
 Factory for creating exporters for specified reaction.
@@ -13,8 +15,8 @@ def get_exporter(reaction:str) -> Exporter:
 
     parameters
     ----------
-    reaction:str {co-oxidation|co2-hydrogenration}
-        chemical reaction to export calculated results
+    reaction:str
+        chemical reaction to export calculated results, generic exporter is used for reactions other than co-oxidation and co2-hydrogenation
 
     returns
     -------
@@ -30,5 +32,7 @@ def get_exporter(reaction:str) -> Exporter:
         return COOxidationExporter()
     elif reaction == 'co2-hydrogenation':
         return CO2HydrogenationExporter()
+    elif reaction in reaction_factory.get_reaction_names():
+        return ReactionExporter(reaction)
     else:
         raise ExporterException(f'Cannot create exporter for reaction "{reaction}"')
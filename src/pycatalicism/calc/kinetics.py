@@ -0,0 +1,361 @@
+import math
+import statistics
+
+import numpy as np
+
+from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Apparent kinetics from activity data. Points measured in differential regime (key reactant conversion below threshold) are selected and ln(rate) is fitted vs. 1/T by linear least squares, so that apparent activation energy and pre-exponential factor are found from Arrhenius equation rate = A * exp(-Ea / (R * T)). Fits of many samples are done at once by vectorized least squares over stack of samples padded with NaN. Confidence intervals are calculated from standard errors of slope and intercept and Student's t quantile.
+"""
+
+# universal gas constant in J/(mol*K)
+R = 8.314462618
+
+class ArrheniusFit():
+    """
+    Wrapper for results of Arrhenius fit of a sample: apparent activation energy, pre-exponential factor, their confidence intervals and fit statistics. Values which cannot be determined (e.g. less than 3 points in differential regime) are stored as NaN.
+    """
+
+    def __init__(self, activation_energy:float, activation_energy_error:float, ln_pre_exponential:float, ln_pre_exponential_error:float, r_squared:float, points:int, t_min:float, t_max:float, max_conversion:float, confidence:float, sample_name:str|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        activation_energy:float
+            apparent activation energy in kJ/mol
+        activation_energy_error:float
+            half-width of confidence interval of activation energy in kJ/mol
+        ln_pre_exponential:float
+            natural logarithm of pre-exponential factor in mol/(g*s)
+        ln_pre_exponential_error:float
+            half-width of confidence interval of ln_pre_exponential
+        r_squared:float
+            coefficient of determination of fit
+        points:int
+            number of points used for fit
+        t_min:float
+            minimum temperature of points used for fit in °C
+        t_max:float
+            maximum temperature of points used for fit in °C
+        max_conversion:float
+            conversion threshold used to select points in differential regime
+        confidence:float
+            confidence level of intervals
+        sample_name:str|None
+            name of sample
+        """
+        self.activation_energy = activation_energy
+        self.activation_energy_error = activation_energy_error
+        self.ln_pre_exponential = ln_pre_exponential
+        self.ln_pre_exponential_error = ln_pre_exponential_error
+        self.r_squared = r_squared
+        self.points = points
+        self.t_min = t_min
+        self.t_max = t_max
+        self.max_conversion = max_conversion
+        self.confidence = confidence
+        self.sample_name = sample_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of fit results in a format:
+
+        Sample<tab><sample-name><br>
+        Max conversion<tab><threshold><br>
+        Confidence<tab><confidence><br>
+        <br>
+        Metric<tab>Value<br>
+        <metric><tab><value><br>
+        ...
+
+        returns
+        -------
+        string:str
+            string representation of fit results
+        """
+        header = f'Sample\t{self.sample_name}\nMax conversion\t{self.max_conversion}\nConfidence\t{self.confidence}\n\nMetric\tValue\n'
+        return header + ''.join(f'{metric}\t{value}\n' for metric, value in self.get_metrics().items())
+
+    def get_activation_energy(self) -> float:
+        """
+        Get apparent activation energy
+
+        returns
+        -------
+        activation_energy:float
+            activation energy in kJ/mol
+        """
+        return self.activation_energy
+
+    def get_activation_energy_interval(self) -> tuple[float,float]:
+        """
+        Get confidence interval of apparent activation energy
+
+        returns
+        -------
+        (low, high):tuple[float,float]
+            bounds of confidence interval in kJ/mol
+        """
+        return (self.activation_energy - self.activation_energy_error, self.activation_energy + self.activation_energy_error)
+
+    def get_pre_exponential(self) -> float:
+        """
+        Get pre-exponential factor
+
+        returns
+        -------
+        pre_exponential:float
+            pre-exponential factor in mol/(g*s)
+        """
+        return math.exp(self.ln_pre_exponential) if not math.isnan(self.ln_pre_exponential) else math.nan
+
+    def get_pre_exponential_interval(self) -> tuple[float,float]:
+        """
+        Get confidence interval of pre-exponential factor
+
+        returns
+        -------
+        (low, high):tuple[float,float]
+            bounds of confidence interval in mol/(g*s)
+        """
+        return (math.exp(self.ln_pre_exponential - self.ln_pre_exponential_error), math.exp(self.ln_pre_exponential + self.ln_pre_exponential_error)) if not math.isnan(self.ln_pre_exponential_error) else (math.nan, math.nan)
+
+    def get_r_squared(self) -> float:
+        """
+        Get coefficient of determination of fit
+
+        returns
+        -------
+        r_squared:float
+            coefficient of determination
+        """
+        return self.r_squared
+
+    def get_points(self) -> int:
+        """
+        Get number of points used for fit
+
+        returns
+        -------
+        points:int
+            number of points
+        """
+        return self.points
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get sample name
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
+
+    def get_metrics(self) -> dict[str,float]:
+        """
+        Get fit results as a flat dictionary
+
+        returns
+        -------
+        metrics:dict[str,float]
+            metrics in a format {<metric>:<value>}
+        """
+        return {
+                'Ea, kJ/mol'            :   self.activation_energy,
+                'Ea error, kJ/mol'      :   self.activation_energy_error,
+                'ln(A), A in mol/(g*s)' :   self.ln_pre_exponential,
+                'ln(A) error'           :   self.ln_pre_exponential_error,
+                'Arrhenius R2'          :   self.r_squared,
+                'Arrhenius points'      :   self.points,
+                'Arrhenius Tmin'        :   self.t_min,
+                'Arrhenius Tmax'        :   self.t_max,
+                }
+
+def fit_arrhenius(temperatures:np.ndarray, rates:np.ndarray, alphas:np.ndarray, max_conversion:float=0.15, confidence:float=0.95) -> dict[str,np.ndarray]:
+    """
+    Fit ln(rate) vs. 1/T for stack of samples. Points with conversion not exceeding max_conversion and positive rate are used.
+
+    parameters
+    ----------
+    temperatures:numpy.ndarray
+        temperatures in °C of shape (samples, points), padded with NaN
+    rates:numpy.ndarray
+        reaction rates in mol/(g*s) of the same shape
+    alphas:numpy.ndarray
+        key reactant conversions as fractions of the same shape
+    max_conversion:float (default:0.15)
+        maximum conversion of points considered to be measured in differential regime
+    confidence:float (default:0.95)
+        confidence level of intervals
+
+    returns
+    -------
+    fit:dict[str,numpy.ndarray]
+        arrays of shape (samples,) with keys activation_energy, activation_energy_error (kJ/mol), ln_pre_exponential, ln_pre_exponential_error, r_squared, points, t_min, t_max
+
+    raises
+    ------
+    exception:CalculatorException
+        if confidence is not between 0 and 1
+    """
+    if not 0 < confidence < 1:
+        raise CalculatorException(f'Confidence level must be between 0 and 1, got {confidence}')
+    temperatures = np.atleast_2d(np.asarray(temperatures, dtype=float))
+    rates = np.atleast_2d(np.asarray(rates, dtype=float))
+    alphas = np.atleast_2d(np.asarray(alphas, dtype=float))
+    with np.errstate(invalid='ignore'):
+        used = (alphas <= max_conversion) & (rates > 0) & ~np.isnan(temperatures)
+    x = np.where(used, 1 / (np.where(used, temperatures, 0) + 273.15), 0)
+    y = np.where(used, np.log(np.where(used, rates, 1)), 0)
+    n = used.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = x.sum(axis=1) / n
+        y_mean = y.sum(axis=1) / n
+        dx = np.where(used, x - x_mean[:, None], 0)
+        dy = np.where(used, y - y_mean[:, None], 0)
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        residuals = np.maximum(syy - slope * sxy, 0)
+        variance = residuals / (n - 2)
+        t = _get_t_quantiles(confidence, n - 2)
+        slope_error = t * np.sqrt(variance / sxx)
+        intercept_error = t * np.sqrt(variance * (1 / n + x_mean * x_mean / sxx))
+        r_squared = 1 - residuals / syy
+        t_min = np.min(np.where(used, temperatures, np.inf), axis=1, initial=np.inf)
+        t_max = np.max(np.where(used, temperatures, -np.inf), axis=1, initial=-np.inf)
+    fitted = n >= 3
+    return {
+            'activation_energy'         :   np.where(fitted, -slope * R / 1000, np.nan),
+            'activation_energy_error'   :   np.where(fitted, slope_error * R / 1000, np.nan),
+            'ln_pre_exponential'        :   np.where(fitted, intercept, np.nan),
+            'ln_pre_exponential_error'  :   np.where(fitted, intercept_error, np.nan),
+            'r_squared'                 :   np.where(fitted, r_squared, np.nan),
+            'points'                    :   n,
+            't_min'                     :   np.where(n > 0, t_min, np.nan),
+            't_max'                     :   np.where(n > 0, t_max, np.nan),
+            }
+
+def get_arrhenius_fits(activities:list[Activity], max_conversion:float=0.15, confidence:float=0.95) -> list[ArrheniusFit]:
+    """
+    Fit Arrhenius equation to activity data of several samples by a single vectorized call
+
+    parameters
+    ----------
+    activities:list[Activity]
+        activity data of samples, conversions of key reactant must be known
+    max_conversion:float (default:0.15)
+        maximum conversion of points considered to be measured in differential regime
+    confidence:float (default:0.95)
+        confidence level of intervals
+
+    returns
+    -------
+    fits:list[ArrheniusFit]
+        results of fit parallel to activities
+
+    raises
+    ------
+    exception:CalculatorException
+        if conversions are not known for activity data
+    """
+    if any(activity.get_alphas() is None for activity in activities):
+        raise CalculatorException('Conversions of key reactant are not known for activity data')
+    length = max((len(activity.get_rates()) for activity in activities), default=0)
+    stacks = [np.full((len(activities), length), np.nan) for _ in range(3)]
+    for row, activity in enumerate(activities):
+        for stack, values in zip(stacks, [activity.get_temperatures(), activity.get_rates(), activity.get_alphas()]):
+            stack[row, :len(values)] = values
+    fit = fit_arrhenius(*stacks, max_conversion=max_conversion, confidence=confidence)
+    fits = []
+    for row, activity in enumerate(activities):
+        fits.append(ArrheniusFit(float(fit['activation_energy'][row]), float(fit['activation_energy_error'][row]), float(fit['ln_pre_exponential'][row]), float(fit['ln_pre_exponential_error'][row]), float(fit['r_squared'][row]), int(fit['points'][row]), float(fit['t_min'][row]), float(fit['t_max'][row]), max_conversion, confidence, activity.get_sample_name()))
+    return fits
+
+def get_arrhenius_fit(activity:Activity, max_conversion:float=0.15, confidence:float=0.95) -> ArrheniusFit:
+    """
+    Fit Arrhenius equation to activity data of single sample
+
+    parameters
+    ----------
+    activity:Activity
+        activity data of sample, conversions of key reactant must be known
+    max_conversion:float (default:0.15)
+        maximum conversion of points considered to be measured in differential regime
+    confidence:float (default:0.95)
+        confidence level of intervals
+
+    returns
+    -------
+    fit:ArrheniusFit
+        results of fit
+    """
+    return get_arrhenius_fits([activity], max_conversion, confidence)[0]
+
+def _get_t_quantiles(confidence:float, dofs:np.ndarray) -> np.ndarray:
+    """
+    Get two-sided quantiles of Student's t distribution for array of degrees of freedom
+
+    parameters
+    ----------
+    confidence:float
+        confidence level
+    dofs:numpy.ndarray
+        degrees of freedom
+
+    returns
+    -------
+    quantiles:numpy.ndarray
+        quantiles parallel to dofs, NaN for non-positive degrees of freedom
+    """
+    dofs = np.asarray(dofs)
+    quantiles = np.full(dofs.shape, np.nan)
+    for dof in np.unique(dofs[dofs > 0]).tolist():
+        quantiles[dofs == dof] = _get_t_quantile(1 - confidence, int(dof))
+    return quantiles
+
+def _get_t_quantile(p:float, n:int) -> float:
+    """
+    Get quantile of Student's t distribution for two-tailed probability by Hill's approximation (G. W. Hill, Algorithm 396, Commun. ACM 13 (1970) 619), which is accurate to at least 6 significant digits for all degrees of freedom.
+
+    parameters
+    ----------
+    p:float
+        two-tailed probability
+    n:int
+        degrees of freedom
+
+    returns
+    -------
+    quantile:float
+        value t such that P(|T| > t) = p
+    """
+    if n == 1:
+        p = p * math.pi / 2
+        return math.cos(p) / math.sin(p)
+    if n == 2:
+        return math.sqrt(2 / (p * (2 - p)) - 2)
+    a = 1 / (n - 0.5)
+    b = 48 / (a * a)
+    c = ((20700 * a / b - 98) * a - 16) * a + 96.36
+    d = ((94.5 / (b + c) - 3) / b + 1) * math.sqrt(a * math.pi / 2) * n
+    x = d * p
+    y = x ** (2 / n)
+    if y > 0.05 + a:
+        x = statistics.NormalDist().inv_cdf(1 - p / 2)
+        y = x * x
+        if n < 5:
+            c = c + 0.3 * (n - 4.5) * (x + 0.6)
+        c = (((0.05 * d * x - 5) * x - 7) * x - 2) * x + b + c
+        y = (((((0.4 * y + 6.3) * y + 36) * y + 94.5) / c - y - 3) / b + 1) * x
+        y = math.expm1(a * y * y)
+    else:
+        y = ((1 / (((n + 6) / (n * y) - 0.089 * d - 0.822) * (n + 2) * 3) + 0.5 / (n + 4)) * y - 1) * (n + 1) / (n + 2) + 1 / y
+    return math.sqrt(n * y)
@@ -0,0 +1,389 @@
+import numpy as np
+
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Light-off metrics engine. Light-off temperatures are calculated for a stack of conversion curves at once, so that metrics of many samples are obtained by a single vectorized call. Curves of different lengths are padded with NaN. Two methods are available: interpolation uses running maximum of conversion (i.e. monotone envelope of the curve) and finds temperature at which it first reaches the level by linear interpolation between neighbouring points, sigmoid fits logistic curve 1/(1+exp(-(T-T50)/w)) to each curve by linear least squares on logit of conversion and finds temperatures from fitted curve.
+"""
+
+# conversion levels of light-off temperatures (T10, T50, T90)
+LEVELS = (0.1, 0.5, 0.9)
+# methods of light-off temperatures determination
+METHODS = ('interpolation', 'sigmoid')
+
+class LightOff():
+    """
+    Wrapper for light-off metrics of a sample: temperatures at which conversion reaches specified levels (e.g. T10, T50, T90), maximum conversion and temperatures of maximum yields of products. Temperatures which cannot be determined from data (e.g. conversion level is not reached) are stored as NaN.
+    """
+
+    def __init__(self, levels:list[float]|np.ndarray[float, np.dtype], temperatures:list[float]|np.ndarray[float, np.dtype], max_conversion:float, max_yield_temperatures:dict[str,float]|None, method:str, sample_name:str|None):
+        """
+        Assign parameters to instance variables after conversion lists to numpy.ndarrays.
+
+        parameters
+        ----------
+        levels:list[float]|numpy.ndarray[float]
+            conversion levels as fractions
+        temperatures:list[float]|numpy.ndarray[float]
+            light-off temperatures parallel to levels
+        max_conversion:float
+            maximum measured conversion
+        max_yield_temperatures:dict[str,float]|None
+            temperatures of maximum yields in a format {<compound>:<temperature>} or None if yields were not calculated
+        method:str {interpolation|sigmoid}
+            method used to determine light-off temperatures
+        sample_name:str|None
+            name of sample
+        """
+        self.levels = np.asarray(levels, dtype=float)
+        self.temperatures = np.asarray(temperatures, dtype=float)
+        self.max_conversion = max_conversion
+        self.max_yield_temperatures = max_yield_temperatures
+        self.method = method
+        self.sample_name = sample_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of light-off metrics in a format:
+
+        Sample<tab><sample-name><br>
+        Method<tab><method><br>
+        <br>
+        Metric<tab>Value<br>
+        <metric><tab><value><br>
+        ...
+
+        returns
+        -------
+        string:str
+            string representation of light-off metrics
+        """
+        header = f'Sample\t{self.sample_name}\nMethod\t{self.method}\n\nMetric\tValue\n'
+        return header + ''.join(f'{metric}\t{value}\n' for metric, value in self.get_metrics().items())
+
+    def get_levels(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get conversion levels of light-off temperatures
+
+        returns
+        -------
+        levels:numpy.ndarray[float]
+            conversion levels as fractions
+        """
+        return self.levels
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get light-off temperatures parallel to conversion levels
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            light-off temperatures, NaN if temperature cannot be determined
+        """
+        return self.temperatures
+
+    def get_temperature(self, level:float) -> float:
+        """
+        Get light-off temperature at conversion level
+
+        parameters
+        ----------
+        level:float
+            conversion level as fraction
+
+        returns
+        -------
+        temperature:float
+            light-off temperature, NaN if temperature cannot be determined
+
+        raises
+        ------
+        exception:CalculatorException
+            if light-off temperature was not calculated for the level
+        """
+        matches = np.flatnonzero(np.isclose(self.levels, level))
+        if len(matches) == 0:
+            raise CalculatorException(f'Light-off temperature at conversion {level} was not calculated')
+        return float(self.temperatures[matches[0]])
+
+    def get_max_conversion(self) -> float:
+        """
+        Get maximum measured conversion
+
+        returns
+        -------
+        max_conversion:float
+            maximum conversion, NaN if conversion was not measured
+        """
+        return self.max_conversion
+
+    def get_max_yield_temperatures(self) -> dict[str,float]|None:
+        """
+        Get temperatures of maximum yields of products
+
+        returns
+        -------
+        max_yield_temperatures:dict[str,float]|None
+            temperatures of maximum yields in a format {<compound>:<temperature>} or None if yields were not calculated
+        """
+        return self.max_yield_temperatures
+
+    def get_method(self) -> str:
+        """
+        Get method used to determine light-off temperatures
+
+        returns
+        -------
+        method:str
+            interpolation or sigmoid
+        """
+        return self.method
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get sample name
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
+
+    def get_metrics(self) -> dict[str,float]:
+        """
+        Get light-off metrics as a flat dictionary, e.g. {'T10':..., 'T50':..., 'T90':..., 'Max conversion':..., 'T max yield CO':...}
+
+        returns
+        -------
+        metrics:dict[str,float]
+            metrics in a format {<metric>:<value>}
+        """
+        metrics = {get_level_name(level):temperature for level, temperature in zip(self.levels.tolist(), self.temperatures.tolist())}
+        metrics['Max conversion'] = self.max_conversion
+        for compound, temperature in (self.max_yield_temperatures or {}).items():
+            metrics[f'T max yield {compound}'] = temperature
+        return metrics
+
+def get_level_name(level:float) -> str:
+    """
+    Get name of light-off temperature at conversion level, e.g. T50 for 0.5
+
+    parameters
+    ----------
+    level:float
+        conversion level as fraction
+
+    returns
+    -------
+    name:str
+        name of light-off temperature
+    """
+    return f'T{level * 100:g}'
+
+def stack_curves(conversions:list[Conversion]) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Stack conversion curves to 2D arrays padding shorter curves with NaN at the end
+
+    parameters
+    ----------
+    conversions:list[Conversion]
+        conversion curves
+
+    returns
+    -------
+    (temperatures, alphas):tuple[numpy.ndarray, numpy.ndarray]
+        temperatures and conversions of shape (curves, points) sorted by temperature along rows
+    """
+    length = max((len(conversion.get_temperatures()) for conversion in conversions), default=0)
+    temperatures = np.full((len(conversions), length), np.nan)
+    alphas = np.full((len(conversions), length), np.nan)
+    for row, conversion in enumerate(conversions):
+        sorted_conversion = conversion.get_sorted()
+        temperatures[row, :len(sorted_conversion.get_temperatures())] = sorted_conversion.get_temperatures()
+        alphas[row, :len(sorted_conversion.get_alphas())] = sorted_conversion.get_alphas()
+    return (temperatures, alphas)
+
+def get_light_off_temperatures(temperatures:np.ndarray, alphas:np.ndarray, levels:tuple[float,...]=LEVELS, method:str='interpolation') -> np.ndarray:
+    """
+    Calculate light-off temperatures for stack of conversion curves
+
+    parameters
+    ----------
+    temperatures:numpy.ndarray
+        temperatures of shape (curves, points) or (points,) sorted along last axis and padded with NaN
+    alphas:numpy.ndarray
+        conversions as fractions of the same shape as temperatures
+    levels:tuple[float,...] (default:(0.1, 0.5, 0.9))
+        conversion levels as fractions
+    method:str {interpolation|sigmoid} (default:interpolation)
+        method used to determine light-off temperatures
+
+    returns
+    -------
+    light_off_temperatures:numpy.ndarray
+        light-off temperatures of shape (curves, levels) or (levels,) for single curve, NaN if temperature cannot be determined
+
+    raises
+    ------
+    exception:CalculatorException
+        if unknown method is provided
+    """
+    temperatures = np.asarray(temperatures, dtype=float)
+    alphas = np.asarray(alphas, dtype=float)
+    single = temperatures.ndim == 1
+    temperatures = np.atleast_2d(temperatures)
+    alphas = np.atleast_2d(alphas)
+    levels_array = np.asarray(levels, dtype=float)
+    if method == 'interpolation':
+        result = _interpolate(temperatures, alphas, levels_array)
+    elif method == 'sigmoid':
+        result = _fit_sigmoid(temperatures, alphas, levels_array)
+    else:
+        raise CalculatorException(f'Unknown light-off method "{method}"')
+    return result[0] if single else result
+
+def get_light_offs(conversions:list[Conversion], yields:list[Selectivity|None]|None=None, levels:tuple[float,...]=LEVELS, method:str='interpolation') -> list[LightOff]:
+    """
+    Calculate light-off metrics for several samples by a single vectorized call
+
+    parameters
+    ----------
+    conversions:list[Conversion]
+        conversion curves of samples
+    yields:list[Selectivity|None]|None (default:None)
+        yields of samples parallel to conversions or None if yields were not calculated
+    levels:tuple[float,...] (default:(0.1, 0.5, 0.9))
+        conversion levels as fractions
+    method:str {interpolation|sigmoid} (default:interpolation)
+        method used to determine light-off temperatures
+
+    returns
+    -------
+    light_offs:list[LightOff]
+        light-off metrics parallel to conversions
+    """
+    temperatures, alphas = stack_curves(conversions)
+    light_off_temperatures = get_light_off_temperatures(temperatures, alphas, levels, method)
+    valid = ~np.isnan(alphas)
+    max_conversions = np.where(valid.any(axis=1), np.max(np.where(valid, alphas, -np.inf), axis=1, initial=-np.inf), np.nan)
+    yields = yields if yields is not None else [None] * len(conversions)
+    light_offs = []
+    for conversion, _yield, row, max_conversion in zip(conversions, yields, light_off_temperatures, max_conversions.tolist()):
+        light_offs.append(LightOff(levels, row, max_conversion, None if _yield is None else get_max_yield_temperatures(_yield), method, conversion.get_sample_name()))
+    return light_offs
+
+def get_light_off(conversion:Conversion, _yield:Selectivity|None=None, levels:tuple[float,...]=LEVELS, method:str='interpolation') -> LightOff:
+    """
+    Calculate light-off metrics for single sample
+
+    parameters
+    ----------
+    conversion:Conversion
+        conversion curve of sample
+    _yield:Selectivity|None (default:None)
+        yields of sample or None if yields were not calculated
+    levels:tuple[float,...] (default:(0.1, 0.5, 0.9))
+        conversion levels as fractions
+    method:str {interpolation|sigmoid} (default:interpolation)
+        method used to determine light-off temperatures
+
+    returns
+    -------
+    light_off:LightOff
+        light-off metrics of sample
+    """
+    return get_light_offs([conversion], [_yield], levels, method)[0]
+
+def get_max_yield_temperatures(_yield:Selectivity) -> dict[str,float]:
+    """
+    Get temperatures at which yields of products are maximal
+
+    parameters
+    ----------
+    _yield:Selectivity
+        wrapper with yields of products
+
+    returns
+    -------
+    max_yield_temperatures:dict[str,float]
+        temperatures in a format {<compound>:<temperature>}, NaN if compound was not formed
+    """
+    matrix = _yield.get_matrix()
+    temperatures = _yield.get_temperatures()
+    if matrix.shape[1] == 0:
+        return {compound:np.nan for compound in _yield.get_compounds()}
+    masked = np.where(np.isnan(matrix), -np.inf, matrix)
+    indices = np.argmax(masked, axis=1)
+    values = np.where(masked.max(axis=1) > 0, temperatures[indices], np.nan)
+    return dict(zip(_yield.get_compounds(), values.tolist()))
+
+def _interpolate(temperatures:np.ndarray, alphas:np.ndarray, levels:np.ndarray) -> np.ndarray:
+    """
+    Find light-off temperatures by linear interpolation of running maximum of conversion. Temperature is NaN if level is not reached or if it is already exceeded at the first measured point.
+
+    parameters
+    ----------
+    temperatures:numpy.ndarray
+        temperatures of shape (curves, points)
+    alphas:numpy.ndarray
+        conversions of shape (curves, points)
+    levels:numpy.ndarray
+        conversion levels
+
+    returns
+    -------
+    light_off_temperatures:numpy.ndarray
+        light-off temperatures of shape (curves, levels)
+    """
+    curves, points = alphas.shape
+    if points == 0:
+        return np.full((curves, len(levels)), np.nan)
+    envelope = np.fmax.accumulate(alphas, axis=1)
+    reached = envelope[:, None, :] >= levels[None, :, None]
+    after = np.argmax(reached, axis=2)
+    before = np.maximum(after - 1, 0)
+    rows = np.arange(curves)[:, None]
+    t0 = temperatures[rows, before]
+    t1 = temperatures[rows, after]
+    a0 = envelope[rows, before]
+    a1 = envelope[rows, after]
+    with np.errstate(invalid='ignore', divide='ignore'):
+        result = t0 + (levels[None, :] - a0) * (t1 - t0) / (a1 - a0)
+    return np.where(reached.any(axis=2) & (after > 0), result, np.nan)
+
+def _fit_sigmoid(temperatures:np.ndarray, alphas:np.ndarray, levels:np.ndarray) -> np.ndarray:
+    """
+    Find light-off temperatures from logistic curve fitted to each conversion curve. Fit is done by linear least squares of logit of conversion vs. temperature using points with conversion between 1 and 99 %. Temperature is NaN if less than 2 points can be used for fit or if fitted conversion does not increase with temperature.
+
+    parameters
+    ----------
+    temperatures:numpy.ndarray
+        temperatures of shape (curves, points)
+    alphas:numpy.ndarray
+        conversions of shape (curves, points)
+    levels:numpy.ndarray
+        conversion levels
+
+    returns
+    -------
+    light_off_temperatures:numpy.ndarray
+        light-off temperatures of shape (curves, levels)
+    """
+    with np.errstate(invalid='ignore'):
+        used = (alphas > 0.01) & (alphas < 0.99) & ~np.isnan(temperatures)
+    x = np.where(used, temperatures, 0)
+    y = np.where(used, np.log(np.where(used, alphas, 0.5) / (1 - np.where(used, alphas, 0.5))), 0)
+    n = used.sum(axis=1)
+    sx = x.sum(axis=1)
+    sy = y.sum(axis=1)
+    sxx = (x * x).sum(axis=1)
+    sxy = (x * y).sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        slope = (n * sxy - sx * sy) / (n * sxx - sx * sx)
+        intercept = (sy - slope * sx) / n
+        result = (np.log(levels / (1 - levels))[None, :] - intercept[:, None]) / slope[:, None]
+    return np.where(((n >= 2) & (slope > 0))[:, None], result, np.nan)
@@ -0,0 +1,303 @@
+import hashlib
+import pickle
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any
+
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.logging_decorator import Logging
+
+# version of cached data format, must be increased if Chromatogram, Results or parsing/calculation algorithms are changed
+CACHE_VERSION = 3
+
+class ParseCache():
+    """
+    Persistent on-disk cache of parsed files and calculation results stored in sqlite database. Parsed files are cached by content hash which is found via (path, mtime, size) fingerprint of a file, so that file is read only if it was changed since the last run. Cache also stores second-level memo of whole calculation results keyed by fingerprint of input data and options of calculation, rendered plots keyed by fingerprint of plotted data and plot style and thermodynamic equilibria keyed by feed composition and pressure. Least recently used entries are evicted when total size of cached data exceeds size cap. Cache entries are versioned by parser type and CACHE_VERSION.
+    """
+
+    @Logging
+    def __init__(self, cache_path:Path, parser_type:str, max_size:int=256*1024**2):
+        """
+        Registers logger to the object which can be used by self.logger instance variable. Opens cache database creating it if necessary.
+
+        parameters
+        ----------
+        cache_path:Path
+            path to directory with cache database
+        parser_type:str
+            parser type used to parse files, cached records of other parsers are not used
+        max_size:int (default:256 MiB)
+            maximum total size of cached data in bytes
+        """
+        cache_path.mkdir(parents=True, exist_ok=True)
+        self.namespace = f'{parser_type}:{CACHE_VERSION}'
+        self.max_size = max_size
+        self.connection = sqlite3.connect(cache_path.joinpath('cache.sqlite'), timeout=30)
+        self.connection.execute('CREATE TABLE IF NOT EXISTS files (path TEXT PRIMARY KEY, mtime INTEGER, size INTEGER, digest TEXT)')
+        self.connection.execute('CREATE TABLE IF NOT EXISTS entries (key TEXT PRIMARY KEY, value BLOB, size INTEGER, accessed REAL)')
+        self.connection.commit()
+
+    def get_digest(self, path:Path) -> str:
+        """
+        Get content hash of file. Hash is read from the database if path, mtime and size of file were not changed since hash was calculated, otherwise file is read and hash is stored to the database.
+
+        parameters
+        ----------
+        path:Path
+            path to file
+
+        returns
+        -------
+        digest:str
+            hex representation of BLAKE2b hash of file contents
+        """
+        stat = path.stat()
+        row = self.connection.execute('SELECT mtime, size, digest FROM files WHERE path = ?', (str(path),)).fetchone()
+        if row is not None and row[0] == stat.st_mtime_ns and row[1] == stat.st_size:
+            return row[2]
+        digest = get_digest(path)
+        self.connection.execute('INSERT OR REPLACE INTO files VALUES (?, ?, ?, ?)', (str(path), stat.st_mtime_ns, stat.st_size, digest))
+        return digest
+
+    def get_fingerprint(self, paths:list[Path], *options:Any) -> str:
+        """
+        Get fingerprint of input data and options of calculation to be used as a key for calculation results.
+
+        parameters
+        ----------
+        paths:list[Path]
+            paths to input files in deterministic order
+        options:Any
+            options of calculation, their string representations are used in fingerprint
+
+        returns
+        -------
+        fingerprint:str
+            hex representation of hash of file digests and options
+        """
+        fingerprint = get_fingerprint([(path.name, self.get_digest(path)) for path in paths], *options)
+        self.connection.commit()
+        return fingerprint
+
+    def get_chromatogram(self, digest:str, name:str) -> Chromatogram|None:
+        """
+        Get parsed file from cache. Name of file is a part of the key, because time of acquisition of chromatogram may be parsed from it.
+
+        parameters
+        ----------
+        digest:str
+            content hash of file
+        name:str
+            name of file
+
+        returns
+        -------
+        chromatogram:Chromatogram|None
+            cached chromatogram or None if file was not found in cache
+        """
+        return self._get(f'parse:{self.namespace}:{digest}:{name}')
+
+    def put_chromatogram(self, digest:str, name:str, chromatogram:Chromatogram):
+        """
+        Store parsed file to cache
+
+        parameters
+        ----------
+        digest:str
+            content hash of file
+        name:str
+            name of file
+        chromatogram:Chromatogram
+            parsed file
+        """
+        self._put(f'parse:{self.namespace}:{digest}:{name}', chromatogram)
+
+    def get_result(self, fingerprint:str) -> Any|None:
+        """
+        Get calculation results from cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of input data and options of calculation
+
+        returns
+        -------
+        result:Any|None
+            cached results or None if results were not found in cache
+        """
+        return self._get(f'result:{self.namespace}:{fingerprint}')
+
+    def put_result(self, fingerprint:str, result:Any):
+        """
+        Store calculation results to cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of input data and options of calculation
+        result:Any
+            picklable calculation results
+        """
+        self._put(f'result:{self.namespace}:{fingerprint}', result)
+
+    def get_plot(self, fingerprint:str) -> bytes|None:
+        """
+        Get rendered plot from cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of plotted data and plot style
+
+        returns
+        -------
+        image:bytes|None
+            contents of cached image file or None if plot was not found in cache
+        """
+        return self._get(f'plot:{self.namespace}:{fingerprint}')
+
+    def put_plot(self, fingerprint:str, image:bytes):
+        """
+        Store rendered plot to cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of plotted data and plot style
+        image:bytes
+            contents of image file
+        """
+        self._put(f'plot:{self.namespace}:{fingerprint}', image)
+
+    def get_equilibrium(self, fingerprint:str) -> Any|None:
+        """
+        Get calculated thermodynamic equilibrium from cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of reaction, feed composition, pressure and temperature grid
+
+        returns
+        -------
+        equilibrium:Any|None
+            cached equilibrium or None if it was not found in cache
+        """
+        return self._get(f'equilibrium:{self.namespace}:{fingerprint}')
+
+    def put_equilibrium(self, fingerprint:str, equilibrium:Any):
+        """
+        Store calculated thermodynamic equilibrium to cache
+
+        parameters
+        ----------
+        fingerprint:str
+            fingerprint of reaction, feed composition, pressure and temperature grid
+        equilibrium:Any
+            picklable equilibrium
+        """
+        self._put(f'equilibrium:{self.namespace}:{fingerprint}', equilibrium)
+
+    def commit(self):
+        """
+        Commit changes to database and evict least recently used entries if total size of cached data exceeds size cap
+        """
+        total = self.connection.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+        if total > self.max_size:
+            evicted = 0
+            for key, size in self.connection.execute('SELECT key, size FROM entries ORDER BY accessed').fetchall():
+                if total <= self.max_size:
+                    break
+                self.connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+                total = total - size
+                evicted = evicted + 1
+            self.logger.debug(f'Evicted {evicted} entries from cache')
+        self.connection.commit()
+
+    def close(self):
+        """
+        Commit changes and close database connection
+        """
+        self.commit()
+        self.connection.close()
+
+    def _get(self, key:str) -> Any|None:
+        """
+        Get unpickled value from database updating its access time
+
+        parameters
+        ----------
+        key:str
+            key of entry
+
+        returns
+        -------
+        value:Any|None
+            cached value or None if entry was not found or cannot be unpickled
+        """
+        row = self.connection.execute('SELECT value FROM entries WHERE key = ?', (key,)).fetchone()
+        if row is None:
+            return None
+        try:
+            value = pickle.loads(row[0])
+        except Exception:
+            self.logger.warning(f'Cannot load cache entry {key}. Removing it.')
+            self.connection.execute('DELETE FROM entries WHERE key = ?', (key,))
+            return None
+        self.connection.execute('UPDATE entries SET accessed = ? WHERE key = ?', (time.time(), key))
+        return value
+
+    def _put(self, key:str, value:Any):
+        """
+        Store pickled value to database
+
+        parameters
+        ----------
+        key:str
+            key of entry
+        value:Any
+            picklable value
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.connection.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)', (key, data, len(data), time.time()))
+
+def get_digest(path:Path) -> str:
+    """
+    Calculate content hash of file
+
+    parameters
+    ----------
+    path:Path
+        path to file
+
+    returns
+    -------
+    digest:str
+        hex representation of BLAKE2b hash of file contents
+    """
+    return hashlib.blake2b(path.read_bytes(), digest_size=20).hexdigest()
+
+def get_fingerprint(digests:list[tuple[str,str]], *options:Any) -> str:
+    """
+    Calculate fingerprint of input files and options of calculation
+
+    parameters
+    ----------
+    digests:list[tuple[str,str]]
+        list of tuples (<file-name>, <digest>) in deterministic order
+    options:Any
+        options of calculation, their string representations are used in fingerprint
+
+    returns
+    -------
+    fingerprint:str
+        hex representation of hash of file digests and options
+    """
+    fingerprint = hashlib.blake2b(digest_size=20)
+    for name, digest in digests:
+        fingerprint.update(f'{name}\0{digest}\0'.encode())
+    for option in options:
+        fingerprint.update(f'{option!r}\0'.encode())
+    return fingerprint.hexdigest()
@@ -0,0 +1,77 @@
+class ParseReport():
+    """
+    Report about files processed by parser. Files which were not parsed are stored together with the reason in order of input files, so that report is the same regardless of the order in which files were processed.
+    """
+
+    def __init__(self):
+        """
+        Initialize empty report.
+        """
+        self.parsed = 0
+        self.errors = []
+
+    def __str__(self) -> str:
+        """
+        Get string representation of report in a form of table:
+
+        File<tab>Error
+
+        returns
+        -------
+        string:str
+            string representation of report
+        """
+        header = f'Parsed\t{self.parsed}\nSkipped\t{len(self.errors)}\n\nFile\tError\n'
+        return header + ''.join(f'{file}\t{error}\n' for file, error in self.errors)
+
+    def __len__(self) -> int:
+        """
+        Get number of files which were not parsed
+
+        returns
+        -------
+        length:int
+            number of errors in report
+        """
+        return len(self.errors)
+
+    def add_parsed(self):
+        """
+        Register successfully parsed file
+        """
+        self.parsed = self.parsed + 1
+
+    def add_error(self, file:str, error:str):
+        """
+        Register file which was not parsed
+
+        parameters
+        ----------
+        file:str
+            path to file
+        error:str
+            reason why file was not parsed
+        """
+        self.errors.append((file, error))
+
+    def get_parsed(self) -> int:
+        """
+        Get number of successfully parsed files
+
+        returns
+        -------
+        parsed:int
+            number of parsed files
+        """
+        return self.parsed
+
+    def get_errors(self) -> list[tuple[str,str]]:
+        """
+        Get list of files which were not parsed
+
+        returns
+        -------
+        errors:list[tuple[str,str]]
+            list of tuples (<file>, <error>) in order of input files
+        """
+        return self.errors
@@ -1,6 +1,8 @@
 from pathlib import Path
 
 from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.parse_report import ParseReport
+from pycatalicism.calc.chromatogram import Chromatogram
 
 class Parser():
     """
@@ -16,7 +18,7 @@ class Parser():
         input_data_path:Path
             path to directory with data files
         initial_data_path:Path
-            path to file with initial (i.e. before catalytic reaction occured) dad
+            path to file with initial (i.e. before catalytic reaction occured) data or to directory with replicate files of initial data
         sample_name:str|None
             name of sample used as label for plotting
 
@@ -31,3 +33,84 @@ class Parser():
             if this method is not overriden
         """
         raise NotImplementedError()
+
+    def parse_initial(self, path:Path) -> Chromatogram:
+        """
+        Methods of concrete classes should override this method.
+
+        parameters
+        ----------
+        path:Path
+            path to file with initial data or to directory with replicate files of initial data
+
+        returns
+        -------
+        chromatogram:Chromatogram
+            parsed data, replicates are aggregated into single chromatogram
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden
+        """
+        raise NotImplementedError()
+
+    def get_report(self) -> ParseReport:
+        """
+        Methods of concrete classes should override this method.
+
+        returns
+        -------
+        report:ParseReport
+            report about files processed by the last call of parse_data method
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden
+        """
+        raise NotImplementedError()
+
+    def parse_file(self, path:Path) -> Chromatogram:
+        """
+        Methods of concrete classes should override this method.
+
+        parameters
+        ----------
+        path:Path
+            path to single data file
+
+        returns
+        -------
+        chromatogram:Chromatogram
+            parsed data
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden
+        """
+        raise NotImplementedError()
+
+    def parse_bytes(self, data:bytes, source:str) -> Chromatogram:
+        """
+        Methods of concrete classes should override this method.
+
+        parameters
+        ----------
+        data:bytes
+            contents of single data file or record
+        source:str
+            name of data source used in error messages
+
+        returns
+        -------
+        chromatogram:Chromatogram
+            parsed data
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden
+        """
+        raise NotImplementedError()
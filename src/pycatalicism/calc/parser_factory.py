@@ -1,12 +1,13 @@
 from pycatalicism.calc.parser import Parser
 from pycatalicism.calc.parserexception import ParserException
+from pycatalicism.calc.parse_cache import ParseCache
 from pycatalicism.calc.chromatec_crystal_composition_copy_paste_parser import ChromatecCrystalCompositionCopyPasteParser
 
 """
 Factory for creating parser for specific data format.
 """
 
-def get_parser(parser_type:str) -> Parser:
+def get_parser(parser_type:str, workers:int=1, pool_type:str='process', chunk_size:int=64, cache:ParseCache|None=None, replicate_statistic:str='mean', outlier_threshold:float|None=3.5) -> Parser:
     """
     Get parser for specified data format.
 
@@ -14,6 +15,18 @@ def get_parser(parser_type:str) -> Parser:
     ----------
     parser_type:str {chromatec-crystal-composition-copy-paste}
         parser type representing certain data format
+    workers:int (default:1)
+        number of workers used to parse files
+    pool_type:str {process|thread} (default:process)
+        type of worker pool
+    chunk_size:int (default:64)
+        number of files sent to worker at once
+    cache:ParseCache|None (default:None)
+        persistent cache of parsed files
+    replicate_statistic:str {mean|median} (default:mean)
+        statistic used to aggregate replicate files of initial data
+    outlier_threshold:float|None (default:3.5)
+        threshold of modified z-score used to reject outliers among replicates
 
     raises
     ------
@@ -21,6 +34,6 @@ def get_parser(parser_type:str) -> Parser:
         if parser type is not known
     """
     if parser_type == 'chromatec-crystal-composition-copy-paste':
-        return ChromatecCrystalCompositionCopyPasteParser()
+        return ChromatecCrystalCompositionCopyPasteParser(workers=workers, pool_type=pool_type, chunk_size=chunk_size, cache=cache, replicate_statistic=replicate_statistic, outlier_threshold=outlier_threshold)
     else:
         raise ParserException(f'cannot create parser for {parser_type}')
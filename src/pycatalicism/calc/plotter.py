@@ -1,14 +1,17 @@
+import hashlib
+import importlib.metadata
 from pathlib import Path
 
 from pycatalicism.calc.conversion import Conversion
 from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.equilibrium import Equilibrium
 
 class Plotter():
     """
-    Abstract class for plotting resulting data
+    Abstract class for plotting resulting data. Plots which are only exported to file are rendered headless by Agg canvas without pyplot, so that figures are not registered in pyplot state and are freed as soon as plot is exported. pyplot is used only if plot must be shown. matplotlib is imported only when figure is created, so that plotters can be used to get fingerprints of cached plots without loading it.
     """
 
-    def plot(self, conversion:Conversion, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None):
+    def plot(self, conversion:Conversion, selectivity:Selectivity|None, show_plot:bool=False, output_plot_path:Path|None=None, plot_title:str|None=None, equilibrium:Equilibrium|None=None):
         """
         Method should be overriden by concrete classes. Plots conversion, selectivity vs. temperature plots, shows them and exports to file.
 
@@ -22,6 +25,10 @@ class Plotter():
             show plot if True
         output_plot_path:Path|None (default:None)
             path to directory to export resulting plots or None if export is not needed
+        plot_title:str|None (default:None)
+            title of plot
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium overlaid on plots as dashed lines
 
         raises
         ------
@@ -29,3 +36,83 @@ class Plotter():
             if method is not overriden
         """
         raise NotImplementedError()
+
+    def get_fingerprint(self, conversion:Conversion|None, selectivity:Selectivity|None, plot_title:str|None=None, equilibrium:Equilibrium|None=None) -> str:
+        """
+        Get content hash of plot made from data with current plotter style. Plot with the same fingerprint is the same image, thus, fingerprint can be used as a key for cached plots.
+
+        parameters
+        ----------
+        conversion:Conversion|None
+            wrapper for conversion data
+        selectivity:Selectivity|None
+            wrapper for selectivity data
+        plot_title:str|None (default:None)
+            title of plot
+        equilibrium:Equilibrium|None (default:None)
+            thermodynamic equilibrium overlaid on plots
+
+        returns
+        -------
+        fingerprint:str
+            hex representation of BLAKE2b hash of plotted data and style
+        """
+        style = {name:value for name, value in vars(self).items() if name != 'logger'}
+        version = importlib.metadata.version('matplotlib')
+        fingerprint = hashlib.blake2b(digest_size=20)
+        fingerprint.update(f'{type(self).__name__}\0{sorted(style.items())!r}\0{plot_title!r}\0{version}\0'.encode())
+        if conversion:
+            fingerprint.update(b'conversion\0')
+            fingerprint.update(conversion.get_temperatures().astype(float).tobytes())
+            fingerprint.update(conversion.get_alphas().astype(float).tobytes())
+        if selectivity:
+            fingerprint.update(f'selectivity\0{selectivity.get_compounds()!r}\0'.encode())
+            fingerprint.update(selectivity.get_temperatures().astype(float).tobytes())
+            fingerprint.update(selectivity.get_matrix().astype(float).tobytes())
+        if equilibrium:
+            fingerprint.update(b'equilibrium\0')
+            fingerprint.update(equilibrium.get_temperatures().astype(float).tobytes())
+            fingerprint.update(equilibrium.get_alphas().astype(float).tobytes())
+            if equilibrium.get_selectivities() is not None:
+                fingerprint.update(equilibrium.get_selectivities().astype(float).tobytes())
+        return fingerprint.hexdigest()
+
+    def _get_figure(self, show_plot:bool) -> 'matplotlib.figure.Figure':
+        """
+        Create new figure. If plot is not shown, figure is attached to Agg canvas directly and pyplot is not used.
+
+        parameters
+        ----------
+        show_plot:bool
+            whether figure will be shown
+
+        returns
+        -------
+        figure:Figure
+            new empty figure
+        """
+        if show_plot:
+            import matplotlib.pyplot as plt
+            return plt.figure()
+        import matplotlib.figure
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        figure = matplotlib.figure.Figure()
+        FigureCanvasAgg(figure)
+        return figure
+
+    def _close_figure(self, figure:'matplotlib.figure.Figure', show_plot:bool):
+        """
+        Release figure after it was shown and/or exported.
+
+        parameters
+        ----------
+        figure:Figure
+            figure to release
+        show_plot:bool
+            whether figure was created for showing by pyplot
+        """
+        if show_plot:
+            import matplotlib.pyplot as plt
+            plt.close(figure)
+        else:
+            figure.clear()
@@ -1,7 +1,9 @@
 from pycatalicism.calc.plotter import Plotter
 from pycatalicism.calc.co_oxidation_plotter import COOxidationPlotter
 from pycatalicism.calc.co2_hydrogenation_plotter import CO2HydrogenationPlotter
+from pycatalicism.calc.reaction_plotter import ReactionPlotter
 from pycatalicism.calc.plotterexception import PlotterException
+from pycatalicism.calc import reaction_factory
 
 """
 Factory for creation of resulting data plotters.
@@ -13,8 +15,8 @@ def get_plotter(reaction:str) -> Plotter:
 
     parameters
     ----------
-    reaction:str {co-oxidation|co2-hydrogenation}
-        chemical reaction of interest
+    reaction:str
+        chemical reaction of interest, generic plotter is used for reactions other than co-oxidation and co2-hydrogenation
 
     returns
     -------
@@ -30,5 +32,7 @@ def get_plotter(reaction:str) -> Plotter:
         return COOxidationPlotter()
     elif reaction == 'co2-hydrogenation':
         return CO2HydrogenationPlotter()
+    elif reaction in reaction_factory.get_reaction_names():
+        return ReactionPlotter(reaction_factory.get_reaction(reaction))
     else:
         raise PlotterException(f'Cannot create plotter for reaction "{reaction}"')
@@ -4,13 +4,13 @@ from pycatalicism.logging_decorator import Logging
 
 class RawData():
     """
-    Wrapper for imported data storage. Data are stored as numpy.ndarrays.
+    Wrapper for imported data storage. Data are stored in columnar form: concentrations are kept as a dense float matrix (points x compounds), temperatures, ambient temperatures, pressures, flow rates and times of acquisition are kept as float numpy.ndarrays parallel to matrix rows. All measurements are kept even if several of them were done at the same temperature. Compound to column and temperature to row indices make single value lookups O(1), such lookups return the first measurement done at the temperature.
     """
 
     @Logging
-    def __init__(self, temperatures:list[float]|np.ndarray[float,np.dtype], initial_concentrations:dict[str,float], concentrations:list[dict[str,float]]|np.ndarray[dict[str,float],np.dtype], initial_ambient_temperature:float|None=None, initial_ambient_pressure:float|None=None, initial_flow:float|None=None, final_ambient_temperatures:list[float]|np.ndarray[float,np.dtype]|None=None, final_ambient_pressures:list[float]|np.ndarray[float,np.dtype]|None=None, final_flows:list[float]|np.ndarray[float,np.dtype]|None=None, sample_name:str|None=None):
+    def __init__(self, temperatures:list[float]|np.ndarray[float,np.dtype], initial_concentrations:dict[str,float], concentrations:list[dict[str,float]]|np.ndarray, initial_ambient_temperature:float|None=None, initial_ambient_pressure:float|None=None, initial_flow:float|None=None, final_ambient_temperatures:list[float]|np.ndarray[float,np.dtype]|None=None, final_ambient_pressures:list[float]|np.ndarray[float,np.dtype]|None=None, final_flows:list[float]|np.ndarray[float,np.dtype]|None=None, sample_name:str|None=None, compounds:list[str]|None=None, timestamps:list[float]|np.ndarray[float,np.dtype]|None=None):
         """
-        Registers logger with instance of this class which can be accessed via self.logger instance variable. Assigns parameters to instance variables converting lists to numpy.ndarray types.
+        Registers logger with instance of this class which can be accessed via self.logger instance variable. Assigns parameters to instance variables converting lists to numpy.ndarray types and concentrations to dense matrix.
 
         parameters
         ----------
@@ -22,8 +22,8 @@ class RawData():
                     chemical formula of compound
                 concentration:float
                     concentration in mol.%
-        concentrations:list[dict[str,float]]|numpy.ndarray[dict[str,float]]
-            list of compounds concentrations parrallel to temperatures list. Each list element is a dictionary in a format similar to initial_concentrations parameter
+        concentrations:list[dict[str,float]]|numpy.ndarray
+            list of compounds concentrations parrallel to temperatures list. Each list element is a dictionary in a format similar to initial_concentrations parameter. If compounds parameter is provided, concentrations must be a matrix of shape (len(temperatures), len(compounds)) with columns parallel to compounds list, missing values must be numpy.nan
         initial_ambient_temperature:float|None (default:None)
             temperature of gas at the point of initial total flow rate measurement in °C
         initial_ambient_pressure:float|None (default:None)
@@ -38,18 +38,81 @@ class RawData():
             list of total flow rates in ml/min
         sample_name:str|None (default:None)
             sample name which will be used as label for plotting
+        compounds:list[str]|None (default:None)
+            names of compounds corresponding to concentration matrix columns or None if concentrations are provided as list of dictionaries
+        timestamps:list[float]|numpy.ndarray[float]|None (default:None)
+            times of acquisition of chromatograms as POSIX timestamps in s parallel to temperatures, numpy.nan if time is not known for some chromatograms, None if it is not known for all of them
         """
-        self.temperatures = np.array(temperatures)
+        self.temperatures = np.asarray(temperatures, dtype=float).reshape(-1)
         self.init_amb_temp = initial_ambient_temperature
         self.init_amb_pres = initial_ambient_pressure
         self.init_flow = initial_flow
-        self.logger.debug(f'{final_ambient_temperatures = }')
-        self.fin_amb_temps = None if final_ambient_temperatures is None else np.array(final_ambient_temperatures)
-        self.fin_amb_pres = None if final_ambient_pressures is None else np.array(final_ambient_pressures)
-        self.fin_flows = None if final_flows is None else np.array(final_flows)
+        self.fin_amb_temps = None if final_ambient_temperatures is None else np.asarray(final_ambient_temperatures, dtype=float)
+        self.fin_amb_pres = None if final_ambient_pressures is None else np.asarray(final_ambient_pressures, dtype=float)
+        self.fin_flows = None if final_flows is None else np.asarray(final_flows, dtype=float)
         self.init_concs = initial_concentrations
-        self.concs = np.array(concentrations)
+        if compounds is None:
+            self.compounds, self.conc_matrix = self._to_matrix(concentrations)
+        else:
+            self.compounds = list(compounds)
+            self.conc_matrix = np.asarray(concentrations, dtype=float).reshape(len(self.temperatures), len(self.compounds))
+        self.compound_index = {compound:column for column, compound in enumerate(self.compounds)}
+        self.temperature_index = {}
+        for row, temperature in enumerate(self.temperatures.tolist()):
+            self.temperature_index.setdefault(temperature, row)
         self.sample_name = sample_name
+        self.timestamps = None if timestamps is None else np.asarray(timestamps, dtype=float)
+
+    def _to_matrix(self, concentrations:list[dict[str,float]]|np.ndarray) -> tuple[list[str],np.ndarray]:
+        """
+        Convert list of concentration dictionaries to dense matrix. Columns are ordered by the first appearance of compound in the list. Concentrations of compounds not found at certain temperature are stored as numpy.nan.
+
+        parameters
+        ----------
+        concentrations:list[dict[str,float]]|numpy.ndarray[dict[str,float]]
+            list of dictionaries in a format {<compound>:<concentration>}
+
+        returns
+        -------
+        (compounds, matrix):tuple
+            compounds:list[str]
+                names of compounds parallel to matrix columns
+            matrix:numpy.ndarray
+                concentrations matrix of shape (points, compounds)
+        """
+        compound_index = {}
+        for point in concentrations:
+            for compound in point:
+                compound_index.setdefault(compound, len(compound_index))
+        matrix = np.full((len(concentrations), len(compound_index)), np.nan)
+        for row, point in enumerate(concentrations):
+            columns = [compound_index[compound] for compound in point]
+            matrix[row, columns] = list(point.values())
+        return list(compound_index), matrix
+
+    def _get_row(self, temperature:float) -> int:
+        """
+        Get row of data matrix corresponding to temperature of catalytic reaction. If several measurements were done at the same temperature, the first one is returned.
+
+        parameters
+        ----------
+        temperature:float
+            temperature of catalytic reaction
+
+        returns
+        -------
+        row:int
+            index of data row
+
+        raises
+        ------
+        exception:IndexError
+            if no measurement was done at specified temperature
+        """
+        try:
+            return self.temperature_index[float(temperature)]
+        except KeyError:
+            raise IndexError(f'No measurement was done at temperature {temperature}')
 
     def get_temperatures(self) -> np.ndarray[float, np.dtype]:
         """
@@ -62,6 +125,53 @@ class RawData():
         """
         return self.temperatures
 
+    def get_compounds(self) -> list[str]:
+        """
+        Get names of compounds which concentrations were measured, ordered as concentration matrix columns
+
+        returns
+        -------
+        compounds:list[str]
+            list of compounds
+        """
+        return self.compounds
+
+    def get_conc_matrix(self) -> np.ndarray:
+        """
+        Get concentrations matrix of shape (points, compounds) with rows parallel to temperatures and columns parallel to compounds. Concentrations which were not measured are stored as numpy.nan.
+
+        returns
+        -------
+        matrix:numpy.ndarray
+            concentrations in mol.%
+        """
+        return self.conc_matrix
+
+    def get_concs(self, compound:str) -> np.ndarray[float, np.dtype]:
+        """
+        Get concentrations of compound at all temperatures as a vector parallel to temperatures
+
+        parameters
+        ----------
+        compound:str
+            compound to get concentrations for
+
+        returns
+        -------
+        concentrations:numpy.ndarray[float]
+            concentrations in mol.%, zeros where concentration was not measured
+        """
+        column = self.compound_index.get(compound)
+        if column is None:
+            self.logger.warning(f'Did not find concentrations for "{compound}". Returning zeros')
+            return np.zeros(len(self.temperatures))
+        concs = self.conc_matrix[:, column]
+        missing = np.isnan(concs)
+        if missing.any():
+            self.logger.warning(f'Did not find concentration for "{compound}" at "{self.temperatures[missing]}". Using zeros')
+            concs = np.where(missing, 0.0, concs)
+        return concs
+
     def get_init_amb_temp(self) -> float|None:
         """
         Get temperature of gas at the point of initial total flow rate measurement in °C
@@ -95,6 +205,39 @@ class RawData():
         """
         return self.init_flow
 
+    def get_fin_amb_temps(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get temperatures of gas at the point of total flow rate measurement parallel to temperatures of catalytic experiment
+
+        returns
+        -------
+        ambient_temperatures:numpy.ndarray[float]|None
+            temperatures in °C or None if flow rate was not measured
+        """
+        return self.fin_amb_temps
+
+    def get_fin_amb_pressures(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get pressures of gas at the point of total flow rate measurement parallel to temperatures of catalytic experiment
+
+        returns
+        -------
+        ambient_pressures:numpy.ndarray[float]|None
+            pressures in Pa or None if flow rate was not measured
+        """
+        return self.fin_amb_pres
+
+    def get_fin_flows(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get total gas flow rates parallel to temperatures of catalytic experiment
+
+        returns
+        -------
+        flow_rates:numpy.ndarray[float]|None
+            flow rates in ml/min or None if flow rate was not measured
+        """
+        return self.fin_flows
+
     def get_fin_amb_temp(self, temperature:float) -> float|None:
         """
         Get temperature of gas at the point of total flow rate measurement during catalytic experiment at temperature provided as parameter to the method
@@ -109,9 +252,8 @@ class RawData():
         ambient_temperature:float|None
             temperature in °C
         """
-        self.logger.debug(f'{self.fin_amb_temps = }')
         if self.fin_amb_temps is not None:
-            return float(self.fin_amb_temps[self.temperatures == temperature])
+            return float(self.fin_amb_temps[self._get_row(temperature)])
         else:
             return None
 
@@ -130,7 +272,7 @@ class RawData():
             pressure in Pa
         """
         if self.fin_amb_pres is not None:
-            return float(self.fin_amb_pres[self.temperatures == temperature])
+            return float(self.fin_amb_pres[self._get_row(temperature)])
         else:
             return None
 
@@ -149,7 +291,7 @@ class RawData():
             flow rate in ml/min
         """
         if self.fin_flows is not None:
-            return float(self.fin_flows[self.temperatures == temperature])
+            return float(self.fin_flows[self._get_row(temperature)])
         else:
             return None
 
@@ -169,6 +311,17 @@ class RawData():
         """
         return self.init_concs[compound]
 
+    def get_init_concs(self) -> dict[str,float]:
+        """
+        Get initial concentrations of all compounds
+
+        returns
+        -------
+        initial_concentrations:dict[str,float]
+            dictionary in a format {<compound>:<concentration>} with concentrations in mol.%
+        """
+        return self.init_concs
+
     def get_conc(self, compound:str, temperature:float) -> float:
         """
         Get concentration of compound at temperature of catalytic reaction provided as parameter to the method
@@ -184,17 +337,19 @@ class RawData():
         -------
         concentration:float
             concentration in mol.% or 0 if at specified temperature concentration for the compound is not found
+
+        raises
+        ------
+        exception:IndexError
+            if no measurement was done at specified temperature
         """
-        self.logger.debug(f'{self.concs = }')
-        self.logger.debug(f'{self.temperatures = }')
-        self.logger.debug(f'{compound = }')
-        self.logger.debug(f'{temperature = }')
-        try:
-            conc = self.concs[self.temperatures == temperature][0][compound]
-        except KeyError:
+        row = self._get_row(temperature)
+        column = self.compound_index.get(compound)
+        conc = np.nan if column is None else self.conc_matrix[row, column]
+        if np.isnan(conc):
             self.logger.warning(f'Did not find concentration for "{compound}" at "{temperature}". Returning zero')
-            conc = 0
-        return conc
+            return 0
+        return float(conc)
 
     def get_sample_name(self) -> str|None:
         """
@@ -206,3 +361,14 @@ class RawData():
             name of sample
         """
         return self.sample_name
+
+    def get_timestamps(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get times of acquisition of chromatograms parallel to temperatures of catalytic experiment
+
+        returns
+        -------
+        timestamps:numpy.ndarray[float]|None
+            POSIX timestamps in s, numpy.nan where time is not known, None if times were not known for all chromatograms
+        """
+        return self.timestamps
@@ -0,0 +1,163 @@
+import numpy as np
+
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.chromatogram import Chromatogram
+
+class RawDataBuilder():
+    """
+    Preallocated columnar buffer to collect parsed chromatograms. Concentrations of each chromatogram are written straight into a row of dense matrix, new compounds get new columns. Buffer grows by doubling if initial capacity is exceeded.
+    """
+
+    def __init__(self, capacity:int=16):
+        """
+        Preallocate buffers for capacity chromatograms.
+
+        parameters
+        ----------
+        capacity:int (default:16)
+            expected number of chromatograms
+        """
+        capacity = max(capacity, 1)
+        self.size = 0
+        self.compound_index = {}
+        self.temperatures = np.empty(capacity)
+        self.concentrations = np.full((capacity, 8), np.nan)
+        self.ambient_temperatures = np.full(capacity, np.nan)
+        self.ambient_pressures = np.full(capacity, np.nan)
+        self.flows = np.full(capacity, np.nan)
+        self.timestamps = np.full(capacity, np.nan)
+
+    def __len__(self) -> int:
+        """
+        Get number of chromatograms added to buffer
+
+        returns
+        -------
+        size:int
+            number of chromatograms
+        """
+        return self.size
+
+    def append(self, chromatogram:Chromatogram):
+        """
+        Write chromatogram data to the next row of buffer
+
+        parameters
+        ----------
+        chromatogram:Chromatogram
+            parsed chromatogram
+        """
+        if self.size == len(self.temperatures):
+            self._grow_rows()
+        self._write(self.size, chromatogram)
+        self.size = self.size + 1
+
+    def replace(self, row:int, chromatogram:Chromatogram):
+        """
+        Overwrite row of buffer with data of chromatogram, e.g. when data file was changed
+
+        parameters
+        ----------
+        row:int
+            index of row to overwrite
+        chromatogram:Chromatogram
+            parsed chromatogram
+        """
+        if row >= self.size:
+            raise IndexError(f'row {row} is out of buffer with {self.size} rows')
+        self.concentrations[row] = np.nan
+        self._write(row, chromatogram)
+
+    def remove(self, row:int):
+        """
+        Remove row from buffer shifting following rows up
+
+        parameters
+        ----------
+        row:int
+            index of row to remove
+        """
+        if row >= self.size:
+            raise IndexError(f'row {row} is out of buffer with {self.size} rows')
+        for buffer in [self.temperatures, self.concentrations, self.ambient_temperatures, self.ambient_pressures, self.flows, self.timestamps]:
+            buffer[row:self.size-1] = buffer[row+1:self.size]
+        self.size = self.size - 1
+        self.concentrations[self.size] = np.nan
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get temperatures of chromatograms in buffer in order of rows
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            view of temperatures buffer
+        """
+        return self.temperatures[:self.size]
+
+    def build(self, initial:Chromatogram, sample_name:str|None, rows:np.ndarray[int, np.dtype]|None=None) -> RawData:
+        """
+        Create RawData from collected chromatograms. Flow rate data are passed to RawData only if they were measured before catalytic reactor, times of acquisition are passed only if they are known for at least one chromatogram.
+
+        parameters
+        ----------
+        initial:Chromatogram
+            chromatogram measured before catalytic reaction started
+        sample_name:str|None
+            name of sample used as label for plotting
+        rows:numpy.ndarray[int]|None (default:None)
+            indices of rows to create RawData from in order of resulting data, all rows are used if None
+
+        returns
+        -------
+        raw_data:RawData
+            wrapper with collected data
+        """
+        if rows is None:
+            rows = np.arange(self.size)
+        flow_is_measured = initial.get_ambient_temperature() and initial.get_ambient_pressure() and initial.get_flow()
+        timestamps = self.timestamps[rows]
+        return RawData(temperatures=self.temperatures[rows], initial_concentrations=initial.get_concentrations_dict(), concentrations=self.concentrations[rows, :len(self.compound_index)], initial_ambient_temperature=initial.get_ambient_temperature(), initial_ambient_pressure=initial.get_ambient_pressure(), initial_flow=initial.get_flow(), final_ambient_temperatures=self.ambient_temperatures[rows] if flow_is_measured else None, final_ambient_pressures=self.ambient_pressures[rows] if flow_is_measured else None, final_flows=self.flows[rows] if flow_is_measured else None, sample_name=sample_name, compounds=list(self.compound_index), timestamps=timestamps if np.isfinite(timestamps).any() else None)
+
+    def _write(self, row:int, chromatogram:Chromatogram):
+        """
+        Write chromatogram data to row of buffer adding columns for new compounds
+
+        parameters
+        ----------
+        row:int
+            index of row
+        chromatogram:Chromatogram
+            parsed chromatogram
+        """
+        columns = [self.compound_index.setdefault(compound, len(self.compound_index)) for compound in chromatogram.get_compounds()]
+        if len(self.compound_index) > self.concentrations.shape[1]:
+            self._grow_columns()
+        self.temperatures[row] = chromatogram.get_temperature()
+        self.concentrations[row, columns] = chromatogram.get_concentrations()
+        self.ambient_temperatures[row] = np.nan if chromatogram.get_ambient_temperature() is None else chromatogram.get_ambient_temperature()
+        self.ambient_pressures[row] = np.nan if chromatogram.get_ambient_pressure() is None else chromatogram.get_ambient_pressure()
+        self.flows[row] = np.nan if chromatogram.get_flow() is None else chromatogram.get_flow()
+        self.timestamps[row] = np.nan if chromatogram.get_timestamp() is None else chromatogram.get_timestamp()
+
+    def _grow_rows(self):
+        """
+        Double number of rows in buffers
+        """
+        capacity = 2 * len(self.temperatures)
+        self.temperatures = np.resize(self.temperatures, capacity)
+        self.concentrations = np.vstack([self.concentrations, np.full(self.concentrations.shape, np.nan)])
+        for name in ['ambient_temperatures', 'ambient_pressures', 'flows', 'timestamps']:
+            old = getattr(self, name)
+            setattr(self, name, np.concatenate([old, np.full(len(old), np.nan)]))
+
+    def _grow_columns(self):
+        """
+        Double number of columns in concentrations buffer until all known compounds fit in
+        """
+        columns = self.concentrations.shape[1]
+        while columns < len(self.compound_index):
+            columns = 2 * columns
+        grown = np.full((self.concentrations.shape[0], columns), np.nan)
+        grown[:, :self.concentrations.shape[1]] = self.concentrations
+        self.concentrations = grown
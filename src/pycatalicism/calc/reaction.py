@@ -0,0 +1,217 @@
+import re
+
+import numpy as np
+
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+class Reaction():
+    """
+    Declaration of catalytic reaction as data: reactants, products, stoichiometric coefficients of products and element balance matrix of all compounds. First reactant is the key reactant for which conversion is calculated. Selectivities are calculated on the basis of one chemical element (carbon by default), i.e. each product is weighted by the number of basis element atoms in its molecule. Conversion based on products concentrations and yields are calculated using stoichiometric coefficients, i.e. number of key reactant molecules converted to one molecule of each product.
+    """
+
+    def __init__(self, name:str, reactants:list[str], products:list[str], element:str='C', coefficients:list[float]|None=None):
+        """
+        Assign parameters to instance variables, parse chemical formulas of all compounds, build element balance matrix and get stoichiometric coefficients of products.
+
+        parameters
+        ----------
+        name:str
+            name of reaction
+        reactants:list[str]
+            chemical formulas of reactants, first one is the key reactant
+        products:list[str]
+            chemical formulas of products. Isomer prefixes (e.g. i-C4H10, n-C5H12) and groups in parentheses (e.g. (CH3)2O) are allowed
+        element:str (default:'C')
+            chemical element used as a basis for selectivity calculation
+        coefficients:list[float]|None (default:None)
+            number of key reactant molecules converted to one molecule of each product, parallel to products (e.g. 0.5 for CO in CH4 + CO2 -> 2CO + 2H2 with CH4 as key reactant). If None, coefficients are taken as ratio of numbers of basis element atoms in product and key reactant molecules, which is valid if basis element of product comes from key reactant only
+
+        raises
+        ------
+        exception:CalculatorException
+            if no reactants were provided, formula of any compound cannot be parsed or coefficients are not parallel to products or not positive
+        """
+        if len(reactants) == 0:
+            raise CalculatorException(f'At least one reactant must be declared for reaction {name}')
+        self._name = name
+        self._reactants = list(reactants)
+        self._products = list(products)
+        self._element = element
+        compositions = [parse_formula(compound) for compound in self._reactants + self._products]
+        self._elements = sorted({atom for composition in compositions for atom in composition} | {element})
+        self._element_matrix = np.array([[composition.get(atom, 0) for composition in compositions] for atom in self._elements], dtype=float)
+        if coefficients is not None:
+            if len(coefficients) != len(self._products) or any(coefficient <= 0 for coefficient in coefficients):
+                raise CalculatorException(f'Stoichiometric coefficients of reaction {name} must be positive numbers parallel to products')
+            self._coefficients = np.array(coefficients, dtype=float)
+        elif self.get_reactant_counts()[0] != 0:
+            self._coefficients = self.get_product_counts() / self.get_reactant_counts()[0]
+        else:
+            self._coefficients = None
+
+    def __str__(self) -> str:
+        """
+        Get string representation of reaction
+
+        returns
+        -------
+        string:str
+            string representation of reaction
+        """
+        return f'{self._name}: {" + ".join(self._reactants)} -> {" + ".join(self._products)} ({self._element} basis)'
+
+    def get_name(self) -> str:
+        """
+        Get name of reaction
+
+        returns
+        -------
+        name:str
+            name of reaction
+        """
+        return self._name
+
+    def get_reactants(self) -> list[str]:
+        """
+        Get chemical formulas of reactants
+
+        returns
+        -------
+        reactants:list[str]
+            reactants with key reactant first
+        """
+        return self._reactants
+
+    def get_key_reactant(self) -> str:
+        """
+        Get reactant for which conversion is calculated
+
+        returns
+        -------
+        reactant:str
+            chemical formula of key reactant
+        """
+        return self._reactants[0]
+
+    def get_products(self) -> list[str]:
+        """
+        Get chemical formulas of products
+
+        returns
+        -------
+        products:list[str]
+            reaction products
+        """
+        return self._products
+
+    def get_element(self) -> str:
+        """
+        Get chemical element used as a basis for selectivity calculation
+
+        returns
+        -------
+        element:str
+            chemical element
+        """
+        return self._element
+
+    def get_element_matrix(self) -> np.ndarray:
+        """
+        Get element balance matrix of shape (elements, compounds). Columns are parallel to reactants followed by products, rows are parallel to sorted list of chemical elements present in compounds.
+
+        returns
+        -------
+        matrix:numpy.ndarray
+            number of atoms of each element in each compound
+        """
+        return self._element_matrix
+
+    def get_elements(self) -> list[str]:
+        """
+        Get chemical elements parallel to rows of element balance matrix
+
+        returns
+        -------
+        elements:list[str]
+            sorted list of chemical elements
+        """
+        return self._elements
+
+    def get_reactant_counts(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get number of basis element atoms in reactants molecules
+
+        returns
+        -------
+        counts:numpy.ndarray[float]
+            vector parallel to reactants
+        """
+        return self._element_matrix[self._elements.index(self._element), :len(self._reactants)]
+
+    def get_product_counts(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get number of basis element atoms in products molecules (e.g. carbon numbers)
+
+        returns
+        -------
+        counts:numpy.ndarray[float]
+            vector parallel to products
+        """
+        return self._element_matrix[self._elements.index(self._element), len(self._reactants):]
+
+    def get_product_coefficients(self) -> np.ndarray[float, np.dtype]|None:
+        """
+        Get stoichiometric coefficients of products, i.e. number of key reactant molecules converted to one molecule of each product
+
+        returns
+        -------
+        coefficients:numpy.ndarray[float]|None
+            vector parallel to products or None if coefficients were not declared and key reactant does not contain basis element
+        """
+        return self._coefficients
+
+_formula_prefix = re.compile(r'^[a-z0-9,]+-')
+_formula_token = re.compile(r'([A-Z][a-z]?)(\d*)|(\()|(\))(\d*)')
+
+def parse_formula(formula:str) -> dict[str,int]:
+    """
+    Parse chemical formula to number of atoms of each element. Isomer prefixes such as "i-", "n-" or "1-" are ignored, multi-digit counts and groups in parentheses are supported, e.g. n-C10H22, CH3OH, (CH3)2O.
+
+    parameters
+    ----------
+    formula:str
+        chemical formula of compound
+
+    returns
+    -------
+    composition:dict[str,int]
+        number of atoms in a format {<element>:<count>}
+
+    raises
+    ------
+    exception:CalculatorException
+        if formula cannot be parsed
+    """
+    stripped = _formula_prefix.sub('', formula)
+    stack = [{}]
+    position = 0
+    while position < len(stripped):
+        match = _formula_token.match(stripped, position)
+        if match is None:
+            raise CalculatorException(f'Cannot parse chemical formula "{formula}"')
+        element, count, opening, closing, group_count = match.groups()
+        if element:
+            stack[-1][element] = stack[-1].get(element, 0) + (int(count) if count else 1)
+        elif opening:
+            stack.append({})
+        elif closing:
+            if len(stack) == 1:
+                raise CalculatorException(f'Cannot parse chemical formula "{formula}"')
+            group = stack.pop()
+            multiplier = int(group_count) if group_count else 1
+            for element, count in group.items():
+                stack[-1][element] = stack[-1].get(element, 0) + count * multiplier
+        position = match.end()
+    if len(stack) != 1 or len(stack[0]) == 0:
+        raise CalculatorException(f'Cannot parse chemical formula "{formula}"')
+    return stack[0]
@@ -0,0 +1,50 @@
+from pathlib import Path
+
+from pycatalicism.calc.exporter import Exporter
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.exporterexception import ExporterException
+from pycatalicism.logging_decorator import Logging
+
+class ReactionExporter(Exporter):
+    """
+    Class for exporting conversion and, if it makes sense for reaction, selectivity data for any declared reaction to conversion.dat and selectivity.dat to a directory provided by user of this class.
+    """
+
+    @Logging
+    def __init__(self, reaction:str):
+        """
+        Registers logger with instances of this class which can be accessed via self.logger instance variable.
+
+        parameters
+        ----------
+        reaction:str
+            name of reaction used in log messages
+        """
+        super().__init__()
+        self.reaction = reaction
+
+    def export(self, output_data_path:Path, conversion:Conversion|None, selectivity:Selectivity|None):
+        """
+        Main interface of this class. Exports conversion and selectivity data to conversion.dat and selectivity.dat to a directory provided by user of this method. Data which were not calculated are not exported.
+
+        parameters
+        ----------
+        output_data_path:Path
+            path to directory to export resulting data
+        conversion:Conversion|None
+            wrapper of key reactant conversion at different temperatures
+        selectivity:Selectivity|None
+            wrapper of selectivities to different compounds at different temperatures
+
+        raises
+        ------
+        exception:ExporterException
+            if ouput_data_path exists and not directory
+        """
+        if output_data_path.exists() and not output_data_path.is_dir():
+            raise ExporterException(f'Data path for exporting data must be a folder')
+        if conversion is not None:
+            self._export_data(output_data_path.joinpath('conversion.dat'), conversion, f'conversion for {self.reaction} reaction')
+        if selectivity is not None:
+            self._export_data(output_data_path.joinpath('selectivity.dat'), selectivity, f'selectivities for {self.reaction} reaction')
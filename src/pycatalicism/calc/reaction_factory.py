@@ -0,0 +1,66 @@
+from pycatalicism.calc.calculatorexception import CalculatorException
+import pycatalicism.config as config
+
+"""
+Factory for getting declarations of catalytic reactions known to the program. Built-in reactions are declared below, additional reactions can be declared by user in config.py as plain dictionaries, Built-in reactions are declared in the same way. Reaction objects are created from declarations only when reaction is requested, so that config.py does not import calculation modules and command line interface can check reaction name without loading numpy.
+"""
+
+# Stoichiometric coefficients of products are numbers of key reactant molecules converted to one molecule of product according to reaction equations:
+#   co-oxidation:                   CO + 0.5O2 -> CO2
+#   co2-hydrogenation:              nCO2 + (3n+1)H2 -> CnH2n+2 + 2nH2O, CO2 + H2 -> CO + H2O
+#   co2-methanation:                CO2 + 4H2 -> CH4 + 2H2O
+#   rwgs:                           CO2 + H2 -> CO + H2O
+#   dry-reforming:                  CH4 + CO2 -> 2CO + 2H2
+#   co-prox:                        CO + 0.5O2 -> CO2 (H2 + 0.5O2 -> H2O does not involve key reactant)
+#   co2-hydrogenation-oxygenates:   CO2 + H2 -> CO + H2O, CO2 + 4H2 -> CH4 + 2H2O, CO2 + 3H2 -> CH3OH + H2O, 2CO2 + 6H2 -> CH3OCH3 + 3H2O, 2CO2 + 6H2 -> C2H5OH + 3H2O, 2CO2 + 7H2 -> C2H6 + 4H2O, 3CO2 + 10H2 -> C3H8 + 6H2O
+
+_reactions = {
+            'co-oxidation'              :   dict(reactants=['CO', 'O2'], products=['CO2'], coefficients=[1]),
+            'co2-hydrogenation'         :   dict(reactants=['CO2', 'H2'], products=['CO', 'CH4', 'C2H6', 'C3H8', 'i-C4H10', 'n-C4H10', 'i-C5H12', 'n-C5H12'], coefficients=[1, 1, 2, 3, 4, 4, 5, 5]),
+            'co2-methanation'           :   dict(reactants=['CO2', 'H2'], products=['CH4'], coefficients=[1]),
+            'rwgs'                      :   dict(reactants=['CO2', 'H2'], products=['CO'], coefficients=[1]),
+            'dry-reforming'             :   dict(reactants=['CH4', 'CO2'], products=['CO'], coefficients=[0.5]),
+            'co-prox'                   :   dict(reactants=['CO', 'O2', 'H2'], products=['CO2'], coefficients=[1]),
+            'co2-hydrogenation-oxygenates'  :   dict(reactants=['CO2', 'H2'], products=['CO', 'CH4', 'CH3OH', 'CH3OCH3', 'C2H5OH', 'C2H6', 'C3H8'], coefficients=[1, 1, 1, 2, 2, 2, 3]),
+            }
+
+def get_reaction(reaction:str) -> 'Reaction':
+    """
+    Get declaration of reaction by its name. Reactions declared in config.py override built-in reactions with the same name.
+
+    parameters
+    ----------
+    reaction:str
+        name of reaction
+
+    returns
+    -------
+    reaction:Reaction
+        declaration of reaction
+
+    raises
+    ------
+    exception:CalculatorException
+        if reaction is not known or its declaration in config.py is wrong
+    """
+    from pycatalicism.calc.reaction import Reaction
+    user_reactions = getattr(config, 'reactions', {})
+    if reaction in user_reactions:
+        try:
+            return Reaction(name=reaction, **user_reactions[reaction])
+        except TypeError as e:
+            raise CalculatorException(f'Wrong declaration of reaction "{reaction}" in config.py: {e}')
+    if reaction not in _reactions:
+        raise CalculatorException(f'Unknown reaction "{reaction}"')
+    return Reaction(name=reaction, **_reactions[reaction])
+
+def get_reaction_names() -> list[str]:
+    """
+    Get names of all reactions known to the program.
+
+    returns
+    -------
+    names:list[str]
+        names of built-in and user declared reactions
+    """
+    return list(_reactions | getattr(config, 'reactions', {}))
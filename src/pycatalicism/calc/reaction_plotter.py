@@ -0,0 +1,24 @@
+import re
+
+from pycatalicism.calc.co2_hydrogenation_plotter import CO2HydrogenationPlotter
+from pycatalicism.calc.reaction import Reaction
+from pycatalicism.logging_decorator import Logging
+
+class ReactionPlotter(CO2HydrogenationPlotter):
+    """
+    Class for plotting key reactant conversion and products selectivity data for any declared reaction and exporting resulting plots to file.
+    """
+
+    @Logging
+    def __init__(self, reaction:Reaction):
+        """
+        Registers logger with instances of this class which can be accessed via self.logger instance variable. Makes conversion axis label from key reactant formula.
+
+        parameters
+        ----------
+        reaction:Reaction
+            declaration of reaction which results are plotted
+        """
+        super().__init__()
+        formula = re.sub(r'(\d+)', r'_{\1}', reaction.get_key_reactant())
+        self.conversion_label = f'$\\mathrm{{{formula}}}$ conversion'
@@ -0,0 +1,628 @@
+import numpy as np
+
+from pycatalicism.calc.calculator import Calculator
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.reaction import Reaction
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.results import Results
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.logging_decorator import Logging
+
+class ReactionCalculator(Calculator):
+    """
+    Generic calculator of conversion, selectivity and yield for any reaction declared as Reaction object. All values are calculated for all temperatures at once as matrix operations over columnar RawData.
+    """
+
+    @Logging
+    def __init__(self, reaction:Reaction, products_basis:bool=False, tracer:str|None=None):
+        """
+        Registers logger with the object which can be accessed via self.logger instance variable. Precomputes vectors of basis element atoms in reactants and products molecules.
+
+        parameters
+        ----------
+        reaction:Reaction
+            declaration of reaction to calculate results for
+        products_basis:bool (default:False)
+            if True, calculate conversion based on products concentrations
+        tracer:str|None (default:None)
+            inert compound (e.g. He, N2 or Ar) used as internal standard to correct for change of total gas flow rate instead of gas-clock measurements (see _get_flow_data)
+
+        raises
+        ------
+        exception:CalculatorException
+            if products_basis is True, but stoichiometric coefficients of products are not known
+        """
+        super().__init__()
+        self.reaction = reaction
+        self.products_basis = products_basis
+        self.tracer = tracer
+        self.reactants = reaction.get_reactants()
+        self.products = reaction.get_products()
+        self.reactant_counts = reaction.get_reactant_counts()
+        self.product_counts = reaction.get_product_counts()
+        self.product_coefficients = reaction.get_product_coefficients()
+        if products_basis and self.product_coefficients is None:
+            raise CalculatorException(f'Cannot calculate conversion based on products for reaction {reaction.get_name()}: stoichiometric coefficients of products are not declared and key reactant {reaction.get_key_reactant()} does not contain {reaction.get_element()}')
+
+    def calculate(self, input_data:RawData, calculate_conversion:bool=True, calculate_selectivity:bool=True, calculate_yield:bool=False, catalyst_mass:float|None=None, flow_rate:float|None=None, metal_loading:float|None=None, metal_molar_mass:float|None=None) -> Results:
+        """
+        Fused calculation engine. Flow rate data and concentration matrices of reactants and products are read from input data only once and all requested results are calculated from them in a single pass. Activity is calculated if catalyst mass is provided.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+        calculate_conversion:bool (default:True)
+            whether to calculate conversion of key reactant (see calculate_conversion)
+        calculate_selectivity:bool (default:True)
+            whether to calculate selectivities to products (see calculate_selectivity)
+        calculate_yield:bool (default:False)
+            whether to calculate yields of products (see calculate_yield)
+        catalyst_mass:float|None (default:None)
+            mass of catalyst in g, activity is calculated only if provided (see calculate_activity)
+        flow_rate:float|None (default:None)
+            total gas flow rate before catalytic reactor in nml/min, overrides flow rate from input data for activity calculation
+        metal_loading:float|None (default:None)
+            active metal loading in wt.%, TOF is calculated if provided together with metal_molar_mass
+        metal_molar_mass:float|None (default:None)
+            molar mass of active metal in g/mol
+
+        returns
+        -------
+        results:Results
+            bundle with requested results, results which were not requested or do not make sense for reaction are None
+        """
+        need_activity = catalyst_mass is not None
+        need_products = calculate_selectivity or calculate_yield or (self.products_basis and (calculate_conversion or need_activity))
+        need_reactants = (calculate_conversion or need_activity) and not self.products_basis
+        flow_data = self._get_flow_data(input_data) if calculate_conversion or calculate_yield or need_activity else None
+        product_concs = self._get_product_concs(input_data) if need_products else None
+        C_f = np.column_stack([input_data.get_concs(reactant) for reactant in self.reactants]) if need_reactants else None
+        temperatures = input_data.get_temperatures()
+        sample_name = input_data.get_sample_name()
+        conversion = None
+        selectivity = None
+        _yield = None
+        activity = None
+        if calculate_conversion or need_activity:
+            if self.products_basis:
+                self.logger.warning(f'Calculating conversion for {self.reaction.get_name()} reaction based on reaction products')
+                alphas = self._products_basis_conversion(flow_data, input_data.get_init_conc(self.reaction.get_key_reactant()), product_concs)
+            else:
+                self.logger.info(f'Calculating conversion for {self.reaction.get_name()} reaction')
+                alphas = self._conversions(flow_data, self._get_init_concs(input_data), C_f)[:, 0]
+            self.logger.debug(f'{alphas = }')
+            if calculate_conversion:
+                conversion = Conversion(temperatures, alphas, sample_name)
+            if need_activity:
+                activity = self._activity(input_data, alphas, catalyst_mass, flow_rate, metal_loading, metal_molar_mass)
+        if calculate_selectivity and len(self.products) > 1:
+            self.logger.info(f'Calculating selectivities for {self.reaction.get_name()} reaction')
+            selectivity = Selectivity(temperatures, self._selectivities(product_concs).T, sample_name, compounds=self.products)
+        if calculate_yield:
+            self.logger.info(f'Calculating yields for {self.reaction.get_name()} reaction')
+            _yield = Selectivity(temperatures, self._yields(flow_data, input_data.get_init_conc(self.reaction.get_key_reactant()), product_concs).T, sample_name, compounds=self.products)
+        return Results(conversion, selectivity, _yield, activity)
+
+    def calculate_conversion(self, input_data:RawData) -> Conversion:
+        """
+        Calculate conversion of key reactant at different temperatures. Conversion is calculated either from reactant concentrations (see calculate_conversions) or, if products_basis was set, from products concentrations:
+
+        a = (SUM(vj * Cj) / C(k)i) * ((pf * ff * Ti) / (pi * fi * Tf))
+        where
+            vj - stoichiometric coefficient of jth product, i.e. number of key reactant molecules converted to one molecule of jth product
+            Cj - concentration of jth product in mol.%
+            C(k)i - concentration of key reactant before catalytic reactor in mol.%
+            fi, ff - total gas flow rates before and after catalytic reactor, respectively, in m^3/s
+            pi, pf - pressure of gas at point of total gas flow rate measurement before and after catalytic reactor, respectively, in Pa
+            Ti, Tf - temperature of gas at point of total gas flow rate measurement before and after catalytic reactor, respectively, in K
+
+        If flow rate measurement data is not provided, conversion is calculated based solely on concentrations and warning is logged to console in this case.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+
+        returns
+        -------
+        conversion:Conversion
+            wrapper with key reactant conversion at different temperatures data
+        """
+        return self.calculate(input_data, calculate_conversion=True, calculate_selectivity=False).get_conversion()
+
+    def calculate_conversions(self, input_data:RawData) -> np.ndarray:
+        """
+        Calculate conversions of all reactants at different temperatures as a single matrix operation. Conversion is calculated as:
+
+        a = ((pi * fi / Ti) * C(r)i - (pf * ff / Tf) * C(r)f) /  ((pi * fi / Ti) * C(r)i)
+        where
+            C(r)i, C(r)f - concentrations of reactant before and after catalytic reactor, respectively, in mol.%
+            fi, ff - total gas flow rates before and after catalytic reactor, respectively, in m^3/s
+            pi, pf - pressure of gas at point of total gas flow rate measurement before and after catalytic reactor, respectively, in Pa
+            Ti, Tf - temperature of gas at point of total gas flow rate measurement before and after catalytic reactor, respectively, in K
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+
+        returns
+        -------
+        conversions:numpy.ndarray
+            matrix of shape (temperatures, reactants) with key reactant conversion in the first column, conversions of reactants absent in initial data are numpy.nan
+        """
+        C_f = np.column_stack([input_data.get_concs(reactant) for reactant in self.reactants])
+        return self._conversions(self._get_flow_data(input_data), self._get_init_concs(input_data), C_f)
+
+    def calculate_alphas(self, input_data:RawData) -> np.ndarray[float, np.dtype]:
+        """
+        Calculate conversion of key reactant (see calculate_conversion) as a vector parallel to rows of input data. Unlike Conversion wrapper, conversions are not sorted, so that measurements done at the same temperature are kept in order of input data (e.g. for time-on-stream analysis).
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            conversions of key reactant parallel to temperatures of input data
+        """
+        if self.products_basis:
+            return self._products_basis_conversion(self._get_flow_data(input_data), input_data.get_init_conc(self.reaction.get_key_reactant()), self._get_product_concs(input_data))
+        return self.calculate_conversions(input_data)[:, 0]
+
+    def calculate_balance(self, input_data:RawData) -> np.ndarray:
+        """
+        Calculate conversion of key reactant on both bases and closure of basis element balance in a single pass: flow rate data and concentration matrices of reactants and products are read from input data only once. Balance closure is the ratio of amounts of basis element after and before catalytic reactor:
+
+        B = ((pf * ff / Tf) * (SUM(nr * C(r)f) + SUM(nj * Cj))) / ((pi * fi / Ti) * SUM(nr * C(r)i))
+        where
+            nr, nj - number of basis element atoms in rth reactant and jth product molecules, respectively
+            C(r)i, C(r)f - concentrations of reactant before and after catalytic reactor, respectively, in mol.%
+            Cj - concentration of jth product in mol.%
+
+        Only reactants present in initial data are taken into account. If key reactant is the only reactant containing basis element and stoichiometric coefficients of products follow basis element, B = 1 - a + a(products), i.e. difference of conversions on both bases equals to deviation of balance closure from unity.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+
+        returns
+        -------
+        balance:numpy.ndarray
+            matrix of shape (temperatures, 3) parallel to rows of input data with conversion calculated from reactants concentrations, conversion calculated from products concentrations (numpy.nan if stoichiometric coefficients of products are not known) and balance closure in columns
+        """
+        flow_data = self._get_flow_data(input_data)
+        T_i, p_i, f_i, T_f, p_f, f_f = flow_data
+        C_i = self._get_init_concs(input_data)
+        C_f = np.column_stack([input_data.get_concs(reactant) for reactant in self.reactants])
+        product_concs = self._get_product_concs(input_data)
+        alphas = self._conversions(flow_data, C_i, C_f)[:, 0]
+        if self.product_coefficients is None:
+            products_alphas = np.full(len(alphas), np.nan)
+        else:
+            products_alphas = self._products_basis_conversion(flow_data, C_i[0], product_concs)
+        counts = np.where(np.isnan(C_i), 0, self.reactant_counts)
+        element_i = (p_i * f_i / T_i) * np.sum(np.nan_to_num(C_i) * counts)
+        element_f = (p_f * f_f / T_f) * (np.nan_to_num(C_f) @ counts + self._sum_products(product_concs * self.product_counts))
+        with np.errstate(divide='ignore', invalid='ignore'):
+            closures = element_f / element_i
+        return np.column_stack([alphas, products_alphas, closures])
+
+    def calculate_selectivity(self, input_data:RawData) -> Selectivity|None:
+        """
+        Calculate selectivities to reaction products at different temperatures. Selectivity to i-th product is calculated as:
+
+        Si = Xi * n / SUM(Xi * n)
+        where
+            Xi - concentration of ith product in mol.%
+            n - number of basis element atoms in product molecule (e.g. carbon number)
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations of reaction product compounds at different temperatures
+
+        returns
+        -------
+        selectivity:Selectivity|None
+            wrapper with selectivities to corresponding compounds at different temperatures or None if reaction has less than two products, since selectivity does not make sense in this case
+        """
+        return self.calculate(input_data, calculate_conversion=False, calculate_selectivity=True).get_selectivity()
+
+    def calculate_yield(self, input_data:RawData) -> Selectivity:
+        """
+        Calculate yields of reaction products at different temperatures. Yield of i-th product is calculated as:
+
+        Yi = ((pf * ff / Tf) * vi * Xi) / ((pi * fi / Ti) * C(k)i)
+        where
+            Xi - concentration of ith product in mol.%
+            vi - stoichiometric coefficient of ith product, i.e. number of key reactant molecules converted to one molecule of ith product
+            C(k)i - concentration of key reactant before catalytic reactor in mol.%
+            fi, ff, pi, pf, Ti, Tf - flow rate data (see calculate_conversions)
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations of reaction product compounds at different temperatures
+
+        returns
+        -------
+        yield:Selectivity
+            wrapper with yields of corresponding compounds at different temperatures stored in the same format as selectivities
+
+        raises
+        ------
+        exception:CalculatorException
+            if stoichiometric coefficients of products are not known
+        """
+        return self.calculate(input_data, calculate_conversion=False, calculate_selectivity=False, calculate_yield=True).get_yield()
+
+    def calculate_activity(self, input_data:RawData, catalyst_mass:float, flow_rate:float|None=None, metal_loading:float|None=None, metal_molar_mass:float|None=None) -> Activity|None:
+        """
+        Calculate catalyst activity at different temperatures. Activity is calculated as rate of key reactant consumption per catalyst mass:
+
+        r = a * C(k)i * F / m
+        where
+            a - conversion of key reactant
+            C(k)i - concentration of key reactant before catalytic reactor in mol.% / 100
+            F - total molar gas flow rate before catalytic reactor in mol/s, calculated from flow_rate at normal conditions (273.15 K, 101325 Pa) if provided or from flow rate measurement data in input data otherwise
+            m - catalyst mass in g
+
+        If metal loading and molar mass are provided, turnover frequency is calculated as:
+
+        TOF = r * M / w
+        where
+            M - molar mass of active metal in g/mol
+            w - metal loading in wt.% / 100
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+        catalyst_mass:float
+            mass of catalyst in g
+        flow_rate:float|None (default:None)
+            total gas flow rate before catalytic reactor in nml/min
+        metal_loading:float|None (default:None)
+            active metal loading in wt.%
+        metal_molar_mass:float|None (default:None)
+            molar mass of active metal in g/mol
+
+        returns
+        -------
+        activity:Activity|None
+            wrapper with activity at different temperatures or None if total gas flow rate is not known
+        """
+        return self.calculate(input_data, calculate_conversion=False, calculate_selectivity=False, catalyst_mass=catalyst_mass, flow_rate=flow_rate, metal_loading=metal_loading, metal_molar_mass=metal_molar_mass).get_activity()
+
+    def get_reaction(self) -> Reaction:
+        """
+        Get declaration of reaction results are calculated for
+
+        returns
+        -------
+        reaction:Reaction
+            declaration of reaction
+        """
+        return self.reaction
+
+    def calculate_draws(self, input_data:RawData, draws:int, errors:dict[str,float|dict[str,float]], calculate_conversion:bool=True, calculate_selectivity:bool=True, calculate_yield:bool=False, rng:np.random.Generator|None=None) -> tuple[np.ndarray|None,np.ndarray|None,np.ndarray|None]:
+        """
+        Batched Monte Carlo engine. Input data are perturbed by normally distributed errors and results are calculated for all draws at once by the same matrix operations as in calculate method with draws as a leading axis. Errors of initial data (initial concentrations, gas-clock temperature, pressure and flow rate measured before catalytic reactor) are drawn once per draw and are common for all temperatures, errors of data measured after catalytic reactor are drawn independently for every temperature. Errors of concentrations of all compounds (reactants, products and tracer) are drawn as a single sample per measurement, so that each compound is perturbed by the same value wherever its concentration is used, e.g. in tracer ratio and in conversion.
+
+        Errors are standard deviations provided by keys:
+            concentration - relative error of concentrations after catalytic reactor
+            initial concentration - relative error of initial concentrations, either single value or dictionary {<compound>:<error>}
+            flow, pressure - relative errors of total gas flow rate and pressure after catalytic reactor
+            temperature - absolute error of gas temperature at point of flow rate measurement after catalytic reactor in K
+            initial flow, initial pressure, initial temperature - the same for measurement before catalytic reactor, values for measurement after catalytic reactor are used if not provided
+        Missing keys mean that corresponding input is not perturbed. Flow rate data are not perturbed if they were not measured. If tracer is used for flow correction, its concentrations are perturbed instead of flow rate data.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations and flow rate data
+        draws:int
+            number of draws
+        errors:dict[str,float|dict[str,float]]
+            standard deviations of input data
+        calculate_conversion:bool (default:True)
+            whether to calculate conversion of key reactant
+        calculate_selectivity:bool (default:True)
+            whether to calculate selectivities to products
+        calculate_yield:bool (default:False)
+            whether to calculate yields of products
+        rng:numpy.random.Generator|None (default:None)
+            random numbers generator, new generator is created if None
+
+        returns
+        -------
+        (alphas, selectivities, yields):tuple[numpy.ndarray|None,numpy.ndarray|None,numpy.ndarray|None]
+            conversions of shape (draws, temperatures), selectivities and yields of shape (draws, temperatures, products) parallel to temperatures of input data, None if not requested
+        """
+        rng = np.random.default_rng() if rng is None else rng
+        shape = (draws, len(input_data.get_temperatures()))
+        need_products = calculate_selectivity or calculate_yield or (self.products_basis and calculate_conversion)
+        init_compounds = list(dict.fromkeys(self.reactants + ([] if self.tracer is None else [self.tracer])))
+        init_errors = errors.get('initial concentration')
+        init_errors = np.array([init_errors.get(compound, 0.0) for compound in init_compounds] if isinstance(init_errors, dict) else [init_errors or 0.0] * len(init_compounds))
+        init_factors = 1 + init_errors * rng.standard_normal((draws, 1, len(init_compounds)))
+        compounds = list(dict.fromkeys(self.reactants + self.products + ([] if self.tracer is None else [self.tracer])))
+        factors = np.broadcast_to(1 + self._draw_errors(rng, errors.get('concentration'), shape + (len(compounds),)), shape + (len(compounds),))
+        T_i, p_i, f_i, T_f, p_f, f_f = self._get_flow_data(input_data)
+        if self.tracer is not None:
+            f_f = f_f * init_factors[..., init_compounds.index(self.tracer)] / factors[..., compounds.index(self.tracer)]
+        elif input_data.get_fin_flows() is not None and input_data.get_init_flow() is not None:
+            T_i = T_i + self._draw_errors(rng, errors.get('initial temperature', errors.get('temperature')), (draws, 1, 1))
+            p_i = p_i * (1 + self._draw_errors(rng, errors.get('initial pressure', errors.get('pressure')), (draws, 1, 1)))
+            f_i = f_i * (1 + self._draw_errors(rng, errors.get('initial flow', errors.get('flow')), (draws, 1, 1)))
+            T_f = T_f + self._draw_errors(rng, errors.get('temperature'), shape)
+            p_f = p_f * (1 + self._draw_errors(rng, errors.get('pressure'), shape))
+            f_f = f_f * (1 + self._draw_errors(rng, errors.get('flow'), shape))
+        flow_data = tuple(np.broadcast_to(value, (draws, 1, 1)) for value in [T_i, p_i, f_i]) + tuple(np.broadcast_to(value, shape) for value in [T_f, p_f, f_f])
+        C_i = self._get_init_concs(input_data) * init_factors[..., :len(self.reactants)]
+        product_concs = self._get_product_concs(input_data) * factors[..., [compounds.index(product) for product in self.products]] if need_products else None
+        alphas = None
+        selectivities = None
+        yields = None
+        if calculate_conversion:
+            self.logger.info(f'Calculating {draws} draws of conversion for {self.reaction.get_name()} reaction')
+            if self.products_basis:
+                alphas = self._products_basis_conversion(tuple(value[..., 0] for value in flow_data[:3]) + flow_data[3:], C_i[:, :, 0], product_concs)
+            else:
+                C_f = np.column_stack([input_data.get_concs(reactant) for reactant in self.reactants]) * factors[..., :len(self.reactants)]
+                alphas = self._conversions(flow_data, C_i, C_f)[..., 0]
+        if calculate_selectivity and len(self.products) > 1:
+            self.logger.info(f'Calculating {draws} draws of selectivities for {self.reaction.get_name()} reaction')
+            selectivities = self._selectivities(product_concs)
+        if calculate_yield:
+            self.logger.info(f'Calculating {draws} draws of yields for {self.reaction.get_name()} reaction')
+            yields = self._yields(flow_data, C_i[..., :1], product_concs)
+        return (alphas, selectivities, yields)
+
+    def _draw_errors(self, rng:np.random.Generator, error:float|None, size:tuple[int,...]) -> np.ndarray|float:
+        """
+        Draw normally distributed errors
+
+        parameters
+        ----------
+        rng:numpy.random.Generator
+            random numbers generator
+        error:float|None
+            standard deviation of errors, errors are zeros if None or zero
+        size:tuple[int,...]
+            shape of drawn errors
+
+        returns
+        -------
+        errors:numpy.ndarray|float
+            drawn errors or 0.0 if error is not provided
+        """
+        return error * rng.standard_normal(size) if error else 0.0
+
+    def _get_flow_data(self, input_data:RawData) -> tuple[float,float,float,np.ndarray,np.ndarray,np.ndarray]:
+        """
+        Get data used to correct for change of total gas flow rate. If tracer was not set, data of total gas flow rate measurement are used (see Calculator._get_flow_data). Otherwise, change of total molar flow rate is derived from concentrations of inert tracer for all temperatures at once:
+
+        (pf * ff / Tf) / (pi * fi / Ti) = C(t)i / C(t)f
+        where
+            C(t)i, C(t)f - concentrations of tracer before and after catalytic reactor, respectively, in mol.%
+
+        Ratio of tracer concentrations is returned in place of final flow rates, all other values are set to 1, so that formulas of flow correction stay the same.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with flow rate data and concentrations
+
+        returns
+        -------
+        (T_i, p_i, f_i, T_f, p_f, f_f):tuple
+            flow rate data (see Calculator._get_flow_data)
+
+        raises
+        ------
+        exception:CalculatorException
+            if tracer was not found in initial data or its concentration after catalytic reactor is not positive at some temperatures
+        """
+        if self.tracer is None:
+            return super()._get_flow_data(input_data)
+        C_t_i = input_data.get_init_concs().get(self.tracer)
+        if C_t_i is None or not C_t_i > 0:
+            raise CalculatorException(f'Cannot use {self.tracer} as tracer: its concentration was not found in initial data')
+        C_t_f = input_data.get_concs(self.tracer)
+        if not (C_t_f > 0).all():
+            raise CalculatorException(f'Cannot use {self.tracer} as tracer: its concentration was not found at temperatures {input_data.get_temperatures()[~(C_t_f > 0)]}')
+        self.logger.info(f'Correcting for change of total gas flow rate by {self.tracer} concentration')
+        ones = np.ones(len(C_t_f))
+        return (1, 1, 1, ones, ones, C_t_i / C_t_f)
+
+    def _get_init_concs(self, input_data:RawData) -> np.ndarray[float, np.dtype]:
+        """
+        Get initial concentrations of reactants as a vector
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with initial concentrations
+
+        returns
+        -------
+        initial_concentrations:numpy.ndarray[float]
+            vector parallel to reactants, concentrations of reactants other than key reactant absent in initial data are numpy.nan
+        """
+        return np.array([input_data.get_init_conc(self.reactants[0])] + [input_data.get_init_concs().get(reactant, np.nan) for reactant in self.reactants[1:]], dtype=float)
+
+    def _conversions(self, flow_data:tuple, C_i:np.ndarray, C_f:np.ndarray) -> np.ndarray:
+        """
+        Calculate conversions of all reactants (see calculate_conversions)
+
+        parameters
+        ----------
+        flow_data:tuple
+            flow rate data returned by _get_flow_data
+        C_i:numpy.ndarray[float]
+            initial concentrations of reactants
+        C_f:numpy.ndarray
+            matrix of shape (temperatures, reactants) of reactants concentrations
+
+        returns
+        -------
+        conversions:numpy.ndarray
+            matrix of shape (temperatures, reactants)
+        """
+        T_i, p_i, f_i, T_f, p_f, f_f = flow_data
+        n_i = p_i * f_i / T_i
+        n_f = p_f * f_f / T_f
+        return (n_i * C_i - n_f[..., np.newaxis] * C_f) / (n_i * C_i)
+
+    def _products_basis_conversion(self, flow_data:tuple, C_k_i:float, product_concs:np.ndarray) -> np.ndarray:
+        """
+        Calculate conversion of key reactant based on products concentrations (see calculate_conversion)
+
+        parameters
+        ----------
+        flow_data:tuple
+            flow rate data returned by _get_flow_data
+        C_k_i:float
+            initial concentration of key reactant
+        product_concs:numpy.ndarray
+            matrix of shape (temperatures, products) of products concentrations
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            conversions parallel to temperatures
+        """
+        T_i, p_i, f_i, T_f, p_f, f_f = flow_data
+        product_sum = self._sum_products(product_concs * self.product_coefficients)
+        return (product_sum / C_k_i) * ((p_f * f_f * T_i) / (p_i * f_i * T_f))
+
+    def _selectivities(self, product_concs:np.ndarray) -> np.ndarray:
+        """
+        Normalize concentrations of products weighted by number of basis element atoms to get selectivities (see calculate_selectivity). Selectivities at temperatures where no products were found are zeros.
+
+        parameters
+        ----------
+        product_concs:numpy.ndarray
+            matrix of shape (temperatures, products) of products concentrations
+
+        returns
+        -------
+        selectivities:numpy.ndarray
+            matrix of shape (temperatures, products)
+        """
+        weighted_concs = product_concs * self.product_counts
+        c_tot = self._sum_products(weighted_concs)
+        self.logger.debug(f'{c_tot = }')
+        c_tot[c_tot == 0] = 1
+        return weighted_concs / c_tot[..., np.newaxis]
+
+    def _yields(self, flow_data:tuple, C_k_i:float, product_concs:np.ndarray) -> np.ndarray:
+        """
+        Calculate yields of products (see calculate_yield)
+
+        parameters
+        ----------
+        flow_data:tuple
+            flow rate data returned by _get_flow_data
+        C_k_i:float
+            initial concentration of key reactant
+        product_concs:numpy.ndarray
+            matrix of shape (temperatures, products) of products concentrations
+
+        returns
+        -------
+        yields:numpy.ndarray
+            matrix of shape (temperatures, products)
+
+        raises
+        ------
+        exception:CalculatorException
+            if stoichiometric coefficients of products are not known
+        """
+        if self.product_coefficients is None:
+            raise CalculatorException(f'Cannot calculate yields for reaction {self.reaction.get_name()}: stoichiometric coefficients of products are not declared and key reactant {self.reaction.get_key_reactant()} does not contain {self.reaction.get_element()}')
+        T_i, p_i, f_i, T_f, p_f, f_f = flow_data
+        n_i = p_i * f_i / T_i
+        n_f = p_f * f_f / T_f
+        return (n_f[..., np.newaxis] * product_concs * self.product_coefficients) / (n_i * C_k_i)
+
+    def _activity(self, input_data:RawData, alphas:np.ndarray, catalyst_mass:float, flow_rate:float|None, metal_loading:float|None, metal_molar_mass:float|None) -> Activity|None:
+        """
+        Calculate activity from key reactant conversions (see calculate_activity)
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with initial concentrations and flow rate data
+        alphas:numpy.ndarray[float]
+            conversions of key reactant parallel to temperatures
+        catalyst_mass:float
+            mass of catalyst in g
+        flow_rate:float|None
+            total gas flow rate before catalytic reactor in nml/min
+        metal_loading:float|None
+            active metal loading in wt.%
+        metal_molar_mass:float|None
+            molar mass of active metal in g/mol
+
+        returns
+        -------
+        activity:Activity|None
+            wrapper with activity at different temperatures or None if total gas flow rate is not known
+        """
+        R = 8.314462618
+        if flow_rate is not None:
+            molar_flow = 101325 * flow_rate * 1e-6 / 60 / (R * 273.15)
+        elif input_data.get_init_flow() is not None and input_data.get_init_amb_pres() is not None and input_data.get_init_amb_temp() is not None:
+            molar_flow = input_data.get_init_amb_pres() * input_data.get_init_flow() * 1e-6 / 60 / (R * (input_data.get_init_amb_temp() + 273.15))
+        else:
+            self.logger.warning(f'Total gas flow rate is not known. Cannot calculate activity')
+            return None
+        self.logger.info(f'Calculating activity for {self.reaction.get_name()} reaction')
+        rates = alphas * input_data.get_init_conc(self.reaction.get_key_reactant()) / 100 * molar_flow / catalyst_mass
+        tofs = None
+        if metal_loading is not None and metal_molar_mass is not None:
+            tofs = rates * metal_molar_mass / (metal_loading / 100)
+        return Activity(input_data.get_temperatures(), rates, tofs, input_data.get_sample_name(), alphas)
+
+    def _get_product_concs(self, input_data:RawData) -> np.ndarray:
+        """
+        Get matrix of reaction products concentrations.
+
+        parameters
+        ----------
+        input_data:RawData
+            wrapper with concentrations of reaction product compounds at different temperatures
+
+        returns
+        -------
+        product_concs:numpy.ndarray
+            matrix of shape (temperatures, products) of Xi values
+        """
+        return np.column_stack([input_data.get_concs(compound) for compound in self.products]) if self.products else np.zeros((len(input_data.get_temperatures()), 0))
+
+    def _sum_products(self, weighted_concs:np.ndarray) -> np.ndarray:
+        """
+        Sum weighted concentrations of reaction products at each temperature. Summation is done sequentially from first to last product (numpy.add.accumulate) rather than pairwise (numpy.sum), so that results do not depend on summation order and stay the same as calculated point by point.
+
+        parameters
+        ----------
+        weighted_concs:numpy.ndarray
+            matrix of shape (temperatures, products) of concentrations of products multiplied by their weights (number of basis element atoms or stoichiometric coefficients)
+
+        returns
+        -------
+        sums:numpy.ndarray[float]
+            sum of weighted concentrations at each temperature
+        """
+        if weighted_concs.shape[-1] == 0:
+            return np.zeros(weighted_concs.shape[:-1])
+        return np.add.accumulate(weighted_concs, axis=-1)[..., -1]
@@ -0,0 +1,43 @@
+from typing import BinaryIO, Iterator
+
+"""
+Reading of concatenated measurement records from binary stream (e.g. stdin or FIFO). Records have the same format as data files and are separated by record separator. Each record is yielded as soon as its separator or end of stream is read.
+"""
+
+def read_records(stream:BinaryIO, separator:bytes, chunk_size:int=64*1024) -> Iterator[bytes]:
+    """
+    Split stream to records. Data are read by chunks which are returned as soon as they are available, so that records are yielded without waiting for the stream to be filled. Records containing only whitespace are skipped.
+
+    parameters
+    ----------
+    stream:BinaryIO
+        binary stream to read records from
+    separator:bytes
+        record separator
+    chunk_size:int (default:64 KiB)
+        maximum number of bytes read at once
+
+    returns
+    -------
+    records:Iterator[bytes]
+        iterator over records without separators
+    """
+    read = stream.read1 if hasattr(stream, 'read1') else stream.read
+    buffer = b''
+    while True:
+        chunk = read(chunk_size)
+        if not chunk:
+            break
+        buffer = buffer + chunk
+        start = 0
+        while True:
+            end = buffer.find(separator, start)
+            if end < 0:
+                break
+            record = buffer[start:end]
+            start = end + len(separator)
+            if record.strip():
+                yield record
+        buffer = buffer[start:]
+    if buffer.strip():
+        yield buffer
@@ -0,0 +1,72 @@
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.activity import Activity
+
+class Results():
+    """
+    Bundle of all results calculated by calculator in a single pass over input data.
+    """
+
+    def __init__(self, conversion:Conversion|None, selectivity:Selectivity|None, _yield:Selectivity|None, activity:Activity|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        conversion:Conversion|None
+            wrapper with conversion vs. temperature data or None if it was not calculated
+        selectivity:Selectivity|None
+            wrapper with selectivity vs. temperature data or None if it was not calculated
+        _yield:Selectivity|None
+            wrapper with yields vs. temperature data or None if they were not calculated
+        activity:Activity|None
+            wrapper with activity vs. temperature data or None if it was not calculated
+        """
+        self.conversion = conversion
+        self.selectivity = selectivity
+        self._yield = _yield
+        self.activity = activity
+
+    def get_conversion(self) -> Conversion|None:
+        """
+        Get conversion vs. temperature data
+
+        returns
+        -------
+        conversion:Conversion|None
+            wrapper with conversion data
+        """
+        return self.conversion
+
+    def get_selectivity(self) -> Selectivity|None:
+        """
+        Get selectivity vs. temperature data
+
+        returns
+        -------
+        selectivity:Selectivity|None
+            wrapper with selectivity data
+        """
+        return self.selectivity
+
+    def get_yield(self) -> Selectivity|None:
+        """
+        Get yields vs. temperature data
+
+        returns
+        -------
+        yield:Selectivity|None
+            wrapper with yields data
+        """
+        return self._yield
+
+    def get_activity(self) -> Activity|None:
+        """
+        Get activity vs. temperature data
+
+        returns
+        -------
+        activity:Activity|None
+            wrapper with activity data
+        """
+        return self.activity
@@ -0,0 +1,166 @@
+import numpy as np
+
+from pycatalicism.calc.results import Results
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.activity import Activity
+
+"""
+Buffer of results used by watch mode of calc module to recalculate only rows of new or changed files.
+"""
+
+class ResultsBuffer():
+    """
+    Columnar buffer of calculated results parallel to rows of RawDataBuilder. Results calculated for new or changed rows are written to their rows of buffer, so that watch mode recalculates only these rows, while Results for all rows are assembled from buffer without recalculation. Each result is stored as a matrix with a row per measurement, buffer grows by doubling as RawDataBuilder does.
+    """
+
+    def __init__(self, capacity:int=16):
+        """
+        Preallocate buffer of temperatures for capacity rows, buffers of results are allocated when results are written for the first time.
+
+        parameters
+        ----------
+        capacity:int (default:16)
+            expected number of rows
+        """
+        self.size = 0
+        self.temperatures = np.full(max(capacity, 1), np.nan)
+        self.columns = {}
+        self.compounds = {}
+
+    def __len__(self) -> int:
+        """
+        Get number of rows in buffer
+
+        returns
+        -------
+        size:int
+            number of rows
+        """
+        return self.size
+
+    def write(self, rows:np.ndarray[int, np.dtype], temperatures:np.ndarray[float, np.dtype], results:Results, alphas:np.ndarray[float, np.dtype]|None=None):
+        """
+        Write results calculated for rows of raw data buffer. Values of results must be parallel to rows, i.e. results must be calculated from rows sorted by temperature, so that stable sorting of selectivities at construction does not change their order. Conversion wrapper orders measurements done at the same temperature by conversion, therefore, conversions parallel to rows must be provided separately. Results which are None are removed from buffer for all rows, since they depend only on calculation settings and initial data, which are the same for all rows.
+
+        parameters
+        ----------
+        rows:numpy.ndarray[int]
+            indices of rows parallel to temperatures, rows beyond current size extend buffer
+        temperatures:numpy.ndarray[float]
+            temperatures of measurements results were calculated for
+        results:Results
+            results calculated for rows
+        alphas:numpy.ndarray[float]|None (default:None)
+            conversions of key reactant parallel to rows, must be provided if results contain conversion
+        """
+        if len(rows) == 0:
+            return
+        size = max(self.size, int(rows.max()) + 1)
+        while size > len(self.temperatures):
+            self._grow()
+        self.temperatures[rows] = temperatures
+        values = _get_values(results, alphas)
+        for name in list(self.columns):
+            if name not in values:
+                del self.columns[name]
+                del self.compounds[name]
+        for name, (compounds, data) in values.items():
+            if name not in self.columns or self.compounds[name] != compounds:
+                self.columns[name] = np.full((len(self.temperatures),) + data.shape[1:], np.nan)
+                self.compounds[name] = compounds
+            self.columns[name][rows] = data
+        self.size = size
+
+    def remove(self, row:int):
+        """
+        Remove row from buffer shifting following rows up
+
+        parameters
+        ----------
+        row:int
+            index of row to remove
+        """
+        if row >= self.size:
+            raise IndexError(f'row {row} is out of buffer with {self.size} rows')
+        for buffer in [self.temperatures] + list(self.columns.values()):
+            buffer[row:self.size-1] = buffer[row+1:self.size]
+        self.size = self.size - 1
+
+    def build(self, sample_name:str|None) -> Results:
+        """
+        Assemble results of all rows.
+
+        parameters
+        ----------
+        sample_name:str|None
+            name of sample
+
+        returns
+        -------
+        results:Results
+            results for all rows, results which were not written are None
+        """
+        temperatures = self.temperatures[:self.size].copy()
+        conversion = None if 'conversion' not in self.columns else Conversion(temperatures, self._get_column('conversion'), sample_name)
+        selectivity = None if 'selectivity' not in self.columns else Selectivity(temperatures, self._get_column('selectivity').T, sample_name, compounds=self.compounds['selectivity'])
+        _yield = None if 'yield' not in self.columns else Selectivity(temperatures, self._get_column('yield').T, sample_name, compounds=self.compounds['yield'])
+        activity = None if 'activity_rates' not in self.columns else Activity(temperatures, self._get_column('activity_rates'), self._get_column('activity_tofs'), sample_name, self._get_column('activity_alphas'))
+        return Results(conversion, selectivity, _yield, activity)
+
+    def _get_column(self, name:str) -> np.ndarray|None:
+        """
+        Get copy of values of result for all rows
+
+        parameters
+        ----------
+        name:str
+            name of result
+
+        returns
+        -------
+        values:numpy.ndarray|None
+            values of result or None if result was not written
+        """
+        return self.columns[name][:self.size].copy() if name in self.columns else None
+
+    def _grow(self):
+        """
+        Double number of rows in buffers
+        """
+        capacity = 2 * len(self.temperatures)
+        self.temperatures = np.concatenate([self.temperatures, np.full(capacity - len(self.temperatures), np.nan)])
+        for name, buffer in self.columns.items():
+            self.columns[name] = np.concatenate([buffer, np.full((capacity - len(buffer),) + buffer.shape[1:], np.nan)])
+
+def _get_values(results:Results, alphas:np.ndarray[float, np.dtype]|None) -> dict[str,tuple[list[str]|None,np.ndarray]]:
+    """
+    Get values of results as matrices with a row per measurement.
+
+    parameters
+    ----------
+    results:Results
+        calculated results
+    alphas:numpy.ndarray[float]|None
+        conversions of key reactant parallel to rows used instead of values of conversion wrapper
+
+    returns
+    -------
+    values:dict[str,tuple[list[str]|None,numpy.ndarray]]
+        dictionary in a format {<result>:(<compounds>, <values>)}, compounds are None for results other than selectivities and yields
+    """
+    values = {}
+    if results.get_conversion() is not None:
+        values['conversion'] = (None, alphas)
+    if results.get_selectivity() is not None:
+        values['selectivity'] = (results.get_selectivity().get_compounds(), results.get_selectivity().get_matrix().T)
+    if results.get_yield() is not None:
+        values['yield'] = (results.get_yield().get_compounds(), results.get_yield().get_matrix().T)
+    activity = results.get_activity()
+    if activity is not None:
+        values['activity_rates'] = (None, activity.get_rates())
+        if activity.get_tofs() is not None:
+            values['activity_tofs'] = (None, activity.get_tofs())
+        if activity.get_alphas() is not None:
+            values['activity_alphas'] = (None, activity.get_alphas())
+    return values
@@ -0,0 +1,165 @@
+import json
+import struct
+import zipfile
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.results import Results
+from pycatalicism.calc.exporterexception import ExporterException
+
+"""
+Binary storage of calculated results in uncompressed NPZ file. Each wrapper of results is stored as a set of columnar arrays, metadata (sample name, reaction, calculation options, fingerprint of input data) are stored as JSON string in metadata array. File can be read by numpy.load, whereas load_results function of this module memory-maps float arrays directly from the file without parsing or copying them.
+"""
+
+FORMAT = 'pycatalicism-results'
+VERSION = 1
+
+_LOCAL_HEADER = struct.Struct('<4s5H3L2H')
+
+def save_results(path:Path, results:Results, metadata:dict[str,Any]|None=None):
+    """
+    Save results to uncompressed NPZ file.
+
+    parameters
+    ----------
+    path:Path
+        path to file
+    results:Results
+        bundle of calculated results
+    metadata:dict[str,Any]|None (default:None)
+        JSON serializable metadata stored in a file together with format name and version
+    """
+    arrays = {}
+    sample_name = None
+    if results.get_conversion() is not None:
+        conversion = results.get_conversion()
+        arrays['conversion_temperatures'] = np.asarray(conversion.get_temperatures(), dtype=float)
+        arrays['conversion_alphas'] = np.asarray(conversion.get_alphas(), dtype=float)
+        sample_name = conversion.get_sample_name()
+    for prefix, selectivity in [('selectivity', results.get_selectivity()), ('yield', results.get_yield())]:
+        if selectivity is not None:
+            arrays[f'{prefix}_temperatures'] = np.asarray(selectivity.get_temperatures(), dtype=float)
+            arrays[f'{prefix}_matrix'] = np.asarray(selectivity.get_matrix(), dtype=float)
+            arrays[f'{prefix}_compounds'] = np.array(selectivity.get_compounds(), dtype=str)
+            sample_name = selectivity.get_sample_name() if sample_name is None else sample_name
+    if results.get_activity() is not None:
+        activity = results.get_activity()
+        arrays['activity_temperatures'] = np.asarray(activity.get_temperatures(), dtype=float)
+        arrays['activity_rates'] = np.asarray(activity.get_rates(), dtype=float)
+        if activity.get_tofs() is not None:
+            arrays['activity_tofs'] = np.asarray(activity.get_tofs(), dtype=float)
+        if activity.get_alphas() is not None:
+            arrays['activity_alphas'] = np.asarray(activity.get_alphas(), dtype=float)
+    header = {'format':FORMAT, 'version':VERSION, 'sample_name':sample_name}
+    header.update(metadata or {})
+    arrays['metadata'] = np.array(json.dumps(header))
+    if not path.parent.exists():
+        path.parent.mkdir(parents=True)
+    with path.open(mode='wb') as file:
+        np.savez(file, **arrays)
+
+def load_metadata(path:Path) -> dict[str,Any]:
+    """
+    Load metadata from results file without loading results.
+
+    parameters
+    ----------
+    path:Path
+        path to file
+
+    returns
+    -------
+    metadata:dict[str,Any]
+        metadata of results
+
+    raises
+    ------
+    exception:ExporterException
+        if file is not a results file or its version is not supported
+    """
+    with zipfile.ZipFile(path) as archive:
+        try:
+            with archive.open('metadata.npy') as member:
+                metadata = json.loads(str(np.lib.format.read_array(member, allow_pickle=False)))
+        except KeyError:
+            raise ExporterException(f'{path} is not a results file')
+    if metadata.get('format') != FORMAT or metadata.get('version', 0) > VERSION:
+        raise ExporterException(f'Unsupported format of results file {path}')
+    return metadata
+
+def load_results(path:Path, mmap:bool=True) -> Results:
+    """
+    Load results from file. Float arrays are memory-mapped from file if mmap is True, results wrappers are created without sorting or copying data.
+
+    parameters
+    ----------
+    path:Path
+        path to file
+    mmap:bool (default:True)
+        whether to memory-map arrays or to read them to memory
+
+    returns
+    -------
+    results:Results
+        bundle of results stored in file
+
+    raises
+    ------
+    exception:ExporterException
+        if file is not a results file or its version is not supported
+    """
+    metadata = load_metadata(path)
+    arrays = _read_arrays(path, mmap)
+    sample_name = metadata.get('sample_name')
+    conversion = None
+    if 'conversion_alphas' in arrays:
+        conversion = Conversion(arrays['conversion_temperatures'], arrays['conversion_alphas'], sample_name, is_sorted=True)
+    selectivities = {}
+    for prefix in ['selectivity', 'yield']:
+        selectivities[prefix] = None
+        if f'{prefix}_matrix' in arrays:
+            selectivities[prefix] = Selectivity(arrays[f'{prefix}_temperatures'], arrays[f'{prefix}_matrix'], sample_name, compounds=arrays[f'{prefix}_compounds'].tolist(), is_sorted=True)
+    activity = None
+    if 'activity_rates' in arrays:
+        activity = Activity(arrays['activity_temperatures'], arrays['activity_rates'], arrays.get('activity_tofs'), sample_name, arrays.get('activity_alphas'))
+    return Results(conversion, selectivities['selectivity'], selectivities['yield'], activity)
+
+def _read_arrays(path:Path, mmap:bool) -> dict[str,np.ndarray]:
+    """
+    Read arrays from NPZ file. Float arrays stored without compression are memory-mapped if mmap is True, other arrays are read to memory.
+
+    parameters
+    ----------
+    path:Path
+        path to file
+    mmap:bool
+        whether to memory-map float arrays
+
+    returns
+    -------
+    arrays:dict[str,numpy.ndarray]
+        dictionary in a format {<name>:<array>}
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, path.open(mode='rb') as file:
+        for info in archive.infolist():
+            name = info.filename.removesuffix('.npy')
+            if name == 'metadata':
+                continue
+            if mmap and info.compress_type == zipfile.ZIP_STORED:
+                file.seek(info.header_offset)
+                fields = _LOCAL_HEADER.unpack(file.read(_LOCAL_HEADER.size))
+                file.seek(info.header_offset + _LOCAL_HEADER.size + fields[-2] + fields[-1])
+                major, _ = np.lib.format.read_magic(file)
+                shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(file) if major == 1 else np.lib.format.read_array_header_2_0(file)
+                if dtype.kind == 'f' and len(shape) > 0 and all(shape):
+                    arrays[name] = np.memmap(path, dtype=dtype, mode='r', offset=file.tell(), shape=shape, order='F' if fortran_order else 'C')
+                    continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return arrays
@@ -2,28 +2,55 @@ import numpy as np
 
 class Selectivity():
     """
-    Wrapper for selectivity data storage. Selectivities are stored as numpy.ndarray of dictionaries, containing name of compounds and corresponding calculated selectivities. The list is parallel to the list of corresponding temperatures.
+    Wrapper for selectivity data storage. Selectivities are stored as a dense matrix of shape (compounds, temperatures) parallel to the list of compounds and numpy.ndarray of temperatures. Data are sorted by temperature once at construction, compound to row and temperature to column indices make single value lookups O(1).
     """
 
-    def __init__(self, temperatures:list[float]|np.ndarray[float, np.dtype], selectivities:list[dict[str,float]]|np.ndarray[dict[str,float], np.dtype], sample_name:str|None):
+    def __init__(self, temperatures:list[float]|np.ndarray[float, np.dtype], selectivities:list[dict[str,float]]|np.ndarray, sample_name:str|None, compounds:list[str]|None=None, is_sorted:bool=False):
         """
-        Assigns parameters to instance variables, converting lists to numpy.ndarrays.
+        Assigns parameters to instance variables, converting selectivities to matrix and sorting data by temperature.
 
         parameters
         ----------
         temperatures:list[float]|numpy.ndarray[float]
             list of temperatures of catalytic reaction at which measurements were done
-        selectivities:list[dict[str,float]]|numpy.ndarray[dict[str,float]]
+        selectivities:list[dict[str,float]]|numpy.ndarray
             list of dictionaries with selectivities parallel to temperatures list. Selectivities are stored in a format {<compound>:<selectivity>}
                 compound:str
                     chemical formula of compound
                 selectivity:float
                     selectivity of catalyst to this compound
+            If compounds parameter is provided, selectivities must be a matrix of shape (len(compounds), len(temperatures))
         sample_name:str|None
             name of sample
+        compounds:list[str]|None (default:None)
+            names of compounds parallel to rows of selectivities matrix or None if selectivities are provided as list of dictionaries
+        is_sorted:bool (default:False)
+            if True, data are already sorted by temperature and are stored as is without copying (e.g. memory-mapped arrays loaded from binary file)
         """
-        self.temperatures = np.array(temperatures)
-        self.selectivities = np.array(selectivities)
+        temperatures = np.asarray(temperatures)
+        if compounds is None:
+            compound_index = {}
+            for point in selectivities:
+                for compound in point:
+                    compound_index.setdefault(compound, len(compound_index))
+            matrix = np.full((len(compound_index), len(temperatures)), np.nan)
+            for column, point in enumerate(selectivities):
+                matrix[[compound_index[compound] for compound in point], column] = list(point.values())
+            compounds = list(compound_index)
+        else:
+            matrix = np.asarray(selectivities, dtype=float).reshape(len(compounds), len(temperatures))
+        if is_sorted:
+            self.temperatures = temperatures
+            self.selectivities = matrix
+        else:
+            order = np.argsort(temperatures, kind='stable')
+            self.temperatures = temperatures[order]
+            self.selectivities = matrix[:, order]
+        self.compounds = list(compounds)
+        self.compound_index = {compound:row for row, compound in enumerate(self.compounds)}
+        self.temperature_index = {}
+        for column, temperature in enumerate(self.temperatures.tolist()):
+            self.temperature_index.setdefault(temperature, column)
         self.sample_name = sample_name
 
     def __str__(self) -> str:
@@ -37,26 +64,14 @@ class Selectivity():
         string:str
             string representation of selectivities
         """
-        sorted_selectivities = self.get_sorted()
-        c_l = []
-        for compound in sorted_selectivities.get_selectivities()[0]:
-            c_l.append(compound)
-        header = f'Sample\t{self.sample_name}\n\nTemperature'
-        for compound in c_l:
-            header = header + f'\t{compound}'
-        header = header + '\n'
-        data = ''
-        for temperature in sorted_selectivities.get_temperatures():
-            data = data + f'{temperature}'
-            for compound in c_l:
-                data = data + f'\t{sorted_selectivities.get_selectivity(compound, temperature)}'
-            data = data + '\n'
-        string = header + data
-        return string
+        header = f'Sample\t{self.sample_name}\n\nTemperature' + ''.join(f'\t{compound}' for compound in self.compounds) + '\n'
+        rows = zip(self.temperatures.tolist(), self.selectivities.T.tolist())
+        data = ''.join(f'{temperature}' + ''.join(f'\t{value}' for value in values) + '\n' for temperature, values in rows)
+        return header + data
 
     def get_temperatures(self) -> np.ndarray[float, np.dtype]:
         """
-        Get list of temperatures of catalytic reaction at which measurements were done
+        Get list of temperatures of catalytic reaction at which measurements were done sorted from lower to higher value
 
         returns
         -------
@@ -65,16 +80,56 @@ class Selectivity():
         """
         return self.temperatures
 
+    def get_compounds(self) -> list[str]:
+        """
+        Get list of compounds parallel to rows of selectivities matrix
+
+        returns
+        -------
+        compounds:list[str]
+            list of compounds
+        """
+        return self.compounds
+
+    def get_matrix(self) -> np.ndarray:
+        """
+        Get selectivities matrix of shape (compounds, temperatures)
+
+        returns
+        -------
+        selectivities:numpy.ndarray
+            matrix of selectivities with rows parallel to compounds and columns parallel to temperatures
+        """
+        return self.selectivities
+
+    def get_compound_selectivities(self, compound:str) -> np.ndarray[float, np.dtype]:
+        """
+        Get selectivities to compound at all temperatures
+
+        parameters
+        ----------
+        compound:str
+            compound for which selectivities to return
+
+        returns
+        -------
+        selectivities:numpy.ndarray[float]
+            selectivities parallel to temperatures
+        """
+        return self.selectivities[self.compound_index[compound]]
+
     def get_selectivities(self) -> np.ndarray[dict[str,float], np.dtype]:
         """
-        Get list of selectivities calculated by the program
+        Get list of selectivities calculated by the program parallel to temperatures. The array of dictionaries is built from selectivities matrix on each call, use get_matrix for bulk access.
 
         returns
         -------
         selectivities:numpy.ndarray[dict[str,float]]
             list of selectivities
         """
-        return self.selectivities
+        selectivities = np.empty(len(self.temperatures), dtype=object)
+        selectivities[:] = [dict(zip(self.compounds, values)) for values in self.selectivities.T.tolist()]
+        return selectivities
 
     def get_selectivity(self, compound:str, temperature:float) -> float:
         """
@@ -91,23 +146,24 @@ class Selectivity():
         -------
         selectivity:float
             selectivity to specified compound
+
+        raises
+        ------
+        exception:IndexError
+            if there is no measurement at specified temperature
         """
-        return self.get_selectivities()[self.temperatures==temperature][0][compound]
+        return self.selectivities[self.compound_index[compound], self._get_column(temperature)]
 
     def get_sorted(self) -> 'Selectivity':
         """
-        Get selectivity object with temperatures and selectivities lists sorted in parallel based on temperatures
+        Get selectivity object with temperatures and selectivities sorted in parallel based on temperatures. Data are sorted at construction, thus, this object itself is returned.
 
         returns
         -------
         selectivity:Selectivity
             sorted selectivity
         """
-        zipped_lists = zip(self.get_temperatures(), self.get_selectivities(), strict=True)
-        sorted_pairs = sorted(zipped_lists)
-        tuples = zip(*sorted_pairs)
-        sorted_temperatures, sorted_selectivities = [list(tuple) for tuple in tuples]
-        return Selectivity(sorted_temperatures, sorted_selectivities, self.sample_name)
+        return self
 
     def get_selectivities_at(self, temperature:float) -> dict[str,float]:
         """
@@ -122,5 +178,45 @@ class Selectivity():
         -------
         selectivities:dict[str,float]
             dictionary of selectivities at specified temperature
+
+        raises
+        ------
+        exception:IndexError
+            if there is no measurement at specified temperature
+        """
+        return dict(zip(self.compounds, self.selectivities[:, self._get_column(temperature)].tolist()))
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get sample name
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
+
+    def _get_column(self, temperature:float) -> int:
+        """
+        Get index of column of selectivities matrix with measurement done at temperature provided as parameter to the method
+
+        parameters
+        ----------
+        temperature:float
+            temperature of catalytic reaction
+
+        returns
+        -------
+        column:int
+            index of column of selectivities matrix
+
+        raises
+        ------
+        exception:IndexError
+            if there is no measurement at specified temperature
         """
-        return self.get_selectivities()[self.get_temperatures() == temperature][0]
+        try:
+            return self.temperature_index[float(temperature)]
+        except KeyError:
+            raise IndexError(f'No selectivities at temperature {temperature}') from None
@@ -0,0 +1,340 @@
+import numpy as np
+
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Time-on-stream analysis of repeated measurements at the same temperature (e.g. stability tests). Chromatograms are grouped by temperature of catalytic reaction and ordered by time of acquisition, conversion of key reactant is calculated for every chromatogram and time on stream is counted from the first chromatogram of each group. Deactivation rate of all groups is found by a single vectorized least squares fit over stack of groups padded with NaN, either for linear (X = X0 - k * t) or for exponential (X = X0 * exp(-kd * t)) decay of conversion.
+"""
+
+class TimeOnStream():
+    """
+    Wrapper for time-on-stream series and fitted deactivation parameters. Series are stored as matrices of shape (groups, points) padded with NaN, rows are parallel to temperatures. Fit parameters which cannot be determined (less than 3 points in a group) are NaN.
+    """
+
+    def __init__(self, temperatures:np.ndarray[float, np.dtype], start_timestamps:np.ndarray[float, np.dtype], times:np.ndarray, alphas:np.ndarray, fit:dict[str,np.ndarray], model:str, sample_name:str|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        temperatures:numpy.ndarray[float]
+            mean temperatures of groups of measurements in °C
+        start_timestamps:numpy.ndarray[float]
+            POSIX timestamps of the first chromatogram of each group in s
+        times:numpy.ndarray
+            times on stream in h of shape (groups, points), padded with NaN
+        alphas:numpy.ndarray
+            key reactant conversions of the same shape
+        fit:dict[str,numpy.ndarray]
+            fit parameters (see fit_deactivation)
+        model:str {exponential|linear}
+            model of deactivation
+        sample_name:str|None
+            name of sample
+        """
+        self.temperatures = temperatures
+        self.start_timestamps = start_timestamps
+        self.times = times
+        self.alphas = alphas
+        self.fit = fit
+        self.model = model
+        self.sample_name = sample_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of fitted parameters and time-on-stream series in a format:
+
+        Sample<tab><sample-name><br>
+        Model<tab><model><br>
+        <br>
+        Temperature<tab>Points<tab>Duration, h<tab>Initial conversion<tab>Deactivation rate, 1/h<tab>Rate error, 1/h<tab>R2<tab>Activity loss, %<br>
+        ...<br>
+        <br>
+        Temperature<tab>Time on stream, h<tab>Conversion<br>
+        ...
+
+        Deactivation rate is a decrease of conversion per hour for linear model and deactivation constant kd for exponential one, rate error is its standard error. Activity loss is a relative decrease of fitted conversion during the series.
+
+        returns
+        -------
+        string:str
+            string representation of time-on-stream analysis
+        """
+        header = f'Sample\t{self.sample_name}\nModel\t{self.model}\n\nTemperature\tPoints\tDuration, h\tInitial conversion\tDeactivation rate, 1/h\tRate error, 1/h\tR2\tActivity loss, %\n'
+        columns = zip(self.temperatures.tolist(), *[self.fit[key].tolist() for key in ['points', 'duration', 'initial_conversion', 'rate', 'rate_error', 'r_squared', 'activity_loss']])
+        fits = ''.join('\t'.join(str(value) for value in row) + '\n' for row in columns)
+        known = ~np.isnan(self.times)
+        rows = zip(np.broadcast_to(self.temperatures[:, np.newaxis], self.times.shape)[known].tolist(), self.times[known].tolist(), self.alphas[known].tolist())
+        series = ''.join(f'{temperature}\t{time}\t{alpha}\n' for temperature, time, alpha in rows)
+        return header + fits + '\nTemperature\tTime on stream, h\tConversion\n' + series
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get mean temperatures of groups of measurements
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            temperatures in °C
+        """
+        return self.temperatures
+
+    def get_start_timestamps(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get times of acquisition of the first chromatogram of each group
+
+        returns
+        -------
+        timestamps:numpy.ndarray[float]
+            POSIX timestamps in s parallel to temperatures
+        """
+        return self.start_timestamps
+
+    def get_series(self, row:int) -> tuple[np.ndarray,np.ndarray]:
+        """
+        Get time-on-stream series of group of measurements
+
+        parameters
+        ----------
+        row:int
+            index of group
+
+        returns
+        -------
+        (times, alphas):tuple[numpy.ndarray,numpy.ndarray]
+            times on stream in h and key reactant conversions
+        """
+        known = ~np.isnan(self.times[row])
+        return (self.times[row][known], self.alphas[row][known])
+
+    def get_times(self) -> np.ndarray:
+        """
+        Get times on stream of all groups
+
+        returns
+        -------
+        times:numpy.ndarray
+            times in h of shape (groups, points), padded with NaN
+        """
+        return self.times
+
+    def get_alphas(self) -> np.ndarray:
+        """
+        Get key reactant conversions of all groups
+
+        returns
+        -------
+        alphas:numpy.ndarray
+            conversions of shape (groups, points), padded with NaN
+        """
+        return self.alphas
+
+    def get_fitted(self) -> np.ndarray:
+        """
+        Get conversions calculated by fitted model at times on stream of all groups
+
+        returns
+        -------
+        alphas:numpy.ndarray
+            fitted conversions of shape (groups, points), NaN where time is not known or fit was not done
+        """
+        return get_model_values(self.model, self.times, self.fit['initial_conversion'][:, np.newaxis], self.fit['rate'][:, np.newaxis])
+
+    def get_rates(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get deactivation rates of groups
+
+        returns
+        -------
+        rates:numpy.ndarray[float]
+            decrease of conversion per hour for linear model or deactivation constant in 1/h for exponential model
+        """
+        return self.fit['rate']
+
+    def get_rate_errors(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get standard errors of deactivation rates of groups
+
+        returns
+        -------
+        errors:numpy.ndarray[float]
+            standard errors in 1/h
+        """
+        return self.fit['rate_error']
+
+    def get_initial_conversions(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get conversions at the start of series calculated by fitted model
+
+        returns
+        -------
+        alphas:numpy.ndarray[float]
+            initial conversions parallel to temperatures
+        """
+        return self.fit['initial_conversion']
+
+    def get_model(self) -> str:
+        """
+        Get model of deactivation
+
+        returns
+        -------
+        model:str
+            exponential or linear
+        """
+        return self.model
+
+    def get_sample_name(self) -> str|None:
+        """
+        Get name of sample
+
+        returns
+        -------
+        sample_name:str|None
+            name of sample
+        """
+        return self.sample_name
+
+def get_time_on_stream(calculator:ReactionCalculator, input_data:RawData, model:str='exponential', tolerance:float=1.0) -> TimeOnStream:
+    """
+    Group measurements by temperature, calculate time-on-stream series of key reactant conversion and fit deactivation model to them. Measurements belong to the same group if their sorted temperatures differ by not more than tolerance from neighbouring ones, so that drift of temperature during long stability test does not split the series. Measurements with unknown time of acquisition are ignored.
+
+    parameters
+    ----------
+    calculator:ReactionCalculator
+        calculator of reaction
+    input_data:RawData
+        wrapper with concentrations, flow rate data and times of acquisition
+    model:str {exponential|linear} (default:exponential)
+        model of deactivation
+    tolerance:float (default:1.0)
+        maximum difference of temperatures of neighbouring measurements of the same group in °C
+
+    returns
+    -------
+    time_on_stream:TimeOnStream
+        time-on-stream series and fitted deactivation parameters
+
+    raises
+    ------
+    exception:CalculatorException
+        if times of acquisition are not known or model is unknown
+    """
+    timestamps = input_data.get_timestamps()
+    if timestamps is None or not np.isfinite(timestamps).any():
+        raise CalculatorException('Times of acquisition of chromatograms are not known')
+    known = np.isfinite(timestamps)
+    temperatures = input_data.get_temperatures()[known]
+    alphas = calculator.calculate_alphas(input_data)[known]
+    timestamps = timestamps[known]
+    order = np.argsort(temperatures, kind='stable')
+    groups = np.concatenate([[0], np.cumsum(np.diff(temperatures[order]) > tolerance)])
+    order = order[np.lexsort((timestamps[order], groups))]
+    counts = np.bincount(groups)
+    starts = np.concatenate([[0], np.cumsum(counts)[:-1]])
+    positions = np.arange(len(groups)) - starts[groups]
+    start_timestamps = timestamps[order][starts]
+    times = np.full((len(counts), counts.max()), np.nan)
+    stacked_alphas = np.full(times.shape, np.nan)
+    times[groups, positions] = (timestamps[order] - start_timestamps[groups]) / 3600
+    stacked_alphas[groups, positions] = alphas[order]
+    group_temperatures = np.bincount(groups, weights=temperatures[order]) / counts
+    fit = fit_deactivation(times, stacked_alphas, model)
+    return TimeOnStream(group_temperatures, start_timestamps, times, stacked_alphas, fit, model, input_data.get_sample_name())
+
+def fit_deactivation(times:np.ndarray, alphas:np.ndarray, model:str='exponential') -> dict[str,np.ndarray]:
+    """
+    Fit deactivation model to stack of time-on-stream series by linear least squares. Conversion is fitted vs. time for linear model, ln(conversion) is fitted vs. time for exponential model, in the latter case only points with positive conversion are used.
+
+    parameters
+    ----------
+    times:numpy.ndarray
+        times on stream in h of shape (groups, points), padded with NaN
+    alphas:numpy.ndarray
+        key reactant conversions as fractions of the same shape
+    model:str {exponential|linear} (default:exponential)
+        model of deactivation
+
+    returns
+    -------
+    fit:dict[str,numpy.ndarray]
+        arrays of shape (groups,) with keys initial_conversion, rate, rate_error (1/h), r_squared, points, duration (h) and activity_loss (%)
+
+    raises
+    ------
+    exception:CalculatorException
+        if model is unknown
+    """
+    times = np.atleast_2d(np.asarray(times, dtype=float))
+    alphas = np.atleast_2d(np.asarray(alphas, dtype=float))
+    with np.errstate(invalid='ignore'):
+        if model == 'linear':
+            used = ~np.isnan(times) & ~np.isnan(alphas)
+            y = np.where(used, alphas, 0)
+        elif model == 'exponential':
+            used = ~np.isnan(times) & (alphas > 0)
+            y = np.where(used, np.log(np.where(used, alphas, 1)), 0)
+        else:
+            raise CalculatorException(f'Unknown deactivation model {model}')
+    x = np.where(used, times, 0)
+    n = used.sum(axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        x_mean = x.sum(axis=1) / n
+        y_mean = y.sum(axis=1) / n
+        dx = np.where(used, x - x_mean[:, None], 0)
+        dy = np.where(used, y - y_mean[:, None], 0)
+        sxx = (dx * dx).sum(axis=1)
+        sxy = (dx * dy).sum(axis=1)
+        syy = (dy * dy).sum(axis=1)
+        slope = sxy / sxx
+        intercept = y_mean - slope * x_mean
+        residuals = np.maximum(syy - slope * sxy, 0)
+        slope_error = np.sqrt(residuals / (n - 2) / sxx)
+        r_squared = 1 - residuals / syy
+        duration = np.max(np.where(used, times, -np.inf), axis=1, initial=-np.inf)
+        initial_conversion = intercept if model == 'linear' else np.exp(intercept)
+        activity_loss = 100 * (1 - get_model_values(model, duration, initial_conversion, -slope) / initial_conversion)
+    fitted = n >= 3
+    return {
+            'initial_conversion'    :   np.where(fitted, initial_conversion, np.nan),
+            'rate'                  :   np.where(fitted, -slope, np.nan),
+            'rate_error'            :   np.where(fitted, slope_error, np.nan),
+            'r_squared'             :   np.where(fitted, r_squared, np.nan),
+            'points'                :   n,
+            'duration'              :   np.where(n > 0, duration, np.nan),
+            'activity_loss'         :   np.where(fitted, activity_loss, np.nan),
+            }
+
+def get_model_values(model:str, times:np.ndarray, initial_conversions:np.ndarray, rates:np.ndarray) -> np.ndarray:
+    """
+    Calculate conversions by deactivation model
+
+    parameters
+    ----------
+    model:str {exponential|linear}
+        model of deactivation
+    times:numpy.ndarray
+        times on stream in h
+    initial_conversions:numpy.ndarray
+        conversions at the start of series, broadcastable to times
+    rates:numpy.ndarray
+        deactivation rates in 1/h, broadcastable to times
+
+    returns
+    -------
+    alphas:numpy.ndarray
+        calculated conversions
+
+    raises
+    ------
+    exception:CalculatorException
+        if model is unknown
+    """
+    if model == 'linear':
+        return initial_conversions - rates * times
+    elif model == 'exponential':
+        return initial_conversions * np.exp(-rates * times)
+    else:
+        raise CalculatorException(f'Unknown deactivation model {model}')
@@ -0,0 +1,69 @@
+from pathlib import Path
+
+from pycatalicism.calc.plotter import Plotter
+from pycatalicism.calc.plotterexception import PlotterException
+from pycatalicism.calc.time_on_stream import TimeOnStream
+from pycatalicism.logging_decorator import Logging
+
+class TimeOnStreamPlotter(Plotter):
+    """
+    Class for plotting time-on-stream series: measured conversions of each group of measurements are plotted vs. time on stream as markers and fitted deactivation model as line of the same color.
+    """
+
+    @Logging
+    def __init__(self):
+        """
+        Registers logger with instances of this class which can be accessed via self.logger instance variable
+        """
+        self.dpi = 300
+        self.width = 160 / 25.4
+        self.height = 100 / 25.4
+
+    def plot_time_on_stream(self, time_on_stream:TimeOnStream, show_plot:bool=False, output_plot_path:Path|None=None):
+        """
+        Main interface of this class. Plots conversion vs. time on stream for all temperatures on a single plot. If show_plot is true, shows plot. If output_plot_path was provided, exports plot to time_on_stream.png to provided directory. Figure is closed afterwards.
+
+        parameters
+        ----------
+        time_on_stream:TimeOnStream
+            time-on-stream series and fitted deactivation parameters
+        show_plot:bool (default:False)
+            if True, show plot
+        output_plot_path:Path|None (default:None)
+            path to directory to export plot
+
+        raises
+        ------
+        exception:PlotterException
+            if output plot path is not a directory
+        """
+        fig = self._get_figure(show_plot)
+        ax = fig.subplots()
+        fitted = time_on_stream.get_fitted()
+        for row, temperature in enumerate(time_on_stream.get_temperatures().tolist()):
+            times, alphas = time_on_stream.get_series(row)
+            points, = ax.plot(times, alphas, linestyle='none', marker='o', markersize=3, label=f'{temperature:.1f} °C')
+            ax.plot(time_on_stream.get_times()[row], fitted[row], color=points.get_color())
+        ax.set_xlabel('Time on stream, h')
+        ax.set_ylabel('Conversion')
+        if time_on_stream.get_sample_name():
+            ax.set_title(time_on_stream.get_sample_name())
+        ax.legend(loc='center left', bbox_to_anchor=(1, 0.5), fontsize='small')
+        try:
+            if show_plot:
+                import matplotlib.pyplot as plt
+                self.logger.info(f'Plotting conversion vs. time on stream')
+                plt.show()
+            if output_plot_path:
+                if output_plot_path.exists() and not output_plot_path.is_dir():
+                    raise PlotterException(f'Output plot path must be a directory')
+                if not output_plot_path.exists():
+                    output_plot_path.mkdir(parents=True)
+                self.logger.info(f'Exporting plot of conversion vs. time on stream')
+                fig.set_dpi(self.dpi)
+                fig.set_figheight(self.height)
+                fig.set_figwidth(self.width)
+                fig.set_tight_layout(True)
+                fig.savefig(fname=output_plot_path.joinpath('time_on_stream.png'))
+        finally:
+            self._close_figure(fig, show_plot)
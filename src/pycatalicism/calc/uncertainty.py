@@ -0,0 +1,267 @@
+import warnings
+
+import numpy as np
+
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.calc import light_off
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Monte Carlo propagation of uncertainties of input data to conversion, selectivities, yields and light-off temperatures. Input data are perturbed by normally distributed errors given either by user as relative errors or estimated from replicate chromatograms of initial gas composition (e.g. gathered by measure-init-concentration command). All draws are calculated by calculator as a single batch and confidence intervals are calculated as percentiles of resulting distributions.
+"""
+
+class Uncertainty():
+    """
+    Wrapper for confidence intervals of results. Median and bounds of confidence interval are stored for every temperature. Values which cannot be determined (e.g. light-off level is not reached in most draws) are NaN.
+    """
+
+    def __init__(self, temperatures:np.ndarray[float, np.dtype], intervals:dict[str,np.ndarray], light_off_intervals:dict[str,np.ndarray], draws:int, confidence:float, sample_name:str|None):
+        """
+        Assign parameters to instance variables.
+
+        parameters
+        ----------
+        temperatures:numpy.ndarray[float]
+            sorted temperatures of catalytic reaction
+        intervals:dict[str,numpy.ndarray]
+            confidence intervals of results in a format {<quantity>:<matrix of shape (3, temperatures) with median, lower and upper bounds>}
+        light_off_intervals:dict[str,numpy.ndarray]
+            confidence intervals of light-off temperatures in a format {<metric>:<vector of median, lower and upper bounds>}, calculated over draws in which light-off temperature could be determined
+        draws:int
+            number of draws
+        confidence:float
+            confidence level of intervals
+        sample_name:str|None
+            name of sample
+        """
+        self.temperatures = temperatures
+        self.intervals = intervals
+        self.light_off_intervals = light_off_intervals
+        self.draws = draws
+        self.confidence = confidence
+        self.sample_name = sample_name
+
+    def __str__(self) -> str:
+        """
+        Get string representation of confidence intervals in a format:
+
+        Sample<tab><sample-name><br>
+        Draws<tab><draws><br>
+        Confidence<tab><confidence><br>
+        <br>
+        Temperature<tab><quantity><tab><quantity> low<tab><quantity> high<tab>...<br>
+        ...<br>
+        <br>
+        Metric<tab>Median<tab>Low<tab>High<br>
+        ...
+
+        returns
+        -------
+        string:str
+            string representation of confidence intervals
+        """
+        header = f'Sample\t{self.sample_name}\nDraws\t{self.draws}\nConfidence\t{self.confidence}\n\nTemperature' + ''.join(f'\t{quantity}\t{quantity} low\t{quantity} high' for quantity in self.intervals) + '\n'
+        columns = np.concatenate([interval for interval in self.intervals.values()]).T.tolist() if self.intervals else [[] for _ in self.temperatures]
+        data = ''.join(f'{temperature}' + ''.join(f'\t{value}' for value in values) + '\n' for temperature, values in zip(self.temperatures.tolist(), columns))
+        metrics = ''.join(f'{metric}\t' + '\t'.join(str(value) for value in interval.tolist()) + '\n' for metric, interval in self.light_off_intervals.items())
+        return header + data + ('\nMetric\tMedian\tLow\tHigh\n' + metrics if metrics else '')
+
+    def get_temperatures(self) -> np.ndarray[float, np.dtype]:
+        """
+        Get sorted temperatures of catalytic reaction
+
+        returns
+        -------
+        temperatures:numpy.ndarray[float]
+            temperatures
+        """
+        return self.temperatures
+
+    def get_quantities(self) -> list[str]:
+        """
+        Get names of quantities with known confidence intervals
+
+        returns
+        -------
+        quantities:list[str]
+            names of quantities, e.g. Conversion, Selectivity CH4, Yield CH4
+        """
+        return list(self.intervals)
+
+    def get_interval(self, quantity:str) -> tuple[np.ndarray,np.ndarray,np.ndarray]:
+        """
+        Get median and confidence interval of quantity at all temperatures
+
+        parameters
+        ----------
+        quantity:str
+            name of quantity
+
+        returns
+        -------
+        (median, low, high):tuple[numpy.ndarray,numpy.ndarray,numpy.ndarray]
+            vectors parallel to temperatures
+        """
+        median, low, high = self.intervals[quantity]
+        return (median, low, high)
+
+    def get_light_off_interval(self, metric:str) -> tuple[float,float,float]:
+        """
+        Get median and confidence interval of light-off temperature
+
+        parameters
+        ----------
+        metric:str
+            name of metric, e.g. T50
+
+        returns
+        -------
+        (median, low, high):tuple[float,float,float]
+            median and bounds of confidence interval in °C
+        """
+        median, low, high = self.light_off_intervals[metric].tolist()
+        return (median, low, high)
+
+    def get_draws(self) -> int:
+        """
+        Get number of draws
+
+        returns
+        -------
+        draws:int
+            number of draws
+        """
+        return self.draws
+
+    def get_confidence(self) -> float:
+        """
+        Get confidence level of intervals
+
+        returns
+        -------
+        confidence:float
+            confidence level
+        """
+        return self.confidence
+
+def estimate_uncertainty(calculator:ReactionCalculator, input_data:RawData, draws:int, errors:dict[str,float|dict[str,float]], confidence:float=0.95, calculate_conversion:bool=True, calculate_selectivity:bool=True, calculate_yield:bool=False, light_off_method:str='interpolation', seed:int|None=None) -> Uncertainty:
+    """
+    Estimate confidence intervals of results by Monte Carlo method. All draws are calculated by calculator as a single batch (see ReactionCalculator.calculate_draws), light-off temperatures of all draws are calculated by a single vectorized call.
+
+    parameters
+    ----------
+    calculator:ReactionCalculator
+        calculator of reaction
+    input_data:RawData
+        wrapper with concentrations and flow rate data
+    draws:int
+        number of draws
+    errors:dict[str,float|dict[str,float]]
+        standard deviations of input data (see ReactionCalculator.calculate_draws)
+    confidence:float (default:0.95)
+        confidence level of intervals
+    calculate_conversion:bool (default:True)
+        whether to estimate uncertainty of conversion and light-off temperatures
+    calculate_selectivity:bool (default:True)
+        whether to estimate uncertainty of selectivities
+    calculate_yield:bool (default:False)
+        whether to estimate uncertainty of yields
+    light_off_method:str {interpolation|sigmoid} (default:interpolation)
+        method used to determine light-off temperatures
+    seed:int|None (default:None)
+        seed of random numbers generator, results are reproducible if provided
+
+    returns
+    -------
+    uncertainty:Uncertainty
+        confidence intervals of results
+
+    raises
+    ------
+    exception:CalculatorException
+        if number of draws is not positive or confidence is not between 0 and 1
+    """
+    if draws < 1:
+        raise CalculatorException(f'Number of draws must be positive, got {draws}')
+    if not 0 < confidence < 1:
+        raise CalculatorException(f'Confidence level must be between 0 and 1, got {confidence}')
+    alphas, selectivities, yields = calculator.calculate_draws(input_data, draws, errors, calculate_conversion, calculate_selectivity, calculate_yield, np.random.default_rng(seed))
+    order = np.argsort(input_data.get_temperatures(), kind='stable')
+    temperatures = input_data.get_temperatures()[order]
+    percentiles = [50, 50 * (1 - confidence), 50 * (1 + confidence)]
+    intervals = {}
+    light_off_intervals = {}
+    if alphas is not None:
+        alphas = alphas[:, order]
+        intervals['Conversion'] = _get_percentiles(alphas, percentiles)
+        light_off_temperatures = light_off.get_light_off_temperatures(np.broadcast_to(temperatures, alphas.shape), alphas, light_off.LEVELS, light_off_method)
+        for level, interval in zip(light_off.LEVELS, _get_percentiles(light_off_temperatures, percentiles).T):
+            light_off_intervals[light_off.get_level_name(level)] = interval
+    for prefix, values in [('Selectivity', selectivities), ('Yield', yields)]:
+        if values is None:
+            continue
+        values = values[:, order]
+        for compound, interval in zip(calculator.get_reaction().get_products(), np.moveaxis(_get_percentiles(values, percentiles), -1, 0)):
+            intervals[f'{prefix} {compound}'] = interval
+    return Uncertainty(temperatures, intervals, light_off_intervals, draws, confidence, input_data.get_sample_name())
+
+def get_replicate_errors(chromatograms:list[Chromatogram]) -> dict[str,float|dict[str,float]]:
+    """
+    Estimate errors of initial data from replicate chromatograms of initial gas composition. Errors are sample standard deviations: relative for concentrations of compounds, flow rate and pressure, absolute for gas-clock temperature.
+
+    parameters
+    ----------
+    chromatograms:list[Chromatogram]
+        replicate chromatograms measured before catalytic reaction started
+
+    returns
+    -------
+    errors:dict[str,float|dict[str,float]]
+        errors with keys initial concentration (dictionary {<compound>:<error>}), initial flow, initial pressure and initial temperature, flow rate errors are present only if flow rate was measured in all replicates
+
+    raises
+    ------
+    exception:CalculatorException
+        if less than two chromatograms are provided
+    """
+    if len(chromatograms) < 2:
+        raise CalculatorException(f'At least two replicate chromatograms are needed to estimate errors, got {len(chromatograms)}')
+    compounds = {}
+    for chromatogram in chromatograms:
+        for compound in chromatogram.get_compounds():
+            compounds.setdefault(compound, len(compounds))
+    concentrations = np.full((len(chromatograms), len(compounds)), np.nan)
+    for row, chromatogram in enumerate(chromatograms):
+        concentrations[row, [compounds[compound] for compound in chromatogram.get_compounds()]] = chromatogram.get_concentrations()
+    with np.errstate(divide='ignore', invalid='ignore'):
+        relative_errors = np.nanstd(concentrations, axis=0, ddof=1) / np.nanmean(concentrations, axis=0)
+    errors = {'initial concentration':{compound:float(error) for compound, error in zip(compounds, np.nan_to_num(relative_errors, nan=0.0, posinf=0.0).tolist())}}
+    flow_data = np.array([(chromatogram.get_ambient_temperature(), chromatogram.get_ambient_pressure(), chromatogram.get_flow()) for chromatogram in chromatograms], dtype=float)
+    if np.isfinite(flow_data).all():
+        temperature_error, pressure_error, flow_error = np.std(flow_data, axis=0, ddof=1).tolist()
+        errors['initial temperature'] = temperature_error
+        errors['initial pressure'] = pressure_error / np.mean(flow_data[:, 1])
+        errors['initial flow'] = flow_error / np.mean(flow_data[:, 2])
+    return errors
+
+def _get_percentiles(values:np.ndarray, percentiles:list[float]) -> np.ndarray:
+    """
+    Get percentiles of values over draws ignoring NaN values
+
+    parameters
+    ----------
+    values:numpy.ndarray
+        values with draws as the first axis
+    percentiles:list[float]
+        percentiles to calculate
+
+    returns
+    -------
+    percentiles:numpy.ndarray
+        array of shape (percentiles, *values.shape[1:]), NaN if all values are NaN
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return np.nanpercentile(values, percentiles, axis=0)
@@ -0,0 +1,236 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from pathlib import Path
+
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+"""
+Watchers of input data directory used by calc watch mode. Linux inotify is used if available, otherwise directory is scanned periodically and files are compared by modification time and size.
+"""
+
+class Watcher():
+    """
+    Abstract class for watchers of directory.
+    """
+
+    def wait(self, timeout:float|None=None) -> set[Path]:
+        """
+        Methods of concrete classes should override this method.
+
+        parameters
+        ----------
+        timeout:float|None (default:None)
+            maximum time to wait for changes in s, wait forever if None
+
+        returns
+        -------
+        paths:set[Path]
+            paths to files which were created, changed or removed, empty set if timeout was reached
+
+        raises
+        ------
+        exception:NotImplementedError
+            if this method is not overriden
+        """
+        raise NotImplementedError()
+
+    def close(self):
+        """
+        Release resources used by watcher.
+        """
+        pass
+
+class PollingWatcher(Watcher):
+    """
+    Watcher which scans directory periodically and compares modification times and sizes of files with previous scan.
+    """
+
+    def __init__(self, path:Path, interval:float=2.0):
+        """
+        Assign parameters to instance variables and make initial scan of directory.
+
+        parameters
+        ----------
+        path:Path
+            path to directory to watch
+        interval:float (default:2.0)
+            time between scans in s
+        """
+        self.path = path
+        self.interval = interval
+        self.snapshot = self._scan()
+
+    def wait(self, timeout:float|None=None) -> set[Path]:
+        """
+        Scan directory until changes are found or timeout is reached.
+
+        parameters
+        ----------
+        timeout:float|None (default:None)
+            maximum time to wait for changes in s, wait forever if None
+
+        returns
+        -------
+        paths:set[Path]
+            paths to files which were created, changed or removed, empty set if timeout was reached
+        """
+        start = time.monotonic()
+        while True:
+            time.sleep(self.interval)
+            snapshot = self._scan()
+            changed = {path for path in snapshot.keys() | self.snapshot.keys() if snapshot.get(path) != self.snapshot.get(path)}
+            self.snapshot = snapshot
+            if changed or (timeout is not None and time.monotonic() - start >= timeout):
+                return changed
+
+    def _scan(self) -> dict[Path,tuple[int,int]]:
+        """
+        Get modification times and sizes of files in directory
+
+        returns
+        -------
+        snapshot:dict[Path,tuple[int,int]]
+            dictionary in a format {<path>:(<mtime>, <size>)}
+        """
+        snapshot = {}
+        with os.scandir(self.path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_file():
+                        stat = entry.stat()
+                        snapshot[Path(entry.path)] = (stat.st_mtime_ns, stat.st_size)
+                except OSError:
+                    continue
+        return snapshot
+
+class InotifyWatcher(Watcher):
+    """
+    Watcher which uses Linux inotify API via libc. Files are reported when they are closed after writing, moved or removed, therefore, partially written files are not reported.
+    """
+
+    _IN_CLOSE_WRITE = 0x00000008
+    _IN_MOVED_FROM = 0x00000040
+    _IN_MOVED_TO = 0x00000080
+    _IN_DELETE = 0x00000200
+    _EVENT = struct.Struct('iIII')
+
+    def __init__(self, path:Path, settle_time:float=0.2):
+        """
+        Initialize inotify instance and add watch for directory.
+
+        parameters
+        ----------
+        path:Path
+            path to directory to watch
+        settle_time:float (default:0.2)
+            time in s to collect further events after the first one, so that files written in a burst are reported together
+
+        raises
+        ------
+        exception:CalculatorException
+            if inotify is not available
+        """
+        if not sys.platform.startswith('linux'):
+            raise CalculatorException('inotify is available only on linux')
+        libc_name = ctypes.util.find_library('c')
+        if libc_name is None:
+            raise CalculatorException('cannot find libc')
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        self.path = path
+        self.settle_time = settle_time
+        self.fd = libc.inotify_init()
+        if self.fd < 0:
+            raise CalculatorException(f'cannot initialize inotify: {os.strerror(ctypes.get_errno())}')
+        mask = self._IN_CLOSE_WRITE | self._IN_MOVED_FROM | self._IN_MOVED_TO | self._IN_DELETE
+        if libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            error = os.strerror(ctypes.get_errno())
+            os.close(self.fd)
+            raise CalculatorException(f'cannot watch {path}: {error}')
+
+    def wait(self, timeout:float|None=None) -> set[Path]:
+        """
+        Wait for inotify events.
+
+        parameters
+        ----------
+        timeout:float|None (default:None)
+            maximum time to wait for changes in s, wait forever if None
+
+        returns
+        -------
+        paths:set[Path]
+            paths to files which were created, changed or removed, empty set if timeout was reached
+        """
+        changed = set()
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        while ready:
+            changed.update(self._read_events())
+            ready, _, _ = select.select([self.fd], [], [], self.settle_time)
+        return changed
+
+    def close(self):
+        """
+        Close inotify file descriptor.
+        """
+        os.close(self.fd)
+
+    def _read_events(self) -> set[Path]:
+        """
+        Read pending events from inotify file descriptor
+
+        returns
+        -------
+        paths:set[Path]
+            paths to files mentioned in events
+        """
+        data = os.read(self.fd, 64 * 1024)
+        paths = set()
+        offset = 0
+        while offset < len(data):
+            _, _, _, length = self._EVENT.unpack_from(data, offset)
+            offset = offset + self._EVENT.size
+            name = data[offset:offset+length].rstrip(b'\0')
+            offset = offset + length
+            if name:
+                paths.add(self.path.joinpath(os.fsdecode(name)))
+        return paths
+
+def get_watcher(path:Path, method:str='auto', interval:float=2.0) -> Watcher:
+    """
+    Get watcher of directory.
+
+    parameters
+    ----------
+    path:Path
+        path to directory to watch
+    method:str {auto|inotify|poll} (default:auto)
+        method used to watch directory, auto uses inotify if available and falls back to polling otherwise
+    interval:float (default:2.0)
+        time between scans of directory in s if polling is used
+
+    returns
+    -------
+    watcher:Watcher
+        watcher of directory
+
+    raises
+    ------
+    exception:CalculatorException
+        if method is not known or inotify was requested but is not available
+    """
+    if method == 'poll':
+        return PollingWatcher(path, interval)
+    elif method == 'inotify':
+        return InotifyWatcher(path)
+    elif method == 'auto':
+        try:
+            return InotifyWatcher(path)
+        except (CalculatorException, OSError, AttributeError):
+            return PollingWatcher(path, interval)
+    else:
+        raise CalculatorException(f'unknown watch method {method}')
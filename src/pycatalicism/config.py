@@ -13,10 +13,104 @@
 #   Поток<tab><flow-rate>]
 raw_data_parser_type = 'chromatec-crystal-composition-copy-paste'
 
+# parallel parsing of raw data files
+# number of workers used to parse files, files are parsed serially if 1
+parser_workers = 1
+# type of workers pool: process|thread
+parser_pool_type = 'process'
+# number of files sent to worker at once
+parser_chunk_size = 64
+
+# persistent cache of parsed files and calculation results
+# path to cache directory, set to None to disable cache
+calc_cache_path = '~/.cache/pycatalicism'
+# maximum size of cached data in bytes, least recently used entries are evicted if exceeded
+calc_cache_max_size = 256 * 1024**2
+
+# watch mode of calc command
+# method used to watch input data directory: auto|inotify|poll (auto uses inotify if available, use poll for network shares)
+calc_watch_method = 'auto'
+# time between scans of input data directory in s if polling is used
+calc_watch_interval = 2.0
+
+# streaming mode of calc command
+# separator of records read from stdin or FIFO (default is ASCII record separator character)
+calc_stream_separator = '\x1e'
+# number of records after which exported data and plot are updated, they are also updated when stream ends
+calc_stream_flush_interval = 10
+
+# light-off metrics (T10, T50, T90) exported to light_off.dat and to summary of calc-batch command if --light-off flag is provided
+# method used to determine light-off temperatures: interpolation|sigmoid (interpolation uses running maximum of conversion and linear interpolation between measured points, sigmoid uses logistic curve fitted to conversion data)
+light_off_method = 'interpolation'
+
+# apparent activation energy and pre-exponential factor exported to arrhenius.dat and to summary of calc-batch command if --arrhenius flag is provided and activity is calculated
+# maximum conversion of key reactant (fraction) of points considered to be measured in differential regime
+kinetics_max_conversion = 0.15
+# confidence level of intervals of Arrhenius parameters
+kinetics_confidence = 0.95
+
+# uncertainty mode of calc command (--uncertainty DRAWS), confidence intervals are exported to uncertainty.dat
+# standard deviations of input data: relative errors of concentrations after and before catalytic reactor, of total gas flow rate and pressure, absolute error of gas-clock temperature in K. Errors of initial data can be set separately by initial flow, initial pressure and initial temperature keys, errors of initial data are estimated from replicate chromatograms if --initial-replicates is provided
+uncertainty_errors = {
+                        'concentration'         :   0.01,
+                        'initial concentration' :   0.01,
+                        'flow'                  :   0.01,
+                        'pressure'              :   0.001,
+                        'temperature'           :   0.5,
+                        }
+# confidence level of intervals
+uncertainty_confidence = 0.95
+# seed of random numbers generator, set to integer to get reproducible results
+uncertainty_seed = None
+
+# time-on-stream mode of calc command (--time-on-stream), series and deactivation rates are exported to time_on_stream.dat
+# model of deactivation fitted to conversion vs. time on stream: exponential|linear
+deactivation_model = 'exponential'
+# maximum difference of temperatures of neighbouring measurements in °C, which are considered to be done at the same temperature
+time_on_stream_tolerance = 1.0
+
+# aggregation of replicate measurements (--aggregate-replicates flag of calc and calc-batch commands) and of replicate files of initial data (if initial-data-path is a directory)
+# statistic used to aggregate replicates: mean|median
+replicate_statistic = 'mean'
+# threshold of modified z-score (0.6745 * |x - median| / MAD) used to reject outliers among replicates, set to None to keep all replicates
+replicate_outlier_threshold = 3.5
+# resolution of temperatures in °C used to find replicate measurements done at the same temperature
+replicate_resolution = 1.0
+
+# balance check (--balance flag of calc and calc-batch commands), conversions on both bases and balance closures are exported to balance.dat
+# maximum allowed difference of conversions calculated from reactants and products concentrations and deviation of balance closure from unity
+balance_threshold = 0.05
+
+# inert compound (e.g. 'He', 'N2' or 'Ar') used as internal standard to correct for change of total gas flow rate instead of gas-clock measurements (--tracer argument of calc and calc-batch commands), set to None to use gas-clock data
+flow_tracer = None
+
+# thermodynamic equilibrium (--equilibrium flag of calc and calc-batch commands), equilibrium conversion and selectivities are exported to equilibrium.dat and overlaid on plots
+# total pressure in reactor in Pa
+equilibrium_pressure = 101325.0
+# step of temperature grid in °C
+equilibrium_step = 5.0
+
+# calc-batch command
+# number of worker processes
+batch_workers = 4
+# name of initial data file in samples directories
+batch_initial_data_file_name = 'initial.txt'
+
+# compare command
+# step of common temperature grid in °C used if step is not provided as a command line argument
+compare_grid_step = 10.0
+
+# additional reactions for calculation of conversion, selectivity and yield by generic calculator. Reactions are declared as
+#   '<reaction-name>'  :   {'reactants':[<key-reactant>, ...], 'products':[<product>, ...], 'element':'C', 'coefficients':[<coefficient>, ...]}
+# conversion is calculated for the key reactant, selectivities are calculated on the basis of element atoms in products molecules, element is optional (carbon by default). Coefficients are numbers of key reactant molecules converted to one molecule of each product and are used for calculation of conversion based on products and yields, they are optional (ratio of numbers of element atoms in product and key reactant molecules by default)
+reactions = {
+            }
+
 # logging levels for different classes/modules
 import logging
 logging_levels = {
                     'ChromatecCrystalCompositionCopyPasteParser'    :   logging.INFO,
+                    'ComparisonPlotter'                             :   logging.INFO,
                     'CO2HydrogenationCalculator'                    :   logging.INFO,
                     'CO2HydrogenationProductsBasisCalculator'       :   logging.INFO,
                     'CO2HydrogenationExporter'                      :   logging.INFO,
@@ -24,7 +118,12 @@ logging_levels = {
                     'COOxidationCalculator'                         :   logging.INFO,
                     'COOxidationExporter'                           :   logging.INFO,
                     'COOxidationPlotter'                            :   logging.INFO,
+                    'ParseCache'                                    :   logging.INFO,
                     'RawData'                                       :   logging.INFO,
+                    'ReactionCalculator'                            :   logging.INFO,
+                    'ReactionExporter'                              :   logging.INFO,
+                    'ReactionPlotter'                               :   logging.INFO,
+                    'TimeOnStreamPlotter'                           :   logging.INFO,
                     }
 
 ## chromatograph configuration ##
@@ -101,16 +200,15 @@ mfc_H2_calibrations = {
                     }
 
 ## furnace configuration ##
-import serial
-
 # Furnace controller type
 furnace_device_name = 'ÒÐÌ101' # <- this string is actually returned by the device \_O_/ although should be 'TPM101' according to owen protocol
 # Furnace controller port name and corresponding port parameters (baudrate, bytesize, parity, stopbits) which must be the same as configured on controller device
 furnace_port = 'COM6'
 furnace_baudrate = 19200
-furnace_bytesize = serial.EIGHTBITS
-furnace_parity = serial.PARITY_NONE
-furnace_stopbits = serial.STOPBITS_ONE
+# NB: values of serial.EIGHTBITS, serial.PARITY_NONE and serial.STOPBITS_ONE are used instead of constants themselves, so that serial is not imported by commands which do not use furnace
+furnace_bytesize = 8
+furnace_parity = 'N'
+furnace_stopbits = 1
 # Time in seconds to wait for the response from the device
 furnace_timeout = 0.1
 # Time in seconds to wait while message is sent to the device
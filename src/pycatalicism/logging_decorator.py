@@ -73,7 +73,7 @@ class Logging:
 
     def _configure_logger(self, logger:logging.Logger, level:int):
         """
-        Set level to logger, add StreamHandler (will log to console) and formatter
+        Set level to logger, add StreamHandler (will log to console) and formatter. Handler is added only once per logger, because loggers are shared by all instances of the same class.
 
         parameters
         ----------
@@ -84,6 +84,8 @@ class Logging:
         """
         logger.setLevel(level)
         logger.propagate = False
+        if logger.handlers:
+            return
 
         ch = logging.StreamHandler()
         ch.setLevel(level)
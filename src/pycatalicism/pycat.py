@@ -10,36 +10,107 @@ import importlib
 import importlib.util
 import sys
 from pathlib import Path
-from datetime import date
+from datetime import date, datetime
 import types
 
-import pycatalicism.calc.calc as calc
 import pycatalicism.config as config
-from pycatalicism.calc.calculatorexception import CalculatorException
-from pycatalicism.furnace.owen_protocol import OwenProtocol
-from pycatalicism.furnace.owen_tmp101 import OwenTPM101
-from pycatalicism.chromatograph.chromatec_control_panel_modbus import ChromatecControlPanelModbus
-from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatecAnalyticModbus
-from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatogramPurpose
-from pycatalicism.chromatograph.chromatec_crystal_5000 import ChromatecCrystal5000
-from pycatalicism.chromatograph.chromatec_control_panel_modbus import WorkingStatus
-from pycatalicism.mass_flow_controller.bronkhorst_f201cv import BronkhorstF201CV
-from pycatalicism.plotters.process_plotter import DataCollectorPlotter
+
+# NB: subcommands import their own stack (calculation, furnace, chromatograph or mass flow controller drivers) inside corresponding functions, so that e.g. calc command does not load pymodbus, propar or serial and hardware commands do not load calculation modules. Check import time with python -X importtime when adding module level imports here.
 
 def calculate(args:argparse.Namespace):
     """
     Calculate conversion and/or selectivity (depending on --conversion/--selectivity flag provided by user) vs. temperature for CO oxidation or CO2 hydrogenation reactions, print results to console and export them if path to export directory was provided by user. Plot corresponding graphs if --show-plot argument was provided by user and export them if export directory was provided.
     """
-    parser_type = config.raw_data_parser_type
+    from pycatalicism.calc import reaction_factory
+    _check_reaction(args.reaction, reaction_factory.get_reaction_names())
+    import pycatalicism.calc.calc as calc
+    from pycatalicism.calc.calculatorexception import CalculatorException
+    settings = _get_calculation_settings(args, show_plot=args.show_plot, output_plot_path=args.output_plot, sample_name=args.sample_name, catalyst_mass=args.catalyst_mass, parser_workers=config.parser_workers if args.workers is None else args.workers, uncertainty_draws=args.uncertainty, initial_replicates_path=args.initial_replicates, calculate_time_on_stream=args.time_on_stream)
+    try:
+        if args.stream:
+            if args.input_data_path == '-':
+                calc.stream(input_stream=sys.stdin.buffer, initial_data_path=args.initial_data_path, reaction=args.reaction, settings=settings, separator=config.calc_stream_separator.encode(), flush_interval=config.calc_stream_flush_interval)
+            else:
+                with open(args.input_data_path, mode='rb') as input_stream:
+                    calc.stream(input_stream=input_stream, initial_data_path=args.initial_data_path, reaction=args.reaction, settings=settings, separator=config.calc_stream_separator.encode(), flush_interval=config.calc_stream_flush_interval)
+            return
+        if args.watch:
+            calc.watch(input_data_path=args.input_data_path, initial_data_path=args.initial_data_path, reaction=args.reaction, settings=settings, watch_method=config.calc_watch_method, watch_interval=config.calc_watch_interval)
+            return
+        calc.calculate(input_data_path=args.input_data_path, initial_data_path=args.initial_data_path, reaction=args.reaction, settings=settings)
+    except CalculatorException as e:
+        if args.conversion or args.selectivity or args._yield or args.catalyst_mass is not None:
+            print(e)
+        else:
+            print('At least one of the flags {--conversion|--selectivity|--yield|--catalyst-mass} must be provided to the program')
+
+def calculate_batch(args:argparse.Namespace):
+    """
+    Calculate conversion and/or selectivity vs. temperature for several samples listed in manifest file or found in samples directory using pool of worker processes. Export results of each sample to subdirectory of output directory and summary table to output directory.
+    """
+    from pycatalicism.calc import reaction_factory
+    _check_reaction(args.reaction, reaction_factory.get_reaction_names())
+    import pycatalicism.calc.batch as calc_batch
+    from pycatalicism.calc.calculatorexception import CalculatorException
+    workers = config.batch_workers if args.workers is None else args.workers
+    settings = _get_calculation_settings(args)
     try:
-        calc.calculate(input_data_path=args.input_data_path, initial_data_path=args.initial_data_path, reaction=args.reaction, parser_type=parser_type, calculate_conversion=args.conversion, calculate_selectivity=args.selectivity, products_basis=args.products_basis, output_data_path=args.output_data, show_plot=args.show_plot, output_plot_path=args.output_plot, sample_name=args.sample_name)
-    except CalculatorException:
-        print('At least one of the flags {--conversion|--selectivity} must be provided to the program')
+        calc_batch.calculate_batch(samples_path=args.samples_path, reaction=args.reaction, settings=settings, export_plot=args.output_plot, workers=workers, initial_data_file_name=config.batch_initial_data_file_name)
+    except CalculatorException as e:
+        print(e)
+
+def _check_reaction(reaction:str, reaction_names:list[str]):
+    """
+    Exit with usage error status if reaction is not known to the program. Reaction names are checked before calculation modules are imported.
+
+    parameters
+    ----------
+    reaction:str
+        name of reaction provided by user
+    reaction_names:list[str]
+        names of reactions known to the program
+    """
+    if reaction not in reaction_names:
+        print(f'Unknown reaction "{reaction}", choose from: {", ".join(reaction_names)}', file=sys.stderr)
+        sys.exit(2)
+
+def _get_calculation_settings(args:argparse.Namespace, **options):
+    """
+    Get settings of calculation from arguments common for calc and calc-batch commands and from config.py.
+
+    parameters
+    ----------
+    args:argparse.Namespace
+        arguments of calc or calc-batch command
+    options
+        additional options of calculation specific to command in a format <option>=<value>
+
+    returns
+    -------
+    settings:CalculationSettings
+        settings of calculation
+    """
+    from pycatalicism.calc.calculation_settings import CalculationSettings
+    return CalculationSettings(calculate_conversion=args.conversion, calculate_selectivity=args.selectivity, calculate_yield=args._yield, products_basis=args.products_basis, flow_rate=args.flow_rate, metal_loading=args.metal_loading, metal_molar_mass=args.metal_molar_mass, tracer=config.flow_tracer if args.tracer is None else args.tracer, parser_type=config.raw_data_parser_type, parser_pool_type=config.parser_pool_type, parser_chunk_size=config.parser_chunk_size, cache_path=None if args.no_cache else config.calc_cache_path, cache_max_size=config.calc_cache_max_size, output_data_path=args.output_data, export_binary=args.binary_output, calculate_light_off=args.light_off, light_off_method=config.light_off_method, fit_arrhenius=args.arrhenius, kinetics_max_conversion=config.kinetics_max_conversion, kinetics_confidence=config.kinetics_confidence, uncertainty_errors=config.uncertainty_errors, uncertainty_confidence=config.uncertainty_confidence, uncertainty_seed=config.uncertainty_seed, deactivation_model=config.deactivation_model, time_on_stream_tolerance=config.time_on_stream_tolerance, aggregate_replicates=args.aggregate_replicates, replicate_statistic=config.replicate_statistic, outlier_threshold=config.replicate_outlier_threshold, replicate_resolution=config.replicate_resolution, check_balance=args.balance, balance_threshold=config.balance_threshold, calculate_equilibrium=args.equilibrium, equilibrium_pressure=config.equilibrium_pressure, equilibrium_step=config.equilibrium_step, **options)
+
+def compare(args:argparse.Namespace):
+    """
+    Compare results of several samples calculated by calc or calc-batch commands on a common temperature grid. Print ranking of samples, export tables of resampled values, differences and ratios relative to reference sample and overlay plot if corresponding directories were provided.
+    """
+    import pycatalicism.calc.compare as calc_compare
+    from pycatalicism.calc.calculatorexception import CalculatorException
+    grid_step = config.compare_grid_step if args.grid_step is None else args.grid_step
+    try:
+        calc_compare.compare(results_paths=args.results_paths, output_data_path=args.output_data, show_plot=args.show_plot, output_plot_path=args.output_plot, reference=args.reference, grid_min=args.grid_min, grid_max=args.grid_max, grid_step=grid_step)
+    except CalculatorException as e:
+        print(e)
 
 def furnace_set_temperature(args:argparse.Namespace):
     """
     Set furnace temperature to specified value
     """
+    from pycatalicism.furnace.owen_protocol import OwenProtocol
+    from pycatalicism.furnace.owen_tmp101 import OwenTPM101
     furnace_controller_protocol = OwenProtocol(address=config.furnace_address, port=config.furnace_port, baudrate=config.furnace_baudrate, bytesize=config.furnace_bytesize, parity=config.furnace_parity, stopbits=config.furnace_stopbits, timeout=config.furnace_timeout, write_timeout=config.furnace_write_timeout, rtscts=config.furnace_rtscts)
     furnace_controller = OwenTPM101(device_name=config.furnace_device_name, owen_protocol=furnace_controller_protocol)
     temperature = float(args.temperature)
@@ -54,6 +125,8 @@ def furnace_print_temperature(args:argparse.Namespace):
     """
     Print current temperature to console
     """
+    from pycatalicism.furnace.owen_protocol import OwenProtocol
+    from pycatalicism.furnace.owen_tmp101 import OwenTPM101
     furnace_controller_protocol = OwenProtocol(address=config.furnace_address, port=config.furnace_port, baudrate=config.furnace_baudrate, bytesize=config.furnace_bytesize, parity=config.furnace_parity, stopbits=config.furnace_stopbits, timeout=config.furnace_timeout, write_timeout=config.furnace_write_timeout, rtscts=config.furnace_rtscts)
     furnace_controller = OwenTPM101(device_name=config.furnace_device_name, owen_protocol=furnace_controller_protocol)
     furnace_controller.connect()
@@ -64,6 +137,9 @@ def chromatograph_set_method(args:argparse.Namespace):
     """
     Set chromatograph instrument method
     """
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import ChromatecControlPanelModbus
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatecAnalyticModbus
+    from pycatalicism.chromatograph.chromatec_crystal_5000 import ChromatecCrystal5000
     control_panel_modbus = ChromatecControlPanelModbus(modbus_id=config.control_panel_modbus_id, working_status_input_address=config.working_status_input_address, serial_number_input_address=config.serial_number_input_address, connection_status_input_address=config.connection_status_input_address, method_holding_address=config.method_holding_address, chromatograph_command_holding_address=config.chromatograph_command_holding_address, application_command_holding_address=config.application_command_holding_address)
     analytic_modbus = ChromatecAnalyticModbus(modbus_id=config.analytic_modbus_id, sample_name_holding_address=config.sample_name_holding_address, chromatogram_purpose_holding_address=config.chromatogram_purpose_holding_address, sample_volume_holding_address=config.sample_volume_holding_address, sample_dilution_holding_address=config.sample_dilution_holding_address, operator_holding_address=config.operator_holding_address, column_holding_address=config.column_holding_address, lab_name_holding_address=config.lab_name_holding_address)
     chromatograph = ChromatecCrystal5000(control_panel_modbus, analytic_modbus, config.methods)
@@ -74,6 +150,9 @@ def chromatograph_start_analysis(args:argparse.Namespace):
     """
     Start chromatograph analysis
     """
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import ChromatecControlPanelModbus
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatecAnalyticModbus
+    from pycatalicism.chromatograph.chromatec_crystal_5000 import ChromatecCrystal5000
     control_panel_modbus = ChromatecControlPanelModbus(modbus_id=config.control_panel_modbus_id, working_status_input_address=config.working_status_input_address, serial_number_input_address=config.serial_number_input_address, connection_status_input_address=config.connection_status_input_address, method_holding_address=config.method_holding_address, chromatograph_command_holding_address=config.chromatograph_command_holding_address, application_command_holding_address=config.application_command_holding_address)
     analytic_modbus = ChromatecAnalyticModbus(modbus_id=config.analytic_modbus_id, sample_name_holding_address=config.sample_name_holding_address, chromatogram_purpose_holding_address=config.chromatogram_purpose_holding_address, sample_volume_holding_address=config.sample_volume_holding_address, sample_dilution_holding_address=config.sample_dilution_holding_address, operator_holding_address=config.operator_holding_address, column_holding_address=config.column_holding_address, lab_name_holding_address=config.lab_name_holding_address)
     chromatograph = ChromatecCrystal5000(control_panel_modbus, analytic_modbus, config.methods)
@@ -84,6 +163,10 @@ def chromatograph_set_passport(args:argparse.Namespace):
     """
     Set values of chromatogram passport. Should be run after analysis is complete.
     """
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import ChromatecControlPanelModbus
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatecAnalyticModbus
+    from pycatalicism.chromatograph.chromatec_crystal_5000 import ChromatecCrystal5000
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatogramPurpose
     control_panel_modbus = ChromatecControlPanelModbus(modbus_id=config.control_panel_modbus_id, working_status_input_address=config.working_status_input_address, serial_number_input_address=config.serial_number_input_address, connection_status_input_address=config.connection_status_input_address, method_holding_address=config.method_holding_address, chromatograph_command_holding_address=config.chromatograph_command_holding_address, application_command_holding_address=config.application_command_holding_address)
     analytic_modbus = ChromatecAnalyticModbus(modbus_id=config.analytic_modbus_id, sample_name_holding_address=config.sample_name_holding_address, chromatogram_purpose_holding_address=config.chromatogram_purpose_holding_address, sample_volume_holding_address=config.sample_volume_holding_address, sample_dilution_holding_address=config.sample_dilution_holding_address, operator_holding_address=config.operator_holding_address, column_holding_address=config.column_holding_address, lab_name_holding_address=config.lab_name_holding_address)
     chromatograph = ChromatecCrystal5000(control_panel_modbus, analytic_modbus, config.methods)
@@ -100,6 +183,7 @@ def mfc_set_flow_rate(args:argparse.Namespace):
     """
     Set flow rate of mfc to specified value.
     """
+    from pycatalicism.mass_flow_controller.bronkhorst_f201cv import BronkhorstF201CV
     mfc_He = BronkhorstF201CV(serial_address=config.mfc_He_serial_address, serial_id=config.mfc_He_serial_id, calibrations=config.mfc_He_calibrations)
     mfc_CO2 = BronkhorstF201CV(serial_address=config.mfc_CO2_serial_address, serial_id=config.mfc_CO2_serial_id, calibrations=config.mfc_CO2_calibrations)
     mfc_H2 = BronkhorstF201CV(serial_address=config.mfc_H2_serial_address, serial_id=config.mfc_H2_serial_id, calibrations=config.mfc_H2_calibrations)
@@ -121,6 +205,7 @@ def mfc_set_calibration(args:argparse.Namespace):
     """
     Set calibration for mass flow controller.
     """
+    from pycatalicism.mass_flow_controller.bronkhorst_f201cv import BronkhorstF201CV
     mfc_He = BronkhorstF201CV(serial_address=config.mfc_He_serial_address, serial_id=config.mfc_He_serial_id, calibrations=config.mfc_He_calibrations)
     mfc_CO2 = BronkhorstF201CV(serial_address=config.mfc_CO2_serial_address, serial_id=config.mfc_CO2_serial_id, calibrations=config.mfc_CO2_calibrations)
     mfc_H2 = BronkhorstF201CV(serial_address=config.mfc_H2_serial_address, serial_id=config.mfc_H2_serial_id, calibrations=config.mfc_H2_calibrations)
@@ -142,6 +227,7 @@ def mfc_print_flow_rate(args:argparse.Namespace):
     """
     Print current flow rate.
     """
+    from pycatalicism.mass_flow_controller.bronkhorst_f201cv import BronkhorstF201CV
     mfc_He = BronkhorstF201CV(serial_address=config.mfc_He_serial_address, serial_id=config.mfc_He_serial_id, calibrations=config.mfc_He_calibrations)
     mfc_CO2 = BronkhorstF201CV(serial_address=config.mfc_CO2_serial_address, serial_id=config.mfc_CO2_serial_id, calibrations=config.mfc_CO2_calibrations)
     mfc_H2 = BronkhorstF201CV(serial_address=config.mfc_H2_serial_address, serial_id=config.mfc_H2_serial_id, calibrations=config.mfc_H2_calibrations)
@@ -173,7 +259,7 @@ def _import_config(path:Path) -> types.ModuleType:
     process_config = importlib.import_module('process_config')
     return process_config
 
-def _initialize_furnace_controller() -> OwenTPM101:
+def _initialize_furnace_controller() -> 'OwenTPM101':
     """
     Initialize furnace controller with patameters in config.py file. Connect to furnace controller.
 
@@ -182,12 +268,14 @@ def _initialize_furnace_controller() -> OwenTPM101:
     furnace_controller:OwenTPM101
         furnace controller
     """
+    from pycatalicism.furnace.owen_protocol import OwenProtocol
+    from pycatalicism.furnace.owen_tmp101 import OwenTPM101
     furnace_controller_protocol = OwenProtocol(address=config.furnace_address, port=config.furnace_port, baudrate=config.furnace_baudrate, bytesize=config.furnace_bytesize, parity=config.furnace_parity, stopbits=config.furnace_stopbits, timeout=config.furnace_timeout, write_timeout=config.furnace_write_timeout, rtscts=config.furnace_rtscts)
     furnace_controller = OwenTPM101(device_name=config.furnace_device_name, owen_protocol=furnace_controller_protocol)
     furnace_controller.connect()
     return furnace_controller
 
-def _initialize_mass_flow_controllers() -> list[BronkhorstF201CV]:
+def _initialize_mass_flow_controllers() -> list['BronkhorstF201CV']:
     """
     Initialize 3 mass flow controllers with parameters in config.py file. Connect to mass flow controllers.
 
@@ -196,6 +284,7 @@ def _initialize_mass_flow_controllers() -> list[BronkhorstF201CV]:
     mfcs:list[BronkhorstF201CV]
         list of mass flow controllers
     """
+    from pycatalicism.mass_flow_controller.bronkhorst_f201cv import BronkhorstF201CV
     mfcs = list()
     mfcs.append(BronkhorstF201CV(serial_address=config.mfc_He_serial_address, serial_id=config.mfc_He_serial_id, calibrations=config.mfc_He_calibrations))
     mfcs.append(BronkhorstF201CV(serial_address=config.mfc_CO2_serial_address, serial_id=config.mfc_CO2_serial_id, calibrations=config.mfc_CO2_calibrations))
@@ -204,7 +293,7 @@ def _initialize_mass_flow_controllers() -> list[BronkhorstF201CV]:
         mfc.connect()
     return mfcs
 
-def _initialize_chromatograph() -> ChromatecCrystal5000:
+def _initialize_chromatograph() -> 'ChromatecCrystal5000':
     """
     Initialize modbus objects and chromatograph object with parameters in config.py file, connect to chromatograph.
 
@@ -213,6 +302,9 @@ def _initialize_chromatograph() -> ChromatecCrystal5000:
     chromatograph:ChromatecCrystal5000
         chromatograph used for analysis
     """
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import ChromatecControlPanelModbus
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatecAnalyticModbus
+    from pycatalicism.chromatograph.chromatec_crystal_5000 import ChromatecCrystal5000
     control_panel_modbus = ChromatecControlPanelModbus(modbus_id=config.control_panel_modbus_id, working_status_input_address=config.working_status_input_address, serial_number_input_address=config.serial_number_input_address, connection_status_input_address=config.connection_status_input_address, method_holding_address=config.method_holding_address, chromatograph_command_holding_address=config.chromatograph_command_holding_address, application_command_holding_address=config.application_command_holding_address)
     analytic_modbus = ChromatecAnalyticModbus(modbus_id=config.analytic_modbus_id, sample_name_holding_address=config.sample_name_holding_address, chromatogram_purpose_holding_address=config.chromatogram_purpose_holding_address, sample_volume_holding_address=config.sample_volume_holding_address, sample_dilution_holding_address=config.sample_dilution_holding_address, operator_holding_address=config.operator_holding_address, column_holding_address=config.column_holding_address, lab_name_holding_address=config.lab_name_holding_address)
     chromatograph = ChromatecCrystal5000(control_panel_modbus, analytic_modbus, config.methods)
@@ -223,6 +315,7 @@ def activate(args:argparse.Namespace):
     """
     Activate catalyst using parameters defined in configuration file, provided as argument. Configuration file is file with several variables created using python syntax. Use activation_config.py as an example. Method initializes furnace controller, mass flow controllers and connects to the devices. It sets mass flow controllers with proper calibrations and flow rates (corresponding valves must be opened prior this method is called). It waits 30 minutes for system to be purged with gases, heats furnace to activation temperature and holds it at that temperature for activation time. It then turns off heating, waits until furnace is cooled down and sets gas flow rates to the specified in configuration file values. NB: valves cannot be opened or closed automatically.
     """
+    from pycatalicism.plotters.process_plotter import DataCollectorPlotter
     # import configuration variables
     config_path = Path(args.config)
     process_config = _import_config(config_path)
@@ -267,6 +360,8 @@ def measure(args:argparse.Namespace):
     """
     Gather chromatograms at different measurement temperatures defined in a config file provided as an argument. Configuration file is a file with several variables defined using python syntax. Use measurement_config.py as an example of configuration. Method initializes devices and connects to them. It sets chromatograph method to 'purge', sets mass flow controller calibrations and flow rates. Heats furnace to the first measurement temperature and waits until target temperature is reached. Starts chromatograph purge, waits until purge is over and sets chromatograph method to the one specified in a config. Then, for each measurement temperature, method waits until chromatograph is ready for analysis, starts measurement, heats furnace to the next temperature. Finally, it turns off furnace and starts chromatograph cool down.
     """
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatogramPurpose
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import WorkingStatus
     # import configuration variables
     config_path = Path(args.config)
     process_config = _import_config(config_path)
@@ -338,6 +433,7 @@ def measure(args:argparse.Namespace):
             time.sleep(60)
         chromatogram_temperature = furnace.get_temperature()
         chromatograph.start_analysis()
+        analysis_start = datetime.now()
         furnace.set_temperature(temperature=temperature)
         while True:
             current_temperature = furnace.get_temperature()
@@ -348,7 +444,7 @@ def measure(args:argparse.Namespace):
         while True:
             chromatograph_working_status = chromatograph.get_working_status()
             if chromatograph_working_status is not WorkingStatus.ANALYSIS:
-                chromatograph.set_passport(name=f'{today.strftime("%Y%m%d")}_{process_config.sample_name}_{chromatogram_temperature:.1f}', volume=0.5, dilution=1, purpose=ChromatogramPurpose.ANALYSIS, operator=process_config.operator, column='HaesepN/NaX', lab_name='Inorganic Nanomaterials')
+                chromatograph.set_passport(name=f'{analysis_start.strftime("%Y%m%d_%H%M%S")}_{process_config.sample_name}_{chromatogram_temperature:.1f}', volume=0.5, dilution=1, purpose=ChromatogramPurpose.ANALYSIS, operator=process_config.operator, column='HaesepN/NaX', lab_name='Inorganic Nanomaterials')
                 break
             time.sleep(60)
         current_time = time.time()
@@ -361,6 +457,7 @@ def measure(args:argparse.Namespace):
         time.sleep(60)
     chromatogram_temperature = furnace.get_temperature()
     chromatograph.start_analysis()
+    analysis_start = datetime.now()
     # wait until analysis is actually started
     while True:
         chromatograph_working_status = chromatograph.get_working_status()
@@ -374,7 +471,7 @@ def measure(args:argparse.Namespace):
     while True:
         chromatograph_working_status = chromatograph.get_working_status()
         if chromatograph_working_status is not WorkingStatus.ANALYSIS:
-            chromatograph.set_passport(name=f'{today.strftime("%Y%m%d")}_{process_config.sample_name}_{chromatogram_temperature:.1f}', volume=0.5, dilution=1, purpose=ChromatogramPurpose.ANALYSIS, operator=process_config.operator, column='HaesepN/NaX', lab_name='Inorganic Nanomaterials')
+            chromatograph.set_passport(name=f'{analysis_start.strftime("%Y%m%d_%H%M%S")}_{process_config.sample_name}_{chromatogram_temperature:.1f}', volume=0.5, dilution=1, purpose=ChromatogramPurpose.ANALYSIS, operator=process_config.operator, column='HaesepN/NaX', lab_name='Inorganic Nanomaterials')
             break
         time.sleep(60)
     # start chromatograph cooldown
@@ -393,6 +490,8 @@ def measure_init_conc(args:argparse.Namespace):
         - measures several chromatograms (number is defined in config file)
         - starts chromatograph cooldown
     """
+    from pycatalicism.chromatograph.chromatec_analytic_modbus import ChromatogramPurpose
+    from pycatalicism.chromatograph.chromatec_control_panel_modbus import WorkingStatus
     config_path = Path(args.config)
     process_config = _import_config(config_path)
     today = date.today()
@@ -466,8 +565,8 @@ def main():
     calc_parser = subparsers.add_parser('calc', help='calculate conversion and selectivity vs. temperature')
     calc_parser.set_defaults(func=calculate)
     calc_parser.add_argument('input_data_path', metavar='input-data-path', help='path to directory with files from concentration measurement device')
-    calc_parser.add_argument('initial_data_path', metavar='initial-data-path', help='path to file with data about initial composition of gas')
-    calc_parser.add_argument('reaction', choices=['co-oxidation', 'co2-hydrogenation'], help='reaction for which to calculate data')
+    calc_parser.add_argument('initial_data_path', metavar='initial-data-path', help='path to file with data about initial composition of gas or to directory with replicate files of such data (e.g. gathered by measure-init-concentration), which are aggregated')
+    calc_parser.add_argument('reaction', help='reaction for which to calculate data: co-oxidation, co2-hydrogenation, co2-methanation, rwgs, dry-reforming, co-prox, co2-hydrogenation-oxygenates or reaction declared in config.py')
     calc_parser.add_argument('--conversion', action='store_true', help='calculate conversion for the specified reaction')
     calc_parser.add_argument('--selectivity', action='store_true', help='calculate selectivities for the specified reaction')
     calc_parser.add_argument('--output-data', default=None, help='path to directory to save calculated data')
@@ -475,6 +574,59 @@ def main():
     calc_parser.add_argument('--output-plot', default=None, help='path to directory to save plot')
     calc_parser.add_argument('--products-basis', action='store_true', help='calculate conversion based on products concentration instead of reactants')
     calc_parser.add_argument('--sample-name', help='sample name will be added to results data files and as a title to the result plots')
+    calc_parser.add_argument('--yield', dest='_yield', action='store_true', help='calculate yields of products for the specified reaction')
+    calc_parser.add_argument('--catalyst-mass', type=float, default=None, help='catalyst mass in g, activity is calculated if provided')
+    calc_parser.add_argument('--flow-rate', type=float, default=None, help='total gas flow rate before reactor in nml/min to calculate activity, measured flow rate is used if not provided')
+    calc_parser.add_argument('--metal-loading', type=float, default=None, help='active metal loading in wt.%%, TOF is calculated if provided together with --metal-molar-mass')
+    calc_parser.add_argument('--metal-molar-mass', type=float, default=None, help='molar mass of active metal in g/mol')
+    calc_parser.add_argument('--workers', type=int, default=None, help='number of workers used to parse input data files, value from config.py is used if not provided')
+    calc_parser.add_argument('--binary-output', action='store_true', help='export results also to binary results.npz file in --output-data directory')
+    calc_parser.add_argument('--stream', action='store_true', help='read records separated by record separator from stdin (if input-data-path is -) or from FIFO and update results as each record arrives')
+    calc_parser.add_argument('--watch', action='store_true', help='watch input data directory and recalculate results when files are added or changed until interrupted with Ctrl+C')
+    calc_parser.add_argument('--no-cache', action='store_true', help='do not use persistent cache of parsed files and calculation results')
+    calc_parser.add_argument('--uncertainty', type=int, default=0, metavar='DRAWS', help='estimate confidence intervals of conversion, selectivities, yields and light-off temperatures by Monte Carlo method with DRAWS draws of input data perturbed by errors from config.py')
+    calc_parser.add_argument('--time-on-stream', action='store_true', help='group measurements done at the same temperature by time of acquisition, fit deactivation model to conversion vs. time on stream and plot it')
+    calc_parser.add_argument('--aggregate-replicates', action='store_true', help='aggregate replicate measurements done at the same temperature by mean or median with rejection of outliers before calculation, statistic is set in config.py')
+    calc_parser.add_argument('--tracer', default=None, help='inert compound (e.g. He, N2 or Ar) used as internal standard to correct for change of total gas flow rate instead of gas-clock measurements, overrides flow_tracer from config.py')
+    calc_parser.add_argument('--equilibrium', action='store_true', help='calculate thermodynamic equilibrium conversion and selectivities for initial gas composition, export them and overlay them on plots')
+    calc_parser.add_argument('--balance', action='store_true', help='calculate conversion based on both reactants and products and closure of carbon balance in a single pass, flag points exceeding threshold set in config.py')
+    calc_parser.add_argument('--light-off', action='store_true', help='determine light-off temperatures T10, T50, T90, maximum conversion and temperatures of maximum yields and export them to light_off.dat')
+    calc_parser.add_argument('--arrhenius', action='store_true', help='fit apparent activation energy and pre-exponential factor to activity in differential regime and export them to arrhenius.dat, --catalyst-mass must be provided')
+    calc_parser.add_argument('--initial-replicates', default=None, help='path to directory with replicate chromatograms of initial gas composition (e.g. gathered by measure-init-concentration) used to estimate errors of initial data in uncertainty mode')
+
+    calc_batch_parser = subparsers.add_parser('calc-batch', help='calculate conversion and selectivity vs. temperature for several samples')
+    calc_batch_parser.set_defaults(func=calculate_batch)
+    calc_batch_parser.add_argument('samples_path', metavar='samples-path', help='path to manifest file with lines "<sample-name><tab><input-data-path><tab><initial-data-path>[<tab><catalyst-mass>]" or to directory with samples directories')
+    calc_batch_parser.add_argument('reaction', help='reaction for which to calculate data: co-oxidation, co2-hydrogenation, co2-methanation, rwgs, dry-reforming, co-prox, co2-hydrogenation-oxygenates or reaction declared in config.py')
+    calc_batch_parser.add_argument('--output-data', required=True, help='path to directory to save calculated data of samples and summary table')
+    calc_batch_parser.add_argument('--conversion', action='store_true', help='calculate conversion for the specified reaction')
+    calc_batch_parser.add_argument('--selectivity', action='store_true', help='calculate selectivities for the specified reaction')
+    calc_batch_parser.add_argument('--yield', dest='_yield', action='store_true', help='calculate yields of products for the specified reaction')
+    calc_batch_parser.add_argument('--output-plot', action='store_true', help='save plots to directories with calculated data of samples')
+    calc_batch_parser.add_argument('--products-basis', action='store_true', help='calculate conversion based on products concentration instead of reactants')
+    calc_batch_parser.add_argument('--flow-rate', type=float, default=None, help='total gas flow rate before reactor in nml/min to calculate activity of samples with catalyst mass in manifest')
+    calc_batch_parser.add_argument('--metal-loading', type=float, default=None, help='active metal loading in wt.%%, TOF is calculated if provided together with --metal-molar-mass')
+    calc_batch_parser.add_argument('--metal-molar-mass', type=float, default=None, help='molar mass of active metal in g/mol')
+    calc_batch_parser.add_argument('--binary-output', action='store_true', help='export results of samples also to binary results.npz files')
+    calc_batch_parser.add_argument('--workers', type=int, default=None, help='number of worker processes, value from config.py is used if not provided')
+    calc_batch_parser.add_argument('--aggregate-replicates', action='store_true', help='aggregate replicate measurements done at the same temperature before calculation')
+    calc_batch_parser.add_argument('--tracer', default=None, help='inert compound (e.g. He, N2 or Ar) used to correct for change of total gas flow rate instead of gas-clock measurements')
+    calc_batch_parser.add_argument('--equilibrium', action='store_true', help='calculate thermodynamic equilibrium for initial gas composition of each sample')
+    calc_batch_parser.add_argument('--balance', action='store_true', help='calculate conversion based on both reactants and products and closure of carbon balance')
+    calc_batch_parser.add_argument('--light-off', action='store_true', help='determine light-off temperatures of samples and add them to summary table')
+    calc_batch_parser.add_argument('--arrhenius', action='store_true', help='fit apparent activation energy of samples with catalyst mass in manifest and add it to summary table')
+    calc_batch_parser.add_argument('--no-cache', action='store_true', help='do not use persistent cache of parsed files and calculation results')
+
+    compare_parser = subparsers.add_parser('compare', help='compare results of several samples on a common temperature grid')
+    compare_parser.set_defaults(func=compare)
+    compare_parser.add_argument('results_paths', metavar='results-path', nargs='+', help='path to directory with results of calc command (results.npz or conversion.dat, selectivity.dat, yield.dat) or to output directory of calc-batch command')
+    compare_parser.add_argument('--output-data', default=None, help='path to directory to save comparison tables and ranking of samples')
+    compare_parser.add_argument('--show-plot', action='store_true', help='whether to show overlay plot or not')
+    compare_parser.add_argument('--output-plot', default=None, help='path to directory to save overlay plot')
+    compare_parser.add_argument('--reference', default=None, help='name of reference sample for difference and ratio tables, first sample is used if not provided')
+    compare_parser.add_argument('--grid-min', type=float, default=None, help='lowest temperature of common grid in °C, determined from data if not provided')
+    compare_parser.add_argument('--grid-max', type=float, default=None, help='highest temperature of common grid in °C, determined from data if not provided')
+    compare_parser.add_argument('--grid-step', type=float, default=None, help='step of common grid in °C, value from config.py is used if not provided')
 
     furnace_parser = subparsers.add_parser('furnace', help='control furnace')
     furnace_subparser = furnace_parser.add_subparsers(required=True)
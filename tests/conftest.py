@@ -0,0 +1,31 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1].joinpath('src')))
+
+from pycatalicism.calc import parser_factory
+
+DATA_PATH = Path(__file__).resolve().parent.joinpath('data')
+
+@pytest.fixture
+def co2_hydrogenation_data() -> tuple[Path, Path]:
+    """
+    Paths to directory with CO2 hydrogenation data files (UTF-8 encoded) and to file with initial gas composition.
+    """
+    return (DATA_PATH.joinpath('co2_hydrogenation', 'data'), DATA_PATH.joinpath('co2_hydrogenation', 'initial.txt'))
+
+@pytest.fixture
+def co2_hydrogenation_input_data(co2_hydrogenation_data):
+    """
+    CO2 hydrogenation data parsed to RawData.
+    """
+    return parser_factory.get_parser('chromatec-crystal-composition-copy-paste').parse_data(*co2_hydrogenation_data, None)
+
+@pytest.fixture
+def co_oxidation_data() -> tuple[Path, Path]:
+    """
+    Paths to directory with CO oxidation data files without total gas flow rate measurements and to file with initial gas composition.
+    """
+    return (DATA_PATH.joinpath('co_oxidation', 'data'), DATA_PATH.joinpath('co_oxidation', 'initial.txt'))
@@ -0,0 +1,43 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import aggregation
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.chromatogram import Chromatogram
+from pycatalicism.calc.rawdata import RawData
+
+def test_outliers_are_rejected_before_aggregation():
+    keys = [300.0, 200.0, 300.0, 300.0, 300.0, 200.0]
+    values = [[10.0, 1.0], [5.0, np.nan], [10.2, 1.1], [30.0, 0.9], [9.8, 1.0], [7.0, 2.0]]
+    result = aggregation.aggregate(keys, values)
+    assert result.get_keys().tolist() == [200.0, 300.0]
+    assert result.get_values() == pytest.approx(np.array([[6.0, 2.0], [10.0, 1.0]]))
+    assert result.get_counts().tolist() == [[2, 1], [3, 4]]
+    assert result.get_rejected().tolist() == [[0, 0], [1, 0]]
+    assert result.get_rows().tolist() == [2, 4]
+    assert np.isnan(result.get_stds()[0, 1])
+    assert aggregation.aggregate(keys, values, outlier_threshold=None).get_values()[1, 0] == pytest.approx(15.0)
+    assert aggregation.aggregate(keys, values, statistic='median').get_values()[1] == pytest.approx([10.0, 1.0])
+
+def test_raw_data_replicates_are_merged_by_rounded_temperature():
+    input_data = RawData([300.2, 250.0, 299.9, 300.1], {'CO':10.0, 'O2':10.0}, [{'CO':4.0, 'CO2':6.0}, {'CO':8.0, 'CO2':2.0}, {'CO':5.0, 'CO2':5.0}, {'CO':6.0, 'CO2':4.0}], final_ambient_temperatures=[20.0, 21.0, 22.0, 24.0], final_ambient_pressures=[101.0, 101.0, 101.0, 101.0], final_flows=[30.0, 31.0, 29.0, 31.0], timestamps=[3.0, 1.0, 4.0, 5.0])
+    raw_data, result = aggregation.aggregate_raw_data(input_data)
+    assert raw_data.get_temperatures() == pytest.approx([250.0, 300.0666666666667])
+    assert raw_data.get_concs('CO') == pytest.approx([8.0, 5.0])
+    assert raw_data.get_fin_flows() == pytest.approx([31.0, 30.0])
+    assert raw_data.get_fin_amb_temps() == pytest.approx([21.0, 22.0])
+    assert raw_data.get_timestamps() == pytest.approx([1.0, 4.0])
+    assert result.get_rows().tolist() == [1, 3]
+    with pytest.raises(CalculatorException):
+        aggregation.aggregate_raw_data(input_data, resolution=0)
+    with pytest.raises(CalculatorException):
+        aggregation.aggregate_raw_data(input_data, statistic='mode')
+
+def test_replicate_chromatograms_are_aggregated_to_single_chromatogram():
+    chromatograms = [Chromatogram(25.0, ['CO', 'O2'], np.array([10.0, 20.0]), ambient_temperature=20.0, ambient_pressure=101.0, flow=30.0, timestamp=20.0), Chromatogram(25.0, ['CO', 'O2', 'He'], np.array([12.0, 22.0, 1.0]), timestamp=10.0)]
+    chromatogram, result = aggregation.aggregate_chromatograms(chromatograms, source='initial')
+    assert chromatogram.get_compounds() == ['CO', 'O2', 'He']
+    assert chromatogram.get_concentrations() == pytest.approx([11.0, 21.0, 1.0])
+    assert chromatogram.get_flow() is None
+    assert chromatogram.get_timestamp() == 10.0
+    assert result.get_counts().tolist() == [[2, 2, 1]]
@@ -0,0 +1,51 @@
+import tarfile
+import zipfile
+
+import numpy as np
+import pytest
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc import parser_factory
+from pycatalicism.calc.calculation_settings import CalculationSettings
+
+PARSER_TYPE = 'chromatec-crystal-composition-copy-paste'
+
+def _make_zip(co2_hydrogenation_data, path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    with zipfile.ZipFile(path, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        archive.write(initial_data_path, 'campaign/initial.txt')
+        for data_file in sorted(input_data_path.iterdir()):
+            archive.write(data_file, f'campaign/sample/{data_file.name}')
+
+def _make_tar(co2_hydrogenation_data, path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    with tarfile.open(path, mode='w:gz') as archive:
+        archive.add(initial_data_path, 'initial.txt')
+        for data_file in sorted(input_data_path.iterdir()):
+            archive.add(data_file, data_file.name)
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_data_from_zip_are_parsed_equal_to_directory(co2_hydrogenation_data, tmp_path, workers):
+    archive_path = tmp_path.joinpath('campaign.zip')
+    _make_zip(co2_hydrogenation_data, archive_path)
+    expected = parser_factory.get_parser(PARSER_TYPE).parse_data(*co2_hydrogenation_data, None)
+    parser = parser_factory.get_parser(PARSER_TYPE, workers=workers, chunk_size=2)
+    raw_data = parser.parse_data(archive_path.joinpath('campaign', 'sample'), archive_path.joinpath('campaign', 'initial.txt'), None)
+    assert raw_data.get_temperatures().tolist() == expected.get_temperatures().tolist()
+    assert np.array_equal(raw_data.get_conc_matrix(), expected.get_conc_matrix(), equal_nan=True)
+    assert raw_data.get_init_concs() == expected.get_init_concs()
+    assert raw_data.get_fin_flows().tolist() == expected.get_fin_flows().tolist()
+
+def test_results_from_tar_match_directory_and_are_cached(co2_hydrogenation_data, tmp_path, monkeypatch):
+    archive_path = tmp_path.joinpath('campaign.tar.gz')
+    _make_tar(co2_hydrogenation_data, archive_path)
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, cache_path=str(tmp_path.joinpath('cache')), print_results=False)
+    expected = calc.calculate(*map(str, co2_hydrogenation_data), 'co2-hydrogenation', settings)
+    results = calc.calculate(str(archive_path), str(archive_path.joinpath('initial.txt')), 'co2-hydrogenation', settings)
+    assert np.array_equal(results.get_conversion().get_alphas(), expected.get_conversion().get_alphas())
+    assert np.array_equal(results.get_selectivity().get_matrix(), expected.get_selectivity().get_matrix())
+    def fail(*args, **kwargs):
+        raise AssertionError('archive was parsed although results are cached')
+    monkeypatch.setattr(calc, '_parse_input_data', fail)
+    cached = calc.calculate(str(archive_path), str(archive_path.joinpath('initial.txt')), 'co2-hydrogenation', settings)
+    assert np.array_equal(cached.get_conversion().get_alphas(), expected.get_conversion().get_alphas())
@@ -0,0 +1,26 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import balance
+from pycatalicism.calc import calculator_factory
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.rawdata import RawData
+
+from test_calculator import CONVERSIONS, PRODUCTS_BASIS_CONVERSIONS
+
+def test_balance_matches_conversions_on_both_bases(co2_hydrogenation_input_data):
+    result = balance.get_balance(calculator_factory.get_calculator('co2-hydrogenation', False), co2_hydrogenation_input_data)
+    assert result.get_alphas() == pytest.approx(CONVERSIONS, rel=1e-12)
+    assert result.get_products_alphas() == pytest.approx(PRODUCTS_BASIS_CONVERSIONS, rel=1e-12)
+    # CO2 is the only carbon containing reactant, so that deviation of closure from unity equals difference of conversions
+    assert result.get_closures() - 1 == pytest.approx(result.get_differences())
+    assert result.get_flagged().all()
+
+def test_closed_balance_is_not_flagged():
+    input_data = RawData([300.0, 200.0, 400.0], {'CO':10.0, 'O2':10.0}, [{'CO':4.0, 'O2':7.0, 'CO2':6.0}, {'CO':9.0, 'O2':9.5, 'CO2':1.0}, {'CO':0.0, 'O2':5.0, 'CO2':8.0}])
+    result = balance.get_balance(calculator_factory.get_calculator('co-oxidation', False), input_data, threshold=0.1)
+    assert result.get_temperatures().tolist() == [200.0, 300.0, 400.0]
+    assert result.get_closures() == pytest.approx([1.0, 1.0, 0.8])
+    assert result.get_flagged().tolist() == [False, False, True]
+    with pytest.raises(CalculatorException):
+        balance.get_balance(calculator_factory.get_calculator('co-oxidation', False), input_data, threshold=0)
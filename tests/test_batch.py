@@ -0,0 +1,52 @@
+import shutil
+
+import pytest
+
+from pycatalicism.calc import batch
+from pycatalicism.calc.calculation_settings import CalculationSettings
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+def _make_samples(co2_hydrogenation_data, samples_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    shutil.copytree(input_data_path, samples_path.joinpath('good'))
+    shutil.copy(initial_data_path, samples_path.joinpath('good', 'initial.txt'))
+    samples_path.joinpath('broken').mkdir()
+
+def test_failed_sample_does_not_stop_batch(co2_hydrogenation_data, tmp_path):
+    samples_path = tmp_path.joinpath('samples')
+    _make_samples(co2_hydrogenation_data, samples_path)
+    output_path = tmp_path.joinpath('results')
+    summary = batch.calculate_batch(str(samples_path), 'co2-hydrogenation', CalculationSettings(calculate_conversion=True, output_data_path=str(output_path)))
+    assert len(summary) == 2
+    assert [sample for sample, _ in summary.get_failed()] == ['broken']
+    assert summary.get_metrics('good')['Points'] == 5
+    assert output_path.joinpath('good', 'conversion.dat').exists()
+    assert output_path.joinpath('summary.dat').read_text() == str(summary)
+
+def test_manifest_samples_are_calculated_in_parallel_as_serially(co2_hydrogenation_data, tmp_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    manifest_path = tmp_path.joinpath('manifest.txt')
+    manifest_path.write_text(f'# samples\nwith-mass\t{input_data_path}\t{initial_data_path}\t0,1\nwithout-mass\t{input_data_path}\t{initial_data_path}\n')
+    settings = CalculationSettings(calculate_conversion=True, calculate_light_off=True, fit_arrhenius=True)
+    serial = batch.calculate_batch(str(manifest_path), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('serial'))))
+    parallel = batch.calculate_batch(str(manifest_path), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('parallel'))), workers=2)
+    assert str(parallel) == str(serial)
+    assert 'T50' in serial.get_metrics('without-mass')
+    assert 'Ea, kJ/mol' in serial.get_metrics('with-mass')
+    assert 'Ea, kJ/mol' not in serial.get_metrics('without-mass')
+
+def test_summary_has_light_off_and_arrhenius_only_if_requested(co2_hydrogenation_data, tmp_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    manifest_path = tmp_path.joinpath('manifest.txt')
+    manifest_path.write_text(f'sample\t{input_data_path}\t{initial_data_path}\t0.1\n')
+    summary = batch.calculate_batch(str(manifest_path), 'co2-hydrogenation', CalculationSettings(calculate_conversion=True, output_data_path=str(tmp_path.joinpath('results'))))
+    assert 'Max rate, mol/(g*s)' in summary.get_metrics('sample')
+    assert 'T50' not in summary.get_metrics('sample')
+    assert 'Ea, kJ/mol' not in summary.get_metrics('sample')
+
+def test_duplicate_sample_names_raise_exception(co2_hydrogenation_data, tmp_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    manifest_path = tmp_path.joinpath('manifest.txt')
+    manifest_path.write_text(f'sample\t{input_data_path}\t{initial_data_path}\nsample\t{input_data_path}\t{initial_data_path}\n')
+    with pytest.raises(CalculatorException):
+        batch.calculate_batch(str(manifest_path), 'co2-hydrogenation', CalculationSettings(calculate_conversion=True, output_data_path=str(tmp_path.joinpath('results'))))
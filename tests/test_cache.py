@@ -0,0 +1,54 @@
+import shutil
+
+import pytest
+
+import pycatalicism.config as config
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc.calculation_settings import CalculationSettings
+
+def _calculate(input_data_path, initial_data_path, cache_path, reaction='co2-hydrogenation', **options):
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, cache_path=str(cache_path), print_results=False, **options)
+    return calc.calculate(str(input_data_path), str(initial_data_path), reaction, settings)
+
+def _count_parsing(monkeypatch) -> list:
+    parsed = []
+    parse_input_data = calc._parse_input_data
+    def count(*args, **kwargs):
+        parsed.append(args)
+        return parse_input_data(*args, **kwargs)
+    monkeypatch.setattr(calc, '_parse_input_data', count)
+    return parsed
+
+def test_cached_results_are_reused(co2_hydrogenation_data, tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath('cache')
+    first = _calculate(*co2_hydrogenation_data, cache_path)
+    def fail(*args, **kwargs):
+        raise AssertionError('input data were parsed although results are cached')
+    monkeypatch.setattr(calc, '_parse_input_data', fail)
+    second = _calculate(*co2_hydrogenation_data, cache_path)
+    assert second.get_conversion().get_alphas() == pytest.approx(first.get_conversion().get_alphas())
+    assert second.get_selectivity().get_matrix() == pytest.approx(first.get_selectivity().get_matrix())
+
+def test_cached_results_are_invalidated_by_changed_data(co2_hydrogenation_data, tmp_path, monkeypatch):
+    input_data_path = tmp_path.joinpath('data')
+    shutil.copytree(co2_hydrogenation_data[0], input_data_path)
+    cache_path = tmp_path.joinpath('cache')
+    first = _calculate(input_data_path, co2_hydrogenation_data[1], cache_path)
+    data_file = input_data_path.joinpath('300.txt')
+    data_file.write_text(data_file.read_text(encoding='utf-8').replace('CO2\t0.815\tДТП\t14,0', 'CO2\t0.815\tДТП\t13,0'), encoding='utf-8')
+    parsed = _count_parsing(monkeypatch)
+    second = _calculate(input_data_path, co2_hydrogenation_data[1], cache_path)
+    assert len(parsed) == 1
+    changed = second.get_conversion().get_temperatures() == 300.5
+    assert second.get_conversion().get_alphas()[changed] > first.get_conversion().get_alphas()[changed]
+    assert second.get_conversion().get_alphas()[~changed] == pytest.approx(first.get_conversion().get_alphas()[~changed])
+
+def test_cached_results_are_invalidated_by_changed_reaction_coefficients(co2_hydrogenation_data, tmp_path, monkeypatch):
+    cache_path = tmp_path.joinpath('cache')
+    monkeypatch.setattr(config, 'reactions', {'co2-to-c2':{'reactants':['CO2', 'H2'], 'products':['CO', 'C2H6'], 'coefficients':[1, 1]}}, raising=False)
+    first = _calculate(*co2_hydrogenation_data, cache_path, reaction='co2-to-c2', products_basis=True)
+    monkeypatch.setattr(config, 'reactions', {'co2-to-c2':{'reactants':['CO2', 'H2'], 'products':['CO', 'C2H6'], 'coefficients':[1, 2]}})
+    parsed = _count_parsing(monkeypatch)
+    second = _calculate(*co2_hydrogenation_data, cache_path, reaction='co2-to-c2', products_basis=True)
+    assert len(parsed) == 1
+    assert (second.get_conversion().get_alphas() > first.get_conversion().get_alphas()).all()
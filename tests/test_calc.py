@@ -0,0 +1,32 @@
+import pytest
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc import calculator_factory
+from pycatalicism.calc.calculation_settings import CalculationSettings
+
+def test_activity_only_results_are_exported(co_oxidation_data, tmp_path):
+    input_data_path, initial_data_path = co_oxidation_data
+    output_data_path = tmp_path.joinpath('results')
+    settings = CalculationSettings(catalyst_mass=0.1, flow_rate=30.0, output_data_path=str(output_data_path), output_plot_path=str(tmp_path.joinpath('plots')), print_results=False)
+    results = calc.calculate(str(input_data_path), str(initial_data_path), 'co-oxidation', settings)
+    assert results.get_conversion() is None
+    assert results.get_activity() is not None
+    assert output_data_path.joinpath('activity.dat').exists()
+    assert not output_data_path.joinpath('conversion.dat').exists()
+
+def test_light_off_and_arrhenius_are_calculated_only_if_requested(co_oxidation_data, tmp_path):
+    input_data_path, initial_data_path = co_oxidation_data
+    settings = CalculationSettings(calculate_conversion=True, catalyst_mass=0.1, flow_rate=30.0, print_results=False)
+    calc.calculate(str(input_data_path), str(initial_data_path), 'co-oxidation', settings.replace(output_data_path=str(tmp_path.joinpath('default'))))
+    assert tmp_path.joinpath('default', 'conversion.dat').exists()
+    assert not tmp_path.joinpath('default', 'light_off.dat').exists()
+    assert not tmp_path.joinpath('default', 'arrhenius.dat').exists()
+    calc.calculate(str(input_data_path), str(initial_data_path), 'co-oxidation', settings.replace(output_data_path=str(tmp_path.joinpath('requested')), calculate_light_off=True, fit_arrhenius=True))
+    assert tmp_path.joinpath('requested', 'light_off.dat').exists()
+    assert tmp_path.joinpath('requested', 'arrhenius.dat').exists()
+
+def test_tracer_from_settings_is_used_for_flow_correction(co2_hydrogenation_data, co2_hydrogenation_input_data):
+    settings = CalculationSettings(calculate_conversion=True, tracer='He', print_results=False)
+    results = calc.calculate(str(co2_hydrogenation_data[0]), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings)
+    expected = calculator_factory.get_calculator('co2-hydrogenation', False, 'He').calculate_conversion(co2_hydrogenation_input_data).get_sorted()
+    assert results.get_conversion().get_alphas() == pytest.approx(expected.get_alphas())
@@ -0,0 +1,45 @@
+import pytest
+
+from pycatalicism.calc import calculator_factory
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+# results of the original per-reaction calculators for tests/data/co2_hydrogenation
+TEMPERATURES = [200.5, 250.5, 300.5, 350.5, 400.5]
+CONVERSIONS = [0.12662406896532846, 0.1900464298633535, 0.3195236763905573, 0.41062747857324, 0.5216629612196979]
+PRODUCTS_BASIS_CONVERSIONS = [0.0492891324042252, 0.11128424573023296, 0.17242783985746413, 0.24868246112423553, 0.3226781940772121]
+SELECTIVITIES = {
+                    'CO'        :   [0.8203445447087777, 0.7581501137225172, 0.704721634954193, 0.6583278472679396, 0.6176652254478074],
+                    'CH4'       :   [0.08203445447087777, 0.15163002274450343, 0.2114164904862579, 0.26333113890717585, 0.3088326127239037],
+                    'C2H6'      :   [0.06562756357670223, 0.06065200909780138, 0.05637773079633544, 0.05266622778143517, 0.049413218035824595],
+                    'C3H8'      :   [0.024610336341263337, 0.02274450341167552, 0.021141649048625793, 0.01974983541803819, 0.01852995676343422],
+                    'i-C4H10'   :   [0.006562756357670222, 0.006065200909780137, 0.005637773079633544, 0.005266622778143517, 0.004941321803582459],
+                    'n-C4H10'   :   [0.0, 0.0, 0.0, 0.0, 0.0],
+                    'i-C5H12'   :   [0.0, 0.0, 0.0, 0.0, 0.0],
+                    'n-C5H12'   :   [0.0008203445447087777, 0.0007581501137225172, 0.000704721634954193, 0.0006583278472679396, 0.0006176652254478073],
+                }
+
+def test_conversion_matches_original_calculator(co2_hydrogenation_input_data):
+    conversion = calculator_factory.get_calculator('co2-hydrogenation', False).calculate_conversion(co2_hydrogenation_input_data).get_sorted()
+    assert conversion.get_temperatures() == pytest.approx(TEMPERATURES)
+    assert conversion.get_alphas() == pytest.approx(CONVERSIONS, rel=1e-12)
+
+def test_products_basis_conversion_matches_original_calculator(co2_hydrogenation_input_data):
+    conversion = calculator_factory.get_calculator('co2-hydrogenation', True).calculate_conversion(co2_hydrogenation_input_data).get_sorted()
+    assert conversion.get_alphas() == pytest.approx(PRODUCTS_BASIS_CONVERSIONS, rel=1e-12)
+
+def test_selectivities_match_original_calculator(co2_hydrogenation_input_data):
+    selectivity = calculator_factory.get_calculator('co2-hydrogenation', False).calculate_selectivity(co2_hydrogenation_input_data).get_sorted()
+    assert selectivity.get_temperatures() == pytest.approx(TEMPERATURES)
+    for compound, selectivities in SELECTIVITIES.items():
+        assert selectivity.get_compound_selectivities(compound) == pytest.approx(selectivities, rel=1e-12, abs=1e-15)
+
+def test_tracer_corrects_flow_by_inert_concentration(co2_hydrogenation_input_data):
+    input_data = co2_hydrogenation_input_data
+    alphas = calculator_factory.get_calculator('co2-hydrogenation', False, 'He').calculate_alphas(input_data)
+    expected = 1 - (input_data.get_concs('CO2') * input_data.get_init_conc('He')) / (input_data.get_init_conc('CO2') * input_data.get_concs('He'))
+    assert alphas == pytest.approx(expected)
+    assert alphas != pytest.approx(calculator_factory.get_calculator('co2-hydrogenation', False).calculate_alphas(input_data))
+
+def test_unknown_tracer_raises_exception(co2_hydrogenation_input_data):
+    with pytest.raises(CalculatorException):
+        calculator_factory.get_calculator('co2-hydrogenation', False, 'Ar').calculate_alphas(co2_hydrogenation_input_data)
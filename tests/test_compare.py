@@ -0,0 +1,37 @@
+import numpy as np
+import pytest
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc import compare
+from pycatalicism.calc.calculation_settings import CalculationSettings
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.comparison import Interpolant
+
+def test_interpolant_averages_replicates_and_is_not_extrapolated():
+    interpolant = Interpolant([300.0, 200.0, 300.0, np.nan], [0.6, 0.2, 0.4, 0.9])
+    assert interpolant([200.0, 250.0, 300.0]) == pytest.approx([0.2, 0.35, 0.5])
+    assert np.isnan(interpolant([150.0, 350.0])).all()
+
+def test_compare_resamples_samples_exported_as_text_and_binary(co2_hydrogenation_data, tmp_path):
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, print_results=False)
+    calc.calculate(str(co2_hydrogenation_data[0]), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('batch', 'a')), sample_name='a'))
+    reference = calc.calculate(str(co2_hydrogenation_data[0]), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('b')), sample_name='b', products_basis=True, export_binary=True))
+    assert tmp_path.joinpath('b', 'results.npz').exists()
+    comparison = compare.compare([str(tmp_path.joinpath('batch')), str(tmp_path.joinpath('b'))], output_data_path=str(tmp_path.joinpath('comparison')), reference='b', grid_step=25.0, print_results=False)
+    assert comparison.get_samples() == ['a', 'b']
+    assert comparison.get_grid() == pytest.approx(np.arange(200.5, 400.6, 25.0))
+    conversion = reference.get_conversion()
+    values = comparison.get_values('Conversion')
+    assert values[1] == pytest.approx(np.interp(comparison.get_grid(), conversion.get_temperatures(), conversion.get_alphas()))
+    assert comparison.get_differences('Conversion')[1] == pytest.approx(np.zeros(len(comparison.get_grid())))
+    assert comparison.get_ratios('Conversion')[0] == pytest.approx(values[0] / values[1])
+    assert [name for name, _ in comparison.get_ranking('Conversion')] == ['a', 'b']
+    for name in ['conversion.dat', 'conversion_difference.dat', 'conversion_ratio.dat', 'selectivity_CH4.dat', 'ranking.dat']:
+        assert tmp_path.joinpath('comparison', name).exists()
+
+def test_compare_rejects_duplicated_sample_names(co2_hydrogenation_data, tmp_path):
+    settings = CalculationSettings(calculate_conversion=True, print_results=False, sample_name='same')
+    for directory in ['a', 'b']:
+        calc.calculate(str(co2_hydrogenation_data[0]), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath(directory))))
+    with pytest.raises(CalculatorException):
+        compare.compare([str(tmp_path.joinpath('a')), str(tmp_path.joinpath('b'))], print_results=False)
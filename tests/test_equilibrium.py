@@ -0,0 +1,40 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import equilibrium
+from pycatalicism.calc import reaction_factory
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.parse_cache import ParseCache
+from pycatalicism.calc.reaction import Reaction
+
+def test_co2_hydrogenation_equilibrium_conversion():
+    sample_equilibrium = equilibrium.get_equilibrium(reaction_factory.get_reaction('co2-hydrogenation'), {'CO2':20.0, 'H2':80.0}, np.array([600.0]))
+    assert sample_equilibrium.get_alphas()[0] == pytest.approx(0.65, abs=0.01)
+    assert np.sum(sample_equilibrium.get_selectivities()[0]) == pytest.approx(1.0)
+
+def test_co_oxidation_is_complete_and_elements_are_conserved():
+    feed = {'CO':2.0, 'O2':10.0, 'He':88.0}
+    sample_equilibrium = equilibrium.get_equilibrium(reaction_factory.get_reaction('co-oxidation'), feed, np.array([100.0, 500.0]))
+    assert sample_equilibrium.get_alphas() == pytest.approx([1.0, 1.0], abs=1e-6)
+    amounts = sample_equilibrium.get_amounts()
+    compounds = sample_equilibrium.get_compounds()
+    assert amounts[:, compounds.index('He')] == pytest.approx([88.0, 88.0])
+    assert amounts[:, compounds.index('CO2')] == pytest.approx([2.0, 2.0], rel=1e-6)
+
+def test_cached_equilibrium_depends_on_products_of_reaction(tmp_path):
+    cache = ParseCache(tmp_path, 'equilibrium')
+    feed = {'CO2':20.0, 'H2':80.0}
+    temperatures = np.array([400.0, 600.0])
+    first = equilibrium.get_equilibrium(Reaction(name='co2-reduction', reactants=['CO2', 'H2'], products=['CO', 'CH4']), feed, temperatures, cache=cache)
+    second = equilibrium.get_equilibrium(Reaction(name='co2-reduction', reactants=['CO2', 'H2'], products=['CO', 'CH4', 'CH3OH']), feed, temperatures, cache=cache)
+    assert first.get_products() == ['CO', 'CH4']
+    assert second.get_products() == ['CO', 'CH4', 'CH3OH']
+    assert second.get_selectivities().shape == (2, 3)
+    assert equilibrium.get_equilibrium(Reaction(name='co2-reduction', reactants=['CO2', 'H2'], products=['CO', 'CH4']), feed, temperatures, cache=cache).get_products() == ['CO', 'CH4']
+
+def test_wrong_feed_or_pressure_raise_exception():
+    reaction = reaction_factory.get_reaction('co-oxidation')
+    with pytest.raises(CalculatorException):
+        equilibrium.get_equilibrium(reaction, {'O2':10.0}, np.array([300.0]))
+    with pytest.raises(CalculatorException):
+        equilibrium.get_equilibrium(reaction, {'CO':2.0, 'O2':10.0}, np.array([300.0]), pressure=0)
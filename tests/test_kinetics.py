@@ -0,0 +1,45 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import kinetics
+from pycatalicism.calc.activity import Activity
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+def _get_activity(temperatures, alphas, activation_energy=80.0, pre_exponential=1e6, sample_name=None):
+    temperatures = np.asarray(temperatures, dtype=float)
+    rates = pre_exponential * np.exp(-activation_energy * 1000 / (kinetics.R * (temperatures + 273.15)))
+    return Activity(temperatures, rates, None, sample_name, np.asarray(alphas, dtype=float))
+
+def test_fit_recovers_arrhenius_parameters_from_differential_regime():
+    # last point is measured at high conversion and must not be used
+    activity = _get_activity([200.0, 220.0, 240.0, 260.0, 280.0], [0.02, 0.05, 0.09, 0.14, 0.4])
+    fit = kinetics.get_arrhenius_fit(activity)
+    assert fit.get_points() == 4
+    assert fit.get_activation_energy() == pytest.approx(80.0)
+    assert fit.get_pre_exponential() == pytest.approx(1e6)
+    assert fit.get_r_squared() == pytest.approx(1.0)
+    assert fit.get_activation_energy_interval() == pytest.approx((80.0, 80.0))
+
+def test_vectorized_fits_of_samples_of_different_length_match_single_fits():
+    rng = np.random.default_rng(0)
+    activities = []
+    for points, activation_energy in [(4, 60.0), (7, 100.0)]:
+        temperatures = np.linspace(180.0, 260.0, points)
+        activity = _get_activity(temperatures, np.full(points, 0.05), activation_energy)
+        activities.append(Activity(temperatures, activity.get_rates() * np.exp(rng.normal(0, 0.05, points)), None, f'{points}', activity.get_alphas()))
+    for fit, activity in zip(kinetics.get_arrhenius_fits(activities), activities):
+        single = kinetics.get_arrhenius_fit(activity)
+        assert fit.get_metrics() == pytest.approx(single.get_metrics())
+        assert fit.get_sample_name() == activity.get_sample_name()
+        low, high = fit.get_activation_energy_interval()
+        assert low < fit.get_activation_energy() < high
+
+def test_confidence_interval_uses_student_quantile():
+    assert kinetics._get_t_quantile(0.05, 3) == pytest.approx(3.182446, rel=1e-6)
+    assert kinetics._get_t_quantile(0.05, 10) == pytest.approx(2.228139, rel=1e-6)
+    assert kinetics._get_t_quantile(0.01, 1) == pytest.approx(63.65674, rel=1e-6)
+
+def test_fit_requires_three_points_and_known_conversions():
+    assert np.isnan(kinetics.get_arrhenius_fit(_get_activity([200.0, 220.0, 240.0], [0.05, 0.1, 0.5])).get_activation_energy())
+    with pytest.raises(CalculatorException):
+        kinetics.get_arrhenius_fit(Activity([200.0, 220.0, 240.0], [1.0, 2.0, 3.0], None, None))
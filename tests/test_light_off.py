@@ -0,0 +1,50 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import light_off
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.conversion import Conversion
+from pycatalicism.calc.selectivity import Selectivity
+
+def test_light_off_temperatures_are_interpolated_on_monotone_envelope():
+    # conversion drops at 300 °C, envelope keeps 0.3 there
+    conversion = Conversion([250.0, 200.0, 300.0, 350.0, 400.0], [0.3, 0.05, 0.2, 0.7, 0.95], 'sample')
+    metrics = light_off.get_light_off(conversion)
+    assert metrics.get_temperature(0.1) == pytest.approx(210.0)
+    assert metrics.get_temperature(0.5) == pytest.approx(325.0)
+    assert metrics.get_temperature(0.9) == pytest.approx(390.0)
+    assert metrics.get_max_conversion() == pytest.approx(0.95)
+    assert metrics.get_sample_name() == 'sample'
+
+def test_unreached_or_initially_exceeded_levels_are_nan():
+    metrics = light_off.get_light_off(Conversion([200.0, 300.0, 400.0], [0.2, 0.4, 0.6], None))
+    assert np.isnan(metrics.get_temperature(0.1))
+    assert metrics.get_temperature(0.5) == pytest.approx(350.0)
+    assert np.isnan(metrics.get_temperature(0.9))
+    with pytest.raises(CalculatorException):
+        metrics.get_temperature(0.3)
+
+def test_vectorized_metrics_of_curves_of_different_length_match_single_curves():
+    conversions = [Conversion([200.0, 250.0, 300.0, 350.0], [0.0, 0.2, 0.6, 1.0], 'a'), Conversion([150.0, 200.0, 250.0, 300.0, 350.0, 400.0], [0.0, 0.05, 0.1, 0.3, 0.8, 0.9], 'b')]
+    for method in light_off.METHODS:
+        light_offs = light_off.get_light_offs(conversions, method=method)
+        for conversion, metrics in zip(conversions, light_offs):
+            single = light_off.get_light_off(conversion, method=method)
+            assert metrics.get_temperatures() == pytest.approx(single.get_temperatures(), nan_ok=True)
+            assert metrics.get_sample_name() == conversion.get_sample_name()
+
+def test_sigmoid_fit_recovers_logistic_curve():
+    temperatures = np.arange(200.0, 420.0, 20.0)
+    alphas = 1 / (1 + np.exp(-(temperatures - 310.0) / 15.0))
+    metrics = light_off.get_light_off(Conversion(temperatures, alphas, None), method='sigmoid')
+    assert metrics.get_temperatures() == pytest.approx([310.0 - 15.0 * np.log(9), 310.0, 310.0 + 15.0 * np.log(9)])
+
+def test_max_yield_temperatures():
+    _yield = Selectivity([200.0, 300.0, 400.0], [{'CO':0.1, 'CH4':0.0}, {'CO':0.3, 'CH4':0.0}, {'CO':0.2, 'CH4':0.0}], None)
+    metrics = light_off.get_light_off(Conversion([200.0, 300.0, 400.0], [0.1, 0.3, 0.2], None), _yield)
+    assert metrics.get_max_yield_temperatures()['CO'] == pytest.approx(300.0)
+    assert np.isnan(metrics.get_max_yield_temperatures()['CH4'])
+
+def test_unknown_method_raises_exception():
+    with pytest.raises(CalculatorException):
+        light_off.get_light_off(Conversion([200.0, 300.0], [0.1, 0.6], None), method='unknown')
@@ -0,0 +1,49 @@
+import shutil
+from datetime import datetime
+
+import numpy as np
+
+from pycatalicism.calc import parser_factory
+
+PARSER_TYPE = 'chromatec-crystal-composition-copy-paste'
+
+def _to_cp1251(source, destination):
+    destination.write_bytes(source.read_text(encoding='utf-8').replace('\n', '\r\n').encode('cp1251'))
+
+def test_cp1251_and_utf8_files_are_parsed_equally(co2_hydrogenation_data, tmp_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    cp1251_path = tmp_path.joinpath('data')
+    cp1251_path.mkdir()
+    for data_file in input_data_path.iterdir():
+        _to_cp1251(data_file, cp1251_path.joinpath(data_file.name))
+    cp1251_initial_path = tmp_path.joinpath('initial.txt')
+    _to_cp1251(initial_data_path, cp1251_initial_path)
+    parser = parser_factory.get_parser(PARSER_TYPE)
+    utf8_data = parser.parse_data(input_data_path, initial_data_path, None)
+    cp1251_data = parser.parse_data(cp1251_path, cp1251_initial_path, None)
+    assert len(utf8_data.get_temperatures()) == 5
+    assert cp1251_data.get_temperatures().tolist() == utf8_data.get_temperatures().tolist()
+    assert cp1251_data.get_compounds() == utf8_data.get_compounds()
+    assert np.array_equal(cp1251_data.get_conc_matrix(), utf8_data.get_conc_matrix(), equal_nan=True)
+    assert cp1251_data.get_init_concs() == utf8_data.get_init_concs()
+    assert cp1251_data.get_fin_flows().tolist() == utf8_data.get_fin_flows().tolist()
+    assert cp1251_data.get_init_flow() == utf8_data.get_init_flow()
+
+def test_malformed_date_line_is_treated_as_missing_timestamp(co2_hydrogenation_data, tmp_path):
+    input_data_path, _ = co2_hydrogenation_data
+    lines = input_data_path.joinpath('200.txt').read_text(encoding='utf-8').split('\n')
+    data_path = tmp_path.joinpath('20230325_140530_sample_200.5.txt')
+    data_path.write_text('\n'.join([lines[0], 'Дата анализа\tunknown'] + lines[1:]), encoding='utf-8')
+    chromatogram = parser_factory.get_parser(PARSER_TYPE).parse_file(data_path)
+    assert chromatogram.get_temperature() == 200.5
+    assert chromatogram.get_timestamp() == datetime(2023, 3, 25, 14, 5, 30).timestamp()
+
+def test_directory_in_input_data_path_is_not_reported_as_error(co2_hydrogenation_data, tmp_path):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    data_path = tmp_path.joinpath('data')
+    shutil.copytree(input_data_path, data_path)
+    data_path.joinpath('backup').mkdir()
+    parser = parser_factory.get_parser(PARSER_TYPE)
+    raw_data = parser.parse_data(data_path, initial_data_path, None)
+    assert len(raw_data.get_temperatures()) == 5
+    assert len(parser.get_report()) == 0
@@ -0,0 +1,13 @@
+import subprocess
+import sys
+from pathlib import Path
+
+SRC_PATH = Path(__file__).resolve().parents[1].joinpath('src')
+
+def test_unknown_reaction_exits_with_usage_error_without_loading_numpy(co2_hydrogenation_data):
+    script = 'import sys\nfrom pycatalicism import pycat\ntry:\n    pycat.main()\nfinally:\n    print("numpy" in sys.modules)'
+    arguments = ['calc', str(co2_hydrogenation_data[0]), str(co2_hydrogenation_data[1]), 'unknown-reaction', '--conversion']
+    process = subprocess.run([sys.executable, '-c', script] + arguments, cwd=SRC_PATH, capture_output=True, text=True)
+    assert process.returncode == 2
+    assert 'Unknown reaction "unknown-reaction"' in process.stderr
+    assert process.stdout.strip() == 'False'
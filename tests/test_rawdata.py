@@ -0,0 +1,10 @@
+import pytest
+
+from pycatalicism.calc.rawdata import RawData
+
+def test_get_conc_at_unknown_temperature_raises_index_error():
+    raw_data = RawData([100.0, 200.0], {'CO':1.0}, [{'CO':0.5}, {'CO':0.2}])
+    assert raw_data.get_conc('CO', 200.0) == 0.2
+    assert raw_data.get_conc('CO2', 200.0) == 0
+    with pytest.raises(IndexError):
+        raw_data.get_conc('CO', 150.0)
@@ -0,0 +1,40 @@
+import pytest
+
+from pycatalicism.calc import reaction_factory
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.rawdata import RawData
+from pycatalicism.calc.reaction import Reaction
+from pycatalicism.calc.reactioncalculator import ReactionCalculator
+
+from test_calculator import PRODUCTS_BASIS_CONVERSIONS
+
+def _calculate(reaction:str, input_data:RawData):
+    return ReactionCalculator(reaction_factory.get_reaction(reaction), products_basis=True).calculate(input_data, calculate_conversion=True, calculate_selectivity=False, calculate_yield=True)
+
+def test_coefficients_default_to_ratio_of_basis_element_atoms():
+    reaction = Reaction(name='co-methanation', reactants=['CO', 'H2'], products=['CH4', 'C2H6', 'CH3OCH3'])
+    assert reaction.get_product_coefficients().tolist() == [1.0, 2.0, 2.0]
+    assert Reaction(name='h2-oxidation', reactants=['H2', 'O2'], products=['H2O']).get_product_coefficients() is None
+
+@pytest.mark.parametrize('coefficients', [[1], [1, 0], [1, -2]])
+def test_wrong_coefficients_raise_exception(coefficients):
+    with pytest.raises(CalculatorException):
+        Reaction(name='co-methanation', reactants=['CO', 'H2'], products=['CH4', 'C2H6'], coefficients=coefficients)
+
+def test_generic_calculator_matches_original_products_basis_calculator(co2_hydrogenation_input_data):
+    conversion = ReactionCalculator(reaction_factory.get_reaction('co2-hydrogenation'), products_basis=True).calculate_conversion(co2_hydrogenation_input_data).get_sorted()
+    assert conversion.get_alphas() == pytest.approx(PRODUCTS_BASIS_CONVERSIONS, rel=1e-12)
+
+def test_dry_reforming_products_basis_conversion_does_not_exceed_unity():
+    # complete conversion of equimolar CH4 and CO2 to 2CO + 2H2
+    input_data = RawData([700.0, 800.0], {'CH4':25.0, 'CO2':25.0, 'He':50.0}, [{'CH4':10.0, 'CO2':10.0, 'CO':30.0, 'H2':30.0}, {'CH4':0.0, 'CO2':0.0, 'CO':50.0, 'H2':50.0}])
+    results = _calculate('dry-reforming', input_data)
+    assert results.get_conversion().get_alphas() == pytest.approx([0.6, 1.0])
+    assert results.get_yield().get_compound_selectivities('CO') == pytest.approx([0.6, 1.0])
+
+def test_methanation_and_rwgs_follow_own_stoichiometry():
+    input_data = RawData([300.0], {'CO2':20.0, 'H2':80.0}, [{'CO2':13.0, 'CO':5.0, 'CH4':2.0}])
+    assert reaction_factory.get_reaction('co2-methanation').get_products() == ['CH4']
+    assert reaction_factory.get_reaction('rwgs').get_products() == ['CO']
+    assert _calculate('co2-methanation', input_data).get_conversion().get_alphas() == pytest.approx([0.1])
+    assert _calculate('rwgs', input_data).get_conversion().get_alphas() == pytest.approx([0.25])
@@ -0,0 +1,39 @@
+import numpy as np
+import pytest
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc import results_npz
+from pycatalicism.calc.calculation_settings import CalculationSettings
+from pycatalicism.calc.exporterexception import ExporterException
+
+def test_binary_results_are_loaded_equal_to_calculated(co2_hydrogenation_data, tmp_path):
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, calculate_yield=True, catalyst_mass=0.1, output_data_path=str(tmp_path), sample_name='sample', print_results=False, export_binary=True)
+    results = calc.calculate(*map(str, co2_hydrogenation_data), 'co2-hydrogenation', settings)
+    loaded = results_npz.load_results(tmp_path.joinpath('results.npz'))
+    # arrays are views of memory-mapped file, not copies
+    assert not loaded.get_conversion().get_alphas().flags.owndata
+    assert not loaded.get_selectivity().get_matrix().flags.owndata
+    assert results_npz.load_results(tmp_path.joinpath('results.npz'), mmap=False).get_conversion().get_alphas().flags.owndata
+    assert loaded.get_conversion().get_sample_name() == 'sample'
+    assert np.array_equal(loaded.get_conversion().get_temperatures(), results.get_conversion().get_temperatures())
+    assert np.array_equal(loaded.get_conversion().get_alphas(), results.get_conversion().get_alphas())
+    for loaded_selectivity, selectivity in [(loaded.get_selectivity(), results.get_selectivity()), (loaded.get_yield(), results.get_yield())]:
+        assert loaded_selectivity.get_compounds() == selectivity.get_compounds()
+        assert np.array_equal(loaded_selectivity.get_matrix(), selectivity.get_matrix())
+    assert np.array_equal(loaded.get_activity().get_rates(), results.get_activity().get_rates())
+    metadata = results_npz.load_metadata(tmp_path.joinpath('results.npz'))
+    assert metadata['reaction'] == 'co2-hydrogenation'
+    assert metadata['options']['catalyst_mass'] == 0.1
+
+def test_binary_results_can_be_read_by_numpy(co2_hydrogenation_data, tmp_path):
+    settings = CalculationSettings(calculate_conversion=True, output_data_path=str(tmp_path), print_results=False, export_binary=True)
+    results = calc.calculate(*map(str, co2_hydrogenation_data), 'co2-hydrogenation', settings)
+    with np.load(tmp_path.joinpath('results.npz')) as arrays:
+        assert np.array_equal(arrays['conversion_alphas'], results.get_conversion().get_alphas())
+        assert 'selectivity_matrix' not in arrays
+
+def test_other_npz_files_are_rejected(tmp_path):
+    path = tmp_path.joinpath('other.npz')
+    np.savez(path, values=np.arange(3))
+    with pytest.raises(ExporterException):
+        results_npz.load_results(path)
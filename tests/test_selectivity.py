@@ -0,0 +1,20 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc.selectivity import Selectivity
+
+def test_lookups_at_unknown_temperature_raise_index_error():
+    selectivity = Selectivity([200.0, 100.0], [{'CO':0.4, 'CH4':0.6}, {'CO':0.9, 'CH4':0.1}], None)
+    assert selectivity.get_selectivity('CO', 200.0) == 0.4
+    assert selectivity.get_selectivities_at(100.0) == {'CO':0.9, 'CH4':0.1}
+    with pytest.raises(IndexError):
+        selectivity.get_selectivity('CO', 150.0)
+    with pytest.raises(IndexError):
+        selectivity.get_selectivities_at(150.0)
+
+def test_get_selectivities_returns_array_of_dictionaries():
+    selectivity = Selectivity([200.0, 100.0], [{'CO':0.4, 'CH4':0.6}, {'CO':0.9, 'CH4':0.1}], None)
+    selectivities = selectivity.get_selectivities()
+    assert isinstance(selectivities, np.ndarray)
+    assert selectivities[selectivity.get_temperatures() == 200.0][0] == {'CO':0.4, 'CH4':0.6}
+    assert selectivities.tolist() == [{'CO':0.9, 'CH4':0.1}, {'CO':0.4, 'CH4':0.6}]
@@ -0,0 +1,28 @@
+import io
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc.calculation_settings import CalculationSettings
+
+def test_stream_calculates_each_record_once_and_exports_at_flush_intervals(co2_hydrogenation_data, tmp_path, monkeypatch):
+    input_data_path, initial_data_path = co2_hydrogenation_data
+    records = [file.read_bytes() for file in sorted(input_data_path.iterdir(), reverse=True)]
+    calculated_rows = []
+    calculate_results = calc._calculate_results
+    def count(calculator, input_data, settings):
+        calculated_rows.append(len(input_data.get_temperatures()))
+        return calculate_results(calculator, input_data, settings)
+    monkeypatch.setattr(calc, '_calculate_results', count)
+    outputs = []
+    output_results = calc._output_results
+    def count_outputs(results, *args, **kwargs):
+        outputs.append(len(results.get_conversion().get_temperatures()))
+        return output_results(results, *args, **kwargs)
+    monkeypatch.setattr(calc, '_output_results', count_outputs)
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, calculate_yield=True, catalyst_mass=0.1, print_results=False)
+    calc.stream(io.BytesIO(b'\x1e'.join(records)), str(initial_data_path), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('stream'))), flush_interval=2)
+    assert calculated_rows == [1, 1, 1, 1, 1]
+    assert outputs == [2, 4, 5]
+    monkeypatch.setattr(calc, '_calculate_results', calculate_results)
+    calc.calculate(str(input_data_path), str(initial_data_path), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('calculate'))))
+    for name in ['conversion.dat', 'selectivity.dat', 'yield.dat', 'activity.dat']:
+        assert tmp_path.joinpath('stream', name).read_text() == tmp_path.joinpath('calculate', name).read_text()
@@ -0,0 +1,51 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import calculator_factory
+from pycatalicism.calc import time_on_stream
+from pycatalicism.calc.calculatorexception import CalculatorException
+from pycatalicism.calc.rawdata import RawData
+
+def _get_input_data(temperatures, hours, alphas):
+    # CO oxidation without flow rate measurements, so that conversion is 1 - C(CO)f / C(CO)i
+    concentrations = [{'CO':10.0 * (1 - alpha), 'O2':10.0, 'CO2':10.0 * alpha} for alpha in alphas]
+    return RawData(temperatures, {'CO':10.0, 'O2':10.0}, concentrations, timestamps=1.7e9 + 3600 * np.asarray(hours, dtype=float))
+
+@pytest.mark.parametrize('model', ['exponential', 'linear'])
+def test_deactivation_is_fitted_for_every_temperature_group(model):
+    hours = np.array([0.0, 1.0, 2.0, 3.0, 4.0])
+    initial_conversions = [0.8, 0.5]
+    rates = [0.1, 0.05]
+    temperatures = []
+    times = []
+    alphas = []
+    # measurements are shuffled, temperature of the first group drifts within tolerance
+    for temperature, initial_conversion, rate, offset in zip([300.0, 400.0], initial_conversions, rates, [0.0, 10.0]):
+        temperatures.extend(temperature + np.array([0.0, 0.4, 0.2, 0.6, 0.3]) * (temperature == 300.0))
+        times.extend(hours + offset)
+        alphas.extend(time_on_stream.get_model_values(model, hours, initial_conversion, rate))
+    order = [3, 8, 0, 5, 9, 1, 6, 4, 2, 7]
+    input_data = _get_input_data(np.array(temperatures)[order], np.array(times)[order], np.array(alphas)[order])
+    result = time_on_stream.get_time_on_stream(calculator_factory.get_calculator('co-oxidation', False), input_data, model=model)
+    assert len(result.get_temperatures()) == 2
+    assert result.get_temperatures() == pytest.approx([300.3, 400.0])
+    for row in range(2):
+        series_times, series_alphas = result.get_series(row)
+        assert series_times == pytest.approx(hours)
+        assert series_alphas == pytest.approx(time_on_stream.get_model_values(model, hours, initial_conversions[row], rates[row]))
+    assert result.get_rates() == pytest.approx(rates)
+    assert result.get_initial_conversions() == pytest.approx(initial_conversions)
+
+def test_groups_with_less_than_three_points_are_not_fitted():
+    fit = time_on_stream.fit_deactivation(np.array([[0.0, 1.0, np.nan], [0.0, 1.0, 2.0]]), np.array([[0.5, 0.4, np.nan], [0.5, 0.4, 0.3]]), 'linear')
+    assert np.isnan(fit['rate'][0])
+    assert fit['rate'][1] == pytest.approx(0.1)
+    assert fit['points'].tolist() == [2, 3]
+
+def test_unknown_times_and_models_raise_exception():
+    calculator = calculator_factory.get_calculator('co-oxidation', False)
+    input_data = RawData([300.0, 300.0], {'CO':10.0, 'O2':10.0}, [{'CO':5.0}, {'CO':6.0}])
+    with pytest.raises(CalculatorException):
+        time_on_stream.get_time_on_stream(calculator, input_data)
+    with pytest.raises(CalculatorException):
+        time_on_stream.get_time_on_stream(calculator, _get_input_data([300.0, 300.0], [0.0, 1.0], [0.5, 0.4]), model='unknown')
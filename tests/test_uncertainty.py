@@ -0,0 +1,49 @@
+import numpy as np
+import pytest
+
+from pycatalicism.calc import calculator_factory
+from pycatalicism.calc import uncertainty
+from pycatalicism.calc.calculatorexception import CalculatorException
+
+class SampleGenerator():
+    """
+    Random numbers generator which returns the same number for all values of one sample and a new number for every sample.
+    """
+
+    def __init__(self):
+        self.samples = 0
+
+    def standard_normal(self, size):
+        self.samples = self.samples + 1
+        return np.full(size, 0.01 * self.samples)
+
+@pytest.mark.parametrize('products_basis', [False, True])
+def test_draws_without_errors_match_calculation(co2_hydrogenation_input_data, products_basis):
+    calculator = calculator_factory.get_calculator('co2-hydrogenation', products_basis)
+    results = calculator.calculate(co2_hydrogenation_input_data, calculate_conversion=True, calculate_selectivity=True, calculate_yield=True)
+    alphas, selectivities, yields = calculator.calculate_draws(co2_hydrogenation_input_data, 3, {}, calculate_yield=True)
+    assert alphas.shape == (3, 5)
+    assert selectivities.shape == (3, 5, 8)
+    assert alphas == pytest.approx(np.broadcast_to(calculator.calculate_alphas(co2_hydrogenation_input_data), (3, 5)))
+    assert selectivities[1, :, 1] == pytest.approx(results.get_selectivity().get_compound_selectivities('CH4'))
+    assert yields[2, :, 0] == pytest.approx(results.get_yield().get_compound_selectivities('CO'))
+
+def test_intervals_are_reproducible_and_contain_calculated_conversion(co2_hydrogenation_input_data):
+    calculator = calculator_factory.get_calculator('co2-hydrogenation', False)
+    errors = {'concentration':0.02, 'initial concentration':0.01, 'flow':0.01, 'temperature':0.5, 'pressure':0.005}
+    first = uncertainty.estimate_uncertainty(calculator, co2_hydrogenation_input_data, 2000, errors, seed=1)
+    second = uncertainty.estimate_uncertainty(calculator, co2_hydrogenation_input_data, 2000, errors, seed=1)
+    median, low, high = first.get_interval('Conversion')
+    assert np.array_equal(median, second.get_interval('Conversion')[0])
+    assert ((low < median) & (median < high)).all()
+    assert median == pytest.approx(calculator.calculate_alphas(co2_hydrogenation_input_data), rel=0.05)
+    narrow = uncertainty.estimate_uncertainty(calculator, co2_hydrogenation_input_data, 2000, {'concentration':0.005}, seed=1)
+    assert (narrow.get_interval('Conversion')[2] - narrow.get_interval('Conversion')[1] < high - low).all()
+    with pytest.raises(CalculatorException):
+        uncertainty.estimate_uncertainty(calculator, co2_hydrogenation_input_data, 0, errors)
+
+def test_tracer_ratio_is_drawn_from_the_same_sample_as_concentrations(co2_hydrogenation_input_data):
+    # concentrations of all compounds of a measurement are scaled by the same factor, which is cancelled by tracer ratio
+    calculator = calculator_factory.get_calculator('co2-hydrogenation', False, 'He')
+    alphas, _, _ = calculator.calculate_draws(co2_hydrogenation_input_data, 2, {'concentration':1.0}, calculate_selectivity=False, rng=SampleGenerator())
+    assert alphas == pytest.approx(np.broadcast_to(calculator.calculate_alphas(co2_hydrogenation_input_data), (2, 5)))
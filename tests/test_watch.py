@@ -0,0 +1,56 @@
+import shutil
+
+import pycatalicism.calc.calc as calc
+from pycatalicism.calc import watcher
+from pycatalicism.calc.calculation_settings import CalculationSettings
+
+class ScriptedWatcher(watcher.Watcher):
+    """
+    Watcher which applies changes to input data directory by script instead of waiting for them.
+    """
+
+    def __init__(self, changes):
+        self.changes = list(changes)
+
+    def wait(self, timeout=None):
+        return self.changes.pop(0)()
+
+def test_watch_recalculates_only_changed_rows(co2_hydrogenation_data, tmp_path, monkeypatch):
+    input_data_path = tmp_path.joinpath('data')
+    shutil.copytree(co2_hydrogenation_data[0], input_data_path)
+    def change():
+        changed = input_data_path.joinpath('300.txt')
+        changed.write_text(changed.read_text(encoding='utf-8').replace('CO2\t0.815\tДТП\t14,0', 'CO2\t0.815\tДТП\t13,0'), encoding='utf-8')
+        added = input_data_path.joinpath('450.txt')
+        added.write_text(input_data_path.joinpath('400.txt').read_text(encoding='utf-8').replace('400.5', '450.5'), encoding='utf-8')
+        removed = input_data_path.joinpath('250.txt')
+        removed.unlink()
+        return {changed, added, removed}
+    monkeypatch.setattr(watcher, 'get_watcher', lambda *args, **kwargs: ScriptedWatcher([change]))
+    calculated_rows = []
+    calculate_results = calc._calculate_results
+    def count(calculator, input_data, settings):
+        calculated_rows.append(len(input_data.get_temperatures()))
+        return calculate_results(calculator, input_data, settings)
+    monkeypatch.setattr(calc, '_calculate_results', count)
+    settings = CalculationSettings(calculate_conversion=True, calculate_selectivity=True, calculate_yield=True, catalyst_mass=0.1)
+    calc.watch(str(input_data_path), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('watch'))), max_updates=2)
+    assert calculated_rows == [5, 2]
+    calc.calculate(str(input_data_path), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('calculate')), print_results=False))
+    for name in ['conversion.dat', 'selectivity.dat', 'yield.dat', 'activity.dat']:
+        assert tmp_path.joinpath('watch', name).read_text() == tmp_path.joinpath('calculate', name).read_text()
+
+def test_watch_keeps_conversions_of_measurements_at_the_same_temperature(co2_hydrogenation_data, tmp_path, monkeypatch):
+    input_data_path = tmp_path.joinpath('data')
+    shutil.copytree(co2_hydrogenation_data[0], input_data_path)
+    # replicate at the same temperature with lower conversion than the file preceding it
+    replicate = input_data_path.joinpath('300b.txt')
+    replicate.write_text(input_data_path.joinpath('300.txt').read_text(encoding='utf-8').replace('CO2\t0.815\tДТП\t14,0', 'CO2\t0.815\tДТП\t15,0'), encoding='utf-8')
+    def remove():
+        replicate.unlink()
+        return {replicate}
+    monkeypatch.setattr(watcher, 'get_watcher', lambda *args, **kwargs: ScriptedWatcher([remove]))
+    settings = CalculationSettings(calculate_conversion=True)
+    calc.watch(str(input_data_path), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('watch'))), max_updates=2)
+    calc.calculate(str(input_data_path), str(co2_hydrogenation_data[1]), 'co2-hydrogenation', settings.replace(output_data_path=str(tmp_path.joinpath('calculate')), print_results=False))
+    assert tmp_path.joinpath('watch', 'conversion.dat').read_text() == tmp_path.joinpath('calculate', 'conversion.dat').read_text()